@@ -0,0 +1,67 @@
+from typing import Optional
+from fastapi import APIRouter, Request, Path, Query
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.ticket_rollup_helper import TicketRollupHelper
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.get(
+    "/{family_id}",
+    summary="Get ticket analytics",
+    response_description="Ticket throughput, MTTR and backlog over a date range",
+)
+@exceptions_decorator
+def get_ticket_analytics(
+    request: Request,
+    family_id: str = Path(..., description="Family ID"),
+    start: Optional[str] = Query(
+        default=None, description="First UTC day, YYYY-MM-DD (default: 28 days ago)"
+    ),
+    end: Optional[str] = Query(
+        default=None, description="Last UTC day, YYYY-MM-DD (default: today)"
+    ),
+    queue_id: Optional[str] = Query(
+        default=None, description="Only this queue (default: the whole family)"
+    ),
+):
+    """
+    Get Ticket Analytics
+
+    Returns the tickets opened, resolved, reopened and closed over the range,
+    in total, per ISO week and per day, with each day's closing OPEN backlog
+    and the mean time to resolve by severity. Computed from daily rollups
+    only, never from the tickets themselves.
+
+    Args:
+        family_id: The family ID
+        start: First day of the range
+        end: Last day of the range
+        queue_id: Optional queue to narrow the analytics to
+
+    Returns:
+        A JSON response containing the analytics
+    """
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Getting ticket analytics of family {family_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    analytics = TicketRollupHelper(request_id=request.state.request_id).get_analytics(
+        family_id, start=start, end=end, queue_id=queue_id
+    )
+
+    return JSONResponse(content={"analytics": analytics}, status_code=200)
@@ -0,0 +1,96 @@
+from typing import Optional
+from fastapi import APIRouter, Request, Path, Query
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+
+from constants.admin import ADMIN_USER_IDS
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.membership_exceptions import AdminPrivilegesRequired
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.audit_helper import AuditHelper
+from helpers.pagination_helper import encode_pagination_token, decode_pagination_token
+from models.audit import AuditModel
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.get(
+    "/actor/{user_id}",
+    summary="Get audit records performed by a user across all families (admin only)",
+    response_description="Paginated audit records by the actor, newest first",
+)
+@exceptions_decorator
+def get_actor_audit(
+    request: Request,
+    user_id: str = Path(..., description="Actor user ID"),
+    since: Optional[int] = Query(
+        default=None, description="Only include records at or after this epoch time"
+    ),
+    until: Optional[int] = Query(
+        default=None, description="Only include records at or before this epoch time"
+    ),
+    limit: int = Query(
+        default=50, ge=1, le=100, description="Number of records to return"
+    ),
+    next_token: Optional[str] = Query(
+        default=None, description="Pagination token from previous response"
+    ),
+    expand: bool = Query(
+        default=False,
+        description="Rebuild full before/after views for delta-encoded records",
+    ),
+):
+    """
+    Get Actor Audit History
+
+    Answers "what did this user change?" with a single ActorAuditIndex query
+    instead of scanning every family partition. Restricted to the user IDs
+    configured in ADMIN_USER_IDS.
+
+    Args:
+        user_id: The actor to search for
+        since: Optional inclusive lower time bound (epoch seconds)
+        until: Optional inclusive upper time bound (epoch seconds)
+        limit: Number of records to return (default: 50, max: 100)
+        next_token: Pagination token to get the next page of results
+        expand: Rebuild full before/after views for delta-encoded records
+
+    Returns:
+        A JSON response containing the audit records, count and next_token
+    """
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Getting audit records by actor {user_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    if token_user_id not in ADMIN_USER_IDS:
+        logger.warning(f"User {token_user_id} attempted an admin audit search.")
+        raise AdminPrivilegesRequired()
+
+    audit_helper = AuditHelper(request_id=request.state.request_id)
+    records, next_key = audit_helper.get_audit_records_by_actor(
+        user_id,
+        since=since,
+        until=until,
+        limit=limit,
+        cursor=decode_pagination_token(next_token),
+    )
+
+    if expand:
+        audits = audit_helper.reconstruct_audit_records(records)
+    else:
+        audits = [AuditModel.clean_returned_audit(r) for r in records]
+
+    return JSONResponse(
+        content={
+            "audits": audits,
+            "count": len(records),
+            "next_token": encode_pagination_token(next_key),
+        },
+        status_code=200,
+    )
@@ -0,0 +1,93 @@
+from typing import Optional
+from fastapi import APIRouter, Request, Path, Query
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.audit_helper import AuditHelper
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.pagination_helper import encode_pagination_token, decode_pagination_token
+from models.audit import AuditModel
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.get(
+    "/{family_id}",
+    summary="Get audit history for a family",
+    response_description="Paginated audit records across all entities, newest first",
+)
+@exceptions_decorator
+def get_family_audit(
+    request: Request,
+    family_id: str = Path(..., description="Family ID"),
+    since: Optional[int] = Query(
+        default=None, description="Only include records at or after this epoch time"
+    ),
+    until: Optional[int] = Query(
+        default=None, description="Only include records at or before this epoch time"
+    ),
+    limit: int = Query(
+        default=50, ge=1, le=100, description="Number of records to return"
+    ),
+    next_token: Optional[str] = Query(
+        default=None, description="Pagination token from previous response"
+    ),
+    expand: bool = Query(
+        default=False,
+        description="Rebuild full before/after views for delta-encoded records",
+    ),
+):
+    """
+    Get Family Audit History
+
+    Returns the family's audit records across all entities, ordered by time
+    (newest first). Only active family members can read the audit history.
+
+    Args:
+        family_id: The family ID to get audit records for
+        since: Optional inclusive lower time bound (epoch seconds)
+        until: Optional inclusive upper time bound (epoch seconds)
+        limit: Number of records to return (default: 50, max: 100)
+        next_token: Pagination token to get the next page of results
+        expand: Rebuild full before/after views for delta-encoded records
+
+    Returns:
+        A JSON response containing the audit records, count and next_token
+    """
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Getting audit history for family {family_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    audit_helper = AuditHelper(request_id=request.state.request_id)
+    records, next_key = audit_helper.get_all_family_audit_records(
+        family_id,
+        limit=limit,
+        last_evaluated_key=decode_pagination_token(next_token),
+        since=since,
+        until=until,
+    )
+
+    if expand:
+        audits = audit_helper.reconstruct_audit_records(records)
+    else:
+        audits = [AuditModel.clean_returned_audit(r) for r in records]
+
+    return JSONResponse(
+        content={
+            "audits": audits,
+            "count": len(records),
+            "next_token": encode_pagination_token(next_key),
+        },
+        status_code=200,
+    )
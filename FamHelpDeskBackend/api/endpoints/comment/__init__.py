@@ -0,0 +1 @@
+# Comment endpoints module
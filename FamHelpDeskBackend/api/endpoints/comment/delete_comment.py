@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Request, Path
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.ticket_comment_helper import TicketCommentHelper
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.delete(
+    "/{family_id}/{queue_id}/{ticket_id}/{comment_id}",
+    summary="Delete a comment",
+    response_description="Confirmation of comment deletion",
+)
+@exceptions_decorator
+def delete_comment(
+    request: Request,
+    family_id: str = Path(..., description="Family ID"),
+    queue_id: str = Path(..., description="Queue ID"),
+    ticket_id: str = Path(..., description="Ticket ID"),
+    comment_id: str = Path(..., description="Comment ID"),
+):
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Deleting comment {comment_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    helper = TicketCommentHelper(request_id=request.state.request_id)
+    helper.delete_comment(
+        family_id=family_id,
+        queue_id=queue_id,
+        ticket_id=ticket_id,
+        comment_id=comment_id,
+        deleted_by=token_user_id,
+    )
+
+    return JSONResponse(
+        content={"message": f"Comment {comment_id} deleted successfully"},
+        status_code=200,
+    )
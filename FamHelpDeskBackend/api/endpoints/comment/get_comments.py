@@ -0,0 +1,114 @@
+from typing import Optional
+from fastapi import APIRouter, Request, Path, Query
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.comment_exceptions import InvalidCommentData
+from exceptions.pagination_exceptions import InvalidPaginationToken
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.pagination_helper import encode_pagination_token, decode_pagination_token
+from helpers.ticket_comment_helper import TicketCommentHelper
+from models.ticket_comment import TicketCommentModel
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+def _encode_cursor(comment_id: str) -> str:
+    return encode_pagination_token({"comment_id": comment_id})
+
+
+def _decode_cursor(token: Optional[str]) -> Optional[str]:
+    cursor = decode_pagination_token(token)
+    if cursor is None:
+        return None
+    if not isinstance(cursor.get("comment_id"), str):
+        raise InvalidPaginationToken()
+    return cursor["comment_id"]
+
+
+@router.get(
+    "/{family_id}/{queue_id}/{ticket_id}",
+    summary="Get comments for a ticket",
+    response_description="A page of comments, newest first, with cursors in both directions",
+)
+@exceptions_decorator
+def get_comments(
+    request: Request,
+    family_id: str = Path(..., description="Family ID"),
+    queue_id: str = Path(..., description="Queue ID"),
+    ticket_id: str = Path(..., description="Ticket ID"),
+    limit: int = Query(
+        default=20, ge=1, le=100, description="Number of comments to return"
+    ),
+    older_token: Optional[str] = Query(
+        default=None, description="Return comments older than this cursor"
+    ),
+    newer_token: Optional[str] = Query(
+        default=None, description="Return comments newer than this cursor"
+    ),
+):
+    """
+    Get Ticket Comments
+
+    Returns the latest comments of a ticket, newest first. Pass older_token
+    from a response to page back through the thread, or newer_token to fetch
+    comments added since that page.
+
+    Args:
+        family_id: The family ID
+        queue_id: The queue ID
+        ticket_id: The ticket ID
+        limit: Number of comments to return (default: 20, max: 100)
+        older_token: Cursor for the page of older comments
+        newer_token: Cursor for the page of newer comments
+
+    Returns:
+        A JSON response containing the comments, count, older_token (None when
+        the start of the thread is reached) and newer_token
+    """
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Getting comments for ticket {ticket_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    if older_token and newer_token:
+        raise InvalidCommentData("Pass either older_token or newer_token, not both")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    before = _decode_cursor(older_token)
+    after = _decode_cursor(newer_token)
+
+    helper = TicketCommentHelper(request_id=request.state.request_id)
+    comments, has_more = helper.get_comments(
+        family_id, queue_id, ticket_id, limit=limit, before=before, after=after
+    )
+
+    # Newer-than pages always have older comments behind them (the cursor)
+    has_older = has_more if after is None else True
+    next_older_token = None
+    next_newer_token = newer_token
+    if comments:
+        if has_older:
+            next_older_token = _encode_cursor(comments[-1].comment_id)
+        next_newer_token = _encode_cursor(comments[0].comment_id)
+
+    return JSONResponse(
+        content={
+            "comments": [
+                TicketCommentModel.clean_returned_comment(c) for c in comments
+            ],
+            "count": len(comments),
+            "older_token": next_older_token,
+            "newer_token": next_newer_token,
+        },
+        status_code=200,
+    )
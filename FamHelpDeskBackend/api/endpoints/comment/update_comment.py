@@ -0,0 +1,63 @@
+from fastapi import APIRouter, Request, Path
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+from pydantic import BaseModel
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.ticket_comment_helper import TicketCommentHelper
+from helpers.ticket_validation_helper import TicketValidationHelper
+from models.ticket_comment import TicketCommentModel
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+class UpdateCommentRequest(BaseModel):
+    comment_body: str
+
+
+@router.put(
+    "/{family_id}/{queue_id}/{ticket_id}/{comment_id}",
+    summary="Update a comment",
+    response_description="The updated comment",
+)
+@exceptions_decorator
+def update_comment(
+    request: Request,
+    body: UpdateCommentRequest,
+    family_id: str = Path(..., description="Family ID"),
+    queue_id: str = Path(..., description="Queue ID"),
+    ticket_id: str = Path(..., description="Ticket ID"),
+    comment_id: str = Path(..., description="Comment ID"),
+):
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Updating comment {comment_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    validation_helper = TicketValidationHelper(request_id=request.state.request_id)
+    validation_helper.validate_comment_body(body.comment_body)
+
+    helper = TicketCommentHelper(request_id=request.state.request_id)
+    comment = helper.update_comment(
+        family_id=family_id,
+        queue_id=queue_id,
+        ticket_id=ticket_id,
+        comment_id=comment_id,
+        comment_body=body.comment_body,
+        updated_by=token_user_id,
+    )
+
+    return JSONResponse(
+        content={"comment": TicketCommentModel.clean_returned_comment(comment)},
+        status_code=200,
+    )
@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Request, Path
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_export_helper import FamilyExportHelper
+from helpers.family_membership_helper import FamilyMembershipHelper
+from models.export import ExportModel
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.post(
+    "/{family_id}",
+    summary="Start an export job of everything in a family",
+    response_description="The PENDING export job",
+)
+@exceptions_decorator
+def create_export(
+    request: Request,
+    family_id: str = Path(..., description="Family ID"),
+):
+    """
+    Export the family in the background, for families too large to stream
+    in one response. Poll the job by export_id until it is READY, then
+    download its gzipped NDJSON file.
+    """
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Requesting an export job of family {family_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    export = FamilyExportHelper(request_id=request.state.request_id).request_export(
+        family_id, actor_user_id=token_user_id
+    )
+
+    return JSONResponse(
+        content={"export": ExportModel.clean_returned_export(export)},
+        status_code=202,
+    )
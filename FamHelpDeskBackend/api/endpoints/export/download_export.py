@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Request, Path
+from fastapi.responses import RedirectResponse, StreamingResponse
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_export_helper import FamilyExportHelper
+from helpers.family_membership_helper import FamilyMembershipHelper
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.get(
+    "/{family_id}/{export_id}/download",
+    summary="Download a finished export job",
+    response_description="A redirect to the gzipped NDJSON file, or the file",
+)
+@exceptions_decorator
+def download_export(
+    request: Request,
+    family_id: str = Path(..., description="Family ID"),
+    export_id: str = Path(..., description="Export ID"),
+):
+    """
+    Download a READY export. Job files are larger than an API response may
+    be, so this redirects (307) to a short-lived pre-signed URL of the file;
+    only a local export store is served directly.
+    """
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Downloading export {export_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    export_helper = FamilyExportHelper(request_id=request.state.request_id)
+    url = export_helper.get_download_url(family_id, export_id)
+    if url:
+        return RedirectResponse(url, status_code=307)
+
+    return StreamingResponse(
+        export_helper.iter_export_file(family_id, export_id),
+        media_type="application/gzip",
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="family-{family_id}-{export_id[:8]}.ndjson.gz"'
+            )
+        },
+    )
@@ -0,0 +1,54 @@
+from fastapi import APIRouter, Request, Path, Query
+from fastapi.responses import StreamingResponse
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_export_helper import FamilyExportHelper
+from helpers.family_membership_helper import FamilyMembershipHelper
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.get(
+    "/{family_id}",
+    summary="Download everything in a family as NDJSON",
+    response_description="The export, streamed as application/x-ndjson or gzip",
+)
+@exceptions_decorator
+def export_family(
+    request: Request,
+    family_id: str = Path(..., description="Family ID"),
+    gzip: bool = Query(False, description="Gzip the export"),
+):
+    """
+    Stream the family's groups, queues, memberships, tickets, comments and
+    audit records, one JSON record per line, ending with an export_end line.
+
+    Families with more than about EXPORT_SYNC_MAX_BYTES of data get 413
+    EXPORT_TOO_LARGE; request an export job (POST) for them instead. With
+    gzip, send "Accept: application/gzip" so API Gateway returns the body
+    as binary.
+    """
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Exporting family {family_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    export_helper = FamilyExportHelper(request_id=request.state.request_id)
+    export_helper.check_direct_export(family_id)
+
+    filename = f"family-{family_id}.ndjson" + (".gz" if gzip else "")
+    return StreamingResponse(
+        export_helper.iter_ndjson(family_id, compress=gzip),
+        media_type="application/gzip" if gzip else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Request, Path
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_export_helper import FamilyExportHelper
+from helpers.family_membership_helper import FamilyMembershipHelper
+from models.export import ExportModel
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.get(
+    "/{family_id}/{export_id}",
+    summary="Get an export job's status",
+    response_description="The export job",
+)
+@exceptions_decorator
+def get_export(
+    request: Request,
+    family_id: str = Path(..., description="Family ID"),
+    export_id: str = Path(..., description="Export ID"),
+):
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Getting export {export_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    export = FamilyExportHelper(request_id=request.state.request_id).get_export(
+        family_id, export_id
+    )
+
+    return JSONResponse(
+        content={"export": ExportModel.clean_returned_export(export)},
+        status_code=200,
+    )
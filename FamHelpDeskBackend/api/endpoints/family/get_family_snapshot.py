@@ -0,0 +1,102 @@
+from fastapi import APIRouter, Request, Path
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.group_exceptions import FamilyNotFound
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_snapshot_helper import FamilySnapshot
+from helpers.user_profile_helper import UserProfileHelper
+from models.base import MembershipStatus
+from models.family import FamilyModel
+from models.family_membership import FamilyMembershipModel
+from models.group import GroupModel
+from models.group_membership import GroupMembershipModel
+from models.queue import QueueModel
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.get(
+    "/{family_id}/snapshot",
+    summary="Get everything the family page needs in one call",
+    response_description="Family, groups, queues, members, requests and the requester's groups",
+)
+@exceptions_decorator
+def get_family_snapshot(
+    request: Request, family_id: str = Path(..., description="Family ID")
+):
+    """
+    Get Family Snapshot
+
+    Loads the family's groups, queues and memberships with a single partition
+    query and returns the views the family page would otherwise fetch from
+    separate endpoints.
+
+    Args:
+        family_id: The family ID to load
+
+    Returns:
+        A JSON response containing the family, groups, queues, active members,
+        pending membership requests and the requester's groups keyed by group_id
+    """
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Getting snapshot for family {family_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    snapshot = FamilySnapshot(family_id, request_id=request.state.request_id).load()
+    family = snapshot.get_family()
+    if not family:
+        raise FamilyNotFound(f"Family with ID {family_id} not found.")
+
+    # Enrich members and requests with one batched profile read
+    members = snapshot.get_family_members()
+    pending_requests = snapshot.get_pending_family_requests()
+    user_profile_helper = UserProfileHelper(request_id=request.state.request_id)
+    profiles = user_profile_helper.get_profiles(
+        [m.user_id for m in members] + [m.user_id for m in pending_requests]
+    )
+
+    def enrich(membership: FamilyMembershipModel) -> dict:
+        profile = profiles.get(membership.user_id)
+        return {
+            **FamilyMembershipModel.clean_returned_membership(membership),
+            "user_display_name": profile.display_name if profile else None,
+            "user_email": profile.email if profile else None,
+        }
+
+    included_statuses = {MembershipStatus.MEMBER.value, MembershipStatus.AWAITING.value}
+    my_groups = {}
+    for membership in snapshot.get_user_group_memberships(
+        token_user_id, included_statuses
+    ):
+        group = snapshot.get_group(membership.group_id)
+        if group:
+            my_groups[group.group_id] = {
+                "membership": GroupMembershipModel.clean_returned_membership(
+                    membership
+                ),
+                "group": GroupModel.clean_returned_group(group),
+            }
+
+    return JSONResponse(
+        content={
+            "family": FamilyModel.clean_returned_family(family),
+            "groups": [
+                GroupModel.clean_returned_group(g) for g in snapshot.get_groups()
+            ],
+            "queues": [
+                QueueModel.clean_returned_queue(q) for q in snapshot.get_queues()
+            ],
+            "members": [enrich(m) for m in members],
+            "requests": [enrich(m) for m in pending_requests],
+            "my_groups": my_groups,
+        },
+        status_code=200,
+    )
@@ -5,6 +5,7 @@ from api.endpoints.family import (
     get_all_families,
     get_my_families,
     get_family,
+    get_family_snapshot,
     update_family,
 )
 from api.endpoints.group import (
@@ -21,6 +22,30 @@ from api.endpoints.queue import (
     update_queue,
     delete_queue,
 )
+from api.endpoints.ticket import (
+    import_tickets,
+    create_ticket,
+    search_tickets,
+    get_tickets,
+    get_next_tickets,
+    get_ticket_by_number,
+    get_ticket,
+    get_duplicate_tickets,
+    get_assigned_tickets,
+    assign_ticket,
+    watch_ticket,
+    resolve_ticket,
+    close_ticket,
+    reopen_ticket,
+    move_tickets,
+    resume_ticket_move,
+)
+from api.endpoints.comment import (
+    create_comment,
+    get_comments,
+    update_comment,
+    delete_comment,
+)
 from api.endpoints.membership.family_membership import (
     family_request_membership,
     family_review_membership,
@@ -43,6 +68,19 @@ from api.endpoints.notifications import (
     acknowledge_notification,
     acknowledge_all,
 )
+from api.endpoints.audit import (
+    get_family_audit,
+    get_entity_audit,
+    get_actor_audit,
+)
+from api.endpoints.report import create_report, get_report, download_report
+from api.endpoints.analytics import get_ticket_analytics
+from api.endpoints.export import (
+    export_family,
+    create_export,
+    get_export,
+    download_export,
+)
 from constants.api import (
     HOME_TAG,
     HOME_PATH,
@@ -54,11 +92,23 @@ from constants.api import (
     GROUP_PATH,
     QUEUE_TAG,
     QUEUE_PATH,
+    TICKET_TAG,
+    TICKET_PATH,
+    COMMENT_TAG,
+    COMMENT_PATH,
     GROUP_MEMBERSHIP_TAG,
     FAMILY_MEMBERSHIP_TAG,
     MEMBERSHIP_PATH,
     NOTIFICATIONS_TAG,
     NOTIFICATIONS_PATH,
+    AUDIT_TAG,
+    AUDIT_PATH,
+    REPORT_TAG,
+    REPORT_PATH,
+    ANALYTICS_TAG,
+    ANALYTICS_PATH,
+    EXPORT_TAG,
+    EXPORT_PATH,
 )
 from fastapi import FastAPI
 
@@ -83,6 +133,9 @@ def get_all_routes(app: FastAPI) -> FastAPI:
     app.include_router(get_all_families.router, prefix=FAMILY_PATH, tags=[FAMILY_TAG])
     app.include_router(get_my_families.router, prefix=FAMILY_PATH, tags=[FAMILY_TAG])
     app.include_router(get_family.router, prefix=FAMILY_PATH, tags=[FAMILY_TAG])
+    app.include_router(
+        get_family_snapshot.router, prefix=FAMILY_PATH, tags=[FAMILY_TAG]
+    )
     app.include_router(update_family.router, prefix=FAMILY_PATH, tags=[FAMILY_TAG])
 
     app.include_router(create_group.router, prefix=GROUP_PATH, tags=[GROUP_TAG])
@@ -97,6 +150,37 @@ def get_all_routes(app: FastAPI) -> FastAPI:
     app.include_router(update_queue.router, prefix=QUEUE_PATH, tags=[QUEUE_TAG])
     app.include_router(delete_queue.router, prefix=QUEUE_PATH, tags=[QUEUE_TAG])
 
+    # Registered before create_ticket so "import" is not taken as a queue ID
+    app.include_router(import_tickets.router, prefix=TICKET_PATH, tags=[TICKET_TAG])
+    app.include_router(create_ticket.router, prefix=TICKET_PATH, tags=[TICKET_TAG])
+    app.include_router(
+        get_assigned_tickets.router, prefix=TICKET_PATH, tags=[TICKET_TAG]
+    )
+    # Registered before get_tickets so "search" is not taken as a queue ID
+    app.include_router(search_tickets.router, prefix=TICKET_PATH, tags=[TICKET_TAG])
+    app.include_router(get_tickets.router, prefix=TICKET_PATH, tags=[TICKET_TAG])
+    # Registered before get_ticket so "next" and "number" are not taken as IDs
+    app.include_router(get_next_tickets.router, prefix=TICKET_PATH, tags=[TICKET_TAG])
+    app.include_router(
+        get_ticket_by_number.router, prefix=TICKET_PATH, tags=[TICKET_TAG]
+    )
+    app.include_router(get_ticket.router, prefix=TICKET_PATH, tags=[TICKET_TAG])
+    app.include_router(
+        get_duplicate_tickets.router, prefix=TICKET_PATH, tags=[TICKET_TAG]
+    )
+    app.include_router(assign_ticket.router, prefix=TICKET_PATH, tags=[TICKET_TAG])
+    app.include_router(watch_ticket.router, prefix=TICKET_PATH, tags=[TICKET_TAG])
+    app.include_router(resolve_ticket.router, prefix=TICKET_PATH, tags=[TICKET_TAG])
+    app.include_router(close_ticket.router, prefix=TICKET_PATH, tags=[TICKET_TAG])
+    app.include_router(reopen_ticket.router, prefix=TICKET_PATH, tags=[TICKET_TAG])
+    app.include_router(move_tickets.router, prefix=TICKET_PATH, tags=[TICKET_TAG])
+    app.include_router(resume_ticket_move.router, prefix=TICKET_PATH, tags=[TICKET_TAG])
+
+    app.include_router(create_comment.router, prefix=COMMENT_PATH, tags=[COMMENT_TAG])
+    app.include_router(get_comments.router, prefix=COMMENT_PATH, tags=[COMMENT_TAG])
+    app.include_router(update_comment.router, prefix=COMMENT_PATH, tags=[COMMENT_TAG])
+    app.include_router(delete_comment.router, prefix=COMMENT_PATH, tags=[COMMENT_TAG])
+
     app.include_router(
         family_request_membership.router,
         prefix=MEMBERSHIP_PATH,
@@ -165,4 +249,21 @@ def get_all_routes(app: FastAPI) -> FastAPI:
         acknowledge_all.router, prefix=NOTIFICATIONS_PATH, tags=[NOTIFICATIONS_TAG]
     )
 
+    app.include_router(get_family_audit.router, prefix=AUDIT_PATH, tags=[AUDIT_TAG])
+    app.include_router(get_entity_audit.router, prefix=AUDIT_PATH, tags=[AUDIT_TAG])
+    app.include_router(get_actor_audit.router, prefix=AUDIT_PATH, tags=[AUDIT_TAG])
+
+    app.include_router(create_report.router, prefix=REPORT_PATH, tags=[REPORT_TAG])
+    app.include_router(get_report.router, prefix=REPORT_PATH, tags=[REPORT_TAG])
+    app.include_router(download_report.router, prefix=REPORT_PATH, tags=[REPORT_TAG])
+
+    app.include_router(
+        get_ticket_analytics.router, prefix=ANALYTICS_PATH, tags=[ANALYTICS_TAG]
+    )
+
+    app.include_router(export_family.router, prefix=EXPORT_PATH, tags=[EXPORT_TAG])
+    app.include_router(create_export.router, prefix=EXPORT_PATH, tags=[EXPORT_TAG])
+    app.include_router(get_export.router, prefix=EXPORT_PATH, tags=[EXPORT_TAG])
+    app.include_router(download_export.router, prefix=EXPORT_PATH, tags=[EXPORT_TAG])
+
     return app
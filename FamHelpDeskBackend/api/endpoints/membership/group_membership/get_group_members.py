@@ -24,7 +24,8 @@ def get_group_members(request: Request, family_id: str, group_id: str):
     Get All Members for Group
 
     Returns all active members for the specified group within a family.
-    Each member includes the user's display name, email, role, and membership details.
+    Each member includes the user's display name, email, role, and membership details,
+    including the member's open_ticket_count in the group's queues.
 
     Args:
         family_id: The family ID containing the group
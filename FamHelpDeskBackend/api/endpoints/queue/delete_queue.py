@@ -5,7 +5,7 @@ from aws_lambda_powertools import Logger
 from constants.services import API_SERVICE
 from decorators.exceptions_decorator import exceptions_decorator
 from exceptions.user_exceptions import InvalidUserIdException
-from exceptions.queue_exceptions import QueueHasActiveTickets
+from exceptions.queue_exceptions import QueueNotFound
 from helpers.queue_helper import QueueHelper
 from helpers.queue_validation_helper import QueueValidationHelper
 
@@ -38,10 +38,7 @@ def delete_queue(request: Request, family_id: str, group_id: str, queue_id: str)
 
     helper = QueueHelper(request_id=request.state.request_id)
 
-    # Check if queue has active tickets before deletion
-    # This should be implemented in the queue helper
-    # For now, we'll let the helper handle this validation
-
+    # Raises QueueHasActiveTickets when the queue's counters show active tickets
     success = helper.delete_queue(
         family_id=family_id,
         group_id=group_id,
@@ -50,11 +47,7 @@ def delete_queue(request: Request, family_id: str, group_id: str, queue_id: str)
     )
 
     if not success:
-        # This could happen if queue has active tickets or other business rules
-        logger.error(f"Queue deletion failed for queue {queue_id}")
-        raise QueueHasActiveTickets(
-            f"Cannot delete queue {queue_id} - it may have active tickets"
-        )
+        raise QueueNotFound(f"Queue {queue_id} not found in family {family_id}")
 
     return JSONResponse(
         content={"message": f"Queue {queue_id} deleted successfully"},
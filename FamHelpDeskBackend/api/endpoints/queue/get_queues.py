@@ -24,8 +24,7 @@ def get_queues(request: Request, family_id: str, group_id: str):
 
     # Validate family and group exist
     validation_helper = QueueValidationHelper(request_id=request.state.request_id)
-    validation_helper.validate_family_exists(family_id)
-    validation_helper.validate_group_exists(family_id, group_id)
+    validation_helper.validate_queue_path(family_id, group_id)
 
     helper = QueueHelper(request_id=request.state.request_id)
     queues = helper.get_all_queues_by_group(family_id, group_id)
@@ -0,0 +1,65 @@
+from typing import Optional
+from fastapi import APIRouter, Request, Path
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+from pydantic import BaseModel
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.report_helper import ReportHelper
+from models.report import ReportModel, ReportStatus, ReportType
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+class CreateReportRequest(BaseModel):
+    report_type: ReportType
+    queue_id: str
+    # Required for TICKET reports
+    ticket_id: Optional[str] = None
+
+
+@router.post(
+    "/{family_id}",
+    summary="Request a PDF report of a queue or ticket",
+    response_description="The report; READY when served from the cache",
+)
+@exceptions_decorator
+def create_report(
+    request: Request,
+    body: CreateReportRequest,
+    family_id: str = Path(..., description="Family ID"),
+):
+    """
+    Request a PDF report of the current state of a queue or ticket.
+
+    A report of unchanged data is returned READY straight from the cache
+    (200). Otherwise it is rendered in the background and returned PENDING
+    (202); poll it by report_id until it is READY, then download it.
+    """
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Requesting {body.report_type.value} report in family {family_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    report = ReportHelper(request_id=request.state.request_id).request_report(
+        family_id,
+        body.report_type,
+        body.queue_id,
+        actor_user_id=token_user_id,
+        ticket_id=body.ticket_id,
+    )
+
+    return JSONResponse(
+        content={"report": ReportModel.clean_returned_report(report)},
+        status_code=200 if report.status == ReportStatus.READY.value else 202,
+    )
@@ -0,0 +1,53 @@
+from fastapi import APIRouter, Request, Path
+from fastapi.responses import Response
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.report_helper import ReportHelper
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.get(
+    "/{family_id}/{report_id}/pdf",
+    summary="Download a rendered report",
+    response_description="The report as application/pdf",
+)
+@exceptions_decorator
+def download_report(
+    request: Request,
+    family_id: str = Path(..., description="Family ID"),
+    report_id: str = Path(..., description="Report ID"),
+):
+    """
+    Download a READY report. Send "Accept: application/pdf" so API Gateway
+    returns the body as binary.
+    """
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Downloading report {report_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    pdf = ReportHelper(request_id=request.state.request_id).get_report_pdf(
+        family_id, report_id
+    )
+
+    return Response(
+        content=pdf,
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f'attachment; filename="report-{report_id[:12]}.pdf"',
+            # Report IDs are content hashes, so a report's PDF never changes
+            "Cache-Control": "private, max-age=31536000, immutable",
+        },
+    )
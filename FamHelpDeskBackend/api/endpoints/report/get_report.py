@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Request, Path
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.report_helper import ReportHelper
+from models.report import ReportModel
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.get(
+    "/{family_id}/{report_id}",
+    summary="Get a report's rendering status",
+    response_description="The report",
+)
+@exceptions_decorator
+def get_report(
+    request: Request,
+    family_id: str = Path(..., description="Family ID"),
+    report_id: str = Path(..., description="Report ID"),
+):
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Getting report {report_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    report = ReportHelper(request_id=request.state.request_id).get_report(
+        family_id, report_id
+    )
+
+    return JSONResponse(
+        content={"report": ReportModel.clean_returned_report(report)},
+        status_code=200,
+    )
@@ -0,0 +1 @@
+# Ticket endpoints module
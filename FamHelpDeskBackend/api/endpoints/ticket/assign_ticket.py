@@ -0,0 +1,69 @@
+from fastapi import APIRouter, Request, Path
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+from pydantic import BaseModel
+from typing import Optional
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.ticket_exceptions import TicketNotFound
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.ticket_helper import TicketHelper
+from helpers.ticket_validation_helper import TicketValidationHelper
+from models.ticket import TicketModel
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+class AssignTicketRequest(BaseModel):
+    # None unassigns the ticket
+    assigned_to: Optional[str] = None
+
+
+@router.put(
+    "/{family_id}/{queue_id}/{ticket_id}/assign",
+    summary="Assign a ticket to a user",
+    response_description="The updated ticket",
+)
+@exceptions_decorator
+def assign_ticket(
+    request: Request,
+    body: AssignTicketRequest,
+    family_id: str = Path(..., description="Family ID"),
+    queue_id: str = Path(..., description="Queue ID"),
+    ticket_id: str = Path(..., description="Ticket ID"),
+):
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Assigning ticket {ticket_id} to {body.assigned_to}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    validation_helper = TicketValidationHelper(request_id=request.state.request_id)
+    validation_helper.validate_assignee(family_id, body.assigned_to)
+
+    helper = TicketHelper(request_id=request.state.request_id)
+    ticket = helper.assign_ticket(
+        family_id=family_id,
+        queue_id=queue_id,
+        ticket_id=ticket_id,
+        assigned_to=body.assigned_to,
+        updated_by=token_user_id,
+    )
+
+    if ticket is None:
+        raise TicketNotFound(
+            f"Ticket {ticket_id} not found in queue {queue_id} of family {family_id}"
+        )
+
+    return JSONResponse(
+        content={"ticket": TicketModel.clean_returned_ticket(ticket)},
+        status_code=200,
+    )
@@ -0,0 +1,77 @@
+from fastapi import APIRouter, Request, Path
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+from pydantic import BaseModel
+from typing import Optional
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.ticket_helper import TicketHelper
+from helpers.ticket_validation_helper import TicketValidationHelper
+from models.ticket import TicketModel, TicketSeverity
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+class CreateTicketRequest(BaseModel):
+    title: str
+    severity: TicketSeverity
+    description: Optional[str] = None
+    assigned_to: Optional[str] = None
+    # Assign to the active group member with the fewest open tickets
+    auto_assign: bool = False
+
+
+@router.post(
+    "/{family_id}/{queue_id}",
+    summary="Create a ticket",
+    response_description="The created ticket",
+)
+@exceptions_decorator
+def create_ticket(
+    request: Request,
+    body: CreateTicketRequest,
+    family_id: str = Path(..., description="Family ID"),
+    queue_id: str = Path(..., description="Queue ID"),
+):
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Creating ticket in queue {queue_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    validation_helper = TicketValidationHelper(request_id=request.state.request_id)
+    queue = validation_helper.validate_create_ticket_data(
+        family_id=family_id,
+        queue_id=queue_id,
+        title=body.title,
+        description=body.description,
+        assigned_to=body.assigned_to,
+        auto_assign=body.auto_assign,
+    )
+
+    helper = TicketHelper(request_id=request.state.request_id)
+    ticket = helper.create_ticket(
+        family_id=family_id,
+        queue_id=queue_id,
+        title=body.title,
+        severity=body.severity,
+        description=body.description,
+        assigned_to=body.assigned_to,
+        created_by=token_user_id,
+        group_id=queue.group_id,
+        auto_assign=body.auto_assign,
+    )
+
+    return JSONResponse(
+        content={"ticket": TicketModel.clean_returned_ticket(ticket)},
+        status_code=201,
+    )
@@ -0,0 +1,67 @@
+from typing import Optional
+from fastapi import APIRouter, Request, Query
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.pagination_helper import encode_pagination_token, decode_pagination_token
+from helpers.ticket_helper import TicketHelper
+from models.ticket import TicketModel
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.get(
+    "/assigned",
+    summary="Get open tickets assigned to the current user",
+    response_description="Paginated open tickets across all families, most severe and oldest first",
+)
+@exceptions_decorator
+def get_assigned_tickets(
+    request: Request,
+    limit: int = Query(
+        default=50, ge=1, le=100, description="Number of tickets to return"
+    ),
+    next_token: Optional[str] = Query(
+        default=None, description="Pagination token from previous response"
+    ),
+):
+    """
+    Get Assigned Tickets
+
+    Returns the requester's OPEN tickets across every family with a single
+    index query, ordered by severity and then age.
+
+    Args:
+        limit: Number of tickets to return (default: 50, max: 100)
+        next_token: Pagination token to get the next page of results
+
+    Returns:
+        A JSON response containing the tickets, count and next_token
+    """
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info("Getting tickets assigned to requester.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    helper = TicketHelper(request_id=request.state.request_id)
+    tickets, next_key = helper.get_assigned_tickets(
+        token_user_id,
+        limit=limit,
+        last_evaluated_key=decode_pagination_token(next_token),
+    )
+
+    return JSONResponse(
+        content={
+            "tickets": [TicketModel.clean_returned_ticket(t) for t in tickets],
+            "count": len(tickets),
+            "next_token": encode_pagination_token(next_key),
+        },
+        status_code=200,
+    )
@@ -0,0 +1,76 @@
+from fastapi import APIRouter, Request, Path, Query
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+
+from constants.duplicates import DUPLICATE_MIN_SIMILARITY, DUPLICATE_MAX_RESULTS
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.ticket_duplicate_helper import TicketDuplicateHelper
+from helpers.ticket_validation_helper import TicketValidationHelper
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.get(
+    "/{family_id}/{queue_id}/{ticket_id}/duplicates",
+    summary="Get likely duplicates of a ticket",
+    response_description="Tickets in the family similar to this one",
+)
+@exceptions_decorator
+def get_duplicate_tickets(
+    request: Request,
+    family_id: str = Path(..., description="Family ID"),
+    queue_id: str = Path(..., description="Queue ID"),
+    ticket_id: str = Path(..., description="Ticket ID"),
+    min_similarity: float = Query(
+        DUPLICATE_MIN_SIMILARITY,
+        ge=0.0,
+        le=1.0,
+        description="Minimum estimated similarity (0-1) of returned tickets",
+    ),
+    limit: int = Query(
+        DUPLICATE_MAX_RESULTS, ge=1, le=25, description="Maximum tickets to return"
+    ),
+):
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Getting duplicates of ticket {ticket_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    validation_helper = TicketValidationHelper(request_id=request.state.request_id)
+    ticket = validation_helper.validate_ticket_exists(family_id, queue_id, ticket_id)
+
+    helper = TicketDuplicateHelper(request_id=request.state.request_id)
+    matches = helper.find_duplicates(
+        family_id,
+        ticket.title,
+        ticket.description,
+        exclude_ticket_id=ticket_id,
+        min_similarity=min_similarity,
+        limit=limit,
+    )
+
+    return JSONResponse(
+        content={
+            "duplicates": [
+                {
+                    "ticket_id": candidate.ticket_id,
+                    "queue_id": candidate.queue_id,
+                    "title": candidate.title,
+                    "creation_date": candidate.creation_date,
+                    "similarity": round(similarity, 3),
+                }
+                for candidate, similarity in matches
+            ]
+        },
+        status_code=200,
+    )
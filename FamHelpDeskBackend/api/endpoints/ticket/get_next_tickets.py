@@ -0,0 +1,63 @@
+from fastapi import APIRouter, Request, Path, Query
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.ticket_helper import TicketHelper
+from helpers.ticket_validation_helper import TicketValidationHelper
+from models.ticket import TicketModel
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.get(
+    "/{family_id}/{queue_id}/next",
+    summary="Get the next tickets to work in a queue",
+    response_description="The most severe, oldest open tickets of the queue",
+)
+@exceptions_decorator
+def get_next_tickets(
+    request: Request,
+    family_id: str = Path(..., description="Family ID"),
+    queue_id: str = Path(..., description="Queue ID"),
+    n: int = Query(default=1, ge=1, le=25, description="Number of tickets to return"),
+):
+    """
+    Get Next Tickets
+
+    Returns the queue's n highest-priority OPEN tickets: most severe first,
+    oldest first within a severity.
+
+    Args:
+        family_id: The family ID
+        queue_id: The queue ID
+        n: Number of tickets to return (default: 1, max: 25)
+
+    Returns:
+        A JSON response containing the tickets in priority order
+    """
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Getting next tickets for queue {queue_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    validation_helper = TicketValidationHelper(request_id=request.state.request_id)
+    validation_helper.validate_queue(family_id, queue_id)
+
+    helper = TicketHelper(request_id=request.state.request_id)
+    tickets = helper.next_ticket(family_id, queue_id, n=n)
+
+    return JSONResponse(
+        content={"tickets": [TicketModel.clean_returned_ticket(t) for t in tickets]},
+        status_code=200,
+    )
@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Request, Path
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.ticket_validation_helper import TicketValidationHelper
+from models.ticket import TicketModel
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.get(
+    "/{family_id}/{queue_id}/{ticket_id}",
+    summary="Get a single ticket by ID",
+    response_description="The ticket details",
+)
+@exceptions_decorator
+def get_ticket(
+    request: Request,
+    family_id: str = Path(..., description="Family ID"),
+    queue_id: str = Path(..., description="Queue ID"),
+    ticket_id: str = Path(..., description="Ticket ID"),
+):
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Getting ticket {ticket_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    validation_helper = TicketValidationHelper(request_id=request.state.request_id)
+    ticket = validation_helper.validate_ticket_exists(family_id, queue_id, ticket_id)
+
+    return JSONResponse(
+        content={"ticket": TicketModel.clean_returned_ticket(ticket)},
+        status_code=200,
+    )
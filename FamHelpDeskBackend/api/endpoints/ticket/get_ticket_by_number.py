@@ -0,0 +1,53 @@
+from fastapi import APIRouter, Request, Path
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.ticket_exceptions import TicketNotFound
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.ticket_helper import TicketHelper
+from helpers.ticket_number_helper import TicketNumberHelper
+from models.ticket import TicketModel
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.get(
+    "/{family_id}/number/{ticket_key}",
+    summary="Get a single ticket by its number",
+    response_description="The ticket details",
+)
+@exceptions_decorator
+def get_ticket_by_number(
+    request: Request,
+    family_id: str = Path(..., description="Family ID"),
+    ticket_key: str = Path(
+        ..., description='Ticket number or key, e.g. "142" or "SMITH-142"'
+    ),
+):
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Getting ticket {ticket_key} in family {family_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    ticket_number = TicketNumberHelper.parse_ticket_number(ticket_key)
+    helper = TicketHelper(request_id=request.state.request_id)
+    ticket = helper.get_ticket_by_number(family_id, ticket_number)
+    if not ticket:
+        raise TicketNotFound(
+            f"Ticket {ticket_key} does not exist in family {family_id}"
+        )
+
+    return JSONResponse(
+        content={"ticket": TicketModel.clean_returned_ticket(ticket)},
+        status_code=200,
+    )
@@ -0,0 +1,91 @@
+from typing import Optional
+from fastapi import APIRouter, Request, Path, Query
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.pagination_helper import encode_pagination_token, decode_pagination_token
+from helpers.ticket_helper import TicketHelper
+from helpers.ticket_validation_helper import TicketValidationHelper
+from models.ticket import TicketModel, TicketSeverity, TicketStatus
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.get(
+    "/{family_id}/{queue_id}",
+    summary="Get tickets in a queue",
+    response_description="Paginated tickets ordered by status, severity and age",
+)
+@exceptions_decorator
+def get_tickets(
+    request: Request,
+    family_id: str = Path(..., description="Family ID"),
+    queue_id: str = Path(..., description="Queue ID"),
+    status: Optional[TicketStatus] = Query(
+        default=None,
+        description="Only include this status (default: OPEN and RESOLVED)",
+    ),
+    severity: Optional[TicketSeverity] = Query(
+        default=None, description="Only include this severity"
+    ),
+    limit: int = Query(
+        default=50, ge=1, le=100, description="Number of tickets to return"
+    ),
+    next_token: Optional[str] = Query(
+        default=None, description="Pagination token from previous response"
+    ),
+):
+    """
+    Get Queue Tickets
+
+    Returns a page of the queue's tickets, most severe and oldest first within
+    each status. Closed tickets are only listed when status=CLOSED is requested.
+
+    Args:
+        family_id: The family ID
+        queue_id: The queue ID
+        status: Optional status filter (default: OPEN and RESOLVED)
+        severity: Optional severity filter
+        limit: Number of tickets to return (default: 50, max: 100)
+        next_token: Pagination token to get the next page of results
+
+    Returns:
+        A JSON response containing the tickets, count and next_token
+    """
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Getting tickets for queue {queue_id} in family {family_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    validation_helper = TicketValidationHelper(request_id=request.state.request_id)
+    validation_helper.validate_queue(family_id, queue_id)
+
+    helper = TicketHelper(request_id=request.state.request_id)
+    tickets, next_key = helper.get_queue_tickets(
+        family_id,
+        queue_id,
+        status=status,
+        severity=severity,
+        limit=limit,
+        last_evaluated_key=decode_pagination_token(next_token),
+    )
+
+    return JSONResponse(
+        content={
+            "tickets": [TicketModel.clean_returned_ticket(t) for t in tickets],
+            "count": len(tickets),
+            "next_token": encode_pagination_token(next_key),
+        },
+        status_code=200,
+    )
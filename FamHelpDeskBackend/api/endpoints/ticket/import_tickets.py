@@ -0,0 +1,100 @@
+import io
+import json
+import tempfile
+from typing import Optional
+from fastapi import APIRouter, Request, Path, Query, Depends
+from fastapi.responses import StreamingResponse
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from constants.ticket import TICKET_IMPORT_SPOOL_MEMORY_BYTES
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.membership_exceptions import AdminPrivilegesRequired
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.ticket_import_helper import TicketImportHelper, TicketImportFormat
+from helpers.ticket_validation_helper import TicketValidationHelper
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+async def spool_request_body(request: Request) -> tempfile.SpooledTemporaryFile:
+    """Copy the upload into a file chunk by chunk, spilling large ones to disk."""
+    spool = tempfile.SpooledTemporaryFile(max_size=TICKET_IMPORT_SPOOL_MEMORY_BYTES)
+    async for chunk in request.stream():
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+
+@router.post(
+    "/{family_id}/import",
+    summary="Import tickets from a CSV or NDJSON file (admin only)",
+    response_description="NDJSON stream of per-row errors, then a summary",
+)
+@exceptions_decorator
+def import_tickets(
+    request: Request,
+    family_id: str = Path(..., description="Family ID"),
+    import_format: TicketImportFormat = Query(
+        TicketImportFormat.CSV, alias="format", description="File format"
+    ),
+    queue_id: Optional[str] = Query(
+        None, description="Queue for rows that do not name one"
+    ),
+    dry_run: bool = Query(False, description="Validate only, write nothing"),
+    body: tempfile.SpooledTemporaryFile = Depends(spool_request_body),
+):
+    """
+    Import tickets from the request body, a CSV file with a header row or
+    one JSON object per line. Rows are validated and written as they are
+    read; the response streams one {"row", "error"} line per row that was
+    not imported and ends with a {"summary"} line.
+    """
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Importing tickets into family {family_id}.")
+
+    try:
+        token_user_id = getattr(request.state, "user_token", None)
+        if not token_user_id:
+            logger.warning("Token User ID could not be extracted from JWT.")
+            raise InvalidUserIdException("Token User ID is required.")
+
+        membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+        membership = membership_helper.require_active_member(family_id, token_user_id)
+        if not membership.get("is_admin", False):
+            raise AdminPrivilegesRequired()
+
+        if queue_id is not None:
+            TicketValidationHelper(request_id=request.state.request_id).validate_queue(
+                family_id, queue_id
+            )
+
+        # Header problems surface here, before the response starts streaming
+        rows = TicketImportHelper.read_rows(
+            io.TextIOWrapper(body, encoding="utf-8-sig", errors="replace", newline=""),
+            import_format,
+        )
+    except Exception:
+        body.close()
+        raise
+
+    helper = TicketImportHelper(request_id=request.state.request_id)
+
+    def stream_results():
+        try:
+            for event in helper.import_tickets(
+                family_id,
+                rows,
+                actor_user_id=token_user_id,
+                default_queue_id=queue_id,
+                dry_run=dry_run,
+            ):
+                yield json.dumps(event) + "\n"
+        finally:
+            body.close()
+
+    return StreamingResponse(
+        stream_results(), media_type="application/x-ndjson", status_code=200
+    )
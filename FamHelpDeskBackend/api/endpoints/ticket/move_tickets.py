@@ -0,0 +1,68 @@
+from typing import List, Optional
+from fastapi import APIRouter, Request, Path
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+from pydantic import BaseModel
+
+from constants.services import API_SERVICE
+from constants.ticket import TICKET_MOVE_REQUEST_SECONDS
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.membership_exceptions import AdminPrivilegesRequired
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.ticket_move_helper import TicketMoveHelper
+from models.ticket_move import TicketMoveModel
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+class MoveTicketsRequest(BaseModel):
+    target_queue_id: str
+    # Omit to move every ticket in the queue
+    ticket_ids: Optional[List[str]] = None
+
+
+@router.post(
+    "/{family_id}/{queue_id}/move",
+    summary="Move tickets with their comments to another queue (admin only)",
+    response_description="The move's checkpoint and this request's progress",
+)
+@exceptions_decorator
+def move_tickets(
+    request: Request,
+    body: MoveTicketsRequest,
+    family_id: str = Path(..., description="Family ID"),
+    queue_id: str = Path(..., description="Source queue ID"),
+):
+    """
+    Start a bulk move and run it for up to TICKET_MOVE_REQUEST_SECONDS. If the
+    returned move is still RUNNING, resume it with its move_id.
+    """
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Moving tickets from queue {queue_id} to {body.target_queue_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership = membership_helper.require_active_member(family_id, token_user_id)
+    if not membership.get("is_admin", False):
+        raise AdminPrivilegesRequired()
+
+    helper = TicketMoveHelper(request_id=request.state.request_id)
+    move = helper.start_move(
+        family_id,
+        queue_id,
+        body.target_queue_id,
+        actor_user_id=token_user_id,
+        ticket_ids=body.ticket_ids,
+    )
+    run = helper.run_move(move, max_seconds=TICKET_MOVE_REQUEST_SECONDS)
+
+    return JSONResponse(
+        content={"move": TicketMoveModel.clean_returned_move(move), "run": run},
+        status_code=200,
+    )
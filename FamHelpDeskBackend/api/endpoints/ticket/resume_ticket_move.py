@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Request, Path
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from constants.ticket import TICKET_MOVE_REQUEST_SECONDS
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.membership_exceptions import AdminPrivilegesRequired
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.ticket_move_helper import TicketMoveHelper
+from models.ticket_move import TicketMoveModel
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.post(
+    "/{family_id}/moves/{move_id}/resume",
+    summary="Resume a bulk ticket move from its checkpoint (admin only)",
+    response_description="The move's checkpoint and this request's progress",
+)
+@exceptions_decorator
+def resume_ticket_move(
+    request: Request,
+    family_id: str = Path(..., description="Family ID"),
+    move_id: str = Path(..., description="Move ID"),
+):
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Resuming ticket move {move_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership = membership_helper.require_active_member(family_id, token_user_id)
+    if not membership.get("is_admin", False):
+        raise AdminPrivilegesRequired()
+
+    helper = TicketMoveHelper(request_id=request.state.request_id)
+    move = helper.get_move(family_id, move_id)
+    run = helper.run_move(move, max_seconds=TICKET_MOVE_REQUEST_SECONDS)
+
+    return JSONResponse(
+        content={"move": TicketMoveModel.clean_returned_move(move), "run": run},
+        status_code=200,
+    )
@@ -0,0 +1,79 @@
+from typing import Optional
+from fastapi import APIRouter, Request, Path, Query
+from fastapi.responses import JSONResponse
+from aws_lambda_powertools import Logger
+
+from constants.services import API_SERVICE
+from decorators.exceptions_decorator import exceptions_decorator
+from exceptions.pagination_exceptions import InvalidPaginationToken
+from exceptions.user_exceptions import InvalidUserIdException
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.pagination_helper import encode_pagination_token, decode_pagination_token
+from helpers.ticket_search_helper import TicketSearchHelper
+from models.ticket import TicketModel
+
+logger = Logger(service=API_SERVICE)
+router = APIRouter()
+
+
+@router.get(
+    "/{family_id}/search",
+    summary="Search tickets by title and description",
+    response_description="Paginated tickets, best match first",
+)
+@exceptions_decorator
+def search_tickets(
+    request: Request,
+    family_id: str = Path(..., description="Family ID"),
+    q: str = Query(..., min_length=1, max_length=500, description="Search text"),
+    limit: int = Query(
+        default=20, ge=1, le=100, description="Number of tickets to return"
+    ),
+    next_token: Optional[str] = Query(
+        default=None, description="Pagination token from previous response"
+    ),
+):
+    """
+    Search Tickets
+
+    Returns the family's tickets whose title or description contains every
+    word of the query, ranked by how often the words occur (title matches
+    count more) and by how recent the ticket is.
+
+    Args:
+        family_id: The family ID
+        q: The search text
+        limit: Number of tickets to return (default: 20, max: 100)
+        next_token: Pagination token to get the next page of results
+
+    Returns:
+        A JSON response containing the tickets, count and next_token
+    """
+    logger.append_keys(request_id=request.state.request_id)
+    logger.info(f"Searching tickets in family {family_id}.")
+
+    token_user_id = getattr(request.state, "user_token", None)
+    if not token_user_id:
+        logger.warning("Token User ID could not be extracted from JWT.")
+        raise InvalidUserIdException("Token User ID is required.")
+
+    membership_helper = FamilyMembershipHelper(request_id=request.state.request_id)
+    membership_helper.require_active_member(family_id, token_user_id)
+
+    offset = (decode_pagination_token(next_token) or {}).get("offset", 0)
+    if not isinstance(offset, int) or offset < 0:
+        raise InvalidPaginationToken()
+
+    helper = TicketSearchHelper(request_id=request.state.request_id)
+    tickets, next_offset = helper.search(family_id, q, limit=limit, offset=offset)
+
+    return JSONResponse(
+        content={
+            "tickets": [TicketModel.clean_returned_ticket(t) for t in tickets],
+            "count": len(tickets),
+            "next_token": encode_pagination_token(
+                {"offset": next_offset} if next_offset is not None else None
+            ),
+        },
+        status_code=200,
+    )
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Move family audit records older than a cutoff out of the table into
+gzip-compressed NDJSON segments with a per-family manifest.
+
+Each segment is read back and checksummed before its hot items are deleted,
+so an interrupted run loses nothing and can simply be re-run. Once archived,
+records are still served by the audit endpoints through AuditHelper.
+
+Usage:
+    python3 archive_audit_records.py --cutoff-days 365
+    python3 archive_audit_records.py --before 1700000000 --family-id <id>
+    python3 archive_audit_records.py --cutoff-days 90 --archive-uri ./audit-archive
+    python3 archive_audit_records.py --cutoff-days 90 --dry-run
+"""
+
+import argparse
+import time
+from aws_lambda_powertools import Logger
+
+from constants.audit import AUDIT_ARCHIVE_URI, AUDIT_ARCHIVE_SEGMENT_SIZE
+from helpers.audit_archive_helper import AuditArchiveHelper
+from helpers.family_helper import FamilyHelper
+
+logger = Logger(service="FamHelpDesk-Audit-Archive")
+
+
+def archive_audit_records(
+    cutoff: int,
+    archive_uri: str,
+    family_ids: list = None,
+    segment_size: int = AUDIT_ARCHIVE_SEGMENT_SIZE,
+    dry_run: bool = False,
+) -> dict:
+    """
+    Archive audit records older than the cutoff for the given families.
+
+    Args:
+        cutoff: Records with a time strictly before this epoch are archived
+        archive_uri: "s3://bucket/prefix" or a local directory
+        family_ids: Families to archive (default: every family)
+        segment_size: Maximum records per segment
+        dry_run: Only report what would be archived
+
+    Returns:
+        Dict with the number of families, records, segments and bytes
+    """
+    archive_helper = AuditArchiveHelper(archive_uri=archive_uri)
+    if not archive_helper.enabled:
+        raise ValueError("An archive URI is required (--archive-uri).")
+
+    if family_ids is None:
+        family_ids = [f.family_id for f in FamilyHelper().get_all_families()]
+
+    totals = {"families": 0, "records": 0, "segments": 0, "bytes": 0}
+    for family_id in family_ids:
+        stats = archive_helper.archive_family(
+            family_id, cutoff, segment_size=segment_size, dry_run=dry_run
+        )
+        totals["families"] += 1
+        for key, value in stats.items():
+            totals[key] += value
+
+    logger.info(
+        f"{'Would archive' if dry_run else 'Archived'} {totals['records']} audit "
+        f"records from {totals['families']} families to {archive_helper.store}"
+    )
+    return totals
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Archive old family audit records to compressed segments"
+    )
+    cutoff_group = parser.add_mutually_exclusive_group(required=True)
+    cutoff_group.add_argument(
+        "--before", type=int, help="Archive records before this epoch time"
+    )
+    cutoff_group.add_argument(
+        "--cutoff-days", type=int, help="Archive records older than this many days"
+    )
+    parser.add_argument(
+        "--family-id",
+        action="append",
+        dest="family_ids",
+        help="Family to archive (repeatable, default: all families)",
+    )
+    parser.add_argument(
+        "--archive-uri",
+        default=AUDIT_ARCHIVE_URI,
+        help="s3://bucket/prefix or local directory (default: AUDIT_ARCHIVE_URI)",
+    )
+    parser.add_argument(
+        "--segment-size",
+        type=int,
+        default=AUDIT_ARCHIVE_SEGMENT_SIZE,
+        help="Maximum records per segment",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report the records that would be archived without moving them",
+    )
+    args = parser.parse_args()
+
+    cutoff = (
+        args.before
+        if args.before is not None
+        else int(time.time()) - args.cutoff_days * 24 * 60 * 60
+    )
+    result = archive_audit_records(
+        cutoff,
+        args.archive_uri,
+        family_ids=args.family_ids,
+        segment_size=args.segment_size,
+        dry_run=args.dry_run,
+    )
+    print(
+        f"{'Would archive' if args.dry_run else 'Archived'} {result['records']} records "
+        f"from {result['families']} families in {result['segments']} segments "
+        f"({result['bytes']} bytes)."
+    )
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Compute duplicate-detection signatures for existing tickets.
+
+Tickets get their MinHash signature when they are created; run this for
+tickets created before duplicate detection existed, or to repair signatures
+after a failed write. Signatures are computed in vectorized batches with
+NumPy when it is installed (pip install numpy) and one at a time otherwise.
+Items are overwritten in place, so it is safe to re-run.
+
+Usage:
+    python3 backfill_ticket_signatures.py                    # All families
+    python3 backfill_ticket_signatures.py --family-id <id>   # One family
+    python3 backfill_ticket_signatures.py --batch-size 1000
+"""
+
+import argparse
+from aws_lambda_powertools import Logger
+
+from helpers.family_export_reader import FamilyExportReader
+from helpers.family_helper import FamilyHelper
+from helpers.ticket_duplicate_helper import TicketDuplicateHelper
+
+logger = Logger(service="FamHelpDesk-Ticket-Signature-Backfill")
+
+
+def backfill_ticket_signatures(family_ids: list = None, batch_size: int = 500) -> dict:
+    """
+    Compute and store the signature of every ticket of the given families.
+
+    Args:
+        family_ids: Families to backfill (default: every family)
+        batch_size: Tickets per vectorized signature batch
+
+    Returns:
+        Dict with the number of families and tickets processed
+    """
+    helper = TicketDuplicateHelper()
+    try:
+        import numpy  # noqa: F401
+
+        compute = helper.compute_signatures
+    except ImportError:
+        logger.warning("NumPy is not installed; computing signatures one at a time")
+
+        def compute(texts):
+            return [helper.compute_signature(t, d) for t, d in texts]
+
+    if family_ids is None:
+        family_ids = [f.family_id for f in FamilyHelper().get_all_families()]
+
+    def flush(batch: list) -> None:
+        signatures = compute([(t.title, t.description) for t in batch])
+        for ticket, signature in zip(batch, signatures):
+            helper.index_ticket(ticket, signature=signature)
+        totals["tickets"] += len(batch)
+        batch.clear()
+
+    totals = {"families": 0, "tickets": 0}
+    for family_id in family_ids:
+        batch = []
+        for ticket in FamilyExportReader(family_id).iter_tickets():
+            batch.append(ticket)
+            if len(batch) >= batch_size:
+                flush(batch)
+        flush(batch)
+        totals["families"] += 1
+
+    logger.info(
+        f"Backfilled signatures of {totals['tickets']} tickets from "
+        f"{totals['families']} families"
+    )
+    return totals
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compute duplicate-detection signatures for existing tickets"
+    )
+    parser.add_argument(
+        "--family-id",
+        action="append",
+        dest="family_ids",
+        help="Family to backfill (repeatable, default: all families)",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=500, help="Tickets per signature batch"
+    )
+    args = parser.parse_args()
+
+    result = backfill_ticket_signatures(
+        family_ids=args.family_ids, batch_size=args.batch_size
+    )
+    print(
+        f"Backfilled signatures of {result['tickets']} tickets from "
+        f"{result['families']} families."
+    )
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Compare the stored size of UPDATE audit records under the full-snapshot and
+delta encodings. Runs offline: items are serialized, never written.
+
+Usage:
+    python3 benchmark_audit_encoding.py
+    python3 benchmark_audit_encoding.py --description-length 8000
+"""
+
+import argparse
+import math
+
+from helpers.audit_encoding_helper import encode_update, estimate_item_size
+from models.audit import AuditModel, AuditActions, AuditEntityTypes
+
+
+def build_record(entity_type: AuditEntityTypes, before: dict, after: dict, delta: bool):
+    record = AuditModel(
+        pk=AuditModel.create_pk("family-id"),
+        sk=AuditModel.create_sk(
+            entity_type.value, "entity-id", 1760000000000, AuditActions.UPDATE.value
+        ),
+        family_id="family-id",
+        entity_type=entity_type.value,
+        entity_id="entity-id",
+        action=AuditActions.UPDATE.value,
+        actor_user_id="actor-user-id",
+        time=1760000000,
+    )
+    if delta:
+        payload = encode_update(before, after)
+        record.encoding = payload["encoding"]
+        record.changes = payload["changes"]
+        record.checksum = payload["checksum"]
+    else:
+        record.before = before
+        record.after = after
+    return record
+
+
+def scenarios(description_length: int):
+    family = {
+        "family_id": "family-id",
+        "family_name": "Smith",
+        "family_description": "The Smith household",
+        "creation_date": 1760000000,
+        "created_by": "user-id",
+    }
+    yield "family rename", AuditEntityTypes.FAMILY, family, {
+        **family,
+        "family_name": "Smith-Jones",
+    }
+
+    ticket = {
+        "family_id": "family-id",
+        "queue_id": "queue-id",
+        "ticket_id": "ticket-id",
+        "title": "Wifi keeps dropping in the living room",
+        "description": "x" * description_length,
+        "severity": "3.0",
+        "status": "OPEN",
+        "creation_date": 1760000000,
+    }
+    yield "ticket status change", AuditEntityTypes.TICKET, ticket, {
+        **ticket,
+        "status": "RESOLVED",
+        "resolved_date": 1760003600,
+    }
+
+
+def run(description_length: int) -> None:
+    print(f"{'scenario':<24}{'full B':>10}{'delta B':>10}{'saved':>8}{'WCU':>10}")
+    for name, entity_type, before, after in scenarios(description_length):
+        full = estimate_item_size(
+            build_record(entity_type, before, after, delta=False).serialize()
+        )
+        delta = estimate_item_size(
+            build_record(entity_type, before, after, delta=True).serialize()
+        )
+        saved = 100 * (full - delta) / full
+        wcu = f"{math.ceil(full / 1024)}->{math.ceil(delta / 1024)}"
+        print(f"{name:<24}{full:>10}{delta:>10}{saved:>7.0f}%{wcu:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark audit encodings")
+    parser.add_argument(
+        "--description-length",
+        type=int,
+        default=2000,
+        help="Length of the synthetic ticket description (default: 2000)",
+    )
+    args = parser.parse_args()
+    run(args.description_length)
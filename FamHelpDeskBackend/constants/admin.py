@@ -0,0 +1,8 @@
+import os
+
+# Comma-separated Cognito user IDs allowed to call cross-family admin endpoints
+ADMIN_USER_IDS = {
+    user_id.strip()
+    for user_id in os.getenv("ADMIN_USER_IDS", "").split(",")
+    if user_id.strip()
+}
@@ -0,0 +1,18 @@
+# Days the analytics endpoint covers when no range is given
+ANALYTICS_DEFAULT_DAYS = 28
+# Longest range, in days, one analytics request may cover
+ANALYTICS_MAX_DAYS = 366
+# Percentiles of the batch analytics report's duration distributions
+BATCH_ANALYTICS_PERCENTILES = [50, 75, 90, 95, 99]
+# Upper bounds, in seconds, of the batch analytics duration histogram
+# buckets; one more bucket holds anything longer
+BATCH_ANALYTICS_DURATION_BUCKETS = [
+    3600,
+    4 * 3600,
+    24 * 3600,
+    3 * 24 * 3600,
+    7 * 24 * 3600,
+    14 * 24 * 3600,
+    30 * 24 * 3600,
+    90 * 24 * 3600,
+]
@@ -19,3 +19,21 @@ MEMBERSHIP_PATH = "/membership"
 
 NOTIFICATIONS_TAG = "Notifications"
 NOTIFICATIONS_PATH = "/notifications"
+
+TICKET_TAG = "Ticket"
+TICKET_PATH = "/ticket"
+
+COMMENT_TAG = "Comment"
+COMMENT_PATH = "/comment"
+
+AUDIT_TAG = "Audit"
+AUDIT_PATH = "/audit"
+
+REPORT_TAG = "Report"
+REPORT_PATH = "/report"
+
+ANALYTICS_TAG = "Analytics"
+ANALYTICS_PATH = "/analytics"
+
+EXPORT_TAG = "Export"
+EXPORT_PATH = "/export"
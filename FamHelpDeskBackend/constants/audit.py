@@ -0,0 +1,28 @@
+import os
+
+# Where archived audit segments live: "s3://bucket/prefix" or a local directory.
+# Archived records are only readable through AuditHelper when this is set.
+AUDIT_ARCHIVE_URI = os.getenv("AUDIT_ARCHIVE_URI", "")
+
+# Attempts at saving an audit record under a free sort key; each retry moves
+# it to the next millisecond of the same entity's history
+AUDIT_SAVE_MAX_ATTEMPTS = 5
+
+# Audit records per archived segment file
+AUDIT_ARCHIVE_SEGMENT_SIZE = 1000
+
+# How long a warm container reuses a family's archive manifest before
+# refetching it; archive runs in other processes show up within this time
+AUDIT_ARCHIVE_MANIFEST_TTL_SECONDS = 60
+
+# Fields of audited entities, by entity type, that other writes change
+# without an audit record (counters and activity). They are left out of
+# audit snapshots, so replaying an entity's history matches its checksums.
+AUDIT_UNTRACKED_FIELDS = {
+    # Changed by ticket assignment writes
+    "MEMBER": ("open_ticket_count",),
+    # Changed by ticket writes
+    "QUEUE": ("ticket_counts",),
+    # Changed by comment writes and watch subscriptions
+    "TICKET": ("comment_count", "last_activity", "watchers"),
+}
@@ -0,0 +1,15 @@
+# Version of the backup layout, written in its manifest. Version 2 added
+# the family's audit archive segments.
+BACKUP_FORMAT_VERSION = 2
+
+# Items per backup segment file
+BACKUP_SEGMENT_SIZE = 5000
+
+# Parallel batch writers of a restore. The table connection pools at most
+# ten HTTP connections, so more writers only queue.
+BACKUP_RESTORE_WORKERS = 8
+
+# Attempts at writing a batch's unprocessed items before a restore fails,
+# with exponential backoff from BACKUP_RESTORE_RETRY_SECONDS
+BACKUP_RESTORE_MAX_ATTEMPTS = 8
+BACKUP_RESTORE_RETRY_SECONDS = 0.05
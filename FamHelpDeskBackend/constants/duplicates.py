@@ -0,0 +1,15 @@
+# MinHash signature length, split into LSH bands of equal rows. With 16 bands
+# of 4 rows, tickets about 50% similar have even odds of sharing a band and
+# 80% similar ones almost always do
+MINHASH_NUM_PERMUTATIONS = 64
+MINHASH_BANDS = 16
+
+# Character shingle length over the normalized title and description
+MINHASH_SHINGLE_SIZE = 3
+
+# Fixed seed so every container derives the same permutations
+MINHASH_SEED = 20240917
+
+# Estimated Jaccard similarity a candidate needs to be reported
+DUPLICATE_MIN_SIMILARITY = 0.5
+DUPLICATE_MAX_RESULTS = 10
@@ -0,0 +1,29 @@
+import os
+import tempfile
+
+# Where export job files live: "s3://bucket/prefix" or a local directory
+EXPORT_STORE_URI = os.getenv(
+    "EXPORT_STORE_URI", os.path.join(tempfile.gettempdir(), "famhelpdesk-exports")
+)
+
+# Lambda that runs export jobs. Unset, jobs run on a background thread of the
+# requesting process, which is only suitable for local development.
+EXPORT_WORKER_FUNCTION = os.getenv("EXPORT_WORKER_FUNCTION", "")
+
+# Version of the export's line format, written in its header line
+EXPORT_FORMAT_VERSION = 1
+
+# Families whose data is estimated at more bytes than this are exported by a
+# job. The API Lambda buffers the streamed body, which must stay under API
+# Gateway's 6 MB payload limit after JSON encoding and, gzipped, base64.
+EXPORT_SYNC_MAX_BYTES = 2 * 1024 * 1024
+
+# Estimated size of one archived audit record, whose size the archive
+# manifest does not record
+EXPORT_ARCHIVED_AUDIT_BYTES = 2 * 1024
+
+# Lines are gathered into chunks of about this many bytes before being sent
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+# Lifetime of the pre-signed download URL of a finished job
+EXPORT_DOWNLOAD_URL_SECONDS = 900
@@ -7,3 +7,28 @@ API_METRICS_NAMESPACE = f"FamHelpDesk-{STAGE.upper()}"
 ENDPOINT = "Endpoint"
 REQUEST_MEMORY_ALLOCATED_KB = "RequestMemoryAllocatedKB"
 REQUEST_MEMORY_FREED_KB = "RequestMemoryFreedKB"
+
+TICKET_SCHEDULER_SERVICE = "FamHelpDesk-Ticket-Scheduler"
+TICKETS_AUTO_CLOSED = "TicketsAutoClosed"
+TICKET_SLA_BREACHES = "TicketSlaBreaches"
+TICKET_DEADLINES_SKIPPED = "TicketDeadlinesSkipped"
+TICKET_DEADLINE_BACKLOG = "TicketDeadlineBacklog"
+TICKET_DEADLINE_LAG_SECONDS = "TicketDeadlineLagSeconds"
+
+TICKET_MOVE_SERVICE = "FamHelpDesk-Ticket-Move"
+TICKETS_MOVED = "TicketsMoved"
+TICKET_COMMENTS_MOVED = "TicketCommentsMoved"
+TICKET_MOVE_FAILURES = "TicketMoveFailures"
+TICKET_MOVE_THROUGHPUT = "TicketMoveThroughput"
+
+REPORT_WORKER_SERVICE = "FamHelpDesk-Report-Worker"
+REPORTS_RENDERED = "ReportsRendered"
+REPORT_RENDER_FAILURES = "ReportRenderFailures"
+REPORT_RENDER_SECONDS = "ReportRenderSeconds"
+REPORT_PDF_BYTES = "ReportPdfBytes"
+
+EXPORT_WORKER_SERVICE = "FamHelpDesk-Export-Worker"
+EXPORTS_COMPLETED = "ExportsCompleted"
+EXPORT_FAILURES = "ExportFailures"
+EXPORT_SECONDS = "ExportSeconds"
+EXPORT_BYTES = "ExportBytes"
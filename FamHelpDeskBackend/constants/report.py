@@ -0,0 +1,23 @@
+import os
+import tempfile
+
+# Where report snapshots and rendered PDFs live: "s3://bucket/prefix" or a
+# local directory
+REPORT_STORE_URI = os.getenv(
+    "REPORT_STORE_URI", os.path.join(tempfile.gettempdir(), "famhelpdesk-reports")
+)
+
+# Lambda that renders reports. Unset, reports render on a background thread of
+# the requesting process, which is only suitable for local development.
+REPORT_WORKER_FUNCTION = os.getenv("REPORT_WORKER_FUNCTION", "")
+
+# Part of every report's content hash; bump it when the PDF layout changes so
+# cached reports are rendered again
+REPORT_RENDERER_VERSION = 1
+
+# A report still PENDING this long after it was requested is enqueued again
+REPORT_PENDING_TIMEOUT_SECONDS = 300
+
+# Most tickets listed in a queue report and comments in a ticket report
+REPORT_MAX_TICKETS = 1000
+REPORT_MAX_COMMENTS = 500
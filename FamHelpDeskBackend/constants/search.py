@@ -0,0 +1,22 @@
+# Terms shorter or longer than this are not indexed
+SEARCH_MIN_TERM_LENGTH = 2
+SEARCH_MAX_TERM_LENGTH = 30
+
+# Distinct terms indexed per ticket, which bounds the posting writes per
+# ticket; title terms are kept first, then the most frequent description terms
+SEARCH_MAX_TERMS_PER_TICKET = 40
+
+# Terms a query may use, and the newest postings read per query term
+SEARCH_MAX_QUERY_TERMS = 8
+SEARCH_MAX_POSTINGS_PER_TERM = 1000
+
+# Weight of a term that appears in the title, relative to the description
+SEARCH_TITLE_WEIGHT = 2.0
+# Age at which a ticket's score is halved
+SEARCH_RECENCY_HALF_LIFE_SECONDS = 30 * 24 * 60 * 60
+
+SEARCH_STOP_WORDS = frozenset("""
+    a an and are as at be but by can do for from has have if in into is it its
+    me my no not of on or our so that the their them then there these they this
+    to up was we were what when which who why will with you your
+    """.split())
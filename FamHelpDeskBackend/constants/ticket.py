@@ -0,0 +1,52 @@
+# Resolved tickets can be reopened for this long after resolution
+TICKET_REOPEN_WINDOW_SECONDS = 30 * 24 * 60 * 60
+
+TICKET_TITLE_MAX_LENGTH = 200
+TICKET_DESCRIPTION_MAX_LENGTH = 5000
+
+COMMENT_BODY_MAX_LENGTH = 5000
+
+# How long an OPEN ticket may stay open before its SLA is breached, by severity
+TICKET_SLA_SECONDS = {
+    "1.0": 4 * 60 * 60,
+    "2.0": 24 * 60 * 60,
+    "2.5": 3 * 24 * 60 * 60,
+    "3.0": 3 * 24 * 60 * 60,
+    "4.0": 7 * 24 * 60 * 60,
+    "5.0": 30 * 24 * 60 * 60,
+}
+
+# Each deadline index partition holds the deadlines of one UTC hour
+TICKET_DEADLINE_BUCKET_SECONDS = 60 * 60
+# Oldest bucket the deadline scheduler reads on its first run or after an outage
+TICKET_DEADLINE_MAX_CATCH_UP_BUCKETS = 7 * 24
+# A past bucket is only marked done this long after it ends, so deadlines
+# still propagating to the index are not skipped
+TICKET_DEADLINE_SETTLE_SECONDS = 5 * 60
+# Deadlines acted on per scheduler run; the rest wait for the next run
+TICKET_DEADLINE_MAX_ITEMS_PER_RUN = 500
+
+# Actor recorded for changes made by scheduled jobs
+SYSTEM_ACTOR = "SYSTEM"
+
+# Ticket numbers each container reserves at once; unused ones become gaps
+TICKET_NUMBER_BLOCK_SIZE = 20
+
+# Bulk imports write tickets in chunks of one BatchWriteItem's worth of rows
+TICKET_IMPORT_BATCH_SIZE = 25
+# Chunks an import writes concurrently; also bounds the rows held in memory
+TICKET_IMPORT_MAX_PARALLEL_BATCHES = 4
+# Uploaded import files are buffered in memory up to this size, then on disk
+TICKET_IMPORT_SPOOL_MEMORY_BYTES = 1024 * 1024
+
+# DynamoDB's limit on the items one transaction may write
+TRANSACTION_MAX_ITEMS = 100
+# Tickets a bulk move may name explicitly; omit them to move a whole queue
+TICKET_MOVE_MAX_TICKET_IDS = 500
+# How long a move request works before returning its checkpoint; API Gateway
+# cuts requests off at 29 seconds
+TICKET_MOVE_REQUEST_SECONDS = 20
+
+# Times ticket creation re-reads the group when the member it picked to
+# auto-assign got another ticket concurrently
+TICKET_AUTO_ASSIGN_MAX_ATTEMPTS = 3
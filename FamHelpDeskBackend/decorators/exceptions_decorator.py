@@ -41,6 +41,30 @@ from exceptions.queue_exceptions import (
     QueuePermissionDenied,
     QueueHasActiveTickets,
 )
+from exceptions.ticket_exceptions import (
+    TicketNotFound,
+    InvalidTicketData,
+    TicketTitleTooLong,
+    TicketDescriptionTooLong,
+    InvalidTicketStatusTransition,
+    TicketReopenWindowExpired,
+    InvalidSearchQuery,
+    TicketMoveNotFound,
+)
+from exceptions.comment_exceptions import (
+    CommentNotFound,
+    InvalidCommentData,
+    CommentBodyTooLong,
+    CommentPermissionDenied,
+)
+from exceptions.report_exceptions import (
+    ReportNotFound,
+    ReportNotReady,
+    InvalidReportRequest,
+)
+from exceptions.analytics_exceptions import InvalidAnalyticsRange
+from exceptions.export_exceptions import ExportNotFound, ExportNotReady, ExportTooLarge
+from exceptions.pagination_exceptions import InvalidPaginationToken
 
 from fastapi.responses import JSONResponse
 from botocore.exceptions import ClientError
@@ -195,6 +219,132 @@ def exceptions_decorator(func):
                 status_code=400,
             )
 
+        # Ticket exceptions
+        except TicketNotFound as exc:
+            return JSONResponse(
+                content={"error": {"code": "TICKET_NOT_FOUND", "message": str(exc)}},
+                status_code=404,
+            )
+        except InvalidTicketData as exc:
+            return JSONResponse(
+                content={"error": {"code": "INVALID_TICKET_DATA", "message": str(exc)}},
+                status_code=400,
+            )
+        except InvalidTicketStatusTransition as exc:
+            return JSONResponse(
+                content={
+                    "error": {
+                        "code": "INVALID_TICKET_STATUS_TRANSITION",
+                        "message": str(exc),
+                    }
+                },
+                status_code=409,
+            )
+        except TicketReopenWindowExpired as exc:
+            return JSONResponse(
+                content={
+                    "error": {
+                        "code": "TICKET_REOPEN_WINDOW_EXPIRED",
+                        "message": str(exc),
+                    }
+                },
+                status_code=409,
+            )
+        except TicketMoveNotFound as exc:
+            return JSONResponse(
+                content={
+                    "error": {"code": "TICKET_MOVE_NOT_FOUND", "message": str(exc)}
+                },
+                status_code=404,
+            )
+        except InvalidSearchQuery as exc:
+            return JSONResponse(
+                content={
+                    "error": {"code": "INVALID_SEARCH_QUERY", "message": str(exc)}
+                },
+                status_code=400,
+            )
+        except (TicketTitleTooLong, TicketDescriptionTooLong) as exc:
+            return JSONResponse(
+                content={
+                    "error": {"code": "INVALID_INPUT_LENGTH", "message": str(exc)}
+                },
+                status_code=400,
+            )
+
+        # Comment exceptions
+        except CommentNotFound as exc:
+            return JSONResponse(
+                content={"error": {"code": "COMMENT_NOT_FOUND", "message": str(exc)}},
+                status_code=404,
+            )
+        except InvalidCommentData as exc:
+            return JSONResponse(
+                content={
+                    "error": {"code": "INVALID_COMMENT_DATA", "message": str(exc)}
+                },
+                status_code=400,
+            )
+        except CommentPermissionDenied as exc:
+            return JSONResponse(
+                content={
+                    "error": {"code": "COMMENT_PERMISSION_DENIED", "message": str(exc)}
+                },
+                status_code=403,
+            )
+        except CommentBodyTooLong as exc:
+            return JSONResponse(
+                content={
+                    "error": {"code": "INVALID_INPUT_LENGTH", "message": str(exc)}
+                },
+                status_code=400,
+            )
+
+        # Report exceptions
+        except ReportNotFound as exc:
+            return JSONResponse(
+                content={"error": {"code": "REPORT_NOT_FOUND", "message": str(exc)}},
+                status_code=404,
+            )
+        except ReportNotReady as exc:
+            return JSONResponse(
+                content={"error": {"code": "REPORT_NOT_READY", "message": str(exc)}},
+                status_code=409,
+            )
+        except InvalidReportRequest as exc:
+            return JSONResponse(
+                content={
+                    "error": {"code": "INVALID_REPORT_REQUEST", "message": str(exc)}
+                },
+                status_code=400,
+            )
+
+        # Analytics exceptions
+        except InvalidAnalyticsRange as exc:
+            return JSONResponse(
+                content={
+                    "error": {"code": "INVALID_ANALYTICS_RANGE", "message": str(exc)}
+                },
+                status_code=400,
+            )
+
+        # Export exceptions
+        except ExportNotFound as exc:
+            return JSONResponse(
+                content={"error": {"code": "EXPORT_NOT_FOUND", "message": str(exc)}},
+                status_code=404,
+            )
+        except ExportNotReady as exc:
+            return JSONResponse(
+                content={"error": {"code": "EXPORT_NOT_READY", "message": str(exc)}},
+                status_code=409,
+            )
+        except ExportTooLarge as exc:
+            return JSONResponse(
+                content={"error": {"code": "EXPORT_TOO_LARGE", "message": str(exc)}},
+                status_code=413,
+            )
+
         # Membership exceptions
         except MembershipNotFound as exc:
             return JSONResponse(
@@ -267,6 +417,18 @@ def exceptions_decorator(func):
                 status_code=403,
             )
 
+        # Pagination exceptions
+        except InvalidPaginationToken as exc:
+            return JSONResponse(
+                content={
+                    "error": {
+                        "code": "INVALID_PAGINATION_TOKEN",
+                        "message": str(exc) or "Invalid pagination token.",
+                    }
+                },
+                status_code=400,
+            )
+
         # JWT exceptions
         except (InvalidJWTException, JWTSignatureException) as exc:
             return JSONResponse(
@@ -0,0 +1,16 @@
+"""Analytics-specific exceptions for the FamHelpDesk API."""
+
+
+class AnalyticsException(Exception):
+    """Base exception for analytics-related errors."""
+
+    def __init__(self, message: str = "Analytics operation failed"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class InvalidAnalyticsRange(AnalyticsException):
+    """Exception raised when an analytics date range is malformed or too long."""
+
+    def __init__(self, message: str = "Invalid analytics date range"):
+        super().__init__(message)
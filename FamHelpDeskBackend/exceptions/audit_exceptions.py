@@ -0,0 +1,6 @@
+class AuditArchiveVerificationFailed(Exception):
+    """Exception raised when an archived audit segment does not read back intact."""
+
+    def __init__(self, message: str = "Audit archive segment failed verification."):
+        self.message = message
+        super().__init__(self.message)
@@ -0,0 +1,30 @@
+"""Backup-specific exceptions for the FamHelpDesk admin tools."""
+
+
+class BackupException(Exception):
+    """Base exception for backup-related errors."""
+
+    def __init__(self, message: str = "Backup operation failed"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class BackupNotFound(BackupException):
+    """Exception raised when a backup location has no manifest."""
+
+    def __init__(self, message: str = "Backup not found"):
+        super().__init__(message)
+
+
+class BackupVerificationFailed(BackupException):
+    """Exception raised when a backup segment does not match its checksum."""
+
+    def __init__(self, message: str = "Backup segment failed verification"):
+        super().__init__(message)
+
+
+class BackupRestoreConflict(BackupException):
+    """Exception raised when restoring under a family ID that is already taken."""
+
+    def __init__(self, message: str = "Target family already exists"):
+        super().__init__(message)
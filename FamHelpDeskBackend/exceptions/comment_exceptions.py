@@ -0,0 +1,37 @@
+"""Comment-specific exceptions for the FamHelpDesk API."""
+
+
+class CommentException(Exception):
+    """Base exception for comment-related errors."""
+
+    def __init__(self, message: str = "Comment operation failed"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class CommentNotFound(CommentException):
+    """Exception raised when a comment is not found."""
+
+    def __init__(self, message: str = "Comment not found"):
+        super().__init__(message)
+
+
+class InvalidCommentData(CommentException):
+    """Exception raised when comment data is invalid."""
+
+    def __init__(self, message: str = "Invalid comment data provided"):
+        super().__init__(message)
+
+
+class CommentBodyTooLong(CommentException):
+    """Exception raised when a comment body exceeds maximum length."""
+
+    def __init__(self, max_length: int = 5000):
+        super().__init__(f"Comment cannot exceed {max_length} characters")
+
+
+class CommentPermissionDenied(CommentException):
+    """Exception raised when a user edits or deletes someone else's comment."""
+
+    def __init__(self, message: str = "Only the author can change this comment"):
+        super().__init__(message)
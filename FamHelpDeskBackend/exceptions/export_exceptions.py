@@ -0,0 +1,30 @@
+"""Export-specific exceptions for the FamHelpDesk API."""
+
+
+class ExportException(Exception):
+    """Base exception for export-related errors."""
+
+    def __init__(self, message: str = "Export operation failed"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class ExportNotFound(ExportException):
+    """Exception raised when an export job is not found."""
+
+    def __init__(self, message: str = "Export not found"):
+        super().__init__(message)
+
+
+class ExportNotReady(ExportException):
+    """Exception raised when downloading an export job that has not finished."""
+
+    def __init__(self, message: str = "Export has not finished yet"):
+        super().__init__(message)
+
+
+class ExportTooLarge(ExportException):
+    """Exception raised when a family is too large to export in one response."""
+
+    def __init__(self, message: str = "Family is too large to export directly"):
+        super().__init__(message)
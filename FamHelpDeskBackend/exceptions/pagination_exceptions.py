@@ -0,0 +1,6 @@
+class InvalidPaginationToken(Exception):
+    """Exception raised when a pagination token cannot be decoded."""
+
+    def __init__(self, message: str = "Invalid pagination token."):
+        self.message = message
+        super().__init__(self.message)
@@ -0,0 +1,30 @@
+"""Report-specific exceptions for the FamHelpDesk API."""
+
+
+class ReportException(Exception):
+    """Base exception for report-related errors."""
+
+    def __init__(self, message: str = "Report operation failed"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class ReportNotFound(ReportException):
+    """Exception raised when a report is not found."""
+
+    def __init__(self, message: str = "Report not found"):
+        super().__init__(message)
+
+
+class ReportNotReady(ReportException):
+    """Exception raised when downloading a report that has not been rendered."""
+
+    def __init__(self, message: str = "Report has not been rendered yet"):
+        super().__init__(message)
+
+
+class InvalidReportRequest(ReportException):
+    """Exception raised when a report request names the wrong targets."""
+
+    def __init__(self, message: str = "Invalid report request"):
+        super().__init__(message)
@@ -0,0 +1,65 @@
+"""Ticket-specific exceptions for the FamHelpDesk API."""
+
+
+class TicketException(Exception):
+    """Base exception for ticket-related errors."""
+
+    def __init__(self, message: str = "Ticket operation failed"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class TicketNotFound(TicketException):
+    """Exception raised when a ticket is not found."""
+
+    def __init__(self, message: str = "Ticket not found"):
+        super().__init__(message)
+
+
+class InvalidTicketData(TicketException):
+    """Exception raised when ticket data is invalid."""
+
+    def __init__(self, message: str = "Invalid ticket data provided"):
+        super().__init__(message)
+
+
+class TicketTitleTooLong(TicketException):
+    """Exception raised when ticket title exceeds maximum length."""
+
+    def __init__(self, max_length: int = 200):
+        super().__init__(f"Ticket title cannot exceed {max_length} characters")
+
+
+class TicketDescriptionTooLong(TicketException):
+    """Exception raised when ticket description exceeds maximum length."""
+
+    def __init__(self, max_length: int = 5000):
+        super().__init__(f"Ticket description cannot exceed {max_length} characters")
+
+
+class InvalidTicketStatusTransition(TicketException):
+    """Exception raised when a ticket cannot move to the requested status."""
+
+    def __init__(self, message: str = "Invalid ticket status transition"):
+        super().__init__(message)
+
+
+class TicketReopenWindowExpired(TicketException):
+    """Exception raised when reopening a ticket after its reopen window."""
+
+    def __init__(self, message: str = "Ticket can no longer be reopened"):
+        super().__init__(message)
+
+
+class InvalidSearchQuery(TicketException):
+    """Exception raised when a search query has no searchable terms."""
+
+    def __init__(self, message: str = "Search query has no searchable terms"):
+        super().__init__(message)
+
+
+class TicketMoveNotFound(TicketException):
+    """Exception raised when a bulk ticket move is not found."""
+
+    def __init__(self, message: str = "Ticket move not found"):
+        super().__init__(message)
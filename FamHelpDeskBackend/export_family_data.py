@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Run family data export jobs.
+
+Deployed as the export worker Lambda (handler below), which the API invokes
+asynchronously with {"family_id": ..., "export_id": ...} for every export
+job it creates. It can also run a job locally, e.g. to retry a FAILED one,
+or write a family's export straight to a local file. Export times and file
+sizes are published as CloudWatch metrics.
+
+Usage:
+    python3 export_family_data.py --family-id <id> --export-id <id>
+    python3 export_family_data.py --family-id <id> --output family.ndjson.gz
+"""
+
+import argparse
+import time
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.metrics import Metrics, MetricUnit
+
+from constants.metrics import (
+    API_METRICS_NAMESPACE,
+    EXPORT_WORKER_SERVICE,
+    EXPORTS_COMPLETED,
+    EXPORT_FAILURES,
+    EXPORT_SECONDS,
+    EXPORT_BYTES,
+)
+from helpers.family_export_helper import FamilyExportHelper
+from models.export import ExportModel, ExportStatus
+
+logger = Logger(service=EXPORT_WORKER_SERVICE)
+
+
+def run_export(family_id: str, export_id: str) -> dict:
+    """
+    Run one export job and publish its metrics.
+
+    Returns:
+        The export as returned by the API, with its final status
+    """
+    started = time.monotonic()
+    export = FamilyExportHelper().run_export(family_id, export_id)
+    elapsed = time.monotonic() - started
+
+    metrics = Metrics(namespace=API_METRICS_NAMESPACE, service=EXPORT_WORKER_SERVICE)
+    if export.status == ExportStatus.READY.value:
+        metrics.add_metric(name=EXPORTS_COMPLETED, unit=MetricUnit.Count, value=1)
+        metrics.add_metric(
+            name=EXPORT_BYTES, unit=MetricUnit.Bytes, value=export.size_bytes or 0
+        )
+    else:
+        metrics.add_metric(name=EXPORT_FAILURES, unit=MetricUnit.Count, value=1)
+    metrics.add_metric(name=EXPORT_SECONDS, unit=MetricUnit.Seconds, value=elapsed)
+    metrics.flush_metrics()
+
+    return ExportModel.clean_returned_export(export)
+
+
+def write_export(family_id: str, output: str) -> int:
+    """Write a family's export to a local file, gzipped if it ends in .gz."""
+    size = 0
+    with open(output, "wb") as f:
+        for chunk in FamilyExportHelper().iter_ndjson(
+            family_id, compress=output.endswith(".gz")
+        ):
+            f.write(chunk)
+            size += len(chunk)
+    return size
+
+
+def handler(event, context):
+    return run_export(event["family_id"], event["export_id"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a family data export")
+    parser.add_argument("--family-id", required=True, help="Family ID")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--export-id", help="Export job to run")
+    target.add_argument("--output", help="Write the export to this file instead")
+    args = parser.parse_args()
+
+    if args.output:
+        size = write_export(args.family_id, args.output)
+        print(f"Wrote {size} bytes to {args.output}")
+    else:
+        result = run_export(args.family_id, args.export_id)
+        print(
+            f"Export {result['export_id']} is {result['status']}"
+            + (f": {result['error']}" if result.get("error") else "")
+        )
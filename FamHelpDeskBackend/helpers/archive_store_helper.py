@@ -0,0 +1,139 @@
+"""
+Storage for compressed NDJSON segments and other generated files.
+
+A store is addressed by URI: "s3://bucket/prefix" writes to S3, anything
+else is treated as a local directory (the object-store stand-in used in
+development and tests).
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+from typing import Any, Dict, Iterable, Iterator, Optional
+from urllib.parse import urlparse
+
+
+class LocalArchiveStore:
+    """Archive store backed by a local directory."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def put(self, key: str, data: bytes) -> None:
+        path = os.path.join(self.root, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temp file first so readers never see a partial object
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = os.path.join(self.root, key)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+
+    def put_file(self, key: str, file_path: str) -> None:
+        path = os.path.join(self.root, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        shutil.copyfile(file_path, tmp_path)
+        os.replace(tmp_path, path)
+
+    def iter_chunks(self, key: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        with open(os.path.join(self.root, key), "rb") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(os.path.join(self.root, key))
+
+    def get_download_url(self, key: str, expires_in: int) -> Optional[str]:
+        # Local files are served by the API itself
+        return None
+
+    def __repr__(self) -> str:
+        return f"LocalArchiveStore({self.root})"
+
+
+class S3ArchiveStore:
+    """Archive store backed by an S3 bucket and key prefix."""
+
+    def __init__(self, bucket: str, prefix: str = ""):
+        import boto3
+
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.client = boto3.client("s3")
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    def put(self, key: str, data: bytes) -> None:
+        self.client.put_object(Bucket=self.bucket, Key=self._key(key), Body=data)
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self._key(key))
+        except self.client.exceptions.NoSuchKey:
+            return None
+        return response["Body"].read()
+
+    def put_file(self, key: str, file_path: str) -> None:
+        # Multipart for large files, read from disk a part at a time
+        self.client.upload_file(file_path, self.bucket, self._key(key))
+
+    def iter_chunks(self, key: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        response = self.client.get_object(Bucket=self.bucket, Key=self._key(key))
+        yield from response["Body"].iter_chunks(chunk_size)
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._key(key))
+        except self.client.exceptions.ClientError:
+            return False
+        return True
+
+    def get_download_url(self, key: str, expires_in: int) -> Optional[str]:
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": self._key(key)},
+            ExpiresIn=expires_in,
+        )
+
+    def __repr__(self) -> str:
+        return f"S3ArchiveStore(s3://{self.bucket}/{self.prefix})"
+
+
+def get_archive_store(uri: Optional[str]):
+    """Return the store for a URI, or None when no URI is configured."""
+    if not uri:
+        return None
+    parsed = urlparse(uri)
+    if parsed.scheme == "s3":
+        return S3ArchiveStore(parsed.netloc, parsed.path)
+    return LocalArchiveStore(uri)
+
+
+def encode_ndjson_segment(items: Iterable[Dict[str, Any]]) -> bytes:
+    """Serialize items as gzip-compressed newline-delimited JSON."""
+    lines = (json.dumps(item, separators=(",", ":")) for item in items)
+    return gzip.compress("\n".join(lines).encode("utf-8"))
+
+
+def decode_ndjson_segment(data: bytes) -> Iterator[Dict[str, Any]]:
+    """Yield the items of a segment produced by encode_ndjson_segment."""
+    for line in gzip.decompress(data).decode("utf-8").splitlines():
+        if line:
+            yield json.loads(line)
+
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
@@ -0,0 +1,392 @@
+"""
+Cold-tier archival of family audit records.
+
+Records older than a cutoff are written to gzip-compressed NDJSON segments,
+one raw DynamoDB item per line, under:
+
+    audit/{family_id}/segment-{n}-{min_time}-{max_time}.ndjson.gz
+    audit/{family_id}/manifest.json
+
+The manifest lists every segment with its time range, record count and
+sha256, plus "archived_before": every record older than it has left the
+table. A segment is added to the manifest only after it has been read back
+and verified, and hot items are deleted only after the manifest is written.
+"""
+
+import copy
+import json
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from aws_lambda_powertools import Logger
+
+from constants.audit import (
+    AUDIT_ARCHIVE_URI,
+    AUDIT_ARCHIVE_SEGMENT_SIZE,
+    AUDIT_ARCHIVE_MANIFEST_TTL_SECONDS,
+)
+from exceptions.audit_exceptions import AuditArchiveVerificationFailed
+from helpers.archive_store_helper import (
+    get_archive_store,
+    encode_ndjson_segment,
+    decode_ndjson_segment,
+    sha256_hex,
+)
+from models.audit import AuditModel
+
+# Shared by every helper in a warm container, so requests neither create
+# their own S3 client nor refetch manifests: archive URI -> store, and
+# (archive URI, family_id) -> (monotonic fetch time, manifest or None)
+_stores: Dict[str, Any] = {}
+_manifests: Dict[Tuple[str, str], Tuple[float, Optional[dict]]] = {}
+_stores_lock = threading.Lock()
+
+
+class AuditArchiveHelper:
+    def __init__(self, request_id: str = None, archive_uri: Optional[str] = None):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+        self.archive_uri = archive_uri if archive_uri is not None else AUDIT_ARCHIVE_URI
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.archive_uri)
+
+    @property
+    def store(self):
+        """The archive store, created on first use and then reused."""
+        if not self.enabled:
+            return None
+        with _stores_lock:
+            if self.archive_uri not in _stores:
+                _stores[self.archive_uri] = get_archive_store(self.archive_uri)
+            return _stores[self.archive_uri]
+
+    @staticmethod
+    def create_manifest_key(family_id: str) -> str:
+        return f"audit/{family_id}/manifest.json"
+
+    @staticmethod
+    def create_segment_key(
+        family_id: str, number: int, min_time: int, max_time: int
+    ) -> str:
+        return f"audit/{family_id}/segment-{number:06d}-{min_time}-{max_time}.ndjson.gz"
+
+    def get_manifest(self, family_id: str) -> Optional[dict]:
+        """
+        Return the family's archive manifest, or None if nothing is archived.
+        The manifest is shared with other callers and must not be modified.
+        """
+        if not self.enabled:
+            return None
+        cache_key = (self.archive_uri, family_id)
+        cached = _manifests.get(cache_key)
+        now = time.monotonic()
+        if cached is None or now - cached[0] >= AUDIT_ARCHIVE_MANIFEST_TTL_SECONDS:
+            data = self.store.get(self.create_manifest_key(family_id))
+            cached = (now, json.loads(data) if data else None)
+            _manifests[cache_key] = cached
+        return cached[1]
+
+    def _get_manifest_for_update(self, family_id: str) -> dict:
+        manifest = self.get_manifest(family_id)
+        return copy.deepcopy(manifest) if manifest else self._new_manifest(family_id)
+
+    def _put_manifest(self, family_id: str, manifest: dict) -> None:
+        self.store.put(
+            self.create_manifest_key(family_id),
+            json.dumps(manifest, indent=2).encode("utf-8"),
+        )
+        _manifests[(self.archive_uri, family_id)] = (time.monotonic(), manifest)
+
+    def has_records(
+        self, family_id: str, since: Optional[int] = None, until: Optional[int] = None
+    ) -> bool:
+        """Whether any archived segment overlaps the time range."""
+        return bool(self._overlapping_segments(family_id, since, until))
+
+    def _overlapping_segments(
+        self, family_id: str, since: Optional[int], until: Optional[int]
+    ) -> List[dict]:
+        manifest = self.get_manifest(family_id)
+        if not manifest:
+            return []
+        until = self._clamp_until(manifest, until)
+        return [
+            segment
+            for segment in manifest["segments"]
+            if (since is None or segment["max_time"] >= since)
+            and (until is None or segment["min_time"] <= until)
+        ]
+
+    # Archival
+    def archive_family(
+        self,
+        family_id: str,
+        cutoff: int,
+        segment_size: int = AUDIT_ARCHIVE_SEGMENT_SIZE,
+        dry_run: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Move a family's audit records older than the cutoff to the archive.
+
+        Args:
+            family_id: The family whose audit records to archive
+            cutoff: Records with a time strictly before this epoch are archived
+            segment_size: Maximum records per segment
+            dry_run: Only count the records that would be archived
+
+        Returns:
+            Dict with the number of archived records, segments and bytes written
+        """
+        if not self.enabled:
+            raise ValueError("No audit archive store is configured.")
+
+        stats = {"records": 0, "segments": 0, "bytes": 0}
+        batch: List[AuditModel] = []
+        for record in AuditModel.family_audit_index.query(
+            family_id,
+            range_key_condition=AuditModel.time < cutoff,
+            scan_index_forward=True,
+        ):
+            batch.append(record)
+            if len(batch) >= segment_size:
+                self._archive_segment(family_id, batch, stats, dry_run)
+                batch = []
+        if batch:
+            self._archive_segment(family_id, batch, stats, dry_run)
+
+        if not dry_run:
+            manifest = self._get_manifest_for_update(family_id)
+            manifest["archived_before"] = max(manifest["archived_before"], cutoff)
+            self._put_manifest(family_id, manifest)
+
+        self.logger.info(
+            f"{'Would archive' if dry_run else 'Archived'} {stats['records']} audit "
+            f"records for family {family_id} in {stats['segments']} segments "
+            f"({stats['bytes']} bytes)"
+        )
+        return stats
+
+    def _archive_segment(
+        self,
+        family_id: str,
+        records: List[AuditModel],
+        stats: Dict[str, int],
+        dry_run: bool,
+    ) -> None:
+        items = [record.serialize() for record in records]
+        data = encode_ndjson_segment(items)
+        stats["records"] += len(records)
+        stats["segments"] += 1
+        stats["bytes"] += len(data)
+        if dry_run:
+            return
+
+        manifest = self._get_manifest_for_update(family_id)
+        min_time = min(record.time for record in records)
+        max_time = max(record.time for record in records)
+        key = self.create_segment_key(
+            family_id, len(manifest["segments"]), min_time, max_time
+        )
+        checksum = sha256_hex(data)
+
+        self.store.put(key, data)
+        self._verify_segment(key, checksum, len(items))
+
+        manifest["segments"].append(
+            {
+                "key": key,
+                "min_time": min_time,
+                "max_time": max_time,
+                "count": len(items),
+                "sha256": checksum,
+            }
+        )
+        self._put_manifest(family_id, manifest)
+
+        # Only now is it safe to drop the hot copies
+        with AuditModel.batch_write() as batch:
+            for record in records:
+                batch.delete(record)
+
+    def restore_family_archive(
+        self, family_id: str, archived_before: int, segments: Iterable[List[dict]]
+    ) -> int:
+        """
+        Replace a family's archive with segments of raw audit items, as
+        restored from a backup. Each segment is verified once written and
+        the manifest is written last, so a failed restore leaves the old
+        manifest in place.
+
+        Returns:
+            The number of records written
+        """
+        if not self.enabled:
+            raise ValueError("No audit archive store is configured.")
+
+        manifest = self._new_manifest(family_id)
+        records = 0
+        for items in segments:
+            data = encode_ndjson_segment(items)
+            times = [int(item["time"]["N"]) for item in items]
+            key = self.create_segment_key(
+                family_id, len(manifest["segments"]), min(times), max(times)
+            )
+            checksum = sha256_hex(data)
+            self.store.put(key, data)
+            self._verify_segment(key, checksum, len(items))
+            manifest["segments"].append(
+                {
+                    "key": key,
+                    "min_time": min(times),
+                    "max_time": max(times),
+                    "count": len(items),
+                    "sha256": checksum,
+                }
+            )
+            records += len(items)
+
+        manifest["archived_before"] = archived_before
+        self._put_manifest(family_id, manifest)
+        self.logger.info(
+            f"Restored {records} archived audit records for family {family_id} "
+            f"in {len(manifest['segments'])} segments"
+        )
+        return records
+
+    def get_segment_data(self, segment: dict) -> bytes:
+        """A segment's compressed data, verified against its manifest checksum."""
+        data = self.store.get(segment["key"])
+        if data is None or sha256_hex(data) != segment["sha256"]:
+            raise AuditArchiveVerificationFailed(
+                f"Segment {segment['key']} failed checksum check."
+            )
+        return data
+
+    def _verify_segment(self, key: str, checksum: str, count: int) -> None:
+        data = self.store.get(key)
+        if data is None or sha256_hex(data) != checksum:
+            raise AuditArchiveVerificationFailed(
+                f"Segment {key} failed checksum check."
+            )
+        if sum(1 for _ in decode_ndjson_segment(data)) != count:
+            raise AuditArchiveVerificationFailed(f"Segment {key} has the wrong count.")
+
+    @staticmethod
+    def _clamp_until(manifest: dict, until: Optional[int]) -> int:
+        # Segments of an interrupted run may still have hot copies; only
+        # records before archived_before are served from the archive.
+        archived_until = manifest["archived_before"] - 1
+        return archived_until if until is None else min(until, archived_until)
+
+    @staticmethod
+    def _new_manifest(family_id: str) -> dict:
+        return {"family_id": family_id, "archived_before": 0, "segments": []}
+
+    # Reads
+    def iter_family_records(
+        self,
+        family_id: str,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        sk_prefix: Optional[str] = None,
+    ) -> Iterator[AuditModel]:
+        """
+        Yield archived audit records of a family in the time range (inclusive),
+        optionally restricted to sort keys starting with sk_prefix. Records are
+        in archive order; a record archived twice by an interrupted run is
+        yielded once.
+        """
+        manifest = self.get_manifest(family_id)
+        if not manifest:
+            return
+        until = self._clamp_until(manifest, until)
+        seen = set()
+        for segment in self._overlapping_segments(family_id, since, until):
+            for record in self._read_segment(segment, since, until, sk_prefix):
+                if record.sk not in seen:
+                    seen.add(record.sk)
+                    yield record
+
+    def get_page(
+        self,
+        family_id: str,
+        limit: int,
+        position: Optional[Dict[str, Any]] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        sk_prefix: Optional[str] = None,
+    ) -> Tuple[List[AuditModel], bool]:
+        """
+        Up to limit archived records in the range that come after a cursor
+        position, newest first (ties by sort key), and whether more follow.
+
+        Segments are read newest first, starting at the one holding the
+        position, and reading stops once no older segment can hold a
+        record of the page.
+        """
+        manifest = self.get_manifest(family_id)
+        if not manifest:
+            return [], False
+        until = self._clamp_until(manifest, until)
+        if position:
+            until = min(until, position["time"])
+        segments = sorted(
+            self._overlapping_segments(family_id, since, until),
+            key=lambda segment: segment["max_time"],
+            reverse=True,
+        )
+
+        found: Dict[str, AuditModel] = {}
+        for segment in segments:
+            if len(found) > limit:
+                # The first record past the page; anything older is not needed
+                boundary = self._newest_first(found.values())[limit]
+                if segment["max_time"] < boundary.time:
+                    break
+            for record in self._read_segment(segment, since, until, sk_prefix):
+                if self.is_after(record, position):
+                    found.setdefault(record.sk, record)
+
+        records = self._newest_first(found.values())
+        return records[:limit], len(records) > limit
+
+    def _read_segment(
+        self,
+        segment: dict,
+        since: Optional[int],
+        until: Optional[int],
+        sk_prefix: Optional[str],
+    ) -> Iterator[AuditModel]:
+        """Yield a segment's records in the time range and under sk_prefix."""
+        data = self.store.get(segment["key"])
+        if data is None:
+            self.logger.warning(f"Archived segment {segment['key']} is missing")
+            return
+        for item in decode_ndjson_segment(data):
+            if sk_prefix and not item["sk"]["S"].startswith(sk_prefix):
+                continue
+            record_time = int(item["time"]["N"])
+            if (since is not None and record_time < since) or (
+                until is not None and record_time > until
+            ):
+                continue
+            yield AuditModel.from_raw_data(item)
+
+    @staticmethod
+    def _newest_first(records) -> List[AuditModel]:
+        return sorted(records, key=lambda r: (r.time, r.sk), reverse=True)
+
+    @staticmethod
+    def position(record: AuditModel) -> Dict[str, Any]:
+        """Cursor position of a record within newest-first archive order."""
+        return {"time": record.time, "sk": record.sk}
+
+    @staticmethod
+    def is_after(record: AuditModel, position: Optional[Dict[str, Any]]) -> bool:
+        """Whether a record comes after a cursor position in newest-first order."""
+        if not position:
+            return True
+        return (record.time, record.sk) < (position["time"], position["sk"])
@@ -1,8 +1,19 @@
+from constants.audit import AUDIT_UNTRACKED_FIELDS, AUDIT_SAVE_MAX_ATTEMPTS
 from models.audit import AuditModel, AuditActions, AuditEntityTypes
+from helpers.audit_archive_helper import AuditArchiveHelper
+from helpers.audit_encoding_helper import (
+    encode_update,
+    apply_changes,
+    revert_changes,
+    state_checksum,
+)
 from typing import List, Dict, Any, Optional, Tuple
-from pynamodb.exceptions import DoesNotExist
+from pynamodb.exceptions import DoesNotExist, PutError
 from aws_lambda_powertools import Logger
-import time
+
+# Pagination keys that continue into archived records carry this field
+# instead of a DynamoDB LastEvaluatedKey
+ARCHIVE_CURSOR = "archive_cursor"
 
 
 class AuditHelper:
@@ -10,6 +21,7 @@ class AuditHelper:
         self.logger = Logger()
         if request_id:
             self.logger.append_keys(request_id=request_id)
+        self.archive_helper = AuditArchiveHelper(request_id=request_id)
 
     # Family-based audit methods
     def create_family_audit_record(
@@ -37,7 +49,33 @@ class AuditHelper:
         Returns:
             AuditModel: The created audit record
         """
-        timestamp = int(time.time())
+        audit_record = self.build_family_audit_record(
+            family_id, entity_type, entity_id, action, actor_user_id, before, after
+        )
+        self._save_new_record(audit_record)
+
+        self.logger.info(
+            f"Created family audit record for {entity_type.value} {entity_id} "
+            f"action {action.value} by user {actor_user_id}"
+        )
+
+        return audit_record
+
+    def build_family_audit_record(
+        self,
+        family_id: str,
+        entity_type: AuditEntityTypes,
+        entity_id: str,
+        action: AuditActions,
+        actor_user_id: str,
+        before: Optional[Dict[str, Any]] = None,
+        after: Optional[Dict[str, Any]] = None,
+    ) -> AuditModel:
+        """
+        Build an unsaved audit record, for bulk writers that save many with
+        one batch write. Takes the same arguments as create_family_audit_record.
+        """
+        timestamp = AuditModel.now_epoch_ms()
 
         audit_record = AuditModel(
             pk=AuditModel.create_pk(family_id),
@@ -49,21 +87,10 @@ class AuditHelper:
             entity_id=entity_id,
             action=action.value,
             actor_user_id=actor_user_id,
-            time=timestamp,
-        )
-
-        if before:
-            audit_record.before = before
-        if after:
-            audit_record.after = after
-
-        audit_record.save()
-
-        self.logger.info(
-            f"Created family audit record for {entity_type.value} {entity_id} "
-            f"action {action.value} by user {actor_user_id}"
+            time=timestamp // 1000,
         )
 
+        self._set_payload(audit_record, action, before, after)
         return audit_record
 
     def get_family_audit_record(
@@ -81,7 +108,8 @@ class AuditHelper:
             family_id: The family ID
             entity_type: Type of entity
             entity_id: Unique identifier of the entity
-            timestamp: The timestamp of the audit record
+            timestamp: The timestamp of the audit record's sort key (epoch
+                milliseconds, or seconds for records written before those)
             action: The action that was performed
 
         Returns:
@@ -102,45 +130,389 @@ class AuditHelper:
             return None
 
     def get_all_family_audit_records(
-        self, family_id: str, limit: int = 50, last_evaluated_key: Optional[Dict] = None
+        self,
+        family_id: str,
+        limit: int = 50,
+        last_evaluated_key: Optional[Dict] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
     ) -> Tuple[List[AuditModel], Optional[Dict]]:
         """
-        Get all audit records for a family with pagination.
+        Get audit records for a family across all entities, newest first.
+        Once the table is exhausted, older records continue from the archive.
 
         Args:
             family_id: The family ID to get audit records for
             limit: Maximum number of records to return (default: 50)
             last_evaluated_key: Pagination key from previous query
+            since: Optional inclusive lower bound on the audit time (epoch seconds)
+            until: Optional inclusive upper bound on the audit time (epoch seconds)
 
         Returns:
             Tuple[List[AuditModel], Optional[Dict]]: Records and next pagination key
         """
-        try:
-            query_kwargs = {
-                "scan_index_forward": False,  # Get most recent first
-                "limit": limit,
-            }
+        if last_evaluated_key and ARCHIVE_CURSOR in last_evaluated_key:
+            return self._fill_from_archive(
+                family_id, [], limit, since, until, None, last_evaluated_key
+            )
 
-            if last_evaluated_key:
-                query_kwargs["last_evaluated_key"] = last_evaluated_key
+        query_kwargs = {
+            "scan_index_forward": False,  # Get most recent first
+            "limit": limit,
+        }
 
-            response = AuditModel.query(AuditModel.create_pk(family_id), **query_kwargs)
+        if last_evaluated_key:
+            query_kwargs["last_evaluated_key"] = last_evaluated_key
 
+        time_condition = self._time_condition(since, until)
+        try:
+            response = AuditModel.family_audit_index.query(
+                family_id, range_key_condition=time_condition, **query_kwargs
+            )
             records = list(response)
-            next_key = (
-                response.last_evaluated_key
-                if hasattr(response, "last_evaluated_key")
-                else None
+        except Exception as e:
+            # Fall back to the audit prefix of the family partition. Results are
+            # ordered by entity rather than by time on this path.
+            self.logger.warning(
+                f"GSI query failed, falling back to partition query: {str(e)}"
             )
-
-            self.logger.info(
-                f"Retrieved {len(records)} audit records for family {family_id}"
+            response = AuditModel.query(
+                AuditModel.create_pk(family_id),
+                AuditModel.sk.startswith("AUDIT#"),
+                filter_condition=time_condition,
+                **query_kwargs,
             )
+            records = list(response)
+
+        next_key = response.last_evaluated_key
+
+        self.logger.info(
+            f"Retrieved {len(records)} audit records for family {family_id}"
+        )
+        if next_key:
             return records, next_key
+        return self._fill_from_archive(family_id, records, limit, since, until)
 
-        except DoesNotExist:
-            self.logger.info(f"No audit records found for family {family_id}")
-            return [], None
+    def get_entity_audit_records(
+        self,
+        family_id: str,
+        entity_type: AuditEntityTypes,
+        entity_id: str,
+        limit: int = 50,
+        last_evaluated_key: Optional[Dict] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+    ) -> Tuple[List[AuditModel], Optional[Dict]]:
+        """
+        Get the audit history of a single entity, newest first. Once the
+        table is exhausted, older records continue from the archive.
+
+        Args:
+            family_id: The family ID the entity belongs to
+            entity_type: Type of entity
+            entity_id: Unique identifier of the entity
+            limit: Maximum number of records to return (default: 50)
+            last_evaluated_key: Pagination key from previous query
+            since: Optional inclusive lower bound on the audit time (epoch seconds)
+            until: Optional inclusive upper bound on the audit time (epoch seconds)
+
+        Returns:
+            Tuple[List[AuditModel], Optional[Dict]]: Records and next pagination key
+        """
+        prefix = AuditModel.create_entity_sk_prefix(entity_type.value, entity_id)
+
+        if last_evaluated_key and ARCHIVE_CURSOR in last_evaluated_key:
+            return self._fill_from_archive(
+                family_id, [], limit, since, until, prefix, last_evaluated_key
+            )
+
+        # Epoch seconds stay 10 digits wide until 2286, so the timestamp in the
+        # sort key orders the same lexically as numerically.
+        if since is None and until is None:
+            range_key_condition = AuditModel.sk.startswith(prefix)
+        else:
+            lower = f"{prefix}{since}" if since is not None else prefix
+            upper = f"{prefix}{until}#~" if until is not None else f"{prefix}~"
+            range_key_condition = AuditModel.sk.between(lower, upper)
+
+        query_kwargs = {
+            "scan_index_forward": False,  # Get most recent first
+            "limit": limit,
+        }
+
+        if last_evaluated_key:
+            query_kwargs["last_evaluated_key"] = last_evaluated_key
+
+        response = AuditModel.query(
+            AuditModel.create_pk(family_id), range_key_condition, **query_kwargs
+        )
+        records = list(response)
+
+        self.logger.info(
+            f"Retrieved {len(records)} audit records for {entity_type.value} "
+            f"{entity_id} in family {family_id}"
+        )
+        if response.last_evaluated_key:
+            return records, response.last_evaluated_key
+        return self._fill_from_archive(family_id, records, limit, since, until, prefix)
+
+    def _fill_from_archive(
+        self,
+        family_id: str,
+        records: List[AuditModel],
+        limit: int,
+        since: Optional[int],
+        until: Optional[int],
+        sk_prefix: Optional[str] = None,
+        last_evaluated_key: Optional[Dict] = None,
+    ) -> Tuple[List[AuditModel], Optional[Dict]]:
+        """
+        Complete a page whose table results are exhausted with archived
+        records (newest first) and return the archive cursor for the rest.
+        """
+        if not self.archive_helper.has_records(family_id, since, until):
+            return records, None
+
+        position = (last_evaluated_key or {}).get(ARCHIVE_CURSOR)
+        remaining = limit - len(records)
+        if remaining <= 0:
+            return records, {ARCHIVE_CURSOR: {}}
+
+        page, has_more = self.archive_helper.get_page(
+            family_id, remaining, position, since, until, sk_prefix
+        )
+        next_key = None
+        if has_more:
+            next_key = {ARCHIVE_CURSOR: AuditArchiveHelper.position(page[-1])}
+
+        self.logger.info(
+            f"Retrieved {len(page)} archived audit records for family {family_id}"
+        )
+        return records + page, next_key
+
+    def get_audit_records_by_actor(
+        self,
+        user_id: str,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        limit: int = 50,
+        cursor: Optional[Dict] = None,
+    ) -> Tuple[List[AuditModel], Optional[Dict]]:
+        """
+        Get every audit record a user performed, across all families, newest first.
+
+        Args:
+            user_id: The actor user ID
+            since: Optional inclusive lower bound on the audit time (epoch seconds)
+            until: Optional inclusive upper bound on the audit time (epoch seconds)
+            limit: Maximum number of records to return (default: 50)
+            cursor: Pagination key from previous query
+
+        Returns:
+            Tuple[List[AuditModel], Optional[Dict]]: Records and next pagination key
+        """
+        query_kwargs = {
+            "scan_index_forward": False,  # Get most recent first
+            "limit": limit,
+        }
+
+        if cursor:
+            query_kwargs["last_evaluated_key"] = cursor
+
+        response = AuditModel.actor_audit_index.query(
+            user_id,
+            range_key_condition=self._time_condition(since, until),
+            **query_kwargs,
+        )
+        records = list(response)
+
+        self.logger.info(f"Retrieved {len(records)} audit records by actor {user_id}")
+        return records, response.last_evaluated_key
+
+    def reconstruct_audit_records(
+        self, records: List[AuditModel]
+    ) -> List[Dict[str, Any]]:
+        """
+        Return cleaned audit records with full before/after views.
+
+        Delta-encoded records are rebuilt by replaying their entity's audit
+        history (one query per distinct entity, plus its archived records when
+        the history reaches into the archive) and checked against the
+        stored checksum. Rebuilt records carry "verified"; it is False when
+        the history has gaps and only the changed fields could be recovered.
+
+        Args:
+            records: Audit records as returned by the query methods
+
+        Returns:
+            List of audit dicts in the same order as the input records
+        """
+        # Latest time needed per entity whose history must be replayed
+        replay_until: Dict[Tuple[str, str, str], int] = {}
+        for record in records:
+            if AuditModel.is_delta_encoded(record):
+                key = (record.pk, record.entity_type, record.entity_id)
+                replay_until[key] = max(replay_until.get(key, 0), record.time)
+
+        views: Dict[Tuple[str, str], Tuple[Any, Any, bool]] = {}
+        for (pk, entity_type, entity_id), until in replay_until.items():
+            prefix = AuditModel.create_entity_sk_prefix(entity_type, entity_id)
+            # Every key of a time up to `until` sorts below the next second,
+            # whether it carries seconds or milliseconds
+            history = list(
+                AuditModel.query(
+                    pk,
+                    AuditModel.sk.between(prefix, f"{prefix}{until + 1}"),
+                    scan_index_forward=True,
+                )
+            )
+            family_id = pk.split("#", 1)[1]
+            if pk == AuditModel.create_pk(family_id):
+                history = self._merge_archived_history(
+                    family_id, prefix, until, history
+                )
+            for sk, view in self._replay_history(history).items():
+                views[(pk, sk)] = view
+
+        results = []
+        for record in records:
+            data = AuditModel.clean_returned_audit(record)
+            view = views.get((record.pk, record.sk))
+            if view is not None:
+                before, after, verified = view
+                data["before"] = before
+                data["after"] = after
+                data["verified"] = verified
+            results.append(data)
+
+        self.logger.info(
+            f"Reconstructed {len(records)} audit records from "
+            f"{len(replay_until)} entity histories"
+        )
+        return results
+
+    def _merge_archived_history(
+        self, family_id: str, prefix: str, until: int, history: List[AuditModel]
+    ) -> List[AuditModel]:
+        """Prepend an entity's archived records to its hot history."""
+        if not self.archive_helper.has_records(family_id, until=until):
+            return history
+        hot_sks = {record.sk for record in history}
+        archived = [
+            record
+            for record in self.archive_helper.iter_family_records(
+                family_id, until=until, sk_prefix=prefix
+            )
+            if record.sk not in hot_sks
+        ]
+        return sorted(archived + history, key=lambda record: record.sk)
+
+    @staticmethod
+    def _replay_history(history) -> Dict[str, Tuple[Any, Any, bool]]:
+        """Replay an entity's audit records (oldest first) into full views."""
+        views = {}
+        state = None
+        for record in history:
+            if AuditModel.is_delta_encoded(record):
+                changes = AuditHelper._drop_untracked(
+                    record.entity_type,
+                    record.changes.as_dict() if record.changes else {},
+                )
+                if state is None:
+                    # No anchor (history starts with a delta): only the
+                    # changed fields can be recovered
+                    before = revert_changes({}, changes)
+                    after = apply_changes({}, changes)
+                    verified = False
+                else:
+                    before = state
+                    after = apply_changes(state, changes)
+                    verified = state_checksum(after) == record.checksum
+                views[record.sk] = (before, after, verified)
+                state = after
+            else:
+                state = (
+                    AuditHelper._drop_untracked(
+                        record.entity_type, record.after.as_dict()
+                    )
+                    if record.after
+                    else None
+                )
+        return views
+
+    @staticmethod
+    def _drop_untracked(
+        entity_type: str, data: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        An entity state or change set without the entity type's untracked
+        fields (records written before a field was untracked may have them).
+        """
+        untracked = AUDIT_UNTRACKED_FIELDS.get(entity_type)
+        if not data or not untracked:
+            return data
+        return {field: value for field, value in data.items() if field not in untracked}
+
+    @staticmethod
+    def _save_new_record(audit_record: AuditModel) -> None:
+        """
+        Save a new audit record without overwriting another of the same key.
+        When two writes of an entity land in the same millisecond, the later
+        one moves to the next free millisecond, keeping them in write order.
+        """
+        timestamp = int(audit_record.sk.split("#TS#", 1)[1].split("#", 1)[0])
+        for attempt in range(AUDIT_SAVE_MAX_ATTEMPTS):
+            try:
+                audit_record.save(condition=AuditModel.sk.does_not_exist())
+                return
+            except PutError as e:
+                if (
+                    e.cause_response_code != "ConditionalCheckFailedException"
+                    or attempt == AUDIT_SAVE_MAX_ATTEMPTS - 1
+                ):
+                    raise
+            timestamp += 1
+            audit_record.sk = AuditModel.create_sk(
+                audit_record.entity_type,
+                audit_record.entity_id,
+                timestamp,
+                audit_record.action,
+            )
+
+    @staticmethod
+    def _set_payload(
+        audit_record: AuditModel,
+        action: AuditActions,
+        before: Optional[Dict[str, Any]],
+        after: Optional[Dict[str, Any]],
+    ) -> None:
+        """
+        Store full snapshots for CREATE/DELETE and only changes for UPDATE,
+        leaving out the entity type's untracked fields.
+        """
+        before = AuditHelper._drop_untracked(audit_record.entity_type, before)
+        after = AuditHelper._drop_untracked(audit_record.entity_type, after)
+        if action == AuditActions.UPDATE and before and after:
+            payload = encode_update(before, after)
+            audit_record.encoding = payload["encoding"]
+            audit_record.changes = payload["changes"]
+            audit_record.checksum = payload["checksum"]
+            return
+
+        if before:
+            audit_record.before = before
+        if after:
+            audit_record.after = after
+
+    @staticmethod
+    def _time_condition(since: Optional[int], until: Optional[int]):
+        if since is not None and until is not None:
+            return AuditModel.time.between(since, until)
+        if since is not None:
+            return AuditModel.time >= since
+        if until is not None:
+            return AuditModel.time <= until
+        return None
 
     # User profile audit methods
     def create_user_audit_record(
@@ -162,7 +534,7 @@ class AuditHelper:
         Returns:
             AuditModel: The created audit record
         """
-        timestamp = int(time.time())
+        timestamp = AuditModel.now_epoch_ms()
 
         audit_record = AuditModel(
             pk=AuditModel.create_user_profile_pk(user_id),
@@ -173,15 +545,12 @@ class AuditHelper:
             entity_id=user_id,
             action=action.value,
             actor_user_id=user_id,
-            time=timestamp,
+            time=timestamp // 1000,
         )
 
-        if before:
-            audit_record.before = before
-        if after:
-            audit_record.after = after
+        self._set_payload(audit_record, action, before, after)
 
-        audit_record.save()
+        self._save_new_record(audit_record)
 
         self.logger.info(
             f"Created user audit record for user {user_id} " f"action {action.value}"
@@ -197,7 +566,8 @@ class AuditHelper:
 
         Args:
             user_id: The user ID
-            timestamp: The timestamp of the audit record
+            timestamp: The timestamp of the audit record's sort key (epoch
+                milliseconds, or seconds for records written before those)
             action: The action that was performed
 
         Returns:
@@ -0,0 +1,582 @@
+"""
+Backup and restore of a whole family partition.
+
+A backup is a directory (local or "s3://bucket/prefix") of gzip-compressed
+NDJSON segments, one raw DynamoDB item per line, and a manifest written
+last that lists every segment with its item count and sha256:
+
+    manifest.json
+    family-{n}.ndjson.gz          every item of FAMILY#{family_id}
+    profiles-{n}.ndjson.gz        the USER_PROFILE# items of the family's members
+    audit_archive-{n}.ndjson.gz   the family's audit archive segments, as is
+
+Raw items round-trip every attribute, GSI keys included, without going
+through the models. Archived audit records are restored into the target's
+audit archive under a new manifest, or into the table when the target has
+no archive store. Delta-encoded audit records carry a checksum of the
+entity's full state, so a restore that remaps IDs replays every entity's
+audit history to recompute them, and every restore ends by replaying the
+restored history to count records that no longer verify. Derived partitions outside the family (search postings,
+duplicate signatures) are not backed up; reindex_ticket_search.py and
+backfill_ticket_signatures.py rebuild them after a restore.
+"""
+
+import gzip
+import json
+import math
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from aws_lambda_powertools import Logger
+from pynamodb.exceptions import DoesNotExist
+
+from constants.backup import (
+    BACKUP_FORMAT_VERSION,
+    BACKUP_SEGMENT_SIZE,
+    BACKUP_RESTORE_WORKERS,
+    BACKUP_RESTORE_MAX_ATTEMPTS,
+    BACKUP_RESTORE_RETRY_SECONDS,
+)
+from exceptions.backup_exceptions import (
+    BackupNotFound,
+    BackupVerificationFailed,
+    BackupRestoreConflict,
+)
+from exceptions.group_exceptions import FamilyNotFound
+from helpers.archive_store_helper import (
+    get_archive_store,
+    encode_ndjson_segment,
+    sha256_hex,
+)
+from helpers.audit_archive_helper import AuditArchiveHelper
+from helpers.audit_encoding_helper import apply_changes, state_checksum
+from helpers.audit_helper import AuditHelper
+from helpers.family_export_reader import FamilyExportReader
+from models.audit import AuditModel
+from models.base import FamHelpDeskBaseModel
+from models.family import FamilyModel
+from models.user_profile import UserProfile
+
+MANIFEST_KEY = "manifest.json"
+# Most items in one BatchWriteItem request
+BATCH_WRITE_SIZE = 25
+
+# (raw item, write capacity units it costs)
+SizedItem = Tuple[Dict[str, Any], int]
+
+
+class WriteRateLimiter:
+    """
+    Paces writes to a number of write capacity units per second, shared by
+    all writer threads. Each acquire reserves the next free slot, so a large
+    batch delays the ones after it rather than bursting.
+    """
+
+    def __init__(self, units_per_second: float):
+        self.interval = 1.0 / units_per_second
+        self.next_time = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, units: int) -> None:
+        with self.lock:
+            now = time.monotonic()
+            start = max(self.next_time, now)
+            self.next_time = start + units * self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class AuditHistoryReplay:
+    """
+    Replays a family's audit records one at a time, as AuditHelper does per
+    entity, keeping only each entity's latest state. Records must come oldest
+    first per entity: the archive's, then the partition's, which are sorted
+    by entity and time. A record seen before (archived by an interrupted run
+    and still in the table) is not replayed again.
+
+    With remap_state, each verified delta record yields the checksum of its
+    state with the IDs remapped, to store in place of the old one.
+    """
+
+    def __init__(self, remap_state: Optional[Callable[[Any], Any]] = None):
+        self.remap_state = remap_state
+        self.states: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+        # Sort key -> checksum to store, of every record replayed
+        self.checksums: Dict[str, Optional[str]] = {}
+        self.stats = {"delta_records": 0, "unverified": 0}
+
+    def replay(self, record: AuditModel) -> Optional[str]:
+        """Replay a record; returns its new checksum, if it has one."""
+        if record.sk not in self.checksums:
+            self.checksums[record.sk] = self._replay(record)
+        return self.checksums[record.sk]
+
+    def _replay(self, record: AuditModel) -> Optional[str]:
+        key = (record.entity_type, record.entity_id)
+        if not AuditModel.is_delta_encoded(record):
+            self.states[key] = (
+                AuditHelper._drop_untracked(record.entity_type, record.after.as_dict())
+                if record.after
+                else None
+            )
+            return None
+
+        state = self.states.get(key)
+        changes = AuditHelper._drop_untracked(
+            record.entity_type, record.changes.as_dict() if record.changes else {}
+        )
+        after = apply_changes(state, changes)
+        self.states[key] = after
+        self.stats["delta_records"] += 1
+        if state is None or state_checksum(after) != record.checksum:
+            # No anchor, or already corrupt: the old checksum is kept
+            self.stats["unverified"] += 1
+            return None
+        if self.remap_state is None:
+            return None
+        return state_checksum(self.remap_state(after))
+
+
+class FamilyBackupHelper:
+    def __init__(self, request_id: str = None):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+        self.request_id = request_id
+        self.connection = FamHelpDeskBaseModel._get_connection()
+
+    def backup_family(
+        self, family_id: str, target_uri: str, segment_size: int = BACKUP_SEGMENT_SIZE
+    ) -> dict:
+        """
+        Write a family's backup to target_uri.
+
+        Raises:
+            FamilyNotFound: The family partition is empty
+
+        Returns:
+            The manifest
+        """
+        store = get_archive_store(target_uri)
+        manifest = {
+            "format_version": BACKUP_FORMAT_VERSION,
+            "family_id": family_id,
+            "created_at": FamHelpDeskBaseModel.now_epoch(),
+            "item_count": 0,
+            "archived_before": 0,
+            "segments": [],
+        }
+
+        def flush(kind: str, items: List[Dict[str, Any]]) -> None:
+            if not items:
+                return
+            data = encode_ndjson_segment(items)
+            key = f"{kind}-{len(manifest['segments']) + 1:06d}.ndjson.gz"
+            store.put(key, data)
+            manifest["segments"].append(
+                {
+                    "key": key,
+                    "kind": kind,
+                    "count": len(items),
+                    "sha256": sha256_hex(data),
+                }
+            )
+            manifest["item_count"] += len(items)
+            items.clear()
+
+        batch: List[Dict[str, Any]] = []
+        user_ids = set()
+        reader = FamilyExportReader(family_id, request_id=self.request_id)
+        for item in reader.iter_items():
+            batch.append(item)
+            if item["sk"]["S"].startswith("MEMBER#"):
+                user_ids.add(item["user_id"]["S"])
+            if len(batch) >= segment_size:
+                flush("family", batch)
+        flush("family", batch)
+        if not manifest["item_count"]:
+            raise FamilyNotFound(f"Family with ID {family_id} not found.")
+
+        for profile in UserProfile.batch_get(
+            [(UserProfile.create_pk(u), UserProfile.create_sk()) for u in user_ids]
+        ):
+            batch.append(profile.serialize())
+            if len(batch) >= segment_size:
+                flush("profiles", batch)
+        flush("profiles", batch)
+
+        # Archived audit records are no longer in the partition; their
+        # segments are copied over unchanged
+        archive = AuditArchiveHelper(request_id=self.request_id)
+        archive_manifest = archive.get_manifest(family_id)
+        if archive_manifest:
+            manifest["archived_before"] = archive_manifest["archived_before"]
+            for segment in archive_manifest["segments"]:
+                key = f"audit_archive-{len(manifest['segments']) + 1:06d}.ndjson.gz"
+                store.put(key, archive.get_segment_data(segment))
+                manifest["segments"].append(
+                    {
+                        "key": key,
+                        "kind": "audit_archive",
+                        "count": segment["count"],
+                        "sha256": segment["sha256"],
+                    }
+                )
+                manifest["item_count"] += segment["count"]
+
+        # Written last: a backup without its manifest is incomplete
+        store.put(MANIFEST_KEY, json.dumps(manifest, indent=2).encode("utf-8"))
+        self.logger.info(
+            f"Backed up {manifest['item_count']} items of family {family_id} "
+            f"in {len(manifest['segments'])} segments to {store}"
+        )
+        return manifest
+
+    def restore_family(
+        self,
+        source_uri: str,
+        target_family_id: Optional[str] = None,
+        user_id_map: Optional[Dict[str, str]] = None,
+        workers: int = BACKUP_RESTORE_WORKERS,
+        max_write_units: Optional[float] = None,
+        overwrite_profiles: bool = False,
+        dry_run: bool = False,
+    ) -> dict:
+        """
+        Restore a backup, optionally under another family ID and user IDs.
+
+        Every segment is verified before anything is written. Items are then
+        put with parallel BatchWriteItem calls, retrying unprocessed items
+        with backoff, paced to max_write_units per second when given. Items
+        of the family not in the backup are left alone. Member profiles that
+        already exist are kept unless overwrite_profiles is set.
+
+        Archived audit records replace the target family's audit archive,
+        unless it already covers as much history as the backup's (as when
+        restoring over the family itself). Without an archive store they
+        are put into the table with the other items. When IDs are remapped,
+        the checksums of delta-encoded audit records are recomputed from a
+        replay of the backup's audit history, which holds every audit sort
+        key of the family in memory. Once restored, the family's audit
+        history is replayed to count delta records that do not verify.
+
+        IDs are remapped by replacing them in every string value, keys and
+        GSI keys included; family and user IDs are UUIDs, so they never
+        occur by accident.
+
+        Raises:
+            BackupNotFound: No manifest at source_uri
+            BackupVerificationFailed: A segment is missing or corrupt, or the
+                backup was written by a newer version
+            BackupRestoreConflict: target_family_id already exists
+
+        Returns:
+            Dict with the items written, archived audit records written,
+            profiles kept, write retries, elapsed seconds and the restored
+            delta audit records that do not verify
+        """
+        store = get_archive_store(source_uri)
+        data = store.get(MANIFEST_KEY)
+        if data is None:
+            raise BackupNotFound(f"No backup manifest at {source_uri}")
+        manifest = json.loads(data)
+        if manifest["format_version"] > BACKUP_FORMAT_VERSION:
+            raise BackupVerificationFailed(
+                f"Backup format {manifest['format_version']} is newer than "
+                f"{BACKUP_FORMAT_VERSION}"
+            )
+
+        for segment in manifest["segments"]:
+            self._fetch_segment(store, segment)
+
+        source_family_id = manifest["family_id"]
+        id_map = dict(user_id_map or {})
+        if target_family_id and target_family_id != source_family_id:
+            if self._family_exists(target_family_id):
+                raise BackupRestoreConflict(f"Family {target_family_id} already exists")
+            id_map[source_family_id] = target_family_id
+        remap = self._remapper(id_map)
+        archive = AuditArchiveHelper(request_id=self.request_id)
+        archive_segments = [
+            segment
+            for segment in manifest["segments"]
+            if segment["kind"] == "audit_archive"
+        ]
+
+        stats = {
+            "items": 0,
+            "archived_records": 0,
+            "profiles_kept": 0,
+            "retries": 0,
+            "seconds": 0.0,
+            "unverified_audits": 0,
+        }
+        if dry_run:
+            stats["items"] = manifest["item_count"]
+            return stats
+
+        replay = None
+        if id_map:
+            replay = AuditHistoryReplay(self._state_remapper(id_map))
+            # Archived records are the older part of every entity's history
+            for segment in archive_segments:
+                for item, _ in self._decode_segment(
+                    self._fetch_segment(store, segment), segment
+                ):
+                    replay.replay(AuditModel.from_raw_data(item))
+
+        def prepare(item: Dict[str, Any]) -> Dict[str, Any]:
+            if replay and item["sk"]["S"].startswith("AUDIT#"):
+                checksum = replay.replay(AuditModel.from_raw_data(item))
+                if checksum is not None:
+                    item["checksum"] = {"S": checksum}
+            return remap(item)
+
+        # Create the shared client before the writer threads race to
+        self.connection.connection.client
+        started = time.monotonic()
+        limiter = WriteRateLimiter(max_write_units) if max_write_units else None
+        stats_lock = threading.Lock()
+        # Bounds the batches decoded ahead of the writers
+        in_flight = threading.BoundedSemaphore(workers * 4)
+        errors: List[Exception] = []
+
+        def write(batch: List[SizedItem]) -> None:
+            try:
+                retries = self._write_batch(batch, limiter)
+                with stats_lock:
+                    stats["items"] += len(batch)
+                    stats["retries"] += retries
+            except Exception as e:
+                errors.append(e)
+            finally:
+                in_flight.release()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for segment in manifest["segments"]:
+                if segment["kind"] == "audit_archive" and archive.enabled:
+                    continue
+                items = [
+                    (prepare(item), units)
+                    for item, units in self._decode_segment(
+                        self._fetch_segment(store, segment), segment
+                    )
+                ]
+                if segment["kind"] == "profiles" and not overwrite_profiles:
+                    items = self._skip_existing_profiles(items, stats)
+                batch: List[SizedItem] = []
+                for item in items:
+                    batch.append(item)
+                    if len(batch) == BATCH_WRITE_SIZE:
+                        in_flight.acquire()
+                        executor.submit(write, batch)
+                        batch = []
+                    if errors:
+                        break
+                if batch and not errors:
+                    in_flight.acquire()
+                    executor.submit(write, batch)
+                if errors:
+                    break
+        if errors:
+            raise errors[0]
+
+        if archive_segments and archive.enabled:
+            self._restore_archive(
+                archive,
+                store,
+                archive_segments,
+                target_family_id or source_family_id,
+                manifest["archived_before"],
+                prepare,
+                stats,
+            )
+
+        stats["unverified_audits"] = self.verify_audit_history(
+            target_family_id or source_family_id
+        )["unverified"]
+        if stats["unverified_audits"]:
+            self.logger.warning(
+                f"{stats['unverified_audits']} restored delta audit records do "
+                "not match their checksums"
+            )
+
+        stats["seconds"] = round(time.monotonic() - started, 2)
+        self.logger.info(
+            f"Restored {stats['items']} items of family {source_family_id} as "
+            f"{target_family_id or source_family_id} in {stats['seconds']}s "
+            f"({stats['retries']} retried writes)"
+        )
+        return stats
+
+    def verify_audit_history(self, family_id: str) -> Dict[str, int]:
+        """
+        Replay a family's audit history, archive first, and count its delta
+        records and those whose rebuilt state does not match their checksum.
+        """
+        replay = AuditHistoryReplay()
+        archive = AuditArchiveHelper(request_id=self.request_id)
+        for record in archive.iter_family_records(family_id):
+            replay.replay(record)
+        for record in AuditModel.query(
+            AuditModel.create_pk(family_id), AuditModel.sk.startswith("AUDIT#")
+        ):
+            replay.replay(record)
+        self.logger.info(
+            f"Replayed the audit history of family {family_id}: {replay.stats}"
+        )
+        return replay.stats
+
+    def _restore_archive(
+        self,
+        archive: AuditArchiveHelper,
+        store,
+        segments: List[dict],
+        family_id: str,
+        archived_before: int,
+        prepare: Callable[[Dict[str, Any]], Dict[str, Any]],
+        stats: dict,
+    ) -> None:
+        existing = archive.get_manifest(family_id)
+        if existing and existing["archived_before"] >= archived_before:
+            self.logger.info(
+                f"Kept the audit archive of family {family_id}; it is as recent "
+                "as the backup's"
+            )
+            return
+        stats["archived_records"] = archive.restore_family_archive(
+            family_id,
+            archived_before,
+            (
+                [
+                    prepare(item)
+                    for item, _ in self._decode_segment(
+                        self._fetch_segment(store, segment), segment
+                    )
+                ]
+                for segment in segments
+            ),
+        )
+
+    def _write_batch(
+        self, batch: List[SizedItem], limiter: Optional[WriteRateLimiter]
+    ) -> int:
+        """Put a batch, retrying unprocessed items. Returns the retried count."""
+        units = sum(cost for _, cost in batch)
+        pending = [item for item, _ in batch]
+        retries = 0
+        for attempt in range(BACKUP_RESTORE_MAX_ATTEMPTS):
+            if limiter:
+                # Retried items are charged the batch's average cost
+                limiter.acquire(math.ceil(units * len(pending) / len(batch)))
+            response = self.connection.batch_write_item(put_items=pending)
+            unprocessed = response.get("UnprocessedItems", {}).get(
+                self.connection.table_name, []
+            )
+            if not unprocessed:
+                return retries
+            pending = [request["PutRequest"]["Item"] for request in unprocessed]
+            retries += len(pending)
+            time.sleep(BACKUP_RESTORE_RETRY_SECONDS * 2**attempt)
+        raise RuntimeError(
+            f"{len(pending)} items still unprocessed after "
+            f"{BACKUP_RESTORE_MAX_ATTEMPTS} attempts"
+        )
+
+    @staticmethod
+    def _fetch_segment(store, segment: dict) -> bytes:
+        """A segment's data, verified against its checksum."""
+        data = store.get(segment["key"])
+        if data is None:
+            raise BackupVerificationFailed(f"Segment {segment['key']} is missing")
+        if sha256_hex(data) != segment["sha256"]:
+            raise BackupVerificationFailed(
+                f"Segment {segment['key']} does not match its checksum"
+            )
+        return data
+
+    @staticmethod
+    def _decode_segment(data: bytes, segment: dict) -> List[SizedItem]:
+        """A segment's items and their write costs."""
+        items = [
+            # A write costs a unit per started KB of item
+            (json.loads(line), max(1, math.ceil(len(line) / 1024)))
+            for line in gzip.decompress(data).splitlines()
+            if line
+        ]
+        if len(items) != segment["count"]:
+            raise BackupVerificationFailed(
+                f"Segment {segment['key']} has {len(items)} items, "
+                f"expected {segment['count']}"
+            )
+        return items
+
+    @staticmethod
+    def _skip_existing_profiles(items: List[SizedItem], stats: dict) -> List[SizedItem]:
+        existing = {
+            profile.pk
+            for profile in UserProfile.batch_get(
+                [(item["pk"]["S"], item["sk"]["S"]) for item, _ in items]
+            )
+        }
+        stats["profiles_kept"] += len(existing)
+        return [
+            (item, units) for item, units in items if item["pk"]["S"] not in existing
+        ]
+
+    @staticmethod
+    def _replacer(id_map: Dict[str, str]) -> Callable[[str], str]:
+        """A function replacing the mapped IDs in a string."""
+        pattern = re.compile("|".join(re.escape(old) for old in id_map))
+        return lambda value: pattern.sub(lambda match: id_map[match.group(0)], value)
+
+    @staticmethod
+    def _remapper(id_map: Dict[str, str]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """A function replacing the mapped IDs in every string value of an item."""
+        if not id_map:
+            return lambda item: item
+        replace = FamilyBackupHelper._replacer(id_map)
+
+        def remap_value(value: Dict[str, Any]) -> Dict[str, Any]:
+            if "S" in value:
+                return {"S": replace(value["S"])}
+            if "SS" in value:
+                return {"SS": [replace(v) for v in value["SS"]]}
+            if "L" in value:
+                return {"L": [remap_value(v) for v in value["L"]]}
+            if "M" in value:
+                return {"M": {k: remap_value(v) for k, v in value["M"].items()}}
+            return value
+
+        return lambda item: {name: remap_value(value) for name, value in item.items()}
+
+    @staticmethod
+    def _state_remapper(id_map: Dict[str, str]) -> Callable[[Any], Any]:
+        """
+        The same replacement on an entity state as audit replays build it,
+        so its checksum matches the state replayed from remapped items.
+        """
+        replace = FamilyBackupHelper._replacer(id_map)
+
+        def remap_value(value: Any) -> Any:
+            if isinstance(value, str):
+                return replace(value)
+            if isinstance(value, (set, frozenset)):
+                return {remap_value(v) for v in value}
+            if isinstance(value, (list, tuple)):
+                return [remap_value(v) for v in value]
+            if isinstance(value, dict):
+                return {k: remap_value(v) for k, v in value.items()}
+            return value
+
+        return remap_value
+
+    @staticmethod
+    def _family_exists(family_id: str) -> bool:
+        try:
+            FamilyModel.get(FamilyModel.create_pk(family_id), FamilyModel.create_sk())
+        except DoesNotExist:
+            return False
+        return True
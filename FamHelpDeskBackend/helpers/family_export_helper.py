@@ -0,0 +1,332 @@
+import hashlib
+import json
+import tempfile
+import threading
+import zlib
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+from aws_lambda_powertools import Logger
+from pynamodb.exceptions import DoesNotExist
+
+from constants.export import (
+    EXPORT_STORE_URI,
+    EXPORT_WORKER_FUNCTION,
+    EXPORT_FORMAT_VERSION,
+    EXPORT_SYNC_MAX_BYTES,
+    EXPORT_ARCHIVED_AUDIT_BYTES,
+    EXPORT_CHUNK_BYTES,
+    EXPORT_DOWNLOAD_URL_SECONDS,
+)
+from exceptions.export_exceptions import ExportNotFound, ExportNotReady, ExportTooLarge
+from helpers.archive_store_helper import get_archive_store
+from helpers.audit_archive_helper import AuditArchiveHelper
+from helpers.family_export_reader import FamilyExportReader
+from models.audit import AuditModel
+from models.export import ExportModel, ExportStatus
+from models.family import FamilyModel
+from models.family_membership import FamilyMembershipModel
+from models.group import GroupModel
+from models.group_membership import GroupMembershipModel
+from models.queue import QueueModel
+from models.ticket import TicketModel
+from models.ticket_comment import TicketCommentModel
+
+# (record type, model, cleaner) of an exported item
+RecordType = Tuple[str, type, Callable[[Any], dict]]
+
+
+class FamilyExportHelper:
+    """
+    Exports of everything in a family as NDJSON, one record per line:
+
+        {"type": "export", "data": {"family_id", "exported_at", "format_version"}}
+        {"type": "family" | "group" | "queue" | "family_membership" |
+                 "group_membership" | "ticket" | "comment" | "audit",
+         "data": <the item as the API returns it>}
+        {"type": "export_end", "data": {"record_count": n}}
+
+    Records are encoded as they come off one paginated query of the family
+    partition, then the audit archive, so memory stays flat and the header
+    goes out before the partition is read. A stream that ends without its
+    export_end line is incomplete. Counters, rollups, reports and other
+    derived items are not exported.
+
+    Families of up to about EXPORT_SYNC_MAX_BYTES of data stream from the
+    API; larger ones are exported by a job (see export_family_data.py) that
+    writes the gzipped file to the export store for download.
+    """
+
+    def __init__(self, request_id: str = None):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+        self.request_id = request_id
+        self.store = get_archive_store(EXPORT_STORE_URI)
+
+    def check_direct_export(self, family_id: str) -> None:
+        """
+        Estimate the family's export size: the partition's from the capacity
+        of COUNT queries, which stop once the limit is passed, and the audit
+        archive's from its manifest's record counts.
+
+        Raises:
+            ExportTooLarge: The family has too much data to export in one
+                response; an export job is needed
+        """
+        manifest = AuditArchiveHelper(request_id=self.request_id).get_manifest(
+            family_id
+        )
+        size = EXPORT_ARCHIVED_AUDIT_BYTES * sum(
+            segment["count"] for segment in (manifest or {}).get("segments", [])
+        )
+        if size <= EXPORT_SYNC_MAX_BYTES:
+            size += FamilyExportReader(
+                family_id, request_id=self.request_id
+            ).estimate_size(max_bytes=EXPORT_SYNC_MAX_BYTES - size)
+        if size > EXPORT_SYNC_MAX_BYTES:
+            raise ExportTooLarge(
+                f"Family {family_id} has about {size // 1024} KB of data; exports "
+                f"of more than {EXPORT_SYNC_MAX_BYTES // 1024} KB must be "
+                "requested as a job"
+            )
+
+    def iter_records(self, family_id: str) -> Iterator[Dict[str, Any]]:
+        """Yield the family's exported records, table first, then the archive."""
+        archive = AuditArchiveHelper(request_id=self.request_id)
+        manifest = archive.get_manifest(family_id)
+        archived_before = manifest["archived_before"] if manifest else 0
+
+        exported, skipped = 0, 0
+        for item in FamilyExportReader(
+            family_id, request_id=self.request_id
+        ).iter_items():
+            record_type = self._classify(item["sk"]["S"])
+            if record_type is None:
+                skipped += 1
+                continue
+            name, model, clean = record_type
+            # Archived records are only left in the table until the archive
+            # run deletes them; they are exported from the archive below
+            if name == "audit" and int(item["time"]["N"]) < archived_before:
+                continue
+            exported += 1
+            yield {"type": name, "data": clean(model.from_raw_data(item))}
+
+        for record in archive.iter_family_records(family_id):
+            exported += 1
+            yield {"type": "audit", "data": AuditModel.clean_returned_audit(record)}
+
+        self.logger.info(
+            f"Exported {exported} records of family {family_id}, "
+            f"skipped {skipped} derived items"
+        )
+
+    def iter_ndjson(
+        self,
+        family_id: str,
+        compress: bool = False,
+        stats: Optional[Dict[str, int]] = None,
+    ) -> Iterator[bytes]:
+        """
+        Yield the family's export as NDJSON chunks of about
+        EXPORT_CHUNK_BYTES, gzipped when compress is set. stats, if given,
+        receives the record count once the export is complete.
+        """
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if compress else None
+        header = self._encode_line(
+            {
+                "type": "export",
+                "data": {
+                    "family_id": family_id,
+                    "exported_at": ExportModel.now_epoch(),
+                    "format_version": EXPORT_FORMAT_VERSION,
+                },
+            }
+        )
+        # Sent at once, so the response starts before the partition is read
+        yield (
+            compressor.compress(header) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            if compressor
+            else header
+        )
+
+        buffer = bytearray()
+        record_count = 0
+        for record in self.iter_records(family_id):
+            buffer += self._encode_line(record)
+            record_count += 1
+            if len(buffer) >= EXPORT_CHUNK_BYTES:
+                chunk = (
+                    compressor.compress(bytes(buffer)) if compressor else bytes(buffer)
+                )
+                buffer.clear()
+                if chunk:
+                    yield chunk
+
+        buffer += self._encode_line(
+            {"type": "export_end", "data": {"record_count": record_count}}
+        )
+        if compressor:
+            yield compressor.compress(bytes(buffer)) + compressor.flush()
+        else:
+            yield bytes(buffer)
+        if stats is not None:
+            stats["record_count"] = record_count
+
+    # Export jobs
+    def request_export(self, family_id: str, actor_user_id: str) -> ExportModel:
+        """Create a PENDING export job and hand it to the export worker."""
+        export_id = ExportModel.generate_uuid()
+        export = ExportModel(
+            pk=ExportModel.create_pk(family_id),
+            sk=ExportModel.create_sk(export_id),
+            family_id=family_id,
+            export_id=export_id,
+            status=ExportStatus.PENDING.value,
+            requested_by=actor_user_id,
+            requested_at=ExportModel.now_epoch(),
+        )
+        export.save()
+        self._enqueue(family_id, export_id)
+        self.logger.info(f"Enqueued export {export_id} of family {family_id}")
+        return export
+
+    def get_export(self, family_id: str, export_id: str) -> ExportModel:
+        try:
+            return ExportModel.get(
+                ExportModel.create_pk(family_id), ExportModel.create_sk(export_id)
+            )
+        except DoesNotExist:
+            raise ExportNotFound(f"Export {export_id} not found in family {family_id}")
+
+    def run_export(self, family_id: str, export_id: str) -> ExportModel:
+        """
+        Write a PENDING job's export to the export store and mark it READY,
+        or FAILED with the error. Runs in the export worker; the file is
+        spooled to local disk, so memory stays flat.
+        """
+        export = self.get_export(family_id, export_id)
+        if export.status == ExportStatus.READY.value:
+            self.logger.info(f"Export {export_id} has already run")
+            return export
+
+        stats: Dict[str, int] = {}
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with tempfile.NamedTemporaryFile(suffix=".ndjson.gz") as f:
+                for chunk in self.iter_ndjson(family_id, compress=True, stats=stats):
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+                f.flush()
+                self.store.put_file(
+                    ExportModel.create_file_key(family_id, export_id), f.name
+                )
+        except Exception as e:
+            self.logger.exception(f"Failed to export family {family_id}")
+            export.update(
+                actions=[
+                    ExportModel.status.set(ExportStatus.FAILED.value),
+                    ExportModel.error.set(str(e)[:500] or type(e).__name__),
+                ]
+            )
+            return export
+
+        export.update(
+            actions=[
+                ExportModel.status.set(ExportStatus.READY.value),
+                ExportModel.completed_at.set(ExportModel.now_epoch()),
+                ExportModel.record_count.set(stats["record_count"]),
+                ExportModel.size_bytes.set(size),
+                ExportModel.sha256.set(digest.hexdigest()),
+                ExportModel.error.remove(),
+            ]
+        )
+        self.logger.info(
+            f"Exported {stats['record_count']} records of family {family_id} "
+            f"({size} bytes)"
+        )
+        return export
+
+    def get_download_url(self, family_id: str, export_id: str) -> Optional[str]:
+        """
+        Pre-signed URL of a READY job's file, or None when the store cannot
+        sign URLs and the API serves the file itself (iter_export_file).
+
+        Raises:
+            ExportNotFound: No such job, or its file is gone from the store
+            ExportNotReady: The job is still PENDING or FAILED
+        """
+        key = self._require_ready_file(family_id, export_id)
+        return self.store.get_download_url(key, EXPORT_DOWNLOAD_URL_SECONDS)
+
+    def iter_export_file(self, family_id: str, export_id: str) -> Iterator[bytes]:
+        """The chunks of a READY job's file, read from the store."""
+        key = self._require_ready_file(family_id, export_id)
+        return self.store.iter_chunks(key)
+
+    def _require_ready_file(self, family_id: str, export_id: str) -> str:
+        export = self.get_export(family_id, export_id)
+        if export.status != ExportStatus.READY.value:
+            raise ExportNotReady(f"Export {export_id} is {export.status}")
+        key = ExportModel.create_file_key(family_id, export_id)
+        if not self.store.exists(key):
+            raise ExportNotFound(f"File of export {export_id} is missing")
+        return key
+
+    def _enqueue(self, family_id: str, export_id: str) -> None:
+        if EXPORT_WORKER_FUNCTION:
+            import boto3
+
+            # Event invocations return once queued; the worker exports later
+            boto3.client("lambda").invoke(
+                FunctionName=EXPORT_WORKER_FUNCTION,
+                InvocationType="Event",
+                Payload=json.dumps({"family_id": family_id, "export_id": export_id}),
+            )
+            return
+
+        threading.Thread(
+            target=FamilyExportHelper(request_id=self.request_id).run_export,
+            args=(family_id, export_id),
+            daemon=True,
+        ).start()
+
+    @staticmethod
+    def _classify(sk: str) -> Optional[RecordType]:
+        """The record type of an item by its sort key, None if not exported."""
+        if sk == FamilyModel.create_sk():
+            return ("family", FamilyModel, FamilyModel.clean_returned_family)
+        if sk.startswith("AUDIT#"):
+            return ("audit", AuditModel, AuditModel.clean_returned_audit)
+
+        parts = sk.split("#")
+        if parts[0] == "MEMBER" and len(parts) == 2:
+            return (
+                "family_membership",
+                FamilyMembershipModel,
+                FamilyMembershipModel.clean_returned_membership,
+            )
+        if parts[0] == "GROUP" and len(parts) == 3 and parts[2] == "META":
+            return ("group", GroupModel, GroupModel.clean_returned_group)
+        if parts[0] == "GROUP" and len(parts) == 4 and parts[2] == "QUEUE":
+            return ("queue", QueueModel, QueueModel.clean_returned_queue)
+        if parts[0] == "GROUP" and len(parts) == 4 and parts[2] == "MEMBER":
+            return (
+                "group_membership",
+                GroupMembershipModel,
+                GroupMembershipModel.clean_returned_membership,
+            )
+        if parts[0] == "QUEUE" and len(parts) == 4 and parts[2] == "TICKET":
+            return ("ticket", TicketModel, TicketModel.clean_returned_ticket)
+        if parts[0] == "QUEUE" and len(parts) == 6 and parts[4] == "COMMENT":
+            return (
+                "comment",
+                TicketCommentModel,
+                TicketCommentModel.clean_returned_comment,
+            )
+        return None
+
+    @staticmethod
+    def _encode_line(record: Dict[str, Any]) -> bytes:
+        return (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
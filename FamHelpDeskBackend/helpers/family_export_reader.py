@@ -0,0 +1,64 @@
+from typing import Any, Dict, Iterator, List, Optional
+from aws_lambda_powertools import Logger
+
+from helpers.partition_helper import PartitionHelper
+from models.family import FamilyModel
+from models.ticket import TicketModel
+
+# Ticket items sort under QUEUE#{queue_id}#TICKET#..., with their comments
+TICKET_SK_PREFIX = "QUEUE#"
+
+
+class FamilyExportReader:
+    """
+    Reads a whole family partition one query page at a time, so memory
+    stays flat however large the family is.
+
+    Batch tools (search reindex, signature backfill, rollup rebuilds,
+    batch analytics) and data exports all read the partition through here
+    rather than running their own partition queries.
+    """
+
+    def __init__(self, family_id: str, request_id: str = None):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+        self.family_id = family_id
+        self.partition_helper = PartitionHelper(request_id=request_id)
+
+    def iter_items(self, page_size: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield every raw item of the family partition, in sort key order."""
+        yield from self.partition_helper.iter_items(
+            FamilyModel.create_pk(self.family_id), page_size=page_size
+        )
+
+    def estimate_size(self, max_bytes: Optional[int] = None) -> int:
+        """Estimated bytes of the family partition (see PartitionHelper)."""
+        return self.partition_helper.estimate_size(
+            FamilyModel.create_pk(self.family_id), max_bytes=max_bytes
+        )
+
+    def iter_ticket_items(
+        self, attributes: Optional[List[str]] = None, page_size: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the raw items of the family's tickets, without their comments.
+
+        Args:
+            attributes: Optional projection; columnar readers fetch only the
+                attributes they decode
+            page_size: Optional maximum number of items per query page
+        """
+        # The status filter drops the comment items that share the prefix
+        yield from self.partition_helper.iter_items(
+            TicketModel.create_pk(self.family_id),
+            range_key_condition=TicketModel.sk.startswith(TICKET_SK_PREFIX),
+            filter_condition=TicketModel.status.exists(),
+            attributes_to_get=attributes,
+            page_size=page_size,
+        )
+
+    def iter_tickets(self, page_size: Optional[int] = None) -> Iterator[TicketModel]:
+        """Yield the family's tickets as models."""
+        for item in self.iter_ticket_items(page_size=page_size):
+            yield TicketModel.from_raw_data(item)
@@ -41,6 +41,13 @@ class FamilyMembershipHelper:
             )
             return None
 
+    def require_active_member(self, family_id: str, user_id: str) -> dict:
+        """Return the user's membership, raising unless they are an active member."""
+        membership = self.get_membership(family_id, user_id)
+        if not membership or membership["status"] != MembershipStatus.MEMBER.value:
+            raise MemberPrivilegesRequired()
+        return membership
+
     def get_all_admins(self, family_id: str) -> List[str]:
         """Get all admin user IDs for a family."""
         admin_ids = []
@@ -0,0 +1,82 @@
+from typing import Optional, Tuple
+from aws_lambda_powertools import Logger
+from pynamodb.connection import Connection
+from pynamodb.exceptions import DoesNotExist
+from pynamodb.transactions import TransactGet
+
+from models.base import FamHelpDeskBaseModel
+from models.family import FamilyModel
+from models.group import GroupModel
+from models.queue import QueueModel
+
+
+class FamilyPathHelper:
+    """Resolves a (family, group, queue) path in a single DynamoDB round trip."""
+
+    def __init__(self, request_id: str = None):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+
+    def get_path(
+        self,
+        family_id: str,
+        group_id: Optional[str] = None,
+        queue_id: Optional[str] = None,
+    ) -> Tuple[Optional[FamilyModel], Optional[GroupModel], Optional[QueueModel]]:
+        """
+        Fetch the family, group and queue items of a path with one TransactGetItems call.
+
+        Args:
+            family_id: The family ID
+            group_id: Optional group ID within the family
+            queue_id: Optional queue ID within the group (requires group_id)
+
+        Returns:
+            Tuple of (family, group, queue); each is None when missing or not requested
+        """
+        if queue_id and not group_id:
+            raise ValueError("group_id is required to resolve a queue path")
+
+        group_future = None
+        queue_future = None
+        with TransactGet(
+            connection=Connection(region=FamHelpDeskBaseModel.Meta.region)
+        ) as transaction:
+            family_future = transaction.get(
+                FamilyModel,
+                FamilyModel.create_pk(family_id),
+                FamilyModel.create_sk(),
+            )
+            if group_id:
+                group_future = transaction.get(
+                    GroupModel,
+                    GroupModel.create_pk(family_id),
+                    GroupModel.create_sk(group_id),
+                )
+            if queue_id:
+                queue_future = transaction.get(
+                    QueueModel,
+                    QueueModel.create_pk(family_id),
+                    QueueModel.create_sk(group_id, queue_id),
+                )
+
+        family = self._resolve(family_future)
+        group = self._resolve(group_future)
+        queue = self._resolve(queue_future)
+
+        self.logger.info(
+            f"Resolved path family={family_id} ({family is not None}), "
+            f"group={group_id} ({group is not None}), "
+            f"queue={queue_id} ({queue is not None})."
+        )
+        return family, group, queue
+
+    @staticmethod
+    def _resolve(future):
+        if future is None:
+            return None
+        try:
+            return future.get()
+        except DoesNotExist:
+            return None
@@ -0,0 +1,165 @@
+from typing import Dict, List, Optional, Set
+from aws_lambda_powertools import Logger
+
+from helpers.partition_helper import PartitionHelper
+from models.base import FamHelpDeskBaseModel, MembershipStatus
+from models.family import FamilyModel
+from models.family_membership import FamilyMembershipModel
+from models.group import GroupModel
+from models.group_membership import GroupMembershipModel
+from models.queue import QueueModel
+
+# Family partition sort keys in order: AUDIT#... < GROUP#... < MEMBER#... < META
+# < QUEUE#... (tickets). The snapshot range skips audits and tickets.
+SNAPSHOT_SK_START = "GROUP#"
+SNAPSHOT_SK_END = "META"
+
+
+class FamilySnapshot:
+    """
+    In-memory view of a family's structural items, loaded with one paginated
+    query of the FAMILY#{family_id} partition.
+
+    Items are classified by sort key shape:
+        META                        -> FamilyModel
+        MEMBER#{user_id}            -> FamilyMembershipModel
+        GROUP#{group_id}#META       -> GroupModel
+        GROUP#{group_id}#QUEUE#...  -> QueueModel
+        GROUP#{group_id}#MEMBER#... -> GroupMembershipModel
+    """
+
+    def __init__(self, family_id: str, request_id: str = None):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+        self.family_id = family_id
+        self.partition_helper = PartitionHelper(request_id=request_id)
+
+        self.family: Optional[FamilyModel] = None
+        self.groups: Dict[str, GroupModel] = {}
+        self.queues: Dict[str, QueueModel] = {}
+        self.family_memberships: Dict[str, FamilyMembershipModel] = {}
+        self.group_memberships: Dict[str, List[GroupMembershipModel]] = {}
+        self.loaded = False
+
+    def load(self) -> "FamilySnapshot":
+        """Read the family partition once and classify every item."""
+        skipped = 0
+        for item in self.partition_helper.iter_items(
+            FamilyModel.create_pk(self.family_id),
+            range_key_condition=FamHelpDeskBaseModel.sk.between(
+                SNAPSHOT_SK_START, SNAPSHOT_SK_END
+            ),
+        ):
+            if not self._add_item(item):
+                skipped += 1
+
+        self.loaded = True
+        self.logger.info(
+            f"Loaded snapshot for family {self.family_id}: "
+            f"{len(self.groups)} groups, {len(self.queues)} queues, "
+            f"{len(self.family_memberships)} family memberships, "
+            f"{sum(len(m) for m in self.group_memberships.values())} group memberships, "
+            f"{skipped} unclassified items."
+        )
+        return self
+
+    def _add_item(self, item: dict) -> bool:
+        sk = PartitionHelper.get_sk(item)
+        if sk == FamilyModel.create_sk():
+            self.family = FamilyModel.from_raw_data(item)
+            return True
+
+        parts = sk.split("#")
+        if parts[0] == "MEMBER" and len(parts) == 2:
+            membership = FamilyMembershipModel.from_raw_data(item)
+            self.family_memberships[membership.user_id] = membership
+            return True
+
+        if parts[0] == "GROUP" and len(parts) == 3 and parts[2] == "META":
+            group = GroupModel.from_raw_data(item)
+            self.groups[group.group_id] = group
+            return True
+
+        if parts[0] == "GROUP" and len(parts) == 4 and parts[2] == "QUEUE":
+            queue = QueueModel.from_raw_data(item)
+            self.queues[queue.queue_id] = queue
+            return True
+
+        if parts[0] == "GROUP" and len(parts) == 4 and parts[2] == "MEMBER":
+            membership = GroupMembershipModel.from_raw_data(item)
+            self.group_memberships.setdefault(membership.group_id, []).append(
+                membership
+            )
+            return True
+
+        return False
+
+    # Typed views
+    def get_family(self) -> Optional[FamilyModel]:
+        return self.family
+
+    def get_groups(self) -> List[GroupModel]:
+        return list(self.groups.values())
+
+    def get_group(self, group_id: str) -> Optional[GroupModel]:
+        return self.groups.get(group_id)
+
+    def get_queues(self, group_id: Optional[str] = None) -> List[QueueModel]:
+        return [
+            queue
+            for queue in self.queues.values()
+            if group_id is None or queue.group_id == group_id
+        ]
+
+    def get_family_members(self) -> List[FamilyMembershipModel]:
+        return self._family_memberships_with_status(MembershipStatus.MEMBER)
+
+    def get_pending_family_requests(self) -> List[FamilyMembershipModel]:
+        return self._family_memberships_with_status(MembershipStatus.AWAITING)
+
+    def get_family_membership(self, user_id: str) -> Optional[FamilyMembershipModel]:
+        return self.family_memberships.get(user_id)
+
+    def get_group_members(self, group_id: str) -> List[GroupMembershipModel]:
+        return self._group_memberships_with_status(group_id, MembershipStatus.MEMBER)
+
+    def get_pending_group_requests(self, group_id: str) -> List[GroupMembershipModel]:
+        return self._group_memberships_with_status(group_id, MembershipStatus.AWAITING)
+
+    def get_user_group_memberships(
+        self, user_id: str, statuses: Optional[Set[str]] = None
+    ) -> List[GroupMembershipModel]:
+        """Group memberships of a user in this family, optionally filtered by status."""
+        return [
+            membership
+            for memberships in self.group_memberships.values()
+            for membership in memberships
+            if membership.user_id == user_id
+            and (statuses is None or membership.status in statuses)
+        ]
+
+    def get_user_ids(self) -> Set[str]:
+        """Every user referenced by a family or group membership."""
+        user_ids = set(self.family_memberships.keys())
+        for memberships in self.group_memberships.values():
+            user_ids.update(m.user_id for m in memberships)
+        return user_ids
+
+    def _family_memberships_with_status(
+        self, status: MembershipStatus
+    ) -> List[FamilyMembershipModel]:
+        return [
+            membership
+            for membership in self.family_memberships.values()
+            if membership.status == status.value
+        ]
+
+    def _group_memberships_with_status(
+        self, group_id: str, status: MembershipStatus
+    ) -> List[GroupMembershipModel]:
+        return [
+            membership
+            for membership in self.group_memberships.get(group_id, [])
+            if membership.status == status.value
+        ]
@@ -7,7 +7,8 @@ from helpers.audit_helper import AuditHelper
 from helpers.queue_helper import QueueHelper
 from helpers.group_membership_helper import GroupMembershipHelper
 from models.audit import AuditActions, AuditEntityTypes
-from exceptions.group_exceptions import GroupNotFound
+from exceptions.group_exceptions import GroupNotFound, GroupHasActiveQueues
+from exceptions.queue_exceptions import QueueHasActiveTickets
 
 
 class GroupHelper:
@@ -157,6 +158,8 @@ class GroupHelper:
                 family_id, group_id, actor_user_id
             )
             self.logger.info(f"Deleted {deleted_queues} queues for group {group_id}")
+        except QueueHasActiveTickets as e:
+            raise GroupHasActiveQueues(f"Cannot delete group {group_id} - {e.message}")
         except Exception as e:
             self.logger.error(f"Failed to delete queues for group {group_id}: {str(e)}")
             raise ValueError("Failed to delete group queues")
@@ -1,9 +1,11 @@
-from typing import List, Optional
-from pynamodb.exceptions import DoesNotExist
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set
+from pynamodb.exceptions import DoesNotExist, UpdateError
 from aws_lambda_powertools import Logger
 
 from models.group_membership import GroupMembershipModel
 from models.base import MembershipStatus
+from models.ticket import TicketModel, TicketStatus
 from helpers.audit_helper import AuditHelper
 from helpers.notification_helper import NotificationHelper
 from models.notification import NotificationType
@@ -79,6 +81,9 @@ class GroupMembershipHelper:
             status=MembershipStatus.AWAITING.value,
             is_admin=False,
             request_date=GroupMembershipModel.now_epoch(),
+            open_ticket_count=self._count_open_assigned_tickets(
+                family_id, group_id, user_id
+            ),
         )
         item.save()
         self.logger.info(
@@ -125,6 +130,9 @@ class GroupMembershipHelper:
             status=MembershipStatus.MEMBER.value,
             is_admin=is_admin,
             request_date=GroupMembershipModel.now_epoch(),
+            open_ticket_count=self._count_open_assigned_tickets(
+                family_id, group_id, user_id
+            ),
         )
         item.save()
         self.logger.info(
@@ -298,12 +306,10 @@ class GroupMembershipHelper:
             raise MembershipPendingRequired()
 
         before = self._clean_membership(item)
-        if approve:
-            item.status = MembershipStatus.MEMBER.value
-        else:
-            item.status = MembershipStatus.DECLINED.value
-
-        item.save()
+        status = MembershipStatus.MEMBER if approve else MembershipStatus.DECLINED
+        # Updates rather than saves on existing memberships, so concurrent
+        # changes to their open ticket counts are never overwritten
+        item.update(actions=[GroupMembershipModel.status.set(status.value)])
         self.logger.info(
             f"{'Approved' if approve else 'Declined'} group membership request for user {target_user_id} in family {family_id}, group {group_id}."
         )
@@ -387,6 +393,9 @@ class GroupMembershipHelper:
                 status=MembershipStatus.MEMBER.value,
                 is_admin=bool(make_admin),
                 request_date=GroupMembershipModel.now_epoch(),
+                open_ticket_count=self._count_open_assigned_tickets(
+                    family_id, group_id, target_user_id
+                ),
             )
             target.save()
             after = self._clean_membership(target)
@@ -406,20 +415,24 @@ class GroupMembershipHelper:
 
         # Update existing membership
         before = self._clean_membership(target)
+        actions = []
         # If pending/declined, promote to member
         if target.status in (
             MembershipStatus.AWAITING.value,
             MembershipStatus.DECLINED.value,
         ):
-            target.status = MembershipStatus.MEMBER.value
+            actions.append(
+                GroupMembershipModel.status.set(MembershipStatus.MEMBER.value)
+            )
         # Admin flag change only if requested and permitted
         if make_admin and not target.is_admin:
-            target.is_admin = True
+            actions.append(GroupMembershipModel.is_admin.set(True))
         elif not make_admin and target.is_admin:
             # Do not downgrade admin via grant_access; keep admin as-is
             pass
 
-        target.save()
+        if actions:
+            target.update(actions=actions)
         after = self._clean_membership(target)
         self.audit_helper.create_family_audit_record(
             family_id=family_id,
@@ -507,8 +520,7 @@ class GroupMembershipHelper:
             raise MembershipNotFound()
 
         before = self._clean_membership(target_item)
-        target_item.is_admin = is_admin
-        target_item.save()
+        target_item.update(actions=[GroupMembershipModel.is_admin.set(is_admin)])
 
         after = self._clean_membership(target_item)
         self.audit_helper.create_family_audit_record(
@@ -526,13 +538,146 @@ class GroupMembershipHelper:
         )
         return after
 
+    # Open ticket counters
+    def get_counted_members(
+        self, family_id: str, group_id: str, user_ids: Iterable[str]
+    ) -> Set[str]:
+        """
+        Which of the users have a membership item in the group, and so an
+        open ticket counter. Tickets can be assigned to any family member;
+        only the group's own members are counted.
+        """
+        keys = [
+            (
+                GroupMembershipModel.create_pk(family_id),
+                GroupMembershipModel.create_sk(group_id, user_id),
+            )
+            for user_id in set(user_ids)
+        ]
+        if not keys:
+            return set()
+        return {item.user_id for item in GroupMembershipModel.batch_get(keys)}
+
+    def get_least_loaded_member(
+        self, family_id: str, group_id: str
+    ) -> Optional[GroupMembershipModel]:
+        """
+        The active member with the fewest open tickets in the group, read
+        with one query of the group's memberships. Ties go to the member who
+        joined first.
+        """
+        members = [
+            item
+            for item in GroupMembershipModel.query(
+                GroupMembershipModel.create_pk(family_id),
+                GroupMembershipModel.sk.startswith(f"GROUP#{group_id}#MEMBER#"),
+            )
+            if item.status == MembershipStatus.MEMBER.value
+        ]
+        if not members:
+            return None
+        return min(
+            members,
+            key=lambda m: (
+                GroupMembershipModel.get_open_ticket_count(m),
+                m.request_date,
+                m.user_id,
+            ),
+        )
+
+    def apply_open_ticket_deltas(
+        self, family_id: str, deltas: Dict[tuple, int]
+    ) -> None:
+        """
+        Best-effort counter updates for bulk writes that are not transactional
+        (imports and moves), keyed by (group_id, user_id). Users who are not
+        members of the group are skipped; reconcile_queue_counts.py repairs
+        counters left behind by a failure.
+        """
+        for (group_id, user_id), delta in deltas.items():
+            if not delta:
+                continue
+            try:
+                GroupMembershipModel(
+                    GroupMembershipModel.create_pk(family_id),
+                    GroupMembershipModel.create_sk(group_id, user_id),
+                ).update(
+                    actions=[GroupMembershipModel.open_ticket_count.add(delta)],
+                    condition=GroupMembershipModel.sk.exists(),
+                )
+            except UpdateError as e:
+                if e.cause_response_code != "ConditionalCheckFailedException":
+                    self.logger.error(
+                        f"Failed to count open tickets of user {user_id} in "
+                        f"group {group_id}: {str(e)}"
+                    )
+
+    def reconcile_open_ticket_counts(
+        self,
+        family_id: str,
+        group_id: str,
+        queue_ids: Iterable[str],
+        dry_run: bool = False,
+    ) -> dict:
+        """
+        Recount the open tickets of every member of a group from its queues
+        and overwrite the counters that drifted.
+
+        Returns:
+            Dict of user ID to (stored, actual) for each drifted counter
+        """
+        actual = Counter()
+        for queue_id in queue_ids:
+            for ticket in TicketModel.queue_ticket_index.query(
+                TicketModel.create_queue_ticket_pk(family_id, queue_id),
+                TicketModel.queue_ticket_sk.startswith(
+                    TicketModel.create_queue_ticket_sk_prefix(TicketStatus.OPEN.value)
+                ),
+            ):
+                if ticket.assigned_to:
+                    actual[ticket.assigned_to] += 1
+
+        drift = {}
+        for membership in GroupMembershipModel.query(
+            GroupMembershipModel.create_pk(family_id),
+            GroupMembershipModel.sk.startswith(f"GROUP#{group_id}#MEMBER#"),
+        ):
+            stored = membership.open_ticket_count or 0
+            if stored == actual[membership.user_id]:
+                continue
+            drift[membership.user_id] = (stored, actual[membership.user_id])
+            if not dry_run:
+                membership.update(
+                    actions=[
+                        GroupMembershipModel.open_ticket_count.set(
+                            actual[membership.user_id]
+                        )
+                    ],
+                    condition=GroupMembershipModel.sk.exists(),
+                )
+        if drift:
+            self.logger.warning(
+                f"{'Found' if dry_run else 'Repaired'} open ticket counter drift in "
+                f"group {group_id} of family {family_id}: {drift}"
+            )
+        return drift
+
+    def _count_open_assigned_tickets(
+        self, family_id: str, group_id: str, user_id: str
+    ) -> int:
+        """
+        Starting value of a new membership's open ticket counter. Tickets stay
+        assigned when a member leaves, so a returning member may have some.
+        """
+        return sum(
+            1
+            for _ in TicketModel.assignee_ticket_index.query(
+                TicketModel.create_assignee_ticket_pk(user_id),
+                filter_condition=(TicketModel.family_id == family_id)
+                & (TicketModel.group_id == group_id),
+            )
+        )
+
     @staticmethod
     def _clean_membership(item: GroupMembershipModel) -> dict:
-        return {
-            "family_id": item.family_id,
-            "group_id": item.group_id,
-            "user_id": item.user_id,
-            "status": item.status,
-            "is_admin": item.is_admin,
-            "request_date": item.request_date,
-        }
+        return GroupMembershipModel.clean_returned_membership(item)
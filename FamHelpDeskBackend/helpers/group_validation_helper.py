@@ -9,6 +9,7 @@ from exceptions.group_exceptions import (
     GroupFamilyMismatch,
 )
 from helpers.family_helper import FamilyHelper
+from helpers.family_path_helper import FamilyPathHelper
 from helpers.group_helper import GroupHelper
 
 
@@ -22,6 +23,7 @@ class GroupValidationHelper:
         self.request_id = request_id
         self.family_helper = FamilyHelper(request_id=request_id)
         self.group_helper = GroupHelper(request_id=request_id)
+        self.path_helper = FamilyPathHelper(request_id=request_id)
 
     def validate_group_name(self, group_name: str, max_length: int = 100) -> None:
         """Validate group name format and length."""
@@ -52,8 +54,17 @@ class GroupValidationHelper:
             raise FamilyNotFound(f"Family with ID {family_id} not found.")
 
     def validate_group_family_relationship(self, family_id: str, group_id: str) -> None:
-        """Validate that the group belongs to the specified family."""
-        group = self.group_helper.get_group(family_id, group_id)
+        """
+        Validate that the family exists and the group belongs to it, fetching
+        both items in a single round trip.
+        """
+        if not family_id or not family_id.strip():
+            raise InvalidGroupData("Family ID is required.")
+
+        family, group, _ = self.path_helper.get_path(family_id, group_id)
+        if not family:
+            raise FamilyNotFound(f"Family with ID {family_id} not found.")
+
         if not group:
             raise GroupFamilyMismatch(
                 f"Group {group_id} does not exist in family {family_id}."
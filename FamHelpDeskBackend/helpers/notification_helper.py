@@ -1,6 +1,6 @@
 import time
 import uuid
-from typing import Optional
+from typing import Callable, Iterable, Optional
 from aws_lambda_powertools import Logger
 from models.notification import NotificationModel, NotificationType
 from pynamodb.exceptions import DoesNotExist
@@ -67,6 +67,85 @@ class NotificationHelper:
 
         return NotificationModel.clean_returned_notification(notification)
 
+    def create_coalesced_notifications(
+        self,
+        user_ids: Iterable[str],
+        notification_type: NotificationType,
+        subject_id: str,
+        message: Callable[[int], str],
+        family_id: Optional[str] = None,
+        ticket_id: Optional[str] = None,
+    ) -> int:
+        """
+        Notify several users of an event about one subject, such as a comment
+        on a ticket, with one batched read and one batched write for all of
+        them.
+
+        Each user has at most one notification per subject and type. While it
+        is unviewed, further events fold into it, raising its event_count and
+        timestamp; once viewed, the next event starts it over. Events that
+        arrive at the same moment may fold into one count.
+
+        Args:
+            user_ids: The users to notify
+            notification_type: Type of notification (NotificationType enum)
+            subject_id: What the events are about, e.g. the ticket ID
+            message: Builds the message from the notification's event count
+            family_id: Optional family ID if notification is family-related
+            ticket_id: Optional ticket ID if notification is ticket-related
+
+        Returns:
+            The number of users notified
+        """
+        user_ids = set(user_ids)
+        if not user_ids:
+            return 0
+
+        notification_id = NotificationModel.create_coalesced_id(
+            notification_type, subject_id
+        )
+        sk = NotificationModel.create_sk(notification_id)
+        existing = {
+            notification.user_id: notification
+            for notification in NotificationModel.batch_get(
+                [(NotificationModel.create_pk(user_id), sk) for user_id in user_ids]
+            )
+        }
+
+        timestamp = int(time.time())
+        with NotificationModel.batch_write() as batch:
+            for user_id in user_ids:
+                previous = existing.get(user_id)
+                event_count = 1
+                if previous is not None and not previous.viewed:
+                    event_count = (previous.event_count or 1) + 1
+                notification = NotificationModel(
+                    pk=NotificationModel.create_pk(user_id),
+                    sk=sk,
+                    notification_id=notification_id,
+                    user_id=user_id,
+                    message=message(event_count),
+                    notification_type=notification_type.value,
+                    timestamp=timestamp,
+                    viewed=False,
+                    event_count=event_count,
+                )
+                if family_id:
+                    notification.family_id = family_id
+                if ticket_id:
+                    notification.ticket_id = ticket_id
+                batch.save(notification)
+
+        self.logger.info(
+            f"Notified {len(user_ids)} users of {notification_type.value} on {subject_id}, "
+            f"{sum(1 for n in existing.values() if not n.viewed)} coalesced",
+            extra={
+                "notification_id": notification_id,
+                "notification_type": notification_type.value,
+            },
+        )
+        return len(user_ids)
+
     def acknowledge_notification(self, user_id: str, notification_id: str) -> bool:
         """
         Mark a notification as viewed.
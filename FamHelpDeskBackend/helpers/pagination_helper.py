@@ -0,0 +1,27 @@
+import base64
+import json
+from typing import Optional
+
+from exceptions.pagination_exceptions import InvalidPaginationToken
+
+
+def encode_pagination_token(last_evaluated_key: Optional[dict]) -> Optional[str]:
+    """Encode a DynamoDB LastEvaluatedKey as an opaque token for API responses."""
+    if not last_evaluated_key:
+        return None
+    return base64.b64encode(json.dumps(last_evaluated_key).encode("utf-8")).decode(
+        "utf-8"
+    )
+
+
+def decode_pagination_token(token: Optional[str]) -> Optional[dict]:
+    """Decode a token produced by encode_pagination_token."""
+    if not token:
+        return None
+    try:
+        decoded = json.loads(base64.b64decode(token).decode("utf-8"))
+    except Exception as e:
+        raise InvalidPaginationToken(f"Invalid pagination token: {str(e)}")
+    if not isinstance(decoded, dict):
+        raise InvalidPaginationToken()
+    return decoded
@@ -0,0 +1,104 @@
+from typing import Any, Dict, Iterator, List, Optional
+from aws_lambda_powertools import Logger
+from pynamodb.expressions.condition import Condition
+
+from models.base import FamHelpDeskBaseModel
+
+
+class PartitionHelper:
+    """
+    Streams the raw items of a single partition, one query page at a time.
+
+    Items are returned in DynamoDB wire format so callers can deserialize each
+    one into the model class that matches its sort key shape.
+    """
+
+    def __init__(self, request_id: str = None):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+        # The base model's table connection carries the key schema the
+        # condition expressions need.
+        self.connection = FamHelpDeskBaseModel._get_connection()
+
+    def iter_items(
+        self,
+        pk: str,
+        range_key_condition: Optional[Condition] = None,
+        filter_condition: Optional[Condition] = None,
+        attributes_to_get: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        scan_index_forward: Optional[bool] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every raw item of a partition, following LastEvaluatedKey.
+
+        Args:
+            pk: The partition key to read
+            range_key_condition: Optional sort key condition
+            filter_condition: Optional filter applied after the read
+            attributes_to_get: Optional projection; items carry only these
+            page_size: Optional maximum number of items per query page
+            scan_index_forward: Sort key order (None uses DynamoDB's default)
+
+        Returns:
+            Iterator of raw DynamoDB items
+        """
+        exclusive_start_key = None
+        pages = 0
+        items = 0
+        while True:
+            response = self.connection.query(
+                pk,
+                range_key_condition=range_key_condition,
+                filter_condition=filter_condition,
+                attributes_to_get=attributes_to_get,
+                exclusive_start_key=exclusive_start_key,
+                limit=page_size,
+                scan_index_forward=scan_index_forward,
+            )
+            pages += 1
+            for item in response.get("Items", []):
+                items += 1
+                yield item
+
+            exclusive_start_key = response.get("LastEvaluatedKey")
+            if not exclusive_start_key:
+                break
+
+        self.logger.info(f"Read {items} items from partition {pk} in {pages} pages.")
+
+    def estimate_size(self, pk: str, max_bytes: Optional[int] = None) -> int:
+        """
+        Estimate the bytes of a partition's items without reading them.
+
+        COUNT queries return no items, but their consumed capacity reflects
+        the data read: an eventually consistent read unit covers 8 KB, so the
+        estimate is rounded up to 8 KB per page.
+
+        Args:
+            pk: The partition key to measure
+            max_bytes: Optional bound; counting stops once it is exceeded
+
+        Returns:
+            The estimated size in bytes
+        """
+        exclusive_start_key = None
+        size = 0
+        while True:
+            response = self.connection.query(
+                pk,
+                exclusive_start_key=exclusive_start_key,
+                return_consumed_capacity="TOTAL",
+                select="COUNT",
+            )
+            size += int(response["ConsumedCapacity"]["CapacityUnits"] * 8 * 1024)
+            exclusive_start_key = response.get("LastEvaluatedKey")
+            if not exclusive_start_key or (max_bytes is not None and size > max_bytes):
+                break
+        return size
+
+    @staticmethod
+    def get_sk(item: Dict[str, Any]) -> str:
+        """Return the plain sort key of a raw item."""
+        return item["sk"]["S"]
@@ -1,11 +1,18 @@
-from typing import Optional, List
-from pynamodb.exceptions import DoesNotExist
+from typing import Dict, Optional, List, Tuple
+from pynamodb.exceptions import DeleteError, DoesNotExist, UpdateError
 from aws_lambda_powertools import Logger
 
+from exceptions.queue_exceptions import QueueHasActiveTickets
 from models.queue import QueueModel
+from models.ticket import TicketModel, TicketSeverity, TicketStatus
 from helpers.audit_helper import AuditHelper
 from models.audit import AuditActions, AuditEntityTypes
 
+# Group of each queue this container has looked up by ID alone:
+# (family_id, queue_id) -> group_id. Queues never change group, and a
+# deleted queue is caught by the read that follows the lookup.
+_queue_groups: Dict[Tuple[str, str], str] = {}
+
 
 class QueueHelper:
     def __init__(self, request_id: str = None):
@@ -34,6 +41,7 @@ class QueueHelper:
             queue_id=queue_id,
             queue_name=queue_name,
             creation_date=creation_date,
+            queue_family_id=family_id,
         )
 
         if queue_description is not None:
@@ -74,13 +82,25 @@ class QueueHelper:
         # Capture before state
         before_data = QueueModel.clean_returned_queue(queue)
 
-        # Update fields if provided
+        # Update fields if provided; the ticket counters are left to the
+        # ticket writes that change them concurrently
+        actions = []
         if queue_name is not None:
-            queue.queue_name = queue_name
+            actions.append(QueueModel.queue_name.set(queue_name))
         if queue_description is not None:
-            queue.queue_description = queue_description
+            actions.append(QueueModel.queue_description.set(queue_description))
 
-        queue.save()
+        if actions:
+            try:
+                queue.update(actions=actions, condition=QueueModel.sk.exists())
+            except UpdateError as e:
+                if e.cause_response_code == "ConditionalCheckFailedException":
+                    self.logger.warning(
+                        f"Queue {queue_id} was deleted from family {family_id} "
+                        "before its update"
+                    )
+                    return None
+                raise
         self.logger.info(f"Updated queue {queue_id} in family {family_id}")
 
         # Capture after state and audit
@@ -110,6 +130,39 @@ class QueueHelper:
             self.logger.info(f"No queue found for {queue_id} in family {family_id}.")
             return None
 
+    def get_queue_by_id(self, family_id: str, queue_id: str) -> QueueModel | None:
+        """
+        Get a queue by ID alone, for callers that do not know its group.
+
+        The first lookup of a queue finds its group through FamilyQueueIndex;
+        later ones read the queue by its key. Queues created before the index
+        and not yet backfilled by migrate_queue_index.py are not in it; they
+        are found by reading the family's group items instead.
+        """
+        group_id = _queue_groups.get((family_id, queue_id))
+        if group_id is not None:
+            return self.get_queue(family_id, group_id, queue_id)
+
+        for queue in QueueModel.family_queue_index.query(
+            family_id, filter_condition=QueueModel.queue_id == queue_id
+        ):
+            _queue_groups[(family_id, queue_id)] = queue.group_id
+            return queue
+
+        for queue in QueueModel.query(
+            QueueModel.create_pk(family_id),
+            QueueModel.sk.startswith("GROUP#"),
+            filter_condition=QueueModel.queue_id == queue_id,
+        ):
+            self.logger.info(
+                f"Queue {queue_id} is missing from FamilyQueueIndex; "
+                "run migrate_queue_index.py"
+            )
+            _queue_groups[(family_id, queue_id)] = queue.group_id
+            return queue
+        self.logger.info(f"No queue found for {queue_id} in family {family_id}.")
+        return None
+
     def get_all_queues_by_group(
         self, family_id: str, group_id: str
     ) -> List[QueueModel]:
@@ -130,11 +183,23 @@ class QueueHelper:
     def get_all_queues_by_family(self, family_id: str) -> List[QueueModel]:
         """Get all queues in a family across all groups."""
         items: List[QueueModel] = []
-        sk_prefix = "GROUP#"
+        try:
+            # Sparse index: only queue items are read
+            for item in QueueModel.family_queue_index.query(family_id):
+                items.append(item)
+            self.logger.info(
+                f"Fetched {len(items)} queues across all groups in family {family_id} via GSI."
+            )
+            return items
+        except Exception as e:
+            self.logger.warning(
+                f"GSI query failed, falling back to partition query: {str(e)}"
+            )
+            items = []
 
         for item in QueueModel.query(
             QueueModel.create_pk(family_id),
-            QueueModel.sk.startswith(sk_prefix),
+            QueueModel.sk.startswith("GROUP#"),
         ):
             # Additional check to ensure it's a queue (not just any group item)
             if "#QUEUE#" in item.sk:
@@ -152,6 +217,12 @@ class QueueHelper:
         queue_id: str,
         deleted_by: str,
     ) -> bool:
+        """
+        Delete a queue that has no open or resolved tickets.
+
+        Raises:
+            QueueHasActiveTickets: The queue's counters show active tickets
+        """
         queue = self.get_queue(family_id, group_id, queue_id)
         if not queue:
             self.logger.warning(
@@ -159,11 +230,27 @@ class QueueHelper:
             )
             return False
 
+        self._require_no_active_tickets(queue)
+
         # Capture queue data for auditing before deletion
         queue_data = QueueModel.clean_returned_queue(queue)
 
-        # Delete the queue
-        queue.delete()
+        # Delete the queue, unless a ticket became active since it was read
+        condition = None
+        for attribute in (
+            QueueModel.open_ticket_count,
+            QueueModel.resolved_ticket_count,
+        ):
+            no_tickets = attribute.does_not_exist() | (attribute == 0)
+            condition = no_tickets if condition is None else condition & no_tickets
+        try:
+            queue.delete(condition=condition)
+        except DeleteError as e:
+            if e.cause_response_code == "ConditionalCheckFailedException":
+                raise QueueHasActiveTickets(
+                    f"Cannot delete queue {queue_id} - it has active tickets"
+                )
+            raise
         self.logger.info(f"Deleted queue {queue_id} from family {family_id}")
 
         # Audit record for deletion
@@ -184,8 +271,16 @@ class QueueHelper:
         group_id: str,
         deleted_by: str,
     ) -> int:
-        """Delete all queues for a group."""
+        """
+        Delete all queues for a group.
+
+        Raises:
+            QueueHasActiveTickets: Any queue has active tickets; nothing is
+                deleted
+        """
         queues = self.get_all_queues_by_group(family_id, group_id)
+        for queue in queues:
+            self._require_no_active_tickets(queue)
         deleted_count = 0
 
         for queue in queues:
@@ -202,3 +297,63 @@ class QueueHelper:
             f"Deleted {deleted_count} queues for group {group_id} in family {family_id}"
         )
         return deleted_count
+
+    def reconcile_ticket_counts(self, queue: QueueModel, dry_run: bool = False) -> dict:
+        """
+        Recount a queue's tickets and overwrite its counters where they drifted.
+
+        Counters only drift through writes that bypass TicketHelper, such as
+        manual table edits. A ticket write that lands between the recount and
+        the overwrite is lost from the counters until the next run.
+
+        Args:
+            queue: The queue to reconcile
+            dry_run: Only report the drift
+
+        Returns:
+            Dict of counter attribute name to (stored, actual) for each
+            counter that drifted
+        """
+        actual = {
+            QueueModel.status_count_attribute(status.value): 0
+            for status in TicketStatus
+        }
+        actual.update(
+            {
+                QueueModel.open_severity_count_attribute(severity.value): 0
+                for severity in TicketSeverity
+            }
+        )
+        for ticket in TicketModel.queue_ticket_index.query(
+            TicketModel.create_queue_ticket_pk(queue.family_id, queue.queue_id)
+        ):
+            actual[QueueModel.status_count_attribute(ticket.status)] += 1
+            if ticket.status == TicketStatus.OPEN.value:
+                actual[QueueModel.open_severity_count_attribute(ticket.severity)] += 1
+
+        drift = {
+            name: (getattr(queue, name) or 0, count)
+            for name, count in actual.items()
+            if (getattr(queue, name) or 0) != count
+        }
+        if drift and not dry_run:
+            queue.update(
+                actions=[
+                    getattr(QueueModel, name).set(count)
+                    for name, (_, count) in drift.items()
+                ],
+                condition=QueueModel.sk.exists(),
+            )
+        if drift:
+            self.logger.warning(
+                f"{'Found' if dry_run else 'Repaired'} ticket counter drift on queue "
+                f"{queue.queue_id} in family {queue.family_id}: {drift}"
+            )
+        return drift
+
+    def _require_no_active_tickets(self, queue: QueueModel) -> None:
+        active = QueueModel.get_active_ticket_count(queue)
+        if active:
+            raise QueueHasActiveTickets(
+                f"Cannot delete queue {queue.queue_id} - it has {active} active tickets"
+            )
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Tuple
 from aws_lambda_powertools import Logger
 
 from exceptions.group_exceptions import (
@@ -14,8 +14,12 @@ from exceptions.queue_exceptions import (
     QueueGroupMismatch,
 )
 from helpers.family_helper import FamilyHelper
+from helpers.family_path_helper import FamilyPathHelper
 from helpers.group_helper import GroupHelper
 from helpers.queue_helper import QueueHelper
+from models.family import FamilyModel
+from models.group import GroupModel
+from models.queue import QueueModel
 
 
 class QueueValidationHelper:
@@ -29,6 +33,7 @@ class QueueValidationHelper:
         self.family_helper = FamilyHelper(request_id=request_id)
         self.group_helper = GroupHelper(request_id=request_id)
         self.queue_helper = QueueHelper(request_id=request_id)
+        self.path_helper = FamilyPathHelper(request_id=request_id)
 
     def validate_queue_name(self, queue_name: str, max_length: int = 100) -> None:
         """Validate queue name format and length."""
@@ -92,6 +97,48 @@ class QueueValidationHelper:
                 f"Queue {queue_id} does not belong to group {group_id} in family {family_id}"
             )
 
+    def validate_queue_path(
+        self, family_id: str, group_id: str, queue_id: Optional[str] = None
+    ) -> Tuple[FamilyModel, GroupModel, Optional[QueueModel]]:
+        """
+        Validate that the family, group and (optionally) queue exist and belong
+        together, fetching all of them in a single round trip.
+        """
+        if not family_id or not family_id.strip():
+            raise InvalidQueueData("Family ID is required")
+        if not group_id or not group_id.strip():
+            raise InvalidQueueData("Group ID is required")
+        if queue_id is not None and not queue_id.strip():
+            raise InvalidQueueData("Queue ID is required")
+
+        family, group, queue = self.path_helper.get_path(family_id, group_id, queue_id)
+
+        if not family:
+            raise FamilyNotFound(f"Family with ID {family_id} not found")
+
+        if not group:
+            raise InvalidQueueData(
+                f"Group {group_id} does not exist in family {family_id}"
+            )
+
+        if group.family_id != family_id:
+            raise GroupFamilyMismatch(
+                f"Group {group_id} does not belong to family {family_id}"
+            )
+
+        if queue_id is not None:
+            if not queue:
+                raise QueueNotFound(
+                    f"Queue {queue_id} does not exist in group {group_id} of family {family_id}"
+                )
+
+            if queue.family_id != family_id or queue.group_id != group_id:
+                raise QueueGroupMismatch(
+                    f"Queue {queue_id} does not belong to group {group_id} in family {family_id}"
+                )
+
+        return family, group, queue
+
     def validate_create_queue_data(
         self,
         family_id: str,
@@ -100,8 +147,7 @@ class QueueValidationHelper:
         queue_description: Optional[str] = None,
     ) -> None:
         """Validate all data required for creating a queue."""
-        self.validate_family_exists(family_id)
-        self.validate_group_exists(family_id, group_id)
+        self.validate_queue_path(family_id, group_id)
         self.validate_queue_name(queue_name)
         self.validate_queue_description(queue_description)
 
@@ -114,7 +160,7 @@ class QueueValidationHelper:
         queue_description: Optional[str] = None,
     ) -> None:
         """Validate all data required for updating a queue."""
-        self.validate_queue_exists(family_id, group_id, queue_id)
+        self.validate_queue_path(family_id, group_id, queue_id)
 
         if queue_name is not None:
             self.validate_queue_name(queue_name)
@@ -124,6 +170,7 @@ class QueueValidationHelper:
 
     def validate_queue_operation(
         self, family_id: str, group_id: str, queue_id: str
-    ) -> None:
-        """Validate that a queue operation can be performed."""
-        self.validate_queue_exists(family_id, group_id, queue_id)
+    ) -> QueueModel:
+        """Validate that a queue operation can be performed and return the queue."""
+        _, _, queue = self.validate_queue_path(family_id, group_id, queue_id)
+        return queue
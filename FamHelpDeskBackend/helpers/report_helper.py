@@ -0,0 +1,313 @@
+import gzip
+import json
+import threading
+from typing import Any, Dict, Optional
+from aws_lambda_powertools import Logger
+from pynamodb.exceptions import DoesNotExist, PutError
+
+from constants.report import (
+    REPORT_STORE_URI,
+    REPORT_WORKER_FUNCTION,
+    REPORT_RENDERER_VERSION,
+    REPORT_PENDING_TIMEOUT_SECONDS,
+    REPORT_MAX_TICKETS,
+    REPORT_MAX_COMMENTS,
+)
+from exceptions.group_exceptions import FamilyNotFound
+from exceptions.queue_exceptions import QueueNotFound
+from exceptions.report_exceptions import (
+    ReportNotFound,
+    ReportNotReady,
+    InvalidReportRequest,
+)
+from exceptions.ticket_exceptions import TicketNotFound
+from helpers.archive_store_helper import get_archive_store, sha256_hex
+from helpers.family_snapshot_helper import FamilySnapshot
+from helpers.report_renderer import render_report_pdf
+from helpers.ticket_helper import TicketHelper
+from helpers.user_profile_helper import UserProfileHelper
+from models.family import FamilyModel
+from models.group import GroupModel
+from models.queue import QueueModel
+from models.report import ReportModel, ReportStatus, ReportType
+from models.ticket import TicketModel
+from models.ticket_comment import TicketCommentModel
+
+
+class ReportHelper:
+    """
+    Printable queue and ticket reports, rendered off the request path.
+
+    Requesting a report only reads: it builds a JSON snapshot of the data
+    the report shows and hashes it into the report ID. A report already
+    rendered from identical data is served from the cache; otherwise the
+    snapshot is written to the report store and a worker is asked to render
+    it (see render_reports.py). The worker loads fpdf; the API never does.
+    """
+
+    def __init__(self, request_id: str = None):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+        self.request_id = request_id
+        self.store = get_archive_store(REPORT_STORE_URI)
+
+    def request_report(
+        self,
+        family_id: str,
+        report_type: ReportType,
+        queue_id: str,
+        actor_user_id: str,
+        ticket_id: Optional[str] = None,
+    ) -> ReportModel:
+        """
+        Get the report of the current data, enqueueing its rendering when no
+        rendered or in-progress report of that data exists.
+
+        Raises:
+            InvalidReportRequest: A ticket report without a ticket ID
+            FamilyNotFound, QueueNotFound, TicketNotFound: The report's
+                targets do not exist
+        """
+        snapshot = self.build_snapshot(family_id, report_type, queue_id, ticket_id)
+        encoded = self._encode_snapshot(snapshot)
+        report_id = sha256_hex(encoded)
+
+        existing = self._find_report(family_id, report_id)
+        now = ReportModel.now_epoch()
+        if existing and not self._needs_render(existing, now):
+            self.logger.info(
+                f"Report {report_id} of family {family_id} is {existing.status}; "
+                "not rendering again"
+            )
+            return existing
+
+        # The snapshot goes to the store before the report is claimed, so a
+        # worker never finds a PENDING report without its snapshot
+        self.store.put(
+            ReportModel.create_snapshot_key(family_id, report_id),
+            gzip.compress(encoded),
+        )
+        report = ReportModel(
+            pk=ReportModel.create_pk(family_id),
+            sk=ReportModel.create_sk(report_id),
+            family_id=family_id,
+            report_id=report_id,
+            report_type=report_type.value,
+            queue_id=queue_id,
+            ticket_id=ticket_id,
+            status=ReportStatus.PENDING.value,
+            requested_by=actor_user_id,
+            requested_at=now,
+        )
+        try:
+            # Only one of several concurrent requests enqueues the render
+            report.save(
+                condition=ReportModel.sk.does_not_exist()
+                | (ReportModel.status == ReportStatus.FAILED.value)
+                | (
+                    (ReportModel.status == ReportStatus.PENDING.value)
+                    & (ReportModel.requested_at < now - REPORT_PENDING_TIMEOUT_SECONDS)
+                )
+            )
+        except PutError as e:
+            if e.cause_response_code != "ConditionalCheckFailedException":
+                raise
+            self.logger.info(f"Report {report_id} was enqueued by another request")
+            return self.get_report(family_id, report_id)
+
+        self._enqueue(family_id, report_id)
+        self.logger.info(
+            f"Enqueued {report_type.value} report {report_id} of family {family_id}"
+        )
+        return report
+
+    def build_snapshot(
+        self,
+        family_id: str,
+        report_type: ReportType,
+        queue_id: str,
+        ticket_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Everything a report shows, as plain JSON. Nothing in it depends on
+        when it was built, so unchanged data always hashes the same.
+        """
+        if report_type == ReportType.TICKET and not ticket_id:
+            raise InvalidReportRequest("A ticket report needs a ticket ID")
+
+        family_snapshot = FamilySnapshot(family_id, request_id=self.request_id).load()
+        family = family_snapshot.get_family()
+        if not family:
+            raise FamilyNotFound(f"Family with ID {family_id} not found.")
+        queue = family_snapshot.queues.get(queue_id)
+        if not queue:
+            raise QueueNotFound(
+                f"Queue {queue_id} does not exist in family {family_id}"
+            )
+        group = family_snapshot.get_group(queue.group_id)
+
+        snapshot = {
+            "renderer_version": REPORT_RENDERER_VERSION,
+            "report_type": report_type.value,
+            "family": FamilyModel.clean_returned_family(family),
+            "group": (
+                GroupModel.clean_returned_group(group)
+                if group
+                else {"group_id": queue.group_id, "group_name": queue.group_id}
+            ),
+            "queue": QueueModel.clean_returned_queue(queue),
+        }
+        if report_type == ReportType.QUEUE:
+            tickets = self._get_report_tickets(family_id, queue_id)
+            snapshot["tickets"] = [
+                TicketModel.clean_returned_ticket(t)
+                for t in tickets[:REPORT_MAX_TICKETS]
+            ]
+            snapshot["truncated"] = len(tickets) > REPORT_MAX_TICKETS
+            user_ids = {t.assigned_to for t in tickets if t.assigned_to}
+        else:
+            ticket = TicketHelper(request_id=self.request_id).get_ticket(
+                family_id, queue_id, ticket_id
+            )
+            if not ticket:
+                raise TicketNotFound(f"Ticket {ticket_id} not found.")
+            comments = list(
+                TicketCommentModel.query(
+                    TicketCommentModel.create_pk(family_id),
+                    TicketCommentModel.sk.startswith(
+                        TicketCommentModel.create_sk_prefix(queue_id, ticket_id)
+                    ),
+                    limit=REPORT_MAX_COMMENTS + 1,
+                )
+            )
+            snapshot["ticket"] = TicketModel.clean_returned_ticket(ticket)
+            snapshot["comments"] = [
+                TicketCommentModel.clean_returned_comment(c)
+                for c in comments[:REPORT_MAX_COMMENTS]
+            ]
+            snapshot["truncated"] = len(comments) > REPORT_MAX_COMMENTS
+            user_ids = {c.comment_user for c in comments}
+            user_ids.update(u for u in (ticket.assigned_to, ticket.created_by) if u)
+
+        profiles = UserProfileHelper(request_id=self.request_id).get_profiles(user_ids)
+        snapshot["users"] = {
+            user_id: profile.display_name for user_id, profile in profiles.items()
+        }
+        return snapshot
+
+    def get_report(self, family_id: str, report_id: str) -> ReportModel:
+        report = self._find_report(family_id, report_id)
+        if not report:
+            raise ReportNotFound(f"Report {report_id} not found in family {family_id}")
+        return report
+
+    def get_report_pdf(self, family_id: str, report_id: str) -> bytes:
+        """
+        Raises:
+            ReportNotFound: No such report, or its PDF is gone from the store
+            ReportNotReady: The report is still PENDING or FAILED
+        """
+        report = self.get_report(family_id, report_id)
+        if report.status != ReportStatus.READY.value:
+            raise ReportNotReady(f"Report {report_id} is {report.status}")
+        pdf = self.store.get(ReportModel.create_pdf_key(family_id, report_id))
+        if pdf is None:
+            raise ReportNotFound(f"PDF of report {report_id} is missing")
+        return pdf
+
+    def render_report(self, family_id: str, report_id: str) -> ReportModel:
+        """
+        Render a PENDING report's snapshot to PDF and mark it READY, or
+        FAILED with the error. Runs in the report worker.
+        """
+        report = self.get_report(family_id, report_id)
+        if report.status == ReportStatus.READY.value:
+            self.logger.info(f"Report {report_id} is already rendered")
+            return report
+
+        try:
+            data = self.store.get(ReportModel.create_snapshot_key(family_id, report_id))
+            if data is None:
+                raise ReportNotFound(f"Snapshot of report {report_id} is missing")
+            snapshot = json.loads(gzip.decompress(data).decode("utf-8"))
+            pdf = render_report_pdf(snapshot)
+            self.store.put(ReportModel.create_pdf_key(family_id, report_id), pdf)
+        except Exception as e:
+            self.logger.exception(f"Failed to render report {report_id}")
+            report.update(
+                actions=[
+                    ReportModel.status.set(ReportStatus.FAILED.value),
+                    ReportModel.error.set(str(e)[:500] or type(e).__name__),
+                ]
+            )
+            return report
+
+        report.update(
+            actions=[
+                ReportModel.status.set(ReportStatus.READY.value),
+                ReportModel.rendered_at.set(ReportModel.now_epoch()),
+                ReportModel.pdf_size.set(len(pdf)),
+                ReportModel.error.remove(),
+            ]
+        )
+        self.logger.info(f"Rendered report {report_id} ({len(pdf)} bytes)")
+        return report
+
+    def _get_report_tickets(self, family_id: str, queue_id: str) -> list:
+        """The queue's open and resolved tickets, one more than a report lists."""
+        ticket_helper = TicketHelper(request_id=self.request_id)
+        tickets, last_evaluated_key = [], None
+        while len(tickets) <= REPORT_MAX_TICKETS:
+            page, last_evaluated_key = ticket_helper.get_queue_tickets(
+                family_id,
+                queue_id,
+                limit=REPORT_MAX_TICKETS + 1 - len(tickets),
+                last_evaluated_key=last_evaluated_key,
+            )
+            tickets.extend(page)
+            if not last_evaluated_key:
+                break
+        return tickets
+
+    def _find_report(self, family_id: str, report_id: str) -> Optional[ReportModel]:
+        try:
+            return ReportModel.get(
+                ReportModel.create_pk(family_id), ReportModel.create_sk(report_id)
+            )
+        except DoesNotExist:
+            return None
+
+    @staticmethod
+    def _needs_render(report: ReportModel, now: int) -> bool:
+        if report.status == ReportStatus.FAILED.value:
+            return True
+        return (
+            report.status == ReportStatus.PENDING.value
+            and report.requested_at < now - REPORT_PENDING_TIMEOUT_SECONDS
+        )
+
+    def _enqueue(self, family_id: str, report_id: str) -> None:
+        if REPORT_WORKER_FUNCTION:
+            import boto3
+
+            # Event invocations return once queued; the worker renders later
+            boto3.client("lambda").invoke(
+                FunctionName=REPORT_WORKER_FUNCTION,
+                InvocationType="Event",
+                Payload=json.dumps({"family_id": family_id, "report_id": report_id}),
+            )
+            return
+
+        threading.Thread(
+            target=ReportHelper(request_id=self.request_id).render_report,
+            args=(family_id, report_id),
+            daemon=True,
+        ).start()
+
+    @staticmethod
+    def _encode_snapshot(snapshot: Dict[str, Any]) -> bytes:
+        # Sorted keys make the encoding, and so the hash, canonical
+        return json.dumps(snapshot, sort_keys=True, separators=(",", ":")).encode(
+            "utf-8"
+        )
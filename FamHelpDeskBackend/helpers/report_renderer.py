@@ -0,0 +1,206 @@
+"""
+PDF layout of queue and ticket reports.
+
+Renders the snapshots built by ReportHelper.build_snapshot. fpdf is imported
+inside render_report_pdf so only the report worker ever loads it; the API
+imports this module without paying for the PDF library.
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from models.report import ReportType
+
+PAGE_WIDTH = 190
+LINE_HEIGHT = 6
+
+# (heading, width, snapshot ticket field) of the queue report's ticket table
+QUEUE_TICKET_COLUMNS: List[Tuple[str, int, str]] = [
+    ("Ticket", 24, "ticket_key"),
+    ("Sev", 12, "severity"),
+    ("Status", 22, "status"),
+    ("Title", 78, "title"),
+    ("Assignee", 30, "assigned_to"),
+    ("Created", 24, "creation_date"),
+]
+
+
+def render_report_pdf(snapshot: Dict[str, Any]) -> bytes:
+    """Render a report snapshot as a PDF document."""
+    from fpdf import FPDF
+
+    footer_text = _latin1(
+        f"{snapshot['family']['family_name']} - {_report_title(snapshot)}"
+    )
+
+    class ReportPDF(FPDF):
+        def footer(self):
+            self.set_y(-15)
+            self.set_font("Helvetica", "I", 8)
+            self.cell(0, 10, f"{footer_text} - page {self.page_no()}", 0, 0, "C")
+
+    pdf = ReportPDF(orientation="P", unit="mm", format="A4")
+    pdf.set_auto_page_break(True, margin=20)
+    pdf.add_page()
+
+    pdf.set_font("Helvetica", "B", 16)
+    pdf.multi_cell(PAGE_WIDTH, 9, _latin1(_report_title(snapshot)))
+    pdf.set_font("Helvetica", "", 10)
+    pdf.cell(
+        PAGE_WIDTH,
+        LINE_HEIGHT,
+        _latin1(
+            f"{snapshot['family']['family_name']} / {snapshot['group']['group_name']}"
+            f" / {snapshot['queue']['queue_name']}"
+        ),
+        0,
+        1,
+    )
+    pdf.ln(4)
+
+    if snapshot["report_type"] == ReportType.QUEUE.value:
+        _render_queue(pdf, snapshot)
+    else:
+        _render_ticket(pdf, snapshot)
+
+    data = pdf.output(dest="S")
+    # fpdf 1.x returns a latin-1 string, fpdf2 a bytearray
+    return data.encode("latin-1") if isinstance(data, str) else bytes(data)
+
+
+def _render_queue(pdf, snapshot: Dict[str, Any]) -> None:
+    queue = snapshot["queue"]
+    users = snapshot["users"]
+
+    if queue.get("queue_description"):
+        pdf.multi_cell(PAGE_WIDTH, LINE_HEIGHT, _latin1(queue["queue_description"]))
+        pdf.ln(2)
+
+    # Snapshot keys come back sorted, so the counts are laid out explicitly
+    counts = queue["ticket_counts"]
+    _section(pdf, "Ticket counts")
+    for status in ("open", "resolved", "closed"):
+        _field(pdf, status.capitalize(), str(counts[status]))
+    for severity, count in sorted(counts["open_by_severity"].items()):
+        _field(pdf, f"Open, severity {severity}", str(count))
+    pdf.ln(2)
+
+    tickets = snapshot["tickets"]
+    heading = f"Open and resolved tickets ({len(tickets)})"
+    if snapshot.get("truncated"):
+        heading += f", first {len(tickets)} shown"
+    _section(pdf, heading)
+
+    pdf.set_font("Helvetica", "B", 9)
+    for title, width, _ in QUEUE_TICKET_COLUMNS:
+        pdf.cell(width, LINE_HEIGHT, title, "B", 0)
+    pdf.ln(LINE_HEIGHT)
+
+    pdf.set_font("Helvetica", "", 9)
+    for ticket in tickets:
+        for _, width, field in QUEUE_TICKET_COLUMNS:
+            if field == "ticket_key":
+                value = ticket.get("ticket_key") or ticket["ticket_id"][:8]
+            elif field == "assigned_to":
+                value = _user_name(users, ticket.get("assigned_to"))
+            elif field == "creation_date":
+                value = _format_date(ticket["creation_date"], with_time=False)
+            else:
+                value = str(ticket.get(field) or "")
+            pdf.cell(width, LINE_HEIGHT, _fit(pdf, _latin1(value), width), 0, 0)
+        pdf.ln(LINE_HEIGHT)
+
+
+def _render_ticket(pdf, snapshot: Dict[str, Any]) -> None:
+    ticket = snapshot["ticket"]
+    users = snapshot["users"]
+
+    _section(pdf, "Details")
+    for label, value in (
+        ("Status", ticket["status"]),
+        ("Severity", ticket["severity"]),
+        ("Assignee", _user_name(users, ticket.get("assigned_to"))),
+        ("Created by", _user_name(users, ticket.get("created_by"))),
+        ("Created", _format_date(ticket["creation_date"])),
+        ("Resolved", _format_date(ticket.get("resolved_date"))),
+        ("Closed", _format_date(ticket.get("closed_date"))),
+        ("SLA due", _format_date(ticket.get("sla_due"))),
+        ("SLA breached", _format_date(ticket.get("sla_breached_at"))),
+    ):
+        if value:
+            _field(pdf, label, value)
+    pdf.ln(2)
+
+    if ticket.get("description"):
+        _section(pdf, "Description")
+        pdf.set_font("Helvetica", "", 10)
+        pdf.multi_cell(PAGE_WIDTH, LINE_HEIGHT, _latin1(ticket["description"]))
+        pdf.ln(2)
+
+    comments = snapshot["comments"]
+    heading = f"Comments ({ticket.get('comment_count', len(comments))})"
+    if snapshot.get("truncated"):
+        heading += f", first {len(comments)} shown"
+    _section(pdf, heading)
+    for comment in comments:
+        pdf.set_font("Helvetica", "B", 9)
+        pdf.cell(
+            PAGE_WIDTH,
+            LINE_HEIGHT,
+            _latin1(
+                f"{_user_name(users, comment['comment_user'])} - "
+                f"{_format_date(comment['comment_date'])}"
+            ),
+            0,
+            1,
+        )
+        pdf.set_font("Helvetica", "", 10)
+        pdf.multi_cell(PAGE_WIDTH, LINE_HEIGHT, _latin1(comment["comment_body"]))
+        pdf.ln(2)
+
+
+def _report_title(snapshot: Dict[str, Any]) -> str:
+    if snapshot["report_type"] == ReportType.QUEUE.value:
+        return f"Queue report: {snapshot['queue']['queue_name']}"
+    ticket = snapshot["ticket"]
+    return f"{ticket.get('ticket_key') or 'Ticket'}: {ticket['title']}"
+
+
+def _section(pdf, title: str) -> None:
+    pdf.set_font("Helvetica", "B", 12)
+    pdf.cell(PAGE_WIDTH, 8, _latin1(title), "B", 1)
+    pdf.ln(1)
+
+
+def _field(pdf, label: str, value: str) -> None:
+    pdf.set_font("Helvetica", "B", 10)
+    pdf.cell(40, LINE_HEIGHT, _latin1(label), 0, 0)
+    pdf.set_font("Helvetica", "", 10)
+    pdf.cell(PAGE_WIDTH - 40, LINE_HEIGHT, _latin1(value), 0, 1)
+
+
+def _user_name(users: Dict[str, str], user_id: Optional[str]) -> str:
+    if not user_id:
+        return ""
+    return users.get(user_id) or user_id[:8]
+
+
+def _format_date(epoch: Optional[int], with_time: bool = True) -> str:
+    if not epoch:
+        return ""
+    fmt = "%Y-%m-%d %H:%M UTC" if with_time else "%Y-%m-%d"
+    return time.strftime(fmt, time.gmtime(epoch))
+
+
+def _fit(pdf, text: str, width: float) -> str:
+    """Shorten text with an ellipsis until it fits a table cell."""
+    if pdf.get_string_width(text) <= width - 1:
+        return text
+    while text and pdf.get_string_width(f"{text}...") > width - 1:
+        text = text[:-1]
+    return f"{text}..."
+
+
+def _latin1(text: str) -> str:
+    # The core PDF fonts only cover latin-1
+    return text.encode("latin-1", "replace").decode("latin-1")
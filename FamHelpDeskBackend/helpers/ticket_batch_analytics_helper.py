@@ -0,0 +1,334 @@
+"""
+Offline ticket analytics of a whole family, computed over columnar arrays.
+
+The rollup analytics (TicketRollupHelper) answer counts and means per day;
+distributions need every ticket. This reads a family's tickets once through
+FamilyExportReader, fetching only the attributes it decodes, into one NumPy
+array per attribute, and computes percentiles, histograms and cohorts with
+whole-array operations, so hundreds of thousands of tickets take seconds,
+most of it the partition read.
+
+NumPy is imported inside the methods, so nothing on the API path loads it;
+it is only needed where the batch tools run (pip install numpy).
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+from aws_lambda_powertools import Logger
+
+from constants.analytics import (
+    BATCH_ANALYTICS_PERCENTILES,
+    BATCH_ANALYTICS_DURATION_BUCKETS,
+)
+from helpers.family_export_reader import FamilyExportReader
+from models.ticket import TicketSeverity, TicketStatus
+
+SEVERITIES = list(TicketSeverity)
+STATUSES = list(TicketStatus)
+# Code of a missing date, an unassigned ticket or an unknown severity
+NO_VALUE = -1
+
+# The only attributes the columns are built from
+COLUMN_ATTRIBUTES = [
+    "queue_id",
+    "severity",
+    "status",
+    "creation_date",
+    "resolved_date",
+    "closed_date",
+    "assigned_to",
+    "sla_breached_at",
+]
+
+
+class TicketColumns:
+    """
+    A family's tickets as parallel arrays, one element per ticket.
+
+    severity and status are codes into SEVERITIES and STATUSES, queue and
+    assignee codes into queue_ids and assignee_ids. Dates are epoch seconds.
+    Missing dates, unassigned tickets and unknown severities are NO_VALUE.
+    """
+
+    def __init__(
+        self,
+        severity,
+        status,
+        queue,
+        assignee,
+        created,
+        resolved,
+        closed,
+        sla_breached,
+        queue_ids: List[str],
+        assignee_ids: List[str],
+    ):
+        self.severity = severity
+        self.status = status
+        self.queue = queue
+        self.assignee = assignee
+        self.created = created
+        self.resolved = resolved
+        self.closed = closed
+        self.sla_breached = sla_breached
+        self.queue_ids = queue_ids
+        self.assignee_ids = assignee_ids
+
+    def __len__(self) -> int:
+        return len(self.created)
+
+
+class TicketBatchAnalyticsHelper:
+    def __init__(self, request_id: str = None):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+        self.request_id = request_id
+
+    def generate_report(self, family_id: str, now: Optional[int] = None) -> dict:
+        """Read a family's tickets and build their analytics report."""
+        started = time.monotonic()
+        columns = self.load_columns(family_id)
+        loaded = time.monotonic()
+        report = self.build_report(columns, now=now)
+        report["family_id"] = family_id
+        self.logger.info(
+            f"Analyzed {len(columns)} tickets of family {family_id}: "
+            f"read in {loaded - started:.2f}s, computed in "
+            f"{time.monotonic() - loaded:.2f}s"
+        )
+        return report
+
+    def load_columns(self, family_id: str) -> TicketColumns:
+        """
+        Stream the family's tickets into columns. Items are decoded straight
+        from their raw form; building models would cost more than the math.
+        """
+        import numpy as np
+
+        severity_codes = {s.value: code for code, s in enumerate(SEVERITIES)}
+        status_codes = {s.value: code for code, s in enumerate(STATUSES)}
+        queue_codes: Dict[str, int] = {}
+        assignee_codes: Dict[str, int] = {}
+        names = ("severity", "status", "queue", "assignee", "created")
+        names += ("resolved", "closed", "sla_breached")
+        values: Dict[str, List[int]] = {name: [] for name in names}
+
+        reader = FamilyExportReader(family_id, request_id=self.request_id)
+        for item in reader.iter_ticket_items(attributes=COLUMN_ATTRIBUTES):
+            values["severity"].append(
+                severity_codes.get(item["severity"]["S"], NO_VALUE)
+            )
+            values["status"].append(status_codes.get(item["status"]["S"], NO_VALUE))
+            values["queue"].append(
+                queue_codes.setdefault(item["queue_id"]["S"], len(queue_codes))
+            )
+            assignee = item.get("assigned_to")
+            values["assignee"].append(
+                assignee_codes.setdefault(assignee["S"], len(assignee_codes))
+                if assignee
+                else NO_VALUE
+            )
+            for name, attribute in (
+                ("created", "creation_date"),
+                ("resolved", "resolved_date"),
+                ("closed", "closed_date"),
+                ("sla_breached", "sla_breached_at"),
+            ):
+                value = item.get(attribute)
+                values[name].append(int(value["N"]) if value else NO_VALUE)
+
+        return TicketColumns(
+            *(np.array(values[name], dtype=np.int64) for name in names),
+            queue_ids=list(queue_codes),
+            assignee_ids=list(assignee_codes),
+        )
+
+    def build_report(self, columns: TicketColumns, now: Optional[int] = None) -> dict:
+        """
+        The analytics of a set of ticket columns, as plain JSON:
+            - counts by status, severity and queue
+            - time to resolve (creation until leaving OPEN) of tickets no
+              longer OPEN, overall and by severity, with a histogram
+            - age of OPEN tickets, with a histogram
+            - SLA breaches by severity
+            - monthly creation cohorts: how many were resolved, how fast,
+              and how many are still OPEN
+            - per assignee workload and time to resolve
+        Reopened tickets count from their latest OPEN period's end.
+        """
+        import numpy as np
+
+        now = int(time.time()) if now is None else now
+        c = columns
+        is_open = c.status == STATUSES.index(TicketStatus.OPEN)
+        # Tickets leave OPEN by being resolved, or closed without being resolved
+        left_open = np.where(c.resolved != NO_VALUE, c.resolved, c.closed)
+        is_done = ~is_open & (left_open != NO_VALUE)
+        resolve_seconds = np.maximum(left_open - c.created, 0)
+        open_age = np.maximum(now - c.created, 0)
+        is_breached = c.sla_breached != NO_VALUE
+        known_severity = c.severity != NO_VALUE
+
+        severity_count = len(SEVERITIES)
+        by_severity_created = np.bincount(
+            c.severity[known_severity], minlength=severity_count
+        )
+        by_severity_open = np.bincount(
+            c.severity[known_severity & is_open], minlength=severity_count
+        )
+        by_severity_breached = np.bincount(
+            c.severity[known_severity & is_breached], minlength=severity_count
+        )
+        done_by_severity = self._grouped_distributions(
+            c.severity[known_severity & is_done],
+            resolve_seconds[known_severity & is_done],
+            severity_count,
+        )
+
+        queue_count = len(c.queue_ids)
+        by_queue_total = np.bincount(c.queue, minlength=queue_count)
+        by_queue_open = np.bincount(c.queue[is_open], minlength=queue_count)
+
+        months = c.created.astype("datetime64[s]").astype("datetime64[M]")
+        cohort_months, cohort = np.unique(months, return_inverse=True)
+        cohort = cohort.reshape(-1)
+        cohort_count = len(cohort_months)
+        cohort_open = np.bincount(cohort[is_open], minlength=cohort_count)
+        cohort_breached = np.bincount(cohort[is_breached], minlength=cohort_count)
+        done_by_cohort = self._grouped_distributions(
+            cohort[is_done], resolve_seconds[is_done], cohort_count
+        )
+        cohort_created = np.bincount(cohort, minlength=cohort_count)
+
+        assignee_count = len(c.assignee_ids)
+        assigned = c.assignee != NO_VALUE
+        assignee_open = np.bincount(
+            c.assignee[assigned & is_open], minlength=assignee_count
+        )
+        done_by_assignee = self._grouped_distributions(
+            c.assignee[assigned & is_done],
+            resolve_seconds[assigned & is_done],
+            assignee_count,
+        )
+
+        report = {
+            "generated_at": now,
+            "ticket_count": len(c),
+            "by_status": {
+                status.value: int(count)
+                for status, count in zip(
+                    STATUSES,
+                    np.bincount(
+                        c.status[c.status != NO_VALUE], minlength=len(STATUSES)
+                    ),
+                )
+            },
+            "by_severity": {
+                severity.value: {
+                    "created": int(by_severity_created[code]),
+                    "open": int(by_severity_open[code]),
+                    "sla_breached": int(by_severity_breached[code]),
+                    "sla_breach_rate": self._rate(
+                        by_severity_breached[code], by_severity_created[code]
+                    ),
+                    "time_to_resolve_seconds": done_by_severity[code],
+                }
+                for code, severity in enumerate(SEVERITIES)
+            },
+            "by_queue": [
+                {
+                    "queue_id": queue_id,
+                    "total": int(by_queue_total[code]),
+                    "open": int(by_queue_open[code]),
+                }
+                for code, queue_id in enumerate(c.queue_ids)
+            ],
+            "time_to_resolve_seconds": self._distribution(resolve_seconds[is_done]),
+            "time_to_resolve_histogram": self._histogram(resolve_seconds[is_done]),
+            "open_age_seconds": self._distribution(open_age[is_open]),
+            "open_age_histogram": self._histogram(open_age[is_open]),
+            "cohorts": [
+                {
+                    "month": str(month),
+                    "created": int(cohort_created[code]),
+                    "resolved": done_by_cohort[code]["count"],
+                    "resolved_rate": self._rate(
+                        done_by_cohort[code]["count"], cohort_created[code]
+                    ),
+                    "still_open": int(cohort_open[code]),
+                    "sla_breached": int(cohort_breached[code]),
+                    "time_to_resolve_seconds": done_by_cohort[code],
+                }
+                for code, month in enumerate(cohort_months)
+            ],
+            "assignees": sorted(
+                (
+                    {
+                        "user_id": user_id,
+                        "open": int(assignee_open[code]),
+                        "resolved": done_by_assignee[code]["count"],
+                        "time_to_resolve_seconds": done_by_assignee[code],
+                    }
+                    for code, user_id in enumerate(c.assignee_ids)
+                ),
+                key=lambda a: (-a["open"], -a["resolved"], a["user_id"]),
+            ),
+        }
+        return report
+
+    @staticmethod
+    def _distribution(values) -> Dict[str, Any]:
+        """Count, mean and percentiles of a set of durations."""
+        import numpy as np
+
+        summary = {"count": int(len(values)), "mean": None}
+        summary.update({f"p{p}": None for p in BATCH_ANALYTICS_PERCENTILES})
+        if len(values):
+            summary["mean"] = round(float(values.mean()))
+            for p, value in zip(
+                BATCH_ANALYTICS_PERCENTILES,
+                np.percentile(values, BATCH_ANALYTICS_PERCENTILES),
+            ):
+                summary[f"p{p}"] = round(float(value))
+        return summary
+
+    @staticmethod
+    def _grouped_distributions(codes, values, group_count: int) -> List[dict]:
+        """
+        _distribution of each group's values, groups given by codes 0 to
+        group_count - 1. One sort by (code, value) lays every group out as
+        a contiguous, sorted slice.
+        """
+        import numpy as np
+
+        order = np.lexsort((values, codes))
+        codes, values = codes[order], values[order]
+        bounds = np.searchsorted(codes, np.arange(group_count + 1))
+        return [
+            TicketBatchAnalyticsHelper._distribution(values[bounds[i] : bounds[i + 1]])
+            for i in range(group_count)
+        ]
+
+    @staticmethod
+    def _histogram(values) -> List[dict]:
+        """Counts of durations per BATCH_ANALYTICS_DURATION_BUCKETS bucket."""
+        import numpy as np
+
+        edges = np.array(BATCH_ANALYTICS_DURATION_BUCKETS, dtype=np.int64)
+        counts = np.bincount(
+            np.searchsorted(edges, values, side="left"), minlength=len(edges) + 1
+        )
+        return [
+            {
+                "max_seconds": (
+                    BATCH_ANALYTICS_DURATION_BUCKETS[i] if i < len(edges) else None
+                ),
+                "count": int(count),
+            }
+            for i, count in enumerate(counts)
+        ]
+
+    @staticmethod
+    def _rate(part, whole) -> Optional[float]:
+        return round(float(part) / float(whole), 4) if whole else None
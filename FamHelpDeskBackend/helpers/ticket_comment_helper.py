@@ -0,0 +1,317 @@
+from typing import List, Optional, Tuple
+from pynamodb.exceptions import DoesNotExist, TransactWriteError
+from aws_lambda_powertools import Logger
+
+from exceptions.comment_exceptions import CommentNotFound, CommentPermissionDenied
+from exceptions.ticket_exceptions import TicketNotFound
+from helpers.audit_helper import AuditHelper
+from helpers.notification_helper import NotificationHelper
+from helpers.transaction_helper import new_transaction, condition_failed
+from models.audit import AuditActions, AuditEntityTypes
+from models.notification import NotificationType
+from models.ticket import TicketModel
+from models.ticket_comment import TicketCommentModel
+
+
+class TicketCommentHelper:
+    """
+    Ticket comment threads.
+
+    Comment IDs are time-ordered, so a thread is a contiguous, time-sorted
+    sort key range and any comment ID works as a keyset cursor in either
+    direction. Each create and delete updates the ticket's comment_count and
+    last_activity in the same transaction; a create also subscribes the
+    commenter to the ticket, and then notifies the ticket's other watchers
+    from the ticket item alone, without reading the thread.
+    """
+
+    def __init__(self, request_id: str = None):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+        self.request_id = request_id
+        self.audit_helper = AuditHelper(request_id=request_id)
+
+    def create_comment(
+        self,
+        family_id: str,
+        queue_id: str,
+        ticket_id: str,
+        comment_user: str,
+        comment_body: str,
+    ) -> TicketCommentModel:
+        comment_id = TicketCommentModel.generate_time_ordered_id()
+        now = TicketCommentModel.now_epoch()
+
+        comment = TicketCommentModel(
+            pk=TicketCommentModel.create_pk(family_id),
+            sk=TicketCommentModel.create_sk(queue_id, ticket_id, comment_id),
+            family_id=family_id,
+            queue_id=queue_id,
+            ticket_id=ticket_id,
+            comment_id=comment_id,
+            comment_user=comment_user,
+            comment_body=comment_body,
+            comment_date=now,
+            last_update=now,
+        )
+
+        try:
+            with new_transaction() as transaction:
+                transaction.save(
+                    comment, condition=TicketCommentModel.sk.does_not_exist()
+                )
+                transaction.update(
+                    self._ticket_key(family_id, queue_id, ticket_id),
+                    actions=[
+                        TicketModel.comment_count.add(1),
+                        TicketModel.last_activity.set(now),
+                        *TicketModel.watch_actions(comment_user),
+                    ],
+                    condition=TicketModel.sk.exists(),
+                )
+        except TransactWriteError as e:
+            if condition_failed(e):
+                raise TicketNotFound(
+                    f"Ticket {ticket_id} not found in queue {queue_id} of family {family_id}"
+                )
+            raise
+
+        self.logger.info(f"Created comment {comment_id} on ticket {ticket_id}")
+
+        self.audit_helper.create_family_audit_record(
+            family_id=family_id,
+            entity_type=AuditEntityTypes.COMMENT,
+            entity_id=comment_id,
+            action=AuditActions.CREATE,
+            actor_user_id=comment_user,
+            after=TicketCommentModel.clean_returned_comment(comment),
+        )
+
+        try:
+            self._notify_watchers(family_id, queue_id, ticket_id, comment_user)
+        except Exception as e:
+            # The comment stands even if its notifications could not be sent
+            self.logger.error(
+                f"Failed to notify watchers of ticket {ticket_id}: {str(e)}"
+            )
+
+        return comment
+
+    def get_comment(
+        self, family_id: str, queue_id: str, ticket_id: str, comment_id: str
+    ) -> TicketCommentModel | None:
+        try:
+            return TicketCommentModel.get(
+                TicketCommentModel.create_pk(family_id),
+                TicketCommentModel.create_sk(queue_id, ticket_id, comment_id),
+            )
+        except DoesNotExist:
+            self.logger.info(
+                f"No comment found for {comment_id} on ticket {ticket_id}."
+            )
+            return None
+
+    def get_comments(
+        self,
+        family_id: str,
+        queue_id: str,
+        ticket_id: str,
+        limit: int = 20,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+    ) -> Tuple[List[TicketCommentModel], bool]:
+        """
+        Get a page of a ticket's comments, newest first.
+
+        Without a cursor this is the latest page. With `before` it is the page
+        of comments just older than that comment ID; with `after` the page of
+        comments just newer than it.
+
+        Args:
+            family_id: The family ID
+            queue_id: The queue ID
+            ticket_id: The ticket ID
+            limit: Maximum number of comments to return (default: 20)
+            before: Only return comments older than this comment ID
+            after: Only return comments newer than this comment ID
+
+        Returns:
+            Tuple of (comments newest first, whether more comments exist past
+            the end of the page in the direction that was read)
+        """
+        pk = TicketCommentModel.create_pk(family_id)
+        cursor = before or after
+        query_kwargs = {
+            # Newer-than pages read forward from the cursor, all others backward
+            "scan_index_forward": after is not None,
+            # One extra item tells whether another page exists
+            "limit": limit + 1,
+        }
+        if cursor:
+            query_kwargs["last_evaluated_key"] = {
+                "pk": {"S": pk},
+                "sk": {"S": TicketCommentModel.create_sk(queue_id, ticket_id, cursor)},
+            }
+
+        comments = list(
+            TicketCommentModel.query(
+                pk,
+                TicketCommentModel.sk.startswith(
+                    TicketCommentModel.create_sk_prefix(queue_id, ticket_id)
+                ),
+                **query_kwargs,
+            )
+        )
+        has_more = len(comments) > limit
+        comments = comments[:limit]
+        if after is not None:
+            comments.reverse()
+
+        self.logger.info(
+            f"Fetched {len(comments)} comments for ticket {ticket_id} in family {family_id}."
+        )
+        return comments, has_more
+
+    def update_comment(
+        self,
+        family_id: str,
+        queue_id: str,
+        ticket_id: str,
+        comment_id: str,
+        comment_body: str,
+        updated_by: str,
+    ) -> TicketCommentModel:
+        comment = self._get_own_comment(
+            family_id, queue_id, ticket_id, comment_id, updated_by
+        )
+        before_data = TicketCommentModel.clean_returned_comment(comment)
+        now = TicketCommentModel.now_epoch()
+
+        try:
+            with new_transaction() as transaction:
+                transaction.update(
+                    comment,
+                    actions=[
+                        TicketCommentModel.comment_body.set(comment_body),
+                        TicketCommentModel.last_update.set(now),
+                    ],
+                    condition=TicketCommentModel.sk.exists(),
+                )
+                transaction.update(
+                    self._ticket_key(family_id, queue_id, ticket_id),
+                    actions=[TicketModel.last_activity.set(now)],
+                    condition=TicketModel.sk.exists(),
+                )
+        except TransactWriteError as e:
+            if condition_failed(e, 0):
+                # Deleted since it was read
+                raise CommentNotFound(f"Comment {comment_id} not found")
+            if condition_failed(e, 1):
+                raise TicketNotFound(
+                    f"Ticket {ticket_id} not found in queue {queue_id} of family {family_id}"
+                )
+            raise
+        comment.comment_body = comment_body
+        comment.last_update = now
+        self.logger.info(f"Updated comment {comment_id} on ticket {ticket_id}")
+
+        self.audit_helper.create_family_audit_record(
+            family_id=family_id,
+            entity_type=AuditEntityTypes.COMMENT,
+            entity_id=comment_id,
+            action=AuditActions.UPDATE,
+            actor_user_id=updated_by,
+            before=before_data,
+            after=TicketCommentModel.clean_returned_comment(comment),
+        )
+
+        return comment
+
+    def delete_comment(
+        self,
+        family_id: str,
+        queue_id: str,
+        ticket_id: str,
+        comment_id: str,
+        deleted_by: str,
+    ) -> None:
+        comment = self._get_own_comment(
+            family_id, queue_id, ticket_id, comment_id, deleted_by
+        )
+        comment_data = TicketCommentModel.clean_returned_comment(comment)
+
+        try:
+            with new_transaction() as transaction:
+                transaction.delete(comment, condition=TicketCommentModel.sk.exists())
+                transaction.update(
+                    self._ticket_key(family_id, queue_id, ticket_id),
+                    actions=[
+                        TicketModel.comment_count.add(-1),
+                        TicketModel.last_activity.set(TicketModel.now_epoch()),
+                    ],
+                    condition=TicketModel.sk.exists(),
+                )
+        except TransactWriteError as e:
+            if condition_failed(e):
+                # Deleted concurrently; the count was already decremented
+                raise CommentNotFound(f"Comment {comment_id} not found")
+            raise
+
+        self.logger.info(f"Deleted comment {comment_id} from ticket {ticket_id}")
+
+        self.audit_helper.create_family_audit_record(
+            family_id=family_id,
+            entity_type=AuditEntityTypes.COMMENT,
+            entity_id=comment_id,
+            action=AuditActions.DELETE,
+            actor_user_id=deleted_by,
+            before=comment_data,
+        )
+
+    def _get_own_comment(
+        self,
+        family_id: str,
+        queue_id: str,
+        ticket_id: str,
+        comment_id: str,
+        user_id: str,
+    ) -> TicketCommentModel:
+        comment = self.get_comment(family_id, queue_id, ticket_id, comment_id)
+        if comment is None:
+            raise CommentNotFound(
+                f"Comment {comment_id} not found on ticket {ticket_id}"
+            )
+        if comment.comment_user != user_id:
+            raise CommentPermissionDenied()
+        return comment
+
+    def _notify_watchers(
+        self, family_id: str, queue_id: str, ticket_id: str, comment_user: str
+    ) -> None:
+        """Notify everyone watching the ticket except the commenter."""
+        ticket = TicketModel.get(
+            TicketModel.create_pk(family_id),
+            TicketModel.create_sk(queue_id, ticket_id),
+        )
+        watchers = TicketModel.get_watchers(ticket) - {comment_user}
+        NotificationHelper(request_id=self.request_id).create_coalesced_notifications(
+            watchers,
+            NotificationType.TICKET_COMMENT,
+            ticket_id,
+            lambda count: (
+                f"New comment on ticket '{ticket.title}'."
+                if count == 1
+                else f"{count} new comments on ticket '{ticket.title}'."
+            ),
+            family_id=family_id,
+            ticket_id=ticket_id,
+        )
+
+    @staticmethod
+    def _ticket_key(family_id: str, queue_id: str, ticket_id: str) -> TicketModel:
+        # Key-only instance: transactional updates only need the primary key
+        return TicketModel(
+            TicketModel.create_pk(family_id),
+            TicketModel.create_sk(queue_id, ticket_id),
+        )
@@ -0,0 +1,162 @@
+from typing import Optional
+from pynamodb.exceptions import DoesNotExist, UpdateError
+from aws_lambda_powertools import Logger
+
+from constants.ticket import (
+    TICKET_DEADLINE_BUCKET_SECONDS,
+    TICKET_DEADLINE_MAX_CATCH_UP_BUCKETS,
+    TICKET_DEADLINE_SETTLE_SECONDS,
+)
+from helpers.ticket_helper import TicketHelper
+from models.scheduler_state import SchedulerStateModel
+from models.ticket import TicketModel, TicketDeadlineKind
+
+
+class TicketDeadlineHelper:
+    """
+    Acts on due ticket deadlines: auto-closes resolved tickets whose reopen
+    window has passed and flags SLA breaches on open tickets.
+
+    Deadlines live in the sparse DeadlineTicketIndex, one partition per time
+    bucket. A run reads only the buckets after the last fully processed one,
+    normally just the current bucket, and only the deadlines already due in
+    them. Every action is conditional on the ticket still being due, so
+    repeated or overlapping runs never act twice.
+    """
+
+    SCHEDULER_NAME = "TICKET_DEADLINES"
+
+    def __init__(self, request_id: str = None):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+        self.request_id = request_id
+        self.ticket_helper = TicketHelper(request_id=request_id)
+
+    def process_due_deadlines(
+        self, now: Optional[int] = None, max_items: Optional[int] = None
+    ) -> dict:
+        """
+        Process every due deadline since the last run.
+
+        Args:
+            now: Current epoch time (default: the clock)
+            max_items: Maximum deadlines to act on; the rest are counted as
+                backlog and left for the next run
+
+        Returns:
+            Dict with the buckets read, tickets auto-closed, SLA breaches
+            flagged, deadlines skipped (no longer due) or failed, the backlog
+            left unprocessed and the lag of the oldest deadline acted on
+        """
+        now = now if now is not None else TicketModel.now_epoch()
+        step = TICKET_DEADLINE_BUCKET_SECONDS
+        current = TicketModel.deadline_bucket(now)
+        first = current - TICKET_DEADLINE_MAX_CATCH_UP_BUCKETS * step
+
+        state = self._get_state()
+        if state.processed_through is not None:
+            first = max(first, state.processed_through + step)
+
+        stats = {
+            "buckets": 0,
+            "auto_closed": 0,
+            "sla_breaches": 0,
+            "skipped": 0,
+            "failed": 0,
+            "backlog": 0,
+            "lag_seconds": 0,
+        }
+        budget = {"remaining": max_items}
+        processed_through = None
+        advancing = True
+        for bucket in range(first, current + 1, step):
+            drained = self._process_bucket(bucket, now, stats, budget)
+            settled = bucket + step + TICKET_DEADLINE_SETTLE_SECONDS <= now
+            # The cursor only moves through contiguous, settled, drained buckets
+            advancing = advancing and drained and settled
+            if advancing:
+                processed_through = bucket
+
+        self._save_state(state, processed_through, now)
+        self.logger.info(f"Processed ticket deadlines up to {now}: {stats}")
+        return stats
+
+    def _process_bucket(self, bucket: int, now: int, stats: dict, budget: dict) -> bool:
+        """Act on the due deadlines of one bucket; True if none were left over."""
+        stats["buckets"] += 1
+        drained = True
+        for ticket in TicketModel.deadline_ticket_index.query(
+            TicketModel.create_deadline_pk(bucket),
+            range_key_condition=TicketModel.deadline_sk
+            <= TicketModel.create_deadline_sk_limit(now),
+        ):
+            if budget["remaining"] is not None and budget["remaining"] <= 0:
+                stats["backlog"] += 1
+                drained = False
+                continue
+            if budget["remaining"] is not None:
+                budget["remaining"] -= 1
+
+            # The index is eventually consistent; the helpers re-read the
+            # ticket and act only if it is still due
+            deadline, kind = TicketModel.get_deadline(
+                ticket.status,
+                ticket.sla_due,
+                ticket.sla_breached_at,
+                ticket.reopen_until,
+            )
+            try:
+                if kind == TicketDeadlineKind.SLA:
+                    acted = self.ticket_helper.flag_sla_breach(
+                        ticket.family_id, ticket.queue_id, ticket.ticket_id, now
+                    )
+                    stats["sla_breaches" if acted else "skipped"] += 1
+                elif kind == TicketDeadlineKind.AUTO_CLOSE:
+                    acted = self.ticket_helper.auto_close_ticket(
+                        ticket.family_id, ticket.queue_id, ticket.ticket_id, now
+                    )
+                    stats["auto_closed" if acted else "skipped"] += 1
+                else:
+                    acted = None
+                    stats["skipped"] += 1
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to process deadline of ticket {ticket.ticket_id}: {str(e)}"
+                )
+                stats["failed"] += 1
+                drained = False
+                continue
+            if acted:
+                stats["lag_seconds"] = max(stats["lag_seconds"], now - deadline)
+        return drained
+
+    def _get_state(self) -> SchedulerStateModel:
+        try:
+            return SchedulerStateModel.get(
+                SchedulerStateModel.create_pk(self.SCHEDULER_NAME),
+                SchedulerStateModel.create_sk(),
+            )
+        except DoesNotExist:
+            return SchedulerStateModel(
+                SchedulerStateModel.create_pk(self.SCHEDULER_NAME),
+                SchedulerStateModel.create_sk(),
+            )
+
+    def _save_state(
+        self, state: SchedulerStateModel, processed_through: Optional[int], now: int
+    ) -> None:
+        actions = [SchedulerStateModel.last_run.set(now)]
+        condition = None
+        if processed_through is not None:
+            actions.append(SchedulerStateModel.processed_through.set(processed_through))
+            # Never move the cursor back behind a concurrent run
+            condition = SchedulerStateModel.processed_through.does_not_exist() | (
+                SchedulerStateModel.processed_through < processed_through
+            )
+        try:
+            state.update(actions=actions, condition=condition)
+        except UpdateError as e:
+            if e.cause_response_code != "ConditionalCheckFailedException":
+                raise
+            self.logger.info("A concurrent run already advanced the deadline cursor")
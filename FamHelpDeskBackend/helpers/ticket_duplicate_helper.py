@@ -0,0 +1,241 @@
+import hashlib
+import random
+import re
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+from aws_lambda_powertools import Logger
+
+from constants.duplicates import (
+    MINHASH_NUM_PERMUTATIONS,
+    MINHASH_BANDS,
+    MINHASH_SHINGLE_SIZE,
+    MINHASH_SEED,
+    DUPLICATE_MIN_SIMILARITY,
+    DUPLICATE_MAX_RESULTS,
+)
+from constants.search import SEARCH_STOP_WORDS
+from models.ticket import TicketModel
+from models.ticket_minhash import TicketSignatureModel, TicketBandModel
+
+# Permutations are h(x) = (a * x + b) mod p over 31-bit shingle hashes, so
+# a * x + b stays below 2^63 and the NumPy path can use uint64 arithmetic
+MINHASH_PRIME = (1 << 31) - 1
+_rng = random.Random(MINHASH_SEED)
+MINHASH_PERMUTATIONS = [
+    (_rng.randrange(1, MINHASH_PRIME), _rng.randrange(0, MINHASH_PRIME))
+    for _ in range(MINHASH_NUM_PERMUTATIONS)
+]
+MINHASH_ROWS_PER_BAND = MINHASH_NUM_PERMUTATIONS // MINHASH_BANDS
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class TicketDuplicateHelper:
+    """
+    Near-duplicate ticket detection with MinHash and locality-sensitive
+    hashing.
+
+    Each ticket's title and description are reduced to character shingles
+    and a fixed-length MinHash signature, whose agreement with another
+    signature estimates the Jaccard similarity of the two shingle sets. The
+    signature is split into bands, and the ticket is filed under one bucket
+    per band. Candidates are the tickets sharing any bucket, so a lookup is
+    MINHASH_BANDS small prefix queries plus one batch read, however many
+    tickets the family has.
+    """
+
+    def __init__(self, request_id: str = None):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+        self.request_id = request_id
+
+    @staticmethod
+    def shingle(title: Optional[str], description: Optional[str]) -> Set[str]:
+        """Character shingles of the text, lowercased and without stop words."""
+        words = WORD_PATTERN.findall(f"{title or ''} {description or ''}".lower())
+        text = " ".join(w for w in words if w not in SEARCH_STOP_WORDS)
+        if len(text) <= MINHASH_SHINGLE_SIZE:
+            return {text}
+        return {
+            text[i : i + MINHASH_SHINGLE_SIZE]
+            for i in range(len(text) - MINHASH_SHINGLE_SIZE + 1)
+        }
+
+    @staticmethod
+    def hash_shingles(shingles: Iterable[str]) -> List[int]:
+        return [
+            zlib.crc32(shingle.encode("utf-8")) % MINHASH_PRIME for shingle in shingles
+        ]
+
+    @staticmethod
+    def compute_signature(
+        title: Optional[str], description: Optional[str]
+    ) -> List[int]:
+        hashes = TicketDuplicateHelper.hash_shingles(
+            TicketDuplicateHelper.shingle(title, description)
+        )
+        return [
+            min((a * x + b) % MINHASH_PRIME for x in hashes)
+            for a, b in MINHASH_PERMUTATIONS
+        ]
+
+    @staticmethod
+    def compute_signatures(
+        texts: List[Tuple[Optional[str], Optional[str]]],
+    ) -> List[List[int]]:
+        """
+        Signatures of many (title, description) pairs at once, for backfills.
+
+        All shingles of the batch are hashed into one array and every
+        permutation is applied to it in a single vectorized step; a segmented
+        minimum then yields each ticket's signature. Identical to
+        compute_signature. NumPy is imported here so the API never loads it.
+        """
+        import numpy as np
+
+        hashes = [
+            TicketDuplicateHelper.hash_shingles(TicketDuplicateHelper.shingle(t, d))
+            for t, d in texts
+        ]
+        if not hashes:
+            return []
+        # Every text has at least one shingle, so no segment is empty
+        offsets = np.cumsum([0] + [len(h) for h in hashes[:-1]])
+        values = np.fromiter(
+            (x for h in hashes for x in h), dtype=np.uint64, count=sum(map(len, hashes))
+        )
+        a = np.array([p[0] for p in MINHASH_PERMUTATIONS], dtype=np.uint64)
+        b = np.array([p[1] for p in MINHASH_PERMUTATIONS], dtype=np.uint64)
+
+        permuted = (a[:, None] * values[None, :] + b[:, None]) % np.uint64(
+            MINHASH_PRIME
+        )
+        signatures = np.minimum.reduceat(permuted, offsets, axis=1)
+        return signatures.T.tolist()
+
+    @staticmethod
+    def band_hashes(signature: List[int]) -> List[str]:
+        rows = MINHASH_ROWS_PER_BAND
+        return [
+            hashlib.blake2b(
+                struct.pack(f">{rows}I", *signature[band * rows : (band + 1) * rows]),
+                digest_size=8,
+            ).hexdigest()
+            for band in range(MINHASH_BANDS)
+        ]
+
+    @staticmethod
+    def estimate_similarity(first: List[int], second: List[int]) -> float:
+        """Estimated Jaccard similarity: the share of agreeing signature values."""
+        return sum(x == y for x, y in zip(first, second)) / len(first)
+
+    def index_ticket(
+        self, ticket: TicketModel, signature: Optional[List[int]] = None
+    ) -> None:
+        """Store a ticket's signature and file it under its band buckets."""
+        if signature is None:
+            signature = self.compute_signature(ticket.title, ticket.description)
+
+        with TicketSignatureModel.batch_write() as batch:
+            for item in self._signature_items(ticket, signature):
+                batch.save(item)
+
+    def index_tickets(self, tickets: List[TicketModel]) -> None:
+        """Index new tickets in one batch write, for bulk creates such as imports."""
+        with TicketSignatureModel.batch_write() as batch:
+            for ticket in tickets:
+                signature = self.compute_signature(ticket.title, ticket.description)
+                for item in self._signature_items(ticket, signature):
+                    batch.save(item)
+
+    def _signature_items(self, ticket: TicketModel, signature: List[int]) -> Iterator:
+        """A ticket's signature item and its band bucket items."""
+        pk = TicketSignatureModel.create_pk(ticket.family_id)
+        yield TicketSignatureModel(
+            pk=pk,
+            sk=TicketSignatureModel.create_sk(ticket.ticket_id),
+            family_id=ticket.family_id,
+            queue_id=ticket.queue_id,
+            ticket_id=ticket.ticket_id,
+            title=ticket.title,
+            creation_date=ticket.creation_date,
+            signature=self._encode_signature(signature),
+        )
+        for band, band_hash in enumerate(self.band_hashes(signature)):
+            yield TicketBandModel(
+                pk=pk,
+                sk=TicketBandModel.create_sk(band, band_hash, ticket.ticket_id),
+                ticket_id=ticket.ticket_id,
+            )
+
+    def find_duplicates(
+        self,
+        family_id: str,
+        title: str,
+        description: Optional[str] = None,
+        exclude_ticket_id: Optional[str] = None,
+        min_similarity: float = DUPLICATE_MIN_SIMILARITY,
+        limit: int = DUPLICATE_MAX_RESULTS,
+    ) -> List[Tuple[TicketSignatureModel, float]]:
+        """
+        Find the family's tickets similar to a title and description.
+
+        Returns:
+            List of (candidate signature item, estimated similarity), most
+            similar first
+        """
+        signature = self.compute_signature(title, description)
+        pk = TicketBandModel.create_pk(family_id)
+
+        def bucket_members(band_and_hash: Tuple[int, str]) -> List[str]:
+            band, band_hash = band_and_hash
+            return [
+                item.ticket_id
+                for item in TicketBandModel.query(
+                    pk,
+                    TicketBandModel.sk.startswith(
+                        TicketBandModel.create_sk_prefix(band, band_hash)
+                    ),
+                )
+            ]
+
+        # The band queries are independent, so they run concurrently
+        with ThreadPoolExecutor(max_workers=MINHASH_BANDS) as executor:
+            candidate_ids = {
+                ticket_id
+                for members in executor.map(
+                    bucket_members, enumerate(self.band_hashes(signature))
+                )
+                for ticket_id in members
+                if ticket_id != exclude_ticket_id
+            }
+        if not candidate_ids:
+            return []
+
+        matches = []
+        for candidate in TicketSignatureModel.batch_get(
+            [(pk, TicketSignatureModel.create_sk(t)) for t in candidate_ids]
+        ):
+            similarity = self.estimate_similarity(
+                signature, self._decode_signature(candidate.signature)
+            )
+            if similarity >= min_similarity:
+                matches.append((candidate, similarity))
+        matches.sort(key=lambda match: (-match[1], -match[0].creation_date))
+
+        self.logger.info(
+            f"Found {len(matches)} duplicate candidates among {len(candidate_ids)} "
+            f"bucket matches in family {family_id}."
+        )
+        return matches[:limit]
+
+    @staticmethod
+    def _encode_signature(signature: List[int]) -> bytes:
+        return struct.pack(f">{len(signature)}I", *signature)
+
+    @staticmethod
+    def _decode_signature(data: bytes) -> List[int]:
+        return list(struct.unpack(f">{len(data) // 4}I", data))
@@ -0,0 +1,960 @@
+from typing import Dict, List, Optional, Tuple
+from pynamodb.exceptions import (
+    DoesNotExist,
+    QueryError,
+    TransactWriteError,
+    UpdateError,
+)
+from aws_lambda_powertools import Logger
+
+from constants.ticket import (
+    TICKET_AUTO_ASSIGN_MAX_ATTEMPTS,
+    TICKET_REOPEN_WINDOW_SECONDS,
+    TICKET_SLA_SECONDS,
+    SYSTEM_ACTOR,
+)
+from exceptions.queue_exceptions import QueueNotFound
+from exceptions.ticket_exceptions import (
+    InvalidTicketStatusTransition,
+    TicketReopenWindowExpired,
+)
+from helpers.audit_helper import AuditHelper
+from helpers.group_membership_helper import GroupMembershipHelper
+from helpers.notification_helper import NotificationHelper
+from helpers.queue_helper import QueueHelper
+from helpers.ticket_number_helper import TicketNumberHelper
+from helpers.ticket_duplicate_helper import TicketDuplicateHelper
+from helpers.ticket_rollup_helper import TicketRollupHelper
+from helpers.ticket_search_helper import TicketSearchHelper
+from helpers.transaction_helper import new_transaction, condition_failed
+from models.audit import AuditActions, AuditEntityTypes
+from models.base import MembershipStatus
+from models.group_membership import GroupMembershipModel
+from models.notification import NotificationType
+from models.queue import QueueModel
+from models.ticket_number import TicketNumberModel
+from models.ticket_rollup import TicketRollupModel
+from models.ticket import (
+    TicketModel,
+    TicketSeverity,
+    TicketStatus,
+    ACTIVE_TICKET_STATUSES,
+)
+
+# Allowed status changes; reopening is further limited by reopen_until
+TICKET_STATUS_TRANSITIONS = {
+    TicketStatus.OPEN: {TicketStatus.RESOLVED, TicketStatus.CLOSED},
+    TicketStatus.RESOLVED: {TicketStatus.OPEN, TicketStatus.CLOSED},
+    TicketStatus.CLOSED: {TicketStatus.OPEN},
+}
+
+
+class TicketHelper:
+    """
+    Ticket lifecycle.
+
+    Every write that adds a ticket or changes its status also moves the
+    ticket between the queue item's counters in the same transaction, so
+    queue listings show exact counts without reading tickets. Writes that
+    change which member an OPEN ticket counts against likewise move the
+    members' open ticket counters, which auto-assignment reads, and every
+    status change is counted on the day's analytics rollups (see
+    TicketRollupHelper). New tickets also get a family-sequential number
+    (see TicketNumberHelper).
+    """
+
+    def __init__(self, request_id: str = None):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+        self.request_id = request_id
+        self.audit_helper = AuditHelper(request_id=request_id)
+
+    def create_ticket(
+        self,
+        family_id: str,
+        queue_id: str,
+        title: str,
+        severity: TicketSeverity,
+        created_by: str,
+        description: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        group_id: Optional[str] = None,
+        auto_assign: bool = False,
+    ) -> TicketModel:
+        """
+        Create an OPEN ticket and count it on its queue.
+
+        Args:
+            group_id: The queue's group, if the caller already has it; it is
+                looked up otherwise
+            auto_assign: Assign the ticket to the active group member with the
+                fewest open tickets; ignored when assigned_to is given
+
+        Raises:
+            QueueNotFound: The queue does not exist
+        """
+        if group_id is None:
+            group_id = self._get_queue_group_id(family_id, queue_id)
+            if group_id is None:
+                raise QueueNotFound(
+                    f"Queue {queue_id} does not exist in family {family_id}"
+                )
+
+        ticket_id = TicketModel.generate_uuid()
+        creation_date = TicketModel.now_epoch()
+        ticket_number, key_prefix = TicketNumberHelper(
+            request_id=self.request_id
+        ).allocate(family_id)
+
+        ticket = TicketModel(
+            pk=TicketModel.create_pk(family_id),
+            sk=TicketModel.create_sk(queue_id, ticket_id),
+            family_id=family_id,
+            queue_id=queue_id,
+            group_id=group_id,
+            ticket_id=ticket_id,
+            ticket_number=ticket_number,
+            ticket_key=TicketNumberModel.create_ticket_key(key_prefix, ticket_number),
+            title=title,
+            severity=severity.value,
+            status=TicketStatus.OPEN.value,
+            creation_date=creation_date,
+            created_by=created_by,
+            comment_count=0,
+            last_activity=creation_date,
+            sla_due=creation_date + TICKET_SLA_SECONDS[severity.value],
+        )
+
+        if description is not None:
+            ticket.description = description
+
+        def write(transaction) -> None:
+            TicketModel.set_index_keys(ticket)
+            transaction.save(ticket, condition=TicketModel.sk.does_not_exist())
+            transaction.update(
+                self._queue_key(family_id, group_id, queue_id),
+                actions=QueueModel.ticket_count_actions(
+                    ticket.severity, new_status=ticket.status
+                ),
+                condition=QueueModel.sk.exists(),
+            )
+            transaction.save(
+                TicketNumberModel(
+                    pk=TicketNumberModel.create_pk(family_id),
+                    sk=TicketNumberModel.create_sk(ticket_number),
+                    family_id=family_id,
+                    ticket_number=ticket_number,
+                    queue_id=queue_id,
+                    ticket_id=ticket_id,
+                ),
+                condition=TicketNumberModel.sk.does_not_exist(),
+            )
+            self._add_rollup_updates(transaction, ticket, None, creation_date)
+
+        try:
+            # The two puts are sent first, then the queue update, the two
+            # rollup updates, then the assignee's counter
+            if assigned_to is None and auto_assign:
+                self._transact_auto_assigned(ticket, write, first_workload_index=5)
+            else:
+                ticket.assigned_to = assigned_to
+                self._transact_with_workload(
+                    family_id,
+                    group_id,
+                    GroupMembershipModel.workload_deltas(
+                        new_assignee=assigned_to, new_status=ticket.status
+                    ),
+                    write,
+                    first_workload_index=5,
+                )
+        except TransactWriteError as e:
+            if condition_failed(e, 2):
+                raise QueueNotFound(
+                    f"Queue {queue_id} does not exist in family {family_id}"
+                )
+            raise
+        self.logger.info(
+            f"Created ticket {ticket_id} in queue {queue_id} of family {family_id}"
+        )
+
+        try:
+            TicketSearchHelper(request_id=self.request_id).index_ticket(ticket)
+        except Exception as e:
+            # The search index is derived data; reindex_ticket_search.py repairs it
+            self.logger.error(
+                f"Failed to index ticket {ticket_id} for search: {str(e)}"
+            )
+        try:
+            TicketDuplicateHelper(request_id=self.request_id).index_ticket(ticket)
+        except Exception as e:
+            # Likewise derived; backfill_ticket_signatures.py repairs it
+            self.logger.error(
+                f"Failed to index ticket {ticket_id} for duplicates: {str(e)}"
+            )
+
+        # Audit record for creation
+        self.audit_helper.create_family_audit_record(
+            family_id=family_id,
+            entity_type=AuditEntityTypes.TICKET,
+            entity_id=ticket_id,
+            action=AuditActions.CREATE,
+            actor_user_id=created_by,
+            after=TicketModel.clean_returned_ticket(ticket),
+        )
+
+        if ticket.assigned_to is not None:
+            self._notify_assignee(ticket, created_by)
+
+        return ticket
+
+    def get_ticket(
+        self, family_id: str, queue_id: str, ticket_id: str
+    ) -> TicketModel | None:
+        try:
+            return TicketModel.get(
+                TicketModel.create_pk(family_id),
+                TicketModel.create_sk(queue_id, ticket_id),
+            )
+        except DoesNotExist:
+            self.logger.info(
+                f"No ticket found for {ticket_id} in queue {queue_id} of family {family_id}."
+            )
+            return None
+
+    def get_ticket_by_number(
+        self, family_id: str, ticket_number: int
+    ) -> TicketModel | None:
+        try:
+            mapping = TicketNumberModel.get(
+                TicketNumberModel.create_pk(family_id),
+                TicketNumberModel.create_sk(ticket_number),
+            )
+        except DoesNotExist:
+            self.logger.info(
+                f"No ticket found for number {ticket_number} in family {family_id}."
+            )
+            return None
+        return self.get_ticket(family_id, mapping.queue_id, mapping.ticket_id)
+
+    def update_ticket_status(
+        self,
+        family_id: str,
+        queue_id: str,
+        ticket_id: str,
+        status: TicketStatus,
+        updated_by: str,
+    ) -> TicketModel | None:
+        """
+        Move a ticket to a new status.
+
+        Resolving or closing starts the reopen window; reopening is only
+        allowed until reopen_until and clears the resolution dates. The queue's
+        counters move in the same transaction.
+
+        Raises:
+            InvalidTicketStatusTransition: The transition is not allowed, or the
+                status changed concurrently
+            TicketReopenWindowExpired: The reopen window has passed
+        """
+        ticket = self.get_ticket(family_id, queue_id, ticket_id)
+        if ticket is None:
+            self.logger.warning(
+                f"Ticket {ticket_id} not found in queue {queue_id} for status update"
+            )
+            return None
+
+        current = TicketStatus(ticket.status)
+        if status not in TICKET_STATUS_TRANSITIONS[current]:
+            raise InvalidTicketStatusTransition(
+                f"Ticket {ticket_id} cannot move from {current.value} to {status.value}"
+            )
+
+        now = TicketModel.now_epoch()
+        # Field changes; None removes the attribute
+        changes = {"status": status.value, "last_activity": now}
+        if status == TicketStatus.OPEN:
+            if ticket.reopen_until is None or now > ticket.reopen_until:
+                raise TicketReopenWindowExpired(
+                    f"Ticket {ticket_id} can no longer be reopened"
+                )
+            # Reopening starts a new SLA period
+            changes.update(
+                resolved_date=None,
+                closed_date=None,
+                reopen_until=None,
+                sla_due=now + TICKET_SLA_SECONDS[ticket.severity],
+                sla_breached_at=None,
+            )
+        elif status == TicketStatus.RESOLVED:
+            changes.update(
+                resolved_date=now, reopen_until=now + TICKET_REOPEN_WINDOW_SECONDS
+            )
+        elif status == TicketStatus.CLOSED:
+            changes["closed_date"] = now
+            if ticket.reopen_until is None:
+                changes["reopen_until"] = now + TICKET_REOPEN_WINDOW_SECONDS
+
+        group_id = ticket.group_id or self._get_queue_group_id(family_id, queue_id)
+        if group_id is not None and ticket.group_id is None:
+            # Backfill tickets created before group_id was stored
+            changes["group_id"] = group_id
+        changes.update(TicketModel.get_index_keys(ticket, **changes))
+
+        before_data = TicketModel.clean_returned_ticket(ticket)
+        actions = [
+            (
+                getattr(TicketModel, name).remove()
+                if value is None
+                else getattr(TicketModel, name).set(value)
+            )
+            for name, value in changes.items()
+        ]
+        if group_id is None:
+            # The queue is gone, so there are no counters to keep
+            self._update_if_status(ticket, current, actions)
+        else:
+            self._transact_status_change(
+                ticket, current, status, group_id, actions, now
+            )
+            for name, value in changes.items():
+                setattr(ticket, name, value)
+        self.logger.info(
+            f"Ticket {ticket_id} moved from {current.value} to {status.value}"
+        )
+
+        self.audit_helper.create_family_audit_record(
+            family_id=family_id,
+            entity_type=AuditEntityTypes.TICKET,
+            entity_id=ticket_id,
+            action=AuditActions.UPDATE,
+            actor_user_id=updated_by,
+            before=before_data,
+            after=TicketModel.clean_returned_ticket(ticket),
+        )
+
+        if ticket.created_by and ticket.created_by != updated_by:
+            NotificationHelper(request_id=self.request_id).create_notification(
+                user_id=ticket.created_by,
+                message=f"Ticket '{ticket.title}' is now {status.value}.",
+                notification_type=NotificationType.TICKET_STATUS_CHANGED,
+                family_id=family_id,
+                ticket_id=ticket_id,
+            )
+
+        return ticket
+
+    def assign_ticket(
+        self,
+        family_id: str,
+        queue_id: str,
+        ticket_id: str,
+        assigned_to: Optional[str],
+        updated_by: str,
+    ) -> TicketModel | None:
+        """Assign a ticket to a user, or unassign it when assigned_to is None."""
+        ticket = self.get_ticket(family_id, queue_id, ticket_id)
+        if ticket is None:
+            self.logger.warning(
+                f"Ticket {ticket_id} not found in queue {queue_id} for assignment"
+            )
+            return None
+
+        if ticket.assigned_to == assigned_to:
+            return ticket
+
+        before_data = TicketModel.clean_returned_ticket(ticket)
+        if assigned_to is None:
+            action = TicketModel.assigned_to.remove()
+        else:
+            action = TicketModel.assigned_to.set(assigned_to)
+        last_activity = TicketModel.now_epoch()
+        actions = [
+            action,
+            TicketModel.last_activity.set(last_activity),
+            *TicketModel.index_key_actions(ticket, assigned_to=assigned_to),
+        ]
+        deltas = GroupMembershipModel.workload_deltas(
+            ticket.assigned_to, ticket.status, assigned_to, ticket.status
+        )
+        group_id = None
+        if deltas:
+            group_id = ticket.group_id or self._get_queue_group_id(family_id, queue_id)
+        if group_id is None:
+            # The assignee index keys depend on the status, so the update only
+            # applies if the status is unchanged
+            self._update_if_status(ticket, TicketStatus(ticket.status), actions)
+        else:
+            self._transact_assignment(ticket, assigned_to, group_id, deltas, actions)
+            ticket.last_activity = last_activity
+        self.logger.info(f"Ticket {ticket_id} assigned to {assigned_to}")
+
+        self.audit_helper.create_family_audit_record(
+            family_id=family_id,
+            entity_type=AuditEntityTypes.TICKET,
+            entity_id=ticket_id,
+            action=AuditActions.UPDATE,
+            actor_user_id=updated_by,
+            before=before_data,
+            after=TicketModel.clean_returned_ticket(ticket),
+        )
+
+        if assigned_to is not None:
+            self._notify_assignee(ticket, updated_by)
+
+        return ticket
+
+    def watch_ticket(
+        self,
+        family_id: str,
+        queue_id: str,
+        ticket_id: str,
+        user_id: str,
+        watching: bool = True,
+    ) -> TicketModel | None:
+        """
+        Subscribe a user to a ticket's comment notifications, or opt them out;
+        opting out also covers the ticket's creator and assignee.
+        """
+        ticket = TicketModel(
+            TicketModel.create_pk(family_id),
+            TicketModel.create_sk(queue_id, ticket_id),
+        )
+        try:
+            ticket.update(
+                actions=TicketModel.watch_actions(user_id, watching),
+                condition=TicketModel.sk.exists(),
+            )
+        except UpdateError as e:
+            if e.cause_response_code == "ConditionalCheckFailedException":
+                self.logger.warning(
+                    f"Ticket {ticket_id} not found in queue {queue_id} for watching"
+                )
+                return None
+            raise
+        self.logger.info(
+            f"User {user_id} {'watches' if watching else 'stopped watching'} "
+            f"ticket {ticket_id}"
+        )
+        return ticket
+
+    def auto_close_ticket(
+        self, family_id: str, queue_id: str, ticket_id: str, now: int
+    ) -> TicketModel | None:
+        """
+        Close a RESOLVED ticket whose reopen window has passed.
+
+        Returns None, changing nothing, when the ticket no longer qualifies,
+        so repeated calls for the same deadline are harmless.
+        """
+        ticket = self.get_ticket(family_id, queue_id, ticket_id)
+        if (
+            ticket is None
+            or ticket.status != TicketStatus.RESOLVED.value
+            or ticket.reopen_until is None
+            or ticket.reopen_until > now
+        ):
+            return None
+        try:
+            return self.update_ticket_status(
+                family_id, queue_id, ticket_id, TicketStatus.CLOSED, SYSTEM_ACTOR
+            )
+        except InvalidTicketStatusTransition:
+            self.logger.info(f"Ticket {ticket_id} changed status before auto-close")
+            return None
+
+    def flag_sla_breach(
+        self, family_id: str, queue_id: str, ticket_id: str, now: int
+    ) -> TicketModel | None:
+        """
+        Mark an OPEN ticket whose SLA deadline has passed as breached and
+        notify its assignee, or its creator when unassigned.
+
+        Returns None, changing nothing, when the ticket no longer has an
+        unflagged breach, so repeated calls for the same deadline are harmless.
+        """
+        ticket = self.get_ticket(family_id, queue_id, ticket_id)
+        if ticket is None:
+            return None
+
+        before_data = TicketModel.clean_returned_ticket(ticket)
+        try:
+            ticket.update(
+                actions=[
+                    TicketModel.sla_breached_at.set(now),
+                    *TicketModel.index_key_actions(ticket, sla_breached_at=now),
+                ],
+                condition=(TicketModel.status == TicketStatus.OPEN.value)
+                & (TicketModel.sla_due <= now)
+                & TicketModel.sla_breached_at.does_not_exist(),
+            )
+        except UpdateError as e:
+            if e.cause_response_code == "ConditionalCheckFailedException":
+                self.logger.info(f"Ticket {ticket_id} has no SLA breach to flag")
+                return None
+            raise
+        self.logger.info(f"Ticket {ticket_id} breached its SLA")
+
+        self.audit_helper.create_family_audit_record(
+            family_id=family_id,
+            entity_type=AuditEntityTypes.TICKET,
+            entity_id=ticket_id,
+            action=AuditActions.UPDATE,
+            actor_user_id=SYSTEM_ACTOR,
+            before=before_data,
+            after=TicketModel.clean_returned_ticket(ticket),
+        )
+
+        recipient = ticket.assigned_to or ticket.created_by
+        if recipient:
+            NotificationHelper(request_id=self.request_id).create_notification(
+                user_id=recipient,
+                message=f"Ticket '{ticket.title}' has breached its SLA.",
+                notification_type=NotificationType.TICKET_SLA_BREACHED,
+                family_id=family_id,
+                ticket_id=ticket_id,
+            )
+
+        return ticket
+
+    def get_queue_tickets(
+        self,
+        family_id: str,
+        queue_id: str,
+        status: Optional[TicketStatus] = None,
+        severity: Optional[TicketSeverity] = None,
+        limit: int = 50,
+        last_evaluated_key: Optional[Dict] = None,
+    ) -> Tuple[List[TicketModel], Optional[Dict]]:
+        """
+        Get a page of a queue's tickets, ordered by status, severity and age.
+
+        Without a status only OPEN and RESOLVED tickets are read: they sort
+        after CLOSED in the index, so closed tickets never cost a read unless
+        they are asked for.
+
+        Args:
+            family_id: The family ID
+            queue_id: The queue ID
+            status: Optional status to list (default: OPEN and RESOLVED)
+            severity: Optional severity to list
+            limit: Maximum number of tickets to return (default: 50)
+            last_evaluated_key: Pagination key from previous query
+
+        Returns:
+            Tuple[List[TicketModel], Optional[Dict]]: Tickets and next pagination key
+        """
+        query_kwargs = {"limit": limit}
+        if last_evaluated_key:
+            query_kwargs["last_evaluated_key"] = last_evaluated_key
+
+        # Cursors of the partition fallback carry no index keys; they are
+        # continued on the partition
+        if last_evaluated_key and "queue_ticket_sk" not in last_evaluated_key:
+            return self._get_queue_tickets_from_partition(
+                family_id, queue_id, status, severity, query_kwargs
+            )
+
+        if status is None:
+            range_key_condition = TicketModel.queue_ticket_sk >= (
+                TicketModel.create_queue_ticket_sk_prefix(
+                    ACTIVE_TICKET_STATUSES[0].value
+                )
+            )
+            filter_condition = (
+                TicketModel.severity == severity.value if severity else None
+            )
+        else:
+            range_key_condition = TicketModel.queue_ticket_sk.startswith(
+                TicketModel.create_queue_ticket_sk_prefix(
+                    status.value, severity.value if severity else None
+                )
+            )
+            filter_condition = None
+
+        try:
+            response = TicketModel.queue_ticket_index.query(
+                TicketModel.create_queue_ticket_pk(family_id, queue_id),
+                range_key_condition=range_key_condition,
+                filter_condition=filter_condition,
+                **query_kwargs,
+            )
+            tickets = list(response)
+        except QueryError as e:
+            if not self._index_missing(e):
+                raise
+            self.logger.warning(
+                f"QueueTicketIndex is missing, falling back to partition query: {str(e)}"
+            )
+            # An index cursor cannot continue a partition query
+            query_kwargs.pop("last_evaluated_key", None)
+            return self._get_queue_tickets_from_partition(
+                family_id, queue_id, status, severity, query_kwargs
+            )
+
+        self.logger.info(
+            f"Fetched {len(tickets)} tickets for queue {queue_id} in family {family_id}."
+        )
+        return tickets, response.last_evaluated_key
+
+    def _get_queue_tickets_from_partition(
+        self,
+        family_id: str,
+        queue_id: str,
+        status: Optional[TicketStatus],
+        severity: Optional[TicketSeverity],
+        query_kwargs: dict,
+    ) -> Tuple[List[TicketModel], Optional[Dict]]:
+        """get_queue_tickets for tables without QueueTicketIndex."""
+        # The status filter also drops the queue's comment items
+        statuses = [status] if status else list(ACTIVE_TICKET_STATUSES)
+        filter_condition = TicketModel.status.is_in(*[s.value for s in statuses])
+        if severity:
+            filter_condition &= TicketModel.severity == severity.value
+        response = TicketModel.query(
+            TicketModel.create_pk(family_id),
+            TicketModel.sk.startswith(f"QUEUE#{queue_id}#TICKET#"),
+            filter_condition=filter_condition,
+            **query_kwargs,
+        )
+        tickets = list(response)
+
+        self.logger.info(
+            f"Fetched {len(tickets)} tickets for queue {queue_id} in family {family_id}."
+        )
+        return tickets, response.last_evaluated_key
+
+    @staticmethod
+    def _index_missing(error: QueryError) -> bool:
+        """Whether a query failed because the table lacks the index."""
+        code = error.cause_response_code
+        message = error.cause_response_message or ""
+        # DynamoDB reports a ValidationException; some emulators report the
+        # index as a missing resource
+        return (code == "ValidationException" and "specified index" in message) or (
+            code == "ResourceNotFoundException" and "Invalid index" in message
+        )
+
+    def next_ticket(
+        self, family_id: str, queue_id: str, n: int = 1
+    ) -> List[TicketModel]:
+        """
+        Get the n OPEN tickets of a queue that should be worked next: the most
+        severe first and, within a severity, the oldest first.
+
+        Open tickets are one contiguous range of QueueTicketIndex already in
+        that order, so this is a single query page of n items.
+        """
+        tickets = list(
+            TicketModel.queue_ticket_index.query(
+                TicketModel.create_queue_ticket_pk(family_id, queue_id),
+                range_key_condition=TicketModel.queue_ticket_sk.startswith(
+                    TicketModel.create_queue_ticket_sk_prefix(TicketStatus.OPEN.value)
+                ),
+                limit=n,
+            )
+        )
+        self.logger.info(
+            f"Fetched next {len(tickets)} tickets for queue {queue_id} in family {family_id}."
+        )
+        return tickets
+
+    def get_assigned_tickets(
+        self,
+        user_id: str,
+        limit: int = 50,
+        last_evaluated_key: Optional[Dict] = None,
+    ) -> Tuple[List[TicketModel], Optional[Dict]]:
+        """
+        Get a page of the OPEN tickets assigned to a user across all families,
+        most severe first and oldest first within a severity.
+
+        Args:
+            user_id: The assignee
+            limit: Maximum number of tickets to return (default: 50)
+            last_evaluated_key: Pagination key from previous query
+
+        Returns:
+            Tuple[List[TicketModel], Optional[Dict]]: Tickets and next pagination key
+        """
+        query_kwargs = {"limit": limit}
+        if last_evaluated_key:
+            query_kwargs["last_evaluated_key"] = last_evaluated_key
+
+        response = TicketModel.assignee_ticket_index.query(
+            TicketModel.create_assignee_ticket_pk(user_id), **query_kwargs
+        )
+        tickets = list(response)
+
+        self.logger.info(f"Fetched {len(tickets)} open tickets assigned to {user_id}.")
+        return tickets, response.last_evaluated_key
+
+    def _transact_status_change(
+        self,
+        ticket: TicketModel,
+        current: TicketStatus,
+        status: TicketStatus,
+        group_id: str,
+        actions: list,
+        now: int,
+    ) -> None:
+        """
+        Apply a status change to the ticket, its queue's counters, the day's
+        rollups and its assignee's open ticket counter together.
+        """
+        deltas = GroupMembershipModel.workload_deltas(
+            ticket.assigned_to, current.value, ticket.assigned_to, status.value
+        )
+        condition = TicketModel.status == current.value
+        if deltas:
+            # The counter moved is the one of the assignee read
+            condition &= TicketModel.assigned_to == ticket.assigned_to
+
+        def write(transaction) -> None:
+            transaction.update(ticket, actions=actions, condition=condition)
+            transaction.update(
+                self._queue_key(ticket.family_id, group_id, ticket.queue_id),
+                actions=QueueModel.ticket_count_actions(
+                    ticket.severity, current.value, status.value
+                ),
+                condition=QueueModel.sk.exists(),
+            )
+            self._add_rollup_updates(transaction, ticket, current, now, status)
+
+        try:
+            self._transact_with_workload(
+                ticket.family_id, group_id, deltas, write, first_workload_index=4
+            )
+        except TransactWriteError as e:
+            if condition_failed(e, 0):
+                raise InvalidTicketStatusTransition(
+                    f"Ticket {ticket.ticket_id} status changed concurrently"
+                )
+            if condition_failed(e, 1):
+                raise QueueNotFound(
+                    f"Queue {ticket.queue_id} does not exist in family {ticket.family_id}"
+                )
+            raise
+
+    def _transact_assignment(
+        self,
+        ticket: TicketModel,
+        assigned_to: Optional[str],
+        group_id: str,
+        deltas: Dict[str, int],
+        actions: list,
+    ) -> None:
+        """Reassign an OPEN ticket and move it between members' counters together."""
+        if ticket.assigned_to is None:
+            unchanged = TicketModel.assigned_to.does_not_exist()
+        else:
+            unchanged = TicketModel.assigned_to == ticket.assigned_to
+
+        def write(transaction) -> None:
+            transaction.update(
+                ticket,
+                actions=actions,
+                condition=(TicketModel.status == ticket.status) & unchanged,
+            )
+
+        try:
+            self._transact_with_workload(
+                ticket.family_id, group_id, deltas, write, first_workload_index=1
+            )
+        except TransactWriteError as e:
+            if condition_failed(e, 0):
+                raise InvalidTicketStatusTransition(
+                    f"Ticket {ticket.ticket_id} changed concurrently"
+                )
+            raise
+        # Transactional updates do not refresh the local item
+        for name, value in TicketModel.get_index_keys(
+            ticket, assigned_to=assigned_to
+        ).items():
+            setattr(ticket, name, value)
+        ticket.assigned_to = assigned_to
+
+    def _transact_with_workload(
+        self,
+        family_id: str,
+        group_id: str,
+        deltas: Dict[str, int],
+        write,
+        first_workload_index: int,
+    ) -> None:
+        """
+        Run the transaction `write` adds its operations to, together with the
+        open ticket counter updates of the users in `deltas` who are members
+        of the group. `first_workload_index` is where the counter updates fall
+        in the transaction. A counter update fails if its membership was
+        removed since it was read; the transaction is then retried once
+        without it.
+        """
+        counted = self._counted_deltas(family_id, group_id, deltas)
+        for attempt in range(2):
+            try:
+                with new_transaction() as transaction:
+                    write(transaction)
+                    for user_id, delta in counted.items():
+                        transaction.update(
+                            self._membership_key(family_id, group_id, user_id),
+                            actions=[GroupMembershipModel.open_ticket_count.add(delta)],
+                            condition=GroupMembershipModel.sk.exists(),
+                        )
+                return
+            except TransactWriteError as e:
+                removed = {
+                    user_id
+                    for index, user_id in enumerate(counted, first_workload_index)
+                    if condition_failed(e, index)
+                }
+                if attempt or not removed:
+                    raise
+                counted = {u: d for u, d in counted.items() if u not in removed}
+
+    def _transact_auto_assigned(
+        self, ticket: TicketModel, write, first_workload_index: int
+    ) -> None:
+        """
+        Run a new ticket's transaction, assigning the ticket to the active
+        member of its group with the fewest open tickets.
+
+        The members are read in one query. The chosen member's counter is
+        only incremented if it still holds the value read, so concurrent
+        creates spread over the group instead of all picking the same member;
+        on a conflict the members are read again. The last attempt only
+        requires the member to still be active. With no active member the
+        ticket is created unassigned.
+        """
+        membership_helper = GroupMembershipHelper(request_id=self.request_id)
+        for attempt in range(TICKET_AUTO_ASSIGN_MAX_ATTEMPTS):
+            member = membership_helper.get_least_loaded_member(
+                ticket.family_id, ticket.group_id
+            )
+            ticket.assigned_to = member.user_id if member else None
+            if member is None:
+                self.logger.info(
+                    f"No active member of group {ticket.group_id} to auto-assign "
+                    f"ticket {ticket.ticket_id} to"
+                )
+                with new_transaction() as transaction:
+                    write(transaction)
+                return
+
+            condition = GroupMembershipModel.status == MembershipStatus.MEMBER.value
+            if attempt < TICKET_AUTO_ASSIGN_MAX_ATTEMPTS - 1:
+                if member.open_ticket_count is None:
+                    condition &= GroupMembershipModel.open_ticket_count.does_not_exist()
+                else:
+                    condition &= (
+                        GroupMembershipModel.open_ticket_count
+                        == member.open_ticket_count
+                    )
+            try:
+                with new_transaction() as transaction:
+                    write(transaction)
+                    transaction.update(
+                        self._membership_key(
+                            ticket.family_id, ticket.group_id, member.user_id
+                        ),
+                        actions=[GroupMembershipModel.open_ticket_count.add(1)],
+                        condition=condition,
+                    )
+            except TransactWriteError as e:
+                if condition_failed(e, first_workload_index):
+                    self.logger.info(
+                        f"Load of member {member.user_id} changed while "
+                        f"auto-assigning ticket {ticket.ticket_id}; picking again"
+                    )
+                    continue
+                raise
+            self.logger.info(
+                f"Auto-assigned ticket {ticket.ticket_id} to {member.user_id} "
+                f"with {GroupMembershipModel.get_open_ticket_count(member)} open tickets"
+            )
+            return
+
+        # Every member read left the group; fall back to leaving it unassigned
+        ticket.assigned_to = None
+        with new_transaction() as transaction:
+            write(transaction)
+
+    def _counted_deltas(
+        self, family_id: str, group_id: str, deltas: Dict[str, int]
+    ) -> Dict[str, int]:
+        """The deltas of the users who have a counter, i.e. group members."""
+        if not deltas:
+            return {}
+        counted = GroupMembershipHelper(request_id=self.request_id).get_counted_members(
+            family_id, group_id, deltas
+        )
+        return {u: d for u, d in deltas.items() if u in counted}
+
+    @staticmethod
+    def _membership_key(
+        family_id: str, group_id: str, user_id: str
+    ) -> GroupMembershipModel:
+        return GroupMembershipModel(
+            GroupMembershipModel.create_pk(family_id),
+            GroupMembershipModel.create_sk(group_id, user_id),
+        )
+
+    @staticmethod
+    def _add_rollup_updates(
+        transaction,
+        ticket: TicketModel,
+        old_status: Optional[TicketStatus],
+        now: int,
+        new_status: TicketStatus = TicketStatus.OPEN,
+    ) -> None:
+        """Add the family's and the queue's rollup updates of a ticket event."""
+        deltas = TicketRollupModel.transition_deltas(
+            ticket.severity,
+            old_status.value if old_status else None,
+            new_status.value,
+            open_seconds=now - ticket.creation_date,
+        )
+        for rollup, actions in TicketRollupHelper.rollup_updates(
+            ticket.family_id, ticket.queue_id, TicketRollupModel.day_of(now), deltas
+        ):
+            transaction.update(rollup, actions=actions)
+
+    def _get_queue_group_id(self, family_id: str, queue_id: str) -> Optional[str]:
+        queue = QueueHelper(request_id=self.request_id).get_queue_by_id(
+            family_id, queue_id
+        )
+        return queue.group_id if queue else None
+
+    @staticmethod
+    def _queue_key(family_id: str, group_id: str, queue_id: str) -> QueueModel:
+        # Key-only instance: transactional updates only need the primary key
+        return QueueModel(
+            QueueModel.create_pk(family_id),
+            QueueModel.create_sk(group_id, queue_id),
+        )
+
+    def _update_if_status(
+        self, ticket: TicketModel, expected: TicketStatus, actions: list
+    ) -> None:
+        """Apply update actions only if the ticket still has the expected status."""
+        try:
+            ticket.update(
+                actions=actions, condition=TicketModel.status == expected.value
+            )
+        except UpdateError as e:
+            if e.cause_response_code == "ConditionalCheckFailedException":
+                raise InvalidTicketStatusTransition(
+                    f"Ticket {ticket.ticket_id} status changed concurrently"
+                )
+            raise
+
+    def _notify_assignee(self, ticket: TicketModel, actor_user_id: str) -> None:
+        if ticket.assigned_to == actor_user_id:
+            return
+        NotificationHelper(request_id=self.request_id).create_notification(
+            user_id=ticket.assigned_to,
+            message=f"You were assigned ticket '{ticket.title}'.",
+            notification_type=NotificationType.TICKET_ASSIGNED,
+            family_id=ticket.family_id,
+            ticket_id=ticket.ticket_id,
+        )
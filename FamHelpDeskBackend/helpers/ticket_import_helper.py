@@ -0,0 +1,477 @@
+import csv
+import json
+from collections import Counter, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+from typing import Deque, Dict, Iterator, List, Optional, TextIO, Tuple
+from aws_lambda_powertools import Logger
+
+from constants.ticket import (
+    TICKET_IMPORT_BATCH_SIZE,
+    TICKET_IMPORT_MAX_PARALLEL_BATCHES,
+    TICKET_REOPEN_WINDOW_SECONDS,
+    TICKET_SLA_SECONDS,
+)
+from exceptions.ticket_exceptions import InvalidTicketData, TicketException
+from helpers.audit_helper import AuditHelper
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.group_membership_helper import GroupMembershipHelper
+from helpers.queue_helper import QueueHelper
+from helpers.ticket_duplicate_helper import TicketDuplicateHelper
+from helpers.ticket_number_helper import TicketNumberHelper
+from helpers.ticket_rollup_helper import TicketRollupHelper
+from helpers.ticket_search_helper import TicketSearchHelper
+from helpers.ticket_validation_helper import TicketValidationHelper
+from models.audit import AuditModel, AuditActions, AuditEntityTypes
+from models.group_membership import GroupMembershipModel
+from models.queue import QueueModel
+from models.ticket_number import TicketNumberModel
+from models.ticket_rollup import TicketRollupModel
+from models.ticket import TicketModel, TicketSeverity, TicketStatus
+
+# (row number, parsed row or None, parse error or None)
+ImportRow = Tuple[int, Optional[dict], Optional[str]]
+
+
+class TicketImportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class TicketImportHelper:
+    """
+    Bulk ticket import from CSV or NDJSON, for migrating a family's tickets
+    from a spreadsheet or another tool.
+
+    Rows are read one at a time and validated with the same rules as ticket
+    creation. Valid rows are written in chunks of TICKET_IMPORT_BATCH_SIZE
+    tickets with batch writes, up to TICKET_IMPORT_MAX_PARALLEL_BATCHES chunks
+    at once, and each chunk then adds its tickets to the queue counters with
+    one update per queue, to the assignees' open ticket counters with one
+    update per assignee, and to the analytics rollups of the days in the
+    tickets' histories. A chunk's search postings, duplicate signatures and
+    audit records are batch written too. Only the chunks in flight are held
+    in memory, so any file size imports in constant memory. Results stream
+    back as one event per failed row, followed by a summary.
+
+    Columns (CSV header or NDJSON keys): title and severity are required;
+    description, status (default OPEN), queue_id (default: the import's
+    queue), assigned_to, created_by (default: the importing user),
+    creation_date, resolved_date and closed_date (epoch seconds) are optional.
+
+    OPEN tickets get a fresh SLA deadline from the time of import. RESOLVED
+    and CLOSED tickets get the reopen window their resolution (or close)
+    started; a RESOLVED ticket whose window has already passed is imported
+    as CLOSED at the end of the window, as the deadline scheduler would
+    have closed it.
+    """
+
+    def __init__(
+        self,
+        request_id: str = None,
+        max_parallel_batches: int = TICKET_IMPORT_MAX_PARALLEL_BATCHES,
+    ):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+        self.request_id = request_id
+        self.max_parallel_batches = max_parallel_batches
+        self.validation_helper = TicketValidationHelper(request_id=request_id)
+        self.number_helper = TicketNumberHelper(request_id=request_id)
+        self.audit_helper = AuditHelper(request_id=request_id)
+
+    @staticmethod
+    def read_rows(
+        stream: TextIO, import_format: TicketImportFormat
+    ) -> Iterator[ImportRow]:
+        """
+        Parse a file lazily, one row at a time. Row numbers are file line
+        numbers, so errors can be traced back to the source.
+
+        Raises:
+            InvalidTicketData: A CSV file has no header with a title column;
+                checked before any row is read
+        """
+        if import_format == TicketImportFormat.CSV:
+            reader = csv.DictReader(stream)
+            if not reader.fieldnames or "title" not in reader.fieldnames:
+                raise InvalidTicketData("CSV header must include a title column")
+            return TicketImportHelper._read_csv_rows(reader)
+        return TicketImportHelper._read_ndjson_rows(stream)
+
+    @staticmethod
+    def _read_csv_rows(reader: csv.DictReader) -> Iterator[ImportRow]:
+        for row in reader:
+            if None in row:
+                yield reader.line_num, None, "Row has more fields than the header"
+                continue
+            # Empty cells are absent values
+            yield reader.line_num, {k: v for k, v in row.items() if v != ""}, None
+
+    @staticmethod
+    def _read_ndjson_rows(stream: TextIO) -> Iterator[ImportRow]:
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield line_number, None, f"Invalid JSON: {str(e)}"
+                continue
+            if not isinstance(row, dict):
+                yield line_number, None, "Row must be a JSON object"
+                continue
+            yield line_number, {k: v for k, v in row.items() if v is not None}, None
+
+    def import_tickets(
+        self,
+        family_id: str,
+        rows: Iterator[ImportRow],
+        actor_user_id: str,
+        default_queue_id: Optional[str] = None,
+        dry_run: bool = False,
+    ) -> Iterator[dict]:
+        """
+        Validate and write rows as they are read.
+
+        Args:
+            family_id: The family to import into
+            rows: Rows from read_rows
+            actor_user_id: The importing user, recorded on audit records and
+                as the creator of rows without created_by
+            default_queue_id: Queue of rows without queue_id
+            dry_run: Validate only; nothing is written
+
+        Yields:
+            {"row": n, "error": message} for every row that was not imported,
+            then {"summary": {"rows", "imported", "failed"}} last
+        """
+        # Looked up once; the import checks every row against these
+        queue_helper = QueueHelper(request_id=self.request_id)
+        queues = {
+            queue.queue_id: queue.group_id
+            for queue in queue_helper.get_all_queues_by_family(family_id)
+        }
+        membership_helper = FamilyMembershipHelper(request_id=self.request_id)
+        members = {
+            member["user_id"] for member in membership_helper.get_all_members(family_id)
+        }
+        now = TicketModel.now_epoch()
+        summary = {"rows": 0, "imported": 0, "failed": 0}
+
+        in_flight: Deque[Future] = deque()
+        chunk: List[Tuple[int, TicketModel]] = []
+        with ThreadPoolExecutor(max_workers=self.max_parallel_batches) as executor:
+            for row_number, row, error in rows:
+                summary["rows"] += 1
+                if error is None:
+                    try:
+                        chunk.append(
+                            (
+                                row_number,
+                                self._build_ticket(
+                                    family_id,
+                                    row,
+                                    queues,
+                                    members,
+                                    actor_user_id,
+                                    default_queue_id,
+                                    now,
+                                ),
+                            )
+                        )
+                    except TicketException as e:
+                        error = e.message
+                if error is not None:
+                    summary["failed"] += 1
+                    yield {"row": row_number, "error": error}
+                    continue
+
+                if len(chunk) == TICKET_IMPORT_BATCH_SIZE:
+                    in_flight.append(
+                        self._submit_chunk(
+                            executor, family_id, chunk, actor_user_id, dry_run
+                        )
+                    )
+                    chunk = []
+                    # Wait for the oldest chunk before reading further rows
+                    while len(in_flight) >= self.max_parallel_batches:
+                        yield from self._collect(in_flight.popleft(), summary)
+
+            if chunk:
+                in_flight.append(
+                    self._submit_chunk(
+                        executor, family_id, chunk, actor_user_id, dry_run
+                    )
+                )
+            while in_flight:
+                yield from self._collect(in_flight.popleft(), summary)
+
+        self.logger.info(
+            f"Imported {summary['imported']} of {summary['rows']} rows into family "
+            f"{family_id} (dry run: {dry_run})"
+        )
+        yield {"summary": summary}
+
+    def _build_ticket(
+        self,
+        family_id: str,
+        row: dict,
+        queues: Dict[str, str],
+        members: set,
+        actor_user_id: str,
+        default_queue_id: Optional[str],
+        now: int,
+    ) -> TicketModel:
+        """Validate a row into an unsaved ticket; raises a TicketException."""
+        title = self._get_str(row, "title")
+        description = self._get_str(row, "description")
+        self.validation_helper.validate_ticket_title(title)
+        self.validation_helper.validate_ticket_description(description)
+
+        severity = self._parse_severity(row.get("severity"))
+        try:
+            status = TicketStatus(str(row.get("status", "OPEN")).strip().upper())
+        except ValueError:
+            raise InvalidTicketData(f"Invalid ticket status: {row.get('status')}")
+
+        queue_id = self._get_str(row, "queue_id") or default_queue_id
+        if not queue_id:
+            raise InvalidTicketData("Queue ID is required")
+        if queue_id not in queues:
+            raise InvalidTicketData(
+                f"Queue {queue_id} does not exist in family {family_id}"
+            )
+
+        assigned_to = self._get_str(row, "assigned_to")
+        created_by = self._get_str(row, "created_by") or actor_user_id
+        for user_id in (assigned_to, created_by):
+            if user_id is not None and user_id not in members:
+                raise InvalidTicketData(
+                    f"User {user_id} is not a member of family {family_id}"
+                )
+
+        creation_date = self._get_epoch(row, "creation_date", now)
+        if creation_date > now:
+            raise InvalidTicketData("creation_date cannot be in the future")
+
+        ticket_id = TicketModel.generate_uuid()
+        ticket = TicketModel(
+            pk=TicketModel.create_pk(family_id),
+            sk=TicketModel.create_sk(queue_id, ticket_id),
+            family_id=family_id,
+            queue_id=queue_id,
+            group_id=queues[queue_id],
+            ticket_id=ticket_id,
+            title=title,
+            severity=severity.value,
+            status=status.value,
+            creation_date=creation_date,
+            created_by=created_by,
+            comment_count=0,
+            last_activity=creation_date,
+        )
+        if description is not None:
+            ticket.description = description
+        if assigned_to is not None:
+            ticket.assigned_to = assigned_to
+
+        if status == TicketStatus.OPEN:
+            # The SLA clock starts at import, so migrated backlogs are not
+            # flagged as breached all at once
+            ticket.sla_due = now + TICKET_SLA_SECONDS[severity.value]
+        elif status == TicketStatus.RESOLVED:
+            ticket.resolved_date = self._get_epoch(row, "resolved_date", now)
+            ticket.reopen_until = ticket.resolved_date + TICKET_REOPEN_WINDOW_SECONDS
+            if ticket.reopen_until <= now:
+                # Its auto-close deadline has passed, possibly further back
+                # than the deadline scheduler reads, so it is closed as the
+                # scheduler would have done
+                ticket.status = TicketStatus.CLOSED.value
+                ticket.closed_date = ticket.reopen_until
+        else:
+            ticket.closed_date = self._get_epoch(row, "closed_date", now)
+            if "resolved_date" in row:
+                ticket.resolved_date = self._get_epoch(row, "resolved_date", now)
+            # As when closing in the app, the reopen window runs from the
+            # resolution, or from the close when it was never resolved
+            window_start = (
+                ticket.resolved_date
+                if ticket.resolved_date is not None
+                else ticket.closed_date
+            )
+            ticket.reopen_until = window_start + TICKET_REOPEN_WINDOW_SECONDS
+
+        # A ticket is created, then resolved, then closed
+        history = [("creation_date", creation_date)]
+        for field in ("resolved_date", "closed_date"):
+            value = getattr(ticket, field, None)
+            if value is None:
+                continue
+            if value > now:
+                raise InvalidTicketData(f"{field} cannot be in the future")
+            previous_field, previous = history[-1]
+            if value < previous:
+                raise InvalidTicketData(f"{field} cannot be before {previous_field}")
+            history.append((field, value))
+        return ticket
+
+    def _submit_chunk(
+        self,
+        executor: ThreadPoolExecutor,
+        family_id: str,
+        chunk: List[Tuple[int, TicketModel]],
+        actor_user_id: str,
+        dry_run: bool,
+    ) -> Future:
+        if not dry_run:
+            # Numbered here rather than in the workers, so numbers follow the
+            # file order even though chunks are written concurrently
+            first, prefix = self.number_helper.reserve_block(family_id, len(chunk))
+            for offset, (_, ticket) in enumerate(chunk):
+                ticket.ticket_number = first + offset
+                ticket.ticket_key = TicketNumberModel.create_ticket_key(
+                    prefix, ticket.ticket_number
+                )
+                TicketModel.set_index_keys(ticket)
+        return executor.submit(
+            self._write_chunk, family_id, chunk, actor_user_id, dry_run
+        )
+
+    def _collect(self, future: Future, summary: dict) -> Iterator[dict]:
+        imported, errors = future.result()
+        summary["imported"] += imported
+        summary["failed"] += len(errors)
+        yield from errors
+
+    def _write_chunk(
+        self,
+        family_id: str,
+        chunk: List[Tuple[int, TicketModel]],
+        actor_user_id: str,
+        dry_run: bool,
+    ) -> Tuple[int, List[dict]]:
+        """Write one chunk; returns (tickets imported, error events)."""
+        if dry_run:
+            return len(chunk), []
+
+        try:
+            with TicketModel.batch_write() as batch:
+                for _, ticket in chunk:
+                    batch.save(ticket)
+                    batch.save(
+                        TicketNumberModel(
+                            pk=TicketNumberModel.create_pk(family_id),
+                            sk=TicketNumberModel.create_sk(ticket.ticket_number),
+                            family_id=family_id,
+                            ticket_number=ticket.ticket_number,
+                            queue_id=ticket.queue_id,
+                            ticket_id=ticket.ticket_id,
+                        )
+                    )
+        except Exception as e:
+            # Part of the chunk may have been written before the failure;
+            # reconcile_queue_counts.py corrects the counters for those
+            self.logger.error(
+                f"Failed to write import rows {chunk[0][0]}-{chunk[-1][0]}: {str(e)}"
+            )
+            return 0, [
+                {"row": row_number, "error": "Failed to write ticket"}
+                for row_number, _ in chunk
+            ]
+
+        deltas: Dict[Tuple[str, str], Counter] = defaultdict(Counter)
+        for _, ticket in chunk:
+            deltas[(ticket.group_id, ticket.queue_id)].update(
+                QueueModel.ticket_count_deltas(
+                    ticket.severity, new_status=ticket.status
+                )
+            )
+        for (group_id, queue_id), queue_deltas in deltas.items():
+            try:
+                QueueModel(
+                    QueueModel.create_pk(family_id),
+                    QueueModel.create_sk(group_id, queue_id),
+                ).update(
+                    actions=QueueModel.count_delta_actions(queue_deltas),
+                    condition=QueueModel.sk.exists(),
+                )
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to count imported tickets on queue {queue_id}: {str(e)}"
+                )
+
+        workload: Dict[Tuple[str, str], int] = Counter()
+        for _, ticket in chunk:
+            for user_id, delta in GroupMembershipModel.workload_deltas(
+                new_assignee=ticket.assigned_to, new_status=ticket.status
+            ).items():
+                workload[(ticket.group_id, user_id)] += delta
+        GroupMembershipHelper(request_id=self.request_id).apply_open_ticket_deltas(
+            family_id, workload
+        )
+
+        events = defaultdict(Counter)
+        for _, ticket in chunk:
+            TicketRollupHelper.collect_events(
+                events, ticket.queue_id, TicketRollupModel.ticket_history_events(ticket)
+            )
+        TicketRollupHelper(request_id=self.request_id).apply_events(family_id, events)
+
+        tickets = [ticket for _, ticket in chunk]
+        self._index_tickets(tickets)
+        with AuditModel.batch_write() as batch:
+            for ticket in tickets:
+                batch.save(
+                    self.audit_helper.build_family_audit_record(
+                        family_id=family_id,
+                        entity_type=AuditEntityTypes.TICKET,
+                        entity_id=ticket.ticket_id,
+                        action=AuditActions.CREATE,
+                        actor_user_id=actor_user_id,
+                        after=TicketModel.clean_returned_ticket(ticket),
+                    )
+                )
+        return len(chunk), []
+
+    def _index_tickets(self, tickets: List[TicketModel]) -> None:
+        # Derived data, as on ticket creation: failures are only logged
+        try:
+            TicketSearchHelper(request_id=self.request_id).index_tickets(tickets)
+            TicketDuplicateHelper(request_id=self.request_id).index_tickets(tickets)
+        except Exception as e:
+            self.logger.error(
+                f"Failed to index imported tickets "
+                f"{tickets[0].ticket_id}-{tickets[-1].ticket_id}: {str(e)}"
+            )
+
+    @staticmethod
+    def _get_str(row: dict, field: str) -> Optional[str]:
+        value = row.get(field)
+        return str(value) if value is not None else None
+
+    @staticmethod
+    def _get_epoch(row: dict, field: str, default: int) -> int:
+        value = row.get(field)
+        if value is None:
+            return default
+        try:
+            epoch = int(value)
+        except (TypeError, ValueError):
+            raise InvalidTicketData(f"{field} must be epoch seconds: {value}")
+        if epoch < 0:
+            raise InvalidTicketData(f"{field} must be epoch seconds: {value}")
+        return epoch
+
+    @staticmethod
+    def _parse_severity(value) -> TicketSeverity:
+        """Accept a severity value ("3.0"), number (3) or name ("SEV_3")."""
+        if value is None:
+            raise InvalidTicketData("Ticket severity is required")
+        text = str(value).strip().upper()
+        if text in TicketSeverity.__members__:
+            return TicketSeverity[text]
+        try:
+            return TicketSeverity(f"{float(text):.1f}")
+        except ValueError:
+            raise InvalidTicketData(f"Invalid ticket severity: {value}")
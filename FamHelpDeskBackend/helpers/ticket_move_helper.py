@@ -0,0 +1,633 @@
+import time
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
+from pynamodb.exceptions import DoesNotExist, TransactWriteError, UpdateError
+from pynamodb.transactions import TransactWrite
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.metrics import Metrics, MetricUnit
+
+from constants.metrics import (
+    API_METRICS_NAMESPACE,
+    TICKET_MOVE_SERVICE,
+    TICKETS_MOVED,
+    TICKET_COMMENTS_MOVED,
+    TICKET_MOVE_FAILURES,
+    TICKET_MOVE_THROUGHPUT,
+)
+from constants.ticket import TRANSACTION_MAX_ITEMS, TICKET_MOVE_MAX_TICKET_IDS
+from exceptions.queue_exceptions import QueueNotFound
+from exceptions.ticket_exceptions import InvalidTicketData, TicketMoveNotFound
+from helpers.audit_helper import AuditHelper
+from helpers.group_membership_helper import GroupMembershipHelper
+from helpers.queue_helper import QueueHelper
+from helpers.ticket_duplicate_helper import TicketDuplicateHelper
+from helpers.ticket_rollup_helper import TicketRollupHelper
+from helpers.ticket_search_helper import TicketSearchHelper
+from helpers.transaction_helper import new_transaction, condition_failed
+from models.audit import AuditActions, AuditEntityTypes
+from models.group_membership import GroupMembershipModel
+from models.queue import QueueModel
+from models.ticket import TicketModel, TicketStatus
+from models.ticket_comment import TicketCommentModel
+from models.ticket_move import TicketMoveModel, TicketMoveStatus
+from models.ticket_number import TicketNumberModel
+from models.ticket_rollup import TicketRollupModel
+
+# A ticket with its comments, as read from the source queue
+TicketThread = Tuple[TicketModel, List[TicketCommentModel]]
+
+
+class TicketMoveHelper:
+    """
+    Bulk moves of tickets, with their comments, from one queue to another.
+
+    Ticket and comment sort keys embed the queue ID, so moving a ticket means
+    deleting its items and writing them again under the new queue. Tickets
+    move in transactional chunks of up to TRANSACTION_MAX_ITEMS items: a chunk
+    re-keys its tickets and comments, repoints their ticket numbers and moves
+    them between the two queues' counters, all or nothing. Moves between
+    groups then move assigned OPEN tickets between the assignees' open ticket
+    counters of the two groups, and OPEN tickets between the two queues'
+    backlogs on the day's analytics rollups, best effort. Old items are only
+    deleted if they are unchanged since they were read, so a concurrent edit
+    cancels the chunk instead of being lost, and its tickets are retried one
+    at a time.
+
+    A ticket whose thread is too long for one transaction moves in phases:
+    its comments are copied, the ticket moves in a transaction, then the old
+    comments are deleted. Comment edits made during that window may be lost.
+
+    Progress is checkpointed on a TicketMoveModel after every chunk, so a
+    move that runs out of time resumes after the last ticket it handled.
+    """
+
+    # Two transaction items per queue: the source and target counter updates
+    QUEUE_UPDATE_ITEMS = 2
+
+    def __init__(self, request_id: str = None):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+        self.request_id = request_id
+        self.audit_helper = AuditHelper(request_id=request_id)
+        self.queue_helper = QueueHelper(request_id=request_id)
+
+    def start_move(
+        self,
+        family_id: str,
+        source_queue_id: str,
+        target_queue_id: str,
+        actor_user_id: str,
+        ticket_ids: Optional[List[str]] = None,
+    ) -> TicketMoveModel:
+        """
+        Create the checkpoint of a new move; run_move does the moving.
+
+        Args:
+            ticket_ids: Tickets to move (default: every ticket in the source
+                queue, e.g. to empty it before deleting it)
+
+        Raises:
+            InvalidTicketData: The queues are the same or too many tickets
+                are named
+            QueueNotFound: The target queue does not exist
+        """
+        if source_queue_id == target_queue_id:
+            raise InvalidTicketData("Source and target queues must differ")
+        if ticket_ids is not None:
+            ticket_ids = sorted(set(ticket_ids))
+            if not ticket_ids or len(ticket_ids) > TICKET_MOVE_MAX_TICKET_IDS:
+                raise InvalidTicketData(
+                    f"Name between 1 and {TICKET_MOVE_MAX_TICKET_IDS} tickets to move"
+                )
+
+        target = self.queue_helper.get_queue_by_id(family_id, target_queue_id)
+        if not target:
+            raise QueueNotFound(
+                f"Queue {target_queue_id} does not exist in family {family_id}"
+            )
+
+        move_id = TicketMoveModel.generate_time_ordered_id()
+        now = TicketMoveModel.now_epoch()
+        move = TicketMoveModel(
+            pk=TicketMoveModel.create_pk(family_id),
+            sk=TicketMoveModel.create_sk(move_id),
+            family_id=family_id,
+            move_id=move_id,
+            source_queue_id=source_queue_id,
+            target_queue_id=target_queue_id,
+            target_group_id=target.group_id,
+            actor_user_id=actor_user_id,
+            ticket_ids=ticket_ids,
+            status=TicketMoveStatus.RUNNING.value,
+            started_at=now,
+            updated_at=now,
+        )
+        move.save(condition=TicketMoveModel.sk.does_not_exist())
+        self.logger.info(
+            f"Started move {move_id} from queue {source_queue_id} to "
+            f"{target_queue_id} in family {family_id}"
+        )
+        return move
+
+    def get_move(self, family_id: str, move_id: str) -> TicketMoveModel:
+        try:
+            return TicketMoveModel.get(
+                TicketMoveModel.create_pk(family_id),
+                TicketMoveModel.create_sk(move_id),
+                consistent_read=True,
+            )
+        except DoesNotExist:
+            raise TicketMoveNotFound(
+                f"Ticket move {move_id} does not exist in family {family_id}"
+            )
+
+    def run_move(
+        self, move: TicketMoveModel, max_seconds: Optional[float] = None
+    ) -> dict:
+        """
+        Move tickets from the move's checkpoint on, until done or until
+        max_seconds have passed; the checkpoint is updated in place.
+
+        Returns:
+            This run's tickets and comments moved, failed ticket IDs,
+            elapsed seconds, tickets per second and whether the move completed
+
+        Raises:
+            QueueNotFound: The target queue was deleted during the move
+        """
+        run = {
+            "tickets_moved": 0,
+            "comments_moved": 0,
+            "failed_ticket_ids": [],
+            "elapsed_seconds": 0.0,
+            "tickets_per_second": None,
+            "completed": move.status == TicketMoveStatus.COMPLETED.value,
+        }
+        if run["completed"]:
+            return run
+
+        # The source queue may be gone, leaving closed tickets behind; they
+        # can still be moved, there are just no source counters to update
+        source = self.queue_helper.get_queue_by_id(move.family_id, move.source_queue_id)
+        source_group_id = source.group_id if source else None
+
+        started = time.monotonic()
+        checkpoint_at = started
+        completed = True
+        for chunk in self._chunks(self._pending_threads(move)):
+            moved, comments, failed = self._move_chunk(move, source_group_id, chunk)
+            run["tickets_moved"] += moved
+            run["comments_moved"] += comments
+            run["failed_ticket_ids"] += failed
+
+            now = time.monotonic()
+            if not self._save_checkpoint(
+                move,
+                chunk[-1][0].ticket_id,
+                moved,
+                comments,
+                len(failed),
+                now - checkpoint_at,
+            ):
+                completed = False
+                break
+            checkpoint_at = now
+            if max_seconds is not None and now - started >= max_seconds:
+                completed = False
+                break
+
+        if completed:
+            move.update(
+                actions=[
+                    TicketMoveModel.status.set(TicketMoveStatus.COMPLETED.value),
+                    TicketMoveModel.completed_at.set(TicketMoveModel.now_epoch()),
+                    TicketMoveModel.updated_at.set(TicketMoveModel.now_epoch()),
+                ]
+            )
+        run["completed"] = completed
+        run["elapsed_seconds"] = round(time.monotonic() - started, 3)
+        if run["elapsed_seconds"] > 0:
+            run["tickets_per_second"] = round(
+                run["tickets_moved"] / run["elapsed_seconds"], 2
+            )
+
+        self.logger.info(
+            f"Move {move.move_id} run: {run['tickets_moved']} tickets and "
+            f"{run['comments_moved']} comments in {run['elapsed_seconds']}s, "
+            f"{len(run['failed_ticket_ids'])} failed, completed: {completed}"
+        )
+        self._publish_metrics(run)
+        return run
+
+    def _pending_threads(self, move: TicketMoveModel) -> Iterator[TicketThread]:
+        """The move's remaining tickets after its cursor, in ticket ID order."""
+        pk = TicketModel.create_pk(move.family_id)
+        if move.ticket_ids is not None:
+            for ticket_id in move.ticket_ids:
+                if move.cursor is not None and ticket_id <= move.cursor:
+                    continue
+                try:
+                    ticket = TicketModel.get(
+                        pk,
+                        TicketModel.create_sk(move.source_queue_id, ticket_id),
+                        consistent_read=True,
+                    )
+                except DoesNotExist:
+                    # Reported as failed, not silently skipped
+                    ticket = TicketModel(
+                        pk, TicketModel.create_sk(move.source_queue_id, ticket_id)
+                    )
+                    ticket.ticket_id = ticket_id
+                    yield ticket, []
+                    continue
+                yield ticket, self._get_comments(ticket)
+            return
+
+        prefix = TicketModel.create_sk(move.source_queue_id, "")
+        # Past the cursor ticket's own comments, which sort right after it
+        start = (
+            TicketModel.create_sk(move.source_queue_id, move.cursor) + "$"
+            if move.cursor is not None
+            else prefix
+        )
+        for ticket in TicketModel.query(
+            pk,
+            TicketModel.sk.between(start, prefix + "~"),
+            # The status filter drops the comment items that share the prefix
+            filter_condition=TicketModel.status.exists(),
+            consistent_read=True,
+        ):
+            yield ticket, self._get_comments(ticket)
+
+    @staticmethod
+    def _get_comments(ticket: TicketModel) -> List[TicketCommentModel]:
+        return list(
+            TicketCommentModel.query(
+                TicketCommentModel.create_pk(ticket.family_id),
+                TicketCommentModel.sk.startswith(
+                    TicketCommentModel.create_sk_prefix(
+                        ticket.queue_id, ticket.ticket_id
+                    )
+                ),
+                consistent_read=True,
+            )
+        )
+
+    def _chunks(self, threads: Iterator[TicketThread]) -> Iterator[List[TicketThread]]:
+        """Group threads into chunks that fit one transaction each."""
+        budget = TRANSACTION_MAX_ITEMS - self.QUEUE_UPDATE_ITEMS
+        chunk, used = [], 0
+        for thread in threads:
+            cost = self._thread_items(thread)
+            if chunk and used + cost > budget:
+                yield chunk
+                chunk, used = [], 0
+            chunk.append(thread)
+            used += cost
+            # A thread over budget on its own still gets a chunk to itself
+            if used >= budget:
+                yield chunk
+                chunk, used = [], 0
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def _thread_items(thread: TicketThread) -> int:
+        ticket, comments = thread
+        # Delete and put per item, plus the ticket number update
+        return 2 + 2 * len(comments) + (1 if ticket.ticket_number else 0)
+
+    def _move_chunk(
+        self,
+        move: TicketMoveModel,
+        source_group_id: Optional[str],
+        chunk: List[TicketThread],
+    ) -> Tuple[int, int, List[str]]:
+        """Move one chunk; returns (tickets moved, comments moved, failed IDs)."""
+        budget = TRANSACTION_MAX_ITEMS - self.QUEUE_UPDATE_ITEMS
+        if len(chunk) == 1 and self._thread_items(chunk[0]) > budget:
+            return self._move_long_thread(move, source_group_id, chunk[0])
+
+        missing = [t.ticket_id for t, _ in chunk if t.status is None]
+        chunk = [thread for thread in chunk if thread[0].status is not None]
+        if not chunk:
+            return 0, 0, missing
+
+        moved = [
+            (self._rehome(move, ticket), [self._rehome(move, c) for c in comments])
+            for ticket, comments in chunk
+        ]
+        try:
+            with new_transaction() as transaction:
+                self._add_counter_updates(
+                    transaction, move, source_group_id, [t for t, _ in chunk]
+                )
+                for (ticket, comments), (new_ticket, new_comments) in zip(chunk, moved):
+                    self._add_ticket_move(transaction, ticket, new_ticket)
+                    for comment, new_comment in zip(comments, new_comments):
+                        transaction.delete(
+                            comment,
+                            condition=TicketCommentModel.last_update
+                            == comment.last_update,
+                        )
+                        transaction.save(
+                            new_comment,
+                            condition=TicketCommentModel.sk.does_not_exist(),
+                        )
+        except TransactWriteError as e:
+            # Each ticket and comment is one delete and one put
+            self._raise_if_target_missing(
+                e, move, sum(2 + 2 * len(comments) for _, comments in chunk)
+            )
+            if len(chunk) == 1 or not condition_failed(e):
+                self.logger.warning(
+                    f"Could not move tickets {[t.ticket_id for t, _ in chunk]}: "
+                    f"{str(e)}"
+                )
+                return 0, 0, missing + [t.ticket_id for t, _ in chunk]
+            # Something in the chunk changed; move its tickets one at a time
+            tickets, comments, failed = 0, 0, missing
+            for thread in chunk:
+                result = self._move_chunk(move, source_group_id, [thread])
+                tickets, comments = tickets + result[0], comments + result[1]
+                failed = failed + result[2]
+            return tickets, comments, failed
+
+        self._move_workload(move, source_group_id, [t for t, _ in chunk])
+        self._move_backlog(move, [t for t, _ in chunk])
+        for (ticket, comments), (new_ticket, _) in zip(chunk, moved):
+            self._after_move(move, ticket, new_ticket)
+        return len(chunk), sum(len(cs) for _, cs in chunk), missing
+
+    def _move_long_thread(
+        self,
+        move: TicketMoveModel,
+        source_group_id: Optional[str],
+        thread: TicketThread,
+    ) -> Tuple[int, int, List[str]]:
+        ticket, comments = thread
+        new_ticket = self._rehome(move, ticket)
+        new_comments = [self._rehome(move, comment) for comment in comments]
+
+        with TicketCommentModel.batch_write() as batch:
+            for new_comment in new_comments:
+                batch.save(new_comment)
+        try:
+            with new_transaction() as transaction:
+                self._add_counter_updates(transaction, move, source_group_id, [ticket])
+                self._add_ticket_move(transaction, ticket, new_ticket)
+        except TransactWriteError as e:
+            with TicketCommentModel.batch_write() as batch:
+                for new_comment in new_comments:
+                    batch.delete(new_comment)
+            # The ticket's delete and put are sent before the updates
+            self._raise_if_target_missing(e, move, 2)
+            self.logger.warning(f"Could not move ticket {ticket.ticket_id}: {str(e)}")
+            return 0, 0, [ticket.ticket_id]
+        with TicketCommentModel.batch_write() as batch:
+            for comment in comments:
+                batch.delete(comment)
+
+        self._move_workload(move, source_group_id, [ticket])
+        self._move_backlog(move, [ticket])
+        self._after_move(move, ticket, new_ticket)
+        return 1, len(comments), []
+
+    def _add_counter_updates(
+        self,
+        transaction: TransactWrite,
+        move: TicketMoveModel,
+        source_group_id: Optional[str],
+        tickets: List[TicketModel],
+    ) -> None:
+        """
+        Add the queue counter updates, target queue first. Add them before
+        any other update, so they are the first updates DynamoDB receives.
+        """
+        source_deltas, target_deltas = Counter(), Counter()
+        for ticket in tickets:
+            source_deltas.update(
+                QueueModel.ticket_count_deltas(
+                    ticket.severity, old_status=ticket.status
+                )
+            )
+            target_deltas.update(
+                QueueModel.ticket_count_deltas(
+                    ticket.severity, new_status=ticket.status
+                )
+            )
+        counters: Dict[Tuple[str, str], Counter] = {
+            (move.target_group_id, move.target_queue_id): target_deltas
+        }
+        if source_group_id is not None:
+            counters[(source_group_id, move.source_queue_id)] = source_deltas
+        for (group_id, queue_id), deltas in counters.items():
+            transaction.update(
+                QueueModel(
+                    QueueModel.create_pk(move.family_id),
+                    QueueModel.create_sk(group_id, queue_id),
+                ),
+                # Counter subtracts leave zeros rather than removing counters
+                actions=QueueModel.count_delta_actions(deltas),
+                condition=QueueModel.sk.exists(),
+            )
+
+    def _move_workload(
+        self,
+        move: TicketMoveModel,
+        source_group_id: Optional[str],
+        tickets: List[TicketModel],
+    ) -> None:
+        """
+        Move moved OPEN tickets between their assignees' open ticket counters
+        in the source and target groups. Not part of the chunk's transaction,
+        which has no room for an update per assignee; reconcile_queue_counts.py
+        repairs counters left behind by a failure.
+        """
+        deltas: Dict[Tuple[str, str], int] = Counter()
+        for ticket in tickets:
+            group_id = ticket.group_id or source_group_id
+            if group_id == move.target_group_id:
+                continue
+            for user_id, delta in GroupMembershipModel.workload_deltas(
+                new_assignee=ticket.assigned_to, new_status=ticket.status
+            ).items():
+                if group_id is not None:
+                    deltas[(group_id, user_id)] -= delta
+                deltas[(move.target_group_id, user_id)] += delta
+        if deltas:
+            GroupMembershipHelper(request_id=self.request_id).apply_open_ticket_deltas(
+                move.family_id, deltas
+            )
+
+    def _move_backlog(self, move: TicketMoveModel, tickets: List[TicketModel]) -> None:
+        """
+        Move moved OPEN tickets from the source queue's backlog to the
+        target's on today's rollups; the family's backlog is unchanged. Past
+        days stay with the queue the tickets were in.
+        """
+        moved = sum(1 for t in tickets if t.status == TicketStatus.OPEN.value)
+        if not moved:
+            return
+        day = TicketRollupModel.day_of(TicketRollupModel.now_epoch())
+        TicketRollupHelper(request_id=self.request_id).apply_events(
+            move.family_id,
+            {
+                (move.source_queue_id, day): Counter(backlog_delta=-moved),
+                (move.target_queue_id, day): Counter(backlog_delta=moved),
+            },
+        )
+
+    @staticmethod
+    def _add_ticket_move(
+        transaction: TransactWrite, ticket: TicketModel, new_ticket: TicketModel
+    ) -> None:
+        # Only an unchanged ticket is moved; anything else cancels the chunk
+        condition = TicketModel.status == ticket.status
+        for attribute in (
+            TicketModel.last_activity,
+            TicketModel.comment_count,
+            TicketModel.assigned_to,
+            TicketModel.sla_breached_at,
+            TicketModel.subscribers,
+            TicketModel.unsubscribed,
+        ):
+            value = getattr(ticket, attribute.attr_name)
+            # Empty sets are not stored
+            condition &= (
+                attribute.does_not_exist()
+                if value is None or value == set()
+                else attribute == value
+            )
+        transaction.delete(ticket, condition=condition)
+        transaction.save(new_ticket, condition=TicketModel.sk.does_not_exist())
+        if ticket.ticket_number:
+            transaction.update(
+                TicketNumberModel(
+                    TicketNumberModel.create_pk(ticket.family_id),
+                    TicketNumberModel.create_sk(ticket.ticket_number),
+                ),
+                actions=[TicketNumberModel.queue_id.set(new_ticket.queue_id)],
+                condition=TicketNumberModel.ticket_id == ticket.ticket_id,
+            )
+
+    @staticmethod
+    def _rehome(move: TicketMoveModel, item):
+        """A copy of a ticket or comment keyed under the target queue."""
+        values = {
+            name: value
+            for name, value in item.attribute_values.items()
+            if name not in ("pk", "sk")
+        }
+        values["queue_id"] = move.target_queue_id
+        if isinstance(item, TicketCommentModel):
+            return TicketCommentModel(
+                item.pk,
+                TicketCommentModel.create_sk(
+                    move.target_queue_id, item.ticket_id, item.comment_id
+                ),
+                **values,
+            )
+        values["group_id"] = move.target_group_id
+        ticket = TicketModel(
+            item.pk,
+            TicketModel.create_sk(move.target_queue_id, item.ticket_id),
+            **values,
+        )
+        TicketModel.set_index_keys(ticket)
+        return ticket
+
+    @staticmethod
+    def _raise_if_target_missing(
+        error: TransactWriteError, move: TicketMoveModel, first_update: int
+    ) -> None:
+        """
+        Raise if the target queue's counter update failed its condition.
+        first_update is its index: the number of deletes and puts, which
+        DynamoDB receives before any update.
+        """
+        if condition_failed(error, first_update):
+            raise QueueNotFound(
+                f"Queue {move.target_queue_id} does not exist in family {move.family_id}"
+            )
+
+    def _after_move(
+        self, move: TicketMoveModel, ticket: TicketModel, new_ticket: TicketModel
+    ) -> None:
+        # Search postings and duplicate signatures carry the queue ID; they
+        # are keyed by ticket, so re-indexing overwrites them in place
+        try:
+            TicketSearchHelper(request_id=self.request_id).index_ticket(new_ticket)
+            TicketDuplicateHelper(request_id=self.request_id).index_ticket(new_ticket)
+        except Exception as e:
+            self.logger.error(
+                f"Failed to re-index moved ticket {ticket.ticket_id}: {str(e)}"
+            )
+        self.audit_helper.create_family_audit_record(
+            family_id=move.family_id,
+            entity_type=AuditEntityTypes.TICKET,
+            entity_id=ticket.ticket_id,
+            action=AuditActions.UPDATE,
+            actor_user_id=move.actor_user_id,
+            before=TicketModel.clean_returned_ticket(ticket),
+            after=TicketModel.clean_returned_ticket(new_ticket),
+        )
+
+    def _save_checkpoint(
+        self,
+        move: TicketMoveModel,
+        cursor: str,
+        tickets: int,
+        comments: int,
+        failed: int,
+        elapsed: float,
+    ) -> bool:
+        """Advance the checkpoint; False if a concurrent run moved it first."""
+        previous = move.cursor
+        try:
+            move.update(
+                actions=[
+                    TicketMoveModel.cursor.set(cursor),
+                    TicketMoveModel.tickets_moved.add(tickets),
+                    TicketMoveModel.comments_moved.add(comments),
+                    TicketMoveModel.failed.add(failed),
+                    TicketMoveModel.elapsed_seconds.add(round(elapsed, 3)),
+                    TicketMoveModel.updated_at.set(TicketMoveModel.now_epoch()),
+                ],
+                condition=(
+                    TicketMoveModel.cursor.does_not_exist()
+                    if previous is None
+                    else TicketMoveModel.cursor == previous
+                ),
+            )
+        except UpdateError as e:
+            if e.cause_response_code != "ConditionalCheckFailedException":
+                raise
+            self.logger.warning(f"Move {move.move_id} is being run concurrently")
+            return False
+        return True
+
+    @staticmethod
+    def _publish_metrics(run: dict) -> None:
+        metrics = Metrics(namespace=API_METRICS_NAMESPACE, service=TICKET_MOVE_SERVICE)
+        metrics.add_metric(
+            name=TICKETS_MOVED, unit=MetricUnit.Count, value=run["tickets_moved"]
+        )
+        metrics.add_metric(
+            name=TICKET_COMMENTS_MOVED,
+            unit=MetricUnit.Count,
+            value=run["comments_moved"],
+        )
+        metrics.add_metric(
+            name=TICKET_MOVE_FAILURES,
+            unit=MetricUnit.Count,
+            value=len(run["failed_ticket_ids"]),
+        )
+        if run["tickets_per_second"] is not None:
+            metrics.add_metric(
+                name=TICKET_MOVE_THROUGHPUT,
+                unit=MetricUnit.CountPerSecond,
+                value=run["tickets_per_second"],
+            )
+        metrics.flush_metrics()
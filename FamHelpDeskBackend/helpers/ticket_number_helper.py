@@ -0,0 +1,97 @@
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+from aws_lambda_powertools import Logger
+
+from constants.ticket import TICKET_NUMBER_BLOCK_SIZE
+from exceptions.ticket_exceptions import InvalidTicketData
+from helpers.family_helper import FamilyHelper
+from models.ticket_number import TicketSequenceModel, TicketNumberModel
+
+# Numbers this container has reserved but not handed out yet:
+# family_id -> [next number, last number, ticket key prefix]
+_reserved_blocks: Dict[str, List] = {}
+_reserved_blocks_lock = threading.Lock()
+
+TICKET_KEY_PATTERN = re.compile(r"^(?:[A-Za-z0-9]+-)?(\d+)$")
+
+
+class TicketNumberHelper:
+    """
+    Human-friendly ticket numbers such as "SMITH-142", unique per family.
+
+    Instead of every ticket create contending on one counter item, a warm
+    container reserves a block of numbers with a single atomic update and
+    hands them out from memory until the block runs out. Numbers therefore
+    rise within a container but interleave across containers, and the rest
+    of a block is skipped when its container is recycled. Uniqueness comes
+    from the blocks never overlapping and from TicketNumberModel being
+    written only if the number is unused.
+    """
+
+    def __init__(
+        self, request_id: str = None, block_size: int = TICKET_NUMBER_BLOCK_SIZE
+    ):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+        self.request_id = request_id
+        self.block_size = block_size
+
+    def allocate(self, family_id: str) -> Tuple[int, str]:
+        """Hand out the family's next ticket number with its ticket key prefix."""
+        with _reserved_blocks_lock:
+            block = _reserved_blocks.get(family_id)
+            if block is None or block[0] > block[1]:
+                block = self._reserve_block(family_id)
+                _reserved_blocks[family_id] = block
+            number = block[0]
+            block[0] += 1
+            return number, block[2]
+
+    def reserve_block(self, family_id: str, count: int) -> Tuple[int, str]:
+        """
+        Reserve `count` consecutive numbers for the caller to hand out itself,
+        e.g. one per row of a bulk import.
+
+        Returns:
+            Tuple of (first reserved number, ticket key prefix)
+        """
+        first, _, prefix = self._reserve_block(family_id, count)
+        return first, prefix
+
+    @staticmethod
+    def parse_ticket_number(value: str) -> int:
+        """
+        Read a ticket number from "142" or a ticket key such as "SMITH-142".
+        The prefix is not checked, so keys stay valid if the family is renamed.
+        """
+        match = TICKET_KEY_PATTERN.match((value or "").strip())
+        if not match or int(match.group(1)) < 1:
+            raise InvalidTicketData(f"Invalid ticket number: {value}")
+        return int(match.group(1))
+
+    def _reserve_block(self, family_id: str, count: Optional[int] = None) -> List:
+        count = count or self.block_size
+        sequence = TicketSequenceModel(
+            TicketSequenceModel.create_pk(family_id),
+            TicketSequenceModel.create_sk(),
+        )
+        # ADD is atomic, so concurrent containers always get disjoint blocks
+        sequence.update(
+            actions=[
+                TicketSequenceModel.family_id.set(family_id),
+                TicketSequenceModel.last_number.add(count),
+            ]
+        )
+        last = sequence.last_number
+        first = last - count + 1
+
+        family = FamilyHelper(request_id=self.request_id).get_family(family_id)
+        prefix = TicketNumberModel.create_ticket_key_prefix(
+            family.family_name if family else None
+        )
+        self.logger.info(
+            f"Reserved ticket numbers {first}-{last} for family {family_id}"
+        )
+        return [first, last, prefix]
@@ -0,0 +1,313 @@
+import datetime
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from aws_lambda_powertools import Logger
+
+from constants.analytics import ANALYTICS_DEFAULT_DAYS, ANALYTICS_MAX_DAYS
+from exceptions.analytics_exceptions import InvalidAnalyticsRange
+from exceptions.queue_exceptions import QueueNotFound
+from helpers.family_export_reader import FamilyExportReader
+from helpers.queue_helper import QueueHelper
+from models.ticket import TicketSeverity
+from models.ticket_rollup import RollupEvent, TicketRollupModel
+
+# (queue ID, UTC day) of a rollup update
+RollupKey = Tuple[str, str]
+
+
+class TicketRollupHelper:
+    """
+    Daily ticket activity rollups and the analytics read from them.
+
+    Each ticket event updates two rollup items: its family's day and its
+    queue's day. Ticket creates and status changes add the updates to their
+    own transactions (see TicketHelper), so the rollups are exact; bulk
+    imports and moves apply them afterwards, best effort, and
+    rebuild_ticket_rollups.py repairs any drift.
+
+    Analytics never read tickets: totals, MTTR and weekly counts come from
+    the rollups of the range, and the backlog of each day is worked back
+    from the queues' current OPEN counters through the later days' rollups.
+    """
+
+    def __init__(self, request_id: str = None):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+        self.request_id = request_id
+
+    @staticmethod
+    def rollup_updates(
+        family_id: str, queue_id: str, day: str, deltas: Dict[str, int]
+    ) -> List[Tuple[TicketRollupModel, list]]:
+        """
+        (key-only item, actions) of the family's and the queue's rollup
+        updates for one event, family first, for adding to a transaction.
+        """
+        if not deltas:
+            return []
+        return [
+            (
+                TicketRollupModel(
+                    TicketRollupModel.create_pk(family_id),
+                    TicketRollupModel.create_sk(day, scope),
+                ),
+                TicketRollupModel.update_actions(family_id, day, deltas, scope),
+            )
+            for scope in (None, queue_id)
+        ]
+
+    def apply_events(self, family_id: str, events: Dict[RollupKey, Counter]) -> None:
+        """
+        Best-effort rollup updates for bulk writes that are not transactional,
+        keyed by (queue ID, day); the family's days get the sums over queues.
+        """
+        family_days: Dict[str, Counter] = defaultdict(Counter)
+        for (_, day), deltas in events.items():
+            family_days[day].update(deltas)
+        updates = [
+            (queue_id, day, deltas) for (queue_id, day), deltas in events.items()
+        ] + [(None, day, deltas) for day, deltas in family_days.items()]
+
+        for queue_id, day, deltas in updates:
+            deltas = {name: delta for name, delta in deltas.items() if delta}
+            if not deltas:
+                continue
+            try:
+                TicketRollupModel(
+                    TicketRollupModel.create_pk(family_id),
+                    TicketRollupModel.create_sk(day, queue_id),
+                ).update(
+                    actions=TicketRollupModel.update_actions(
+                        family_id, day, deltas, queue_id
+                    )
+                )
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to update {queue_id or 'family'} rollup of {day}: {str(e)}"
+                )
+
+    @staticmethod
+    def collect_events(
+        events: Dict[RollupKey, Counter],
+        queue_id: str,
+        ticket_events: Iterable[RollupEvent],
+    ) -> None:
+        """Sum a ticket's events into per (queue ID, day) deltas."""
+        for day, deltas in ticket_events:
+            events[(queue_id, day)].update(deltas)
+
+    def get_analytics(
+        self,
+        family_id: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        queue_id: Optional[str] = None,
+    ) -> dict:
+        """
+        Ticket analytics of a family, or one of its queues, over a range of
+        UTC days (inclusive, YYYY-MM-DD). The range defaults to the last
+        ANALYTICS_DEFAULT_DAYS days.
+
+        Raises:
+            InvalidAnalyticsRange: Malformed dates, or a range that is
+                reversed or longer than ANALYTICS_MAX_DAYS
+            QueueNotFound: The queue does not exist
+        """
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        end_date = self._parse_day(end) if end else today
+        start_date = (
+            self._parse_day(start)
+            if start
+            else end_date - datetime.timedelta(days=ANALYTICS_DEFAULT_DAYS - 1)
+        )
+        if start_date > end_date:
+            raise InvalidAnalyticsRange("start must not be after end")
+        if (end_date - start_date).days + 1 > ANALYTICS_MAX_DAYS:
+            raise InvalidAnalyticsRange(
+                f"The range may span at most {ANALYTICS_MAX_DAYS} days"
+            )
+
+        queue_helper = QueueHelper(request_id=self.request_id)
+        if queue_id:
+            queue = queue_helper.get_queue_by_id(family_id, queue_id)
+            if queue is None:
+                raise QueueNotFound(
+                    f"Queue {queue_id} does not exist in family {family_id}"
+                )
+            open_now = queue.open_ticket_count or 0
+        else:
+            open_now = sum(
+                q.open_ticket_count or 0
+                for q in queue_helper.get_all_queues_by_family(family_id)
+            )
+
+        # Days after the range are read too, to work the backlog back to it
+        last_read = max(end_date, today)
+        rollups = {
+            rollup.day: TicketRollupModel.get_counts(rollup)
+            for rollup in TicketRollupModel.query(
+                TicketRollupModel.create_pk(family_id),
+                TicketRollupModel.sk.between(
+                    TicketRollupModel.create_sk(start_date.isoformat(), queue_id),
+                    TicketRollupModel.create_sk(last_read.isoformat(), queue_id),
+                ),
+            )
+        }
+
+        backlog = open_now
+        backlog_by_day = {}
+        day = last_read
+        while day >= start_date:
+            backlog_by_day[day] = backlog
+            backlog -= rollups.get(day.isoformat(), {}).get("backlog_delta", 0)
+            day -= datetime.timedelta(days=1)
+
+        totals = Counter()
+        daily, weekly = [], {}
+        day = start_date
+        while day <= end_date:
+            counts = rollups.get(day.isoformat()) or TicketRollupModel.get_counts(None)
+            totals.update(counts)
+            daily.append(
+                {
+                    "date": day.isoformat(),
+                    "opened": counts["opened_count"],
+                    "resolved": counts["resolved_count"],
+                    "reopened": counts["reopened_count"],
+                    "closed": counts["closed_count"],
+                    "backlog": backlog_by_day[day],
+                }
+            )
+            week_start = day - datetime.timedelta(days=day.weekday())
+            week = weekly.setdefault(
+                week_start,
+                {
+                    "week_start": week_start.isoformat(),
+                    "opened": 0,
+                    "resolved": 0,
+                    "reopened": 0,
+                    "closed": 0,
+                },
+            )
+            for name in ("opened", "resolved", "reopened", "closed"):
+                week[name] += counts[f"{name}_count"]
+            day += datetime.timedelta(days=1)
+
+        mttr_by_severity = {}
+        for severity in TicketSeverity:
+            resolved = totals[
+                TicketRollupModel.resolved_severity_count_attribute(severity.value)
+            ]
+            seconds = totals[
+                TicketRollupModel.resolve_seconds_attribute(severity.value)
+            ]
+            mttr_by_severity[severity.value] = (
+                round(seconds / resolved) if resolved else None
+            )
+        all_resolved = sum(
+            totals[TicketRollupModel.resolved_severity_count_attribute(s.value)]
+            for s in TicketSeverity
+        )
+        all_seconds = sum(
+            totals[TicketRollupModel.resolve_seconds_attribute(s.value)]
+            for s in TicketSeverity
+        )
+
+        self.logger.info(
+            f"Computed analytics of {queue_id or 'family'} {family_id} from "
+            f"{len(rollups)} rollups, {start_date} to {end_date}"
+        )
+        analytics = {
+            "family_id": family_id,
+            "start": start_date.isoformat(),
+            "end": end_date.isoformat(),
+            "totals": {
+                "opened": totals["opened_count"],
+                "resolved": totals["resolved_count"],
+                "reopened": totals["reopened_count"],
+                "closed": totals["closed_count"],
+            },
+            "mttr_seconds": round(all_seconds / all_resolved) if all_resolved else None,
+            "mttr_seconds_by_severity": mttr_by_severity,
+            "weekly": list(weekly.values()),
+            "daily": daily,
+        }
+        if queue_id:
+            analytics["queue_id"] = queue_id
+        return analytics
+
+    def rebuild_rollups(self, family_id: str, dry_run: bool = False) -> dict:
+        """
+        Recompute a family's rollups from its tickets and overwrite them.
+
+        The rebuilt history is what the tickets' dates tell (see
+        TicketRollupModel.ticket_history_events), so earlier reopens are
+        lost. Run it for families with tickets from before rollups existed,
+        or after a failed import or move.
+
+        Returns:
+            Dict with the tickets read and rollup items written
+        """
+        events: Dict[RollupKey, Counter] = defaultdict(Counter)
+        tickets = 0
+        for ticket in FamilyExportReader(
+            family_id, request_id=self.request_id
+        ).iter_tickets():
+            tickets += 1
+            self.collect_events(
+                events, ticket.queue_id, TicketRollupModel.ticket_history_events(ticket)
+            )
+
+        family_days: Dict[str, Counter] = defaultdict(Counter)
+        for (_, day), deltas in events.items():
+            family_days[day].update(deltas)
+        items = [
+            self._rollup_item(family_id, day, deltas, queue_id)
+            for (queue_id, day), deltas in events.items()
+        ] + [
+            self._rollup_item(family_id, day, deltas)
+            for day, deltas in family_days.items()
+        ]
+
+        rebuilt = {item.sk for item in items}
+        stale = [
+            rollup
+            for rollup in TicketRollupModel.query(
+                TicketRollupModel.create_pk(family_id),
+                TicketRollupModel.sk.startswith("ROLLUP#"),
+            )
+            if rollup.sk not in rebuilt
+        ]
+        if not dry_run:
+            with TicketRollupModel.batch_write() as batch:
+                for item in items:
+                    batch.save(item)
+                for rollup in stale:
+                    batch.delete(rollup)
+
+        self.logger.info(
+            f"Rebuilt {len(items)} rollups of family {family_id} from {tickets} "
+            f"tickets, {len(stale)} stale removed"
+        )
+        return {"tickets": tickets, "rollups": len(items), "removed": len(stale)}
+
+    @staticmethod
+    def _rollup_item(
+        family_id: str, day: str, deltas: Counter, queue_id: Optional[str] = None
+    ) -> TicketRollupModel:
+        return TicketRollupModel(
+            TicketRollupModel.create_pk(family_id),
+            TicketRollupModel.create_sk(day, queue_id),
+            family_id=family_id,
+            queue_id=queue_id,
+            day=day,
+            **{name: value for name, value in deltas.items() if value},
+        )
+
+    @staticmethod
+    def _parse_day(value: str) -> datetime.date:
+        try:
+            return datetime.date.fromisoformat(value)
+        except ValueError:
+            raise InvalidAnalyticsRange(f"Invalid date {value}; expected YYYY-MM-DD")
@@ -0,0 +1,251 @@
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from aws_lambda_powertools import Logger
+
+from constants.search import (
+    SEARCH_MIN_TERM_LENGTH,
+    SEARCH_MAX_TERM_LENGTH,
+    SEARCH_MAX_TERMS_PER_TICKET,
+    SEARCH_MAX_QUERY_TERMS,
+    SEARCH_MAX_POSTINGS_PER_TERM,
+    SEARCH_TITLE_WEIGHT,
+    SEARCH_RECENCY_HALF_LIFE_SECONDS,
+    SEARCH_STOP_WORDS,
+)
+from exceptions.ticket_exceptions import InvalidSearchQuery
+from models.ticket import TicketModel
+from models.ticket_search import TicketSearchPostingModel
+
+TERM_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class TicketSearchHelper:
+    """
+    Full-text ticket search over an inverted index kept in the table.
+
+    Indexing a ticket writes one posting per distinct term of its title and
+    description, at most SEARCH_MAX_TERMS_PER_TICKET of them. A query reads
+    the newest postings of each of its terms, intersects them and ranks the
+    matches by term frequency, with title matches weighing more, decayed by
+    ticket age. Only Query, BatchGetItem and BatchWriteItem are used, so it
+    runs unchanged against local DynamoDB stand-ins.
+    """
+
+    def __init__(self, request_id: str = None):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+        self.request_id = request_id
+
+    @staticmethod
+    def tokenize(text: Optional[str]) -> Counter:
+        """Count the indexable terms of a text: lowercase words, no stop words."""
+        terms = Counter()
+        for term in TERM_PATTERN.findall((text or "").lower()):
+            if (
+                SEARCH_MIN_TERM_LENGTH <= len(term) <= SEARCH_MAX_TERM_LENGTH
+                and term not in SEARCH_STOP_WORDS
+            ):
+                terms[term] += 1
+        return terms
+
+    @staticmethod
+    def get_ticket_terms(
+        title: Optional[str], description: Optional[str]
+    ) -> Dict[str, Tuple[int, bool]]:
+        """
+        The terms a ticket is indexed under, as term -> (frequency, in title).
+        Title terms are kept first, then the most frequent description terms.
+        """
+        title_terms = TicketSearchHelper.tokenize(title)
+        all_terms = title_terms + TicketSearchHelper.tokenize(description)
+        ranked = sorted(
+            all_terms, key=lambda t: (t not in title_terms, -all_terms[t], t)
+        )
+        return {
+            term: (all_terms[term], term in title_terms)
+            for term in ranked[:SEARCH_MAX_TERMS_PER_TICKET]
+        }
+
+    def index_ticket(
+        self,
+        ticket: TicketModel,
+        previous_title: Optional[str] = None,
+        previous_description: Optional[str] = None,
+    ) -> int:
+        """
+        Write a ticket's postings. Postings are keyed by term and ticket, so
+        re-indexing overwrites them in place; pass the previous title and
+        description to also delete the postings of terms the ticket lost.
+
+        Returns:
+            Number of postings written
+        """
+        terms = self.get_ticket_terms(ticket.title, ticket.description)
+        stale_terms = [
+            term
+            for term in self.get_ticket_terms(previous_title, previous_description)
+            if term not in terms
+        ]
+
+        with TicketSearchPostingModel.batch_write() as batch:
+            for term, (frequency, in_title) in terms.items():
+                batch.save(self._posting(ticket, term, frequency, in_title))
+            for term in stale_terms:
+                batch.delete(self._posting_key(ticket, term))
+
+        self.logger.info(
+            f"Indexed ticket {ticket.ticket_id} under {len(terms)} terms, "
+            f"removed {len(stale_terms)}"
+        )
+        return len(terms)
+
+    def index_tickets(self, tickets: List[TicketModel]) -> int:
+        """
+        Write the postings of new tickets in one batch write, for bulk
+        creates such as imports.
+
+        Returns:
+            Number of postings written
+        """
+        postings = 0
+        with TicketSearchPostingModel.batch_write() as batch:
+            for ticket in tickets:
+                terms = self.get_ticket_terms(ticket.title, ticket.description)
+                for term, (frequency, in_title) in terms.items():
+                    batch.save(self._posting(ticket, term, frequency, in_title))
+                postings += len(terms)
+
+        self.logger.info(f"Indexed {len(tickets)} tickets under {postings} postings")
+        return postings
+
+    def remove_ticket(self, ticket: TicketModel) -> None:
+        """Delete all of a ticket's postings."""
+        with TicketSearchPostingModel.batch_write() as batch:
+            for term in self.get_ticket_terms(ticket.title, ticket.description):
+                batch.delete(self._posting_key(ticket, term))
+
+    def search(
+        self, family_id: str, query: str, limit: int = 20, offset: int = 0
+    ) -> Tuple[List[TicketModel], Optional[int]]:
+        """
+        Find the family's tickets that contain every term of the query.
+
+        Only the newest SEARCH_MAX_POSTINGS_PER_TERM postings of each term are
+        read, so very old tickets under very common terms can fall out of
+        the results.
+
+        Args:
+            family_id: The family ID
+            query: Free text; its first SEARCH_MAX_QUERY_TERMS terms are used
+            limit: Maximum number of tickets to return (default: 20)
+            offset: Number of ranked matches to skip
+
+        Returns:
+            Tuple of (tickets best match first, offset of the next page or None)
+
+        Raises:
+            InvalidSearchQuery: The query has no indexable terms
+        """
+        terms = list(self.tokenize(query))[:SEARCH_MAX_QUERY_TERMS]
+        if not terms:
+            raise InvalidSearchQuery()
+
+        now = TicketModel.now_epoch()
+        # ticket_id -> (posting, score so far); narrowed by each term in turn
+        matches: Optional[Dict[str, Tuple[TicketSearchPostingModel, float]]] = None
+        for term in terms:
+            narrowed = {}
+            for posting in TicketSearchPostingModel.query(
+                TicketSearchPostingModel.create_pk(family_id, term),
+                scan_index_forward=False,
+                limit=SEARCH_MAX_POSTINGS_PER_TERM,
+            ):
+                if matches is not None and posting.ticket_id not in matches:
+                    continue
+                score = matches[posting.ticket_id][1] if matches else 0.0
+                narrowed[posting.ticket_id] = (
+                    posting,
+                    score + self._term_score(posting),
+                )
+            matches = narrowed
+            if not matches:
+                break
+
+        ranked = sorted(
+            matches.values(),
+            key=lambda match: (
+                -match[1] * self._recency_factor(match[0].creation_date, now),
+                -match[0].creation_date,
+                match[0].ticket_id,
+            ),
+        )
+        page = [posting for posting, _ in ranked[offset : offset + limit]]
+        next_offset = offset + limit if len(ranked) > offset + limit else None
+
+        tickets = self._get_tickets(family_id, page)
+        self.logger.info(
+            f"Search for {terms} in family {family_id} matched {len(ranked)} tickets."
+        )
+        return tickets, next_offset
+
+    def _get_tickets(
+        self, family_id: str, postings: List[TicketSearchPostingModel]
+    ) -> List[TicketModel]:
+        if not postings:
+            return []
+        by_sk = {
+            ticket.sk: ticket
+            for ticket in TicketModel.batch_get(
+                [
+                    (
+                        TicketModel.create_pk(family_id),
+                        TicketModel.create_sk(p.queue_id, p.ticket_id),
+                    )
+                    for p in postings
+                ]
+            )
+        }
+        # Postings of deleted tickets simply drop out of the page
+        return [
+            by_sk[sk]
+            for sk in (TicketModel.create_sk(p.queue_id, p.ticket_id) for p in postings)
+            if sk in by_sk
+        ]
+
+    @staticmethod
+    def _term_score(posting: TicketSearchPostingModel) -> float:
+        score = 1.0 + math.log(posting.term_frequency)
+        return score * SEARCH_TITLE_WEIGHT if posting.in_title else score
+
+    @staticmethod
+    def _recency_factor(creation_date: int, now: int) -> float:
+        age = max(0, now - creation_date)
+        return 0.5 ** (age / SEARCH_RECENCY_HALF_LIFE_SECONDS)
+
+    @staticmethod
+    def _posting(
+        ticket: TicketModel, term: str, frequency: int, in_title: bool
+    ) -> TicketSearchPostingModel:
+        return TicketSearchPostingModel(
+            pk=TicketSearchPostingModel.create_pk(ticket.family_id, term),
+            sk=TicketSearchPostingModel.create_sk(
+                ticket.creation_date, ticket.ticket_id
+            ),
+            family_id=ticket.family_id,
+            term=term,
+            queue_id=ticket.queue_id,
+            ticket_id=ticket.ticket_id,
+            creation_date=ticket.creation_date,
+            term_frequency=frequency,
+            in_title=in_title,
+        )
+
+    @staticmethod
+    def _posting_key(ticket: TicketModel, term: str) -> TicketSearchPostingModel:
+        return TicketSearchPostingModel(
+            TicketSearchPostingModel.create_pk(ticket.family_id, term),
+            TicketSearchPostingModel.create_sk(ticket.creation_date, ticket.ticket_id),
+        )
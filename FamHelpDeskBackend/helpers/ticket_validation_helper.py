@@ -0,0 +1,116 @@
+from typing import Optional
+from aws_lambda_powertools import Logger
+
+from constants.ticket import (
+    TICKET_TITLE_MAX_LENGTH,
+    TICKET_DESCRIPTION_MAX_LENGTH,
+    COMMENT_BODY_MAX_LENGTH,
+)
+from exceptions.comment_exceptions import InvalidCommentData, CommentBodyTooLong
+from exceptions.queue_exceptions import QueueNotFound
+from exceptions.ticket_exceptions import (
+    InvalidTicketData,
+    TicketTitleTooLong,
+    TicketDescriptionTooLong,
+    TicketNotFound,
+)
+from helpers.family_membership_helper import FamilyMembershipHelper
+from helpers.queue_helper import QueueHelper
+from helpers.ticket_helper import TicketHelper
+from models.base import MembershipStatus
+from models.queue import QueueModel
+from models.ticket import TicketModel
+
+
+class TicketValidationHelper:
+    """Helper class for validating ticket operations and data."""
+
+    def __init__(self, request_id: str = None):
+        self.logger = Logger()
+        if request_id:
+            self.logger.append_keys(request_id=request_id)
+        self.request_id = request_id
+        self.membership_helper = FamilyMembershipHelper(request_id=request_id)
+        self.queue_helper = QueueHelper(request_id=request_id)
+        self.ticket_helper = TicketHelper(request_id=request_id)
+
+    def validate_ticket_title(
+        self, title: str, max_length: int = TICKET_TITLE_MAX_LENGTH
+    ) -> None:
+        """Validate ticket title presence and length."""
+        if not title or not title.strip():
+            raise InvalidTicketData("Ticket title is required and cannot be empty")
+
+        if len(title) > max_length:
+            raise TicketTitleTooLong(max_length)
+
+    def validate_ticket_description(
+        self,
+        description: Optional[str],
+        max_length: int = TICKET_DESCRIPTION_MAX_LENGTH,
+    ) -> None:
+        """Validate ticket description length."""
+        if description is not None and len(description) > max_length:
+            raise TicketDescriptionTooLong(max_length)
+
+    def validate_comment_body(
+        self, comment_body: str, max_length: int = COMMENT_BODY_MAX_LENGTH
+    ) -> None:
+        """Validate comment body presence and length."""
+        if not comment_body or not comment_body.strip():
+            raise InvalidCommentData("Comment body is required and cannot be empty")
+
+        if len(comment_body) > max_length:
+            raise CommentBodyTooLong(max_length)
+
+    def validate_queue(self, family_id: str, queue_id: str) -> QueueModel:
+        """Validate that the queue exists in the family and return it."""
+        if not queue_id or not queue_id.strip():
+            raise InvalidTicketData("Queue ID is required")
+
+        queue = self.queue_helper.get_queue_by_id(family_id, queue_id)
+        if not queue:
+            raise QueueNotFound(
+                f"Queue {queue_id} does not exist in family {family_id}"
+            )
+        return queue
+
+    def validate_assignee(self, family_id: str, assigned_to: Optional[str]) -> None:
+        """Validate that an assignee is an active member of the family."""
+        if assigned_to is None:
+            return
+
+        membership = self.membership_helper.get_membership(family_id, assigned_to)
+        if not membership or membership["status"] != MembershipStatus.MEMBER.value:
+            raise InvalidTicketData(
+                f"User {assigned_to} is not a member of family {family_id}"
+            )
+
+    def validate_ticket_exists(
+        self, family_id: str, queue_id: str, ticket_id: str
+    ) -> TicketModel:
+        """Validate that the ticket exists in the queue and return it."""
+        ticket = self.ticket_helper.get_ticket(family_id, queue_id, ticket_id)
+        if not ticket:
+            raise TicketNotFound(
+                f"Ticket {ticket_id} does not exist in queue {queue_id} of family {family_id}"
+            )
+        return ticket
+
+    def validate_create_ticket_data(
+        self,
+        family_id: str,
+        queue_id: str,
+        title: str,
+        description: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        auto_assign: bool = False,
+    ) -> QueueModel:
+        """Validate all data required for creating a ticket and return its queue."""
+        if auto_assign and assigned_to is not None:
+            raise InvalidTicketData("Give either an assignee or auto_assign, not both")
+        queue = self.validate_queue(family_id, queue_id)
+        self.validate_ticket_title(title)
+        self.validate_ticket_description(description)
+        self.validate_assignee(family_id, assigned_to)
+        return queue
@@ -0,0 +1,27 @@
+from typing import Optional
+from pynamodb.connection import Connection
+from pynamodb.exceptions import TransactWriteError
+from pynamodb.transactions import TransactWrite
+
+from models.base import FamHelpDeskBaseModel
+
+
+def new_transaction() -> TransactWrite:
+    """Start a write transaction against the table's region."""
+    return TransactWrite(connection=Connection(region=FamHelpDeskBaseModel.Meta.region))
+
+
+def condition_failed(error: TransactWriteError, index: Optional[int] = None) -> bool:
+    """
+    Whether a transaction was cancelled by a failed condition check: on the
+    operation at `index`, or on any of them. PynamoDB sends operations grouped
+    by kind, condition checks, deletes, puts, then updates, each group in the
+    order it was added; `index` counts in that order.
+    """
+    reasons = error.cancellation_reasons or []
+    if index is not None:
+        reasons = reasons[index : index + 1]
+    return any(
+        reason is not None and reason.code == "ConditionalCheckFailed"
+        for reason in reasons
+    )
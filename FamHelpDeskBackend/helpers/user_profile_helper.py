@@ -6,7 +6,7 @@ from models.audit import AuditActions, AuditEntityTypes
 
 from pynamodb.exceptions import DoesNotExist
 from aws_lambda_powertools import Logger
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 
 class UserProfileHelper:
@@ -66,6 +66,19 @@ class UserProfileHelper:
             self.logger.info(f"No user profile found for {user_id}.")
             return None
 
+    def get_profiles(self, user_ids: Iterable[str]) -> Dict[str, UserProfile]:
+        """Fetch several profiles with BatchGetItem, keyed by user_id."""
+        keys = [
+            (UserProfile.create_pk(user_id), UserProfile.create_sk())
+            for user_id in set(user_ids)
+        ]
+        if not keys:
+            return {}
+
+        profiles = {profile.user_id: profile for profile in UserProfile.batch_get(keys)}
+        self.logger.info(f"Fetched {len(profiles)} of {len(keys)} user profiles.")
+        return profiles
+
     def update_profile(self, user_id: str, **kwargs) -> UserProfile:
         profile = self.get_profile(user_id)
         if not profile:
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Import tickets into a family from a CSV or NDJSON file, e.g. when migrating
+from a spreadsheet or another tool.
+
+The file is read and written in chunks as it streams, so any size imports in
+constant memory. Every row that is not imported is printed as a JSON line
+with its line number and the reason, followed by a summary line. See
+TicketImportHelper for the columns.
+
+Usage:
+    python3 import_tickets.py --family-id <id> --actor-user-id <id> tickets.csv
+    python3 import_tickets.py --family-id <id> --actor-user-id <id> \\
+        --queue-id <id> --format ndjson tickets.ndjson
+    cat tickets.csv | python3 import_tickets.py --family-id <id> \\
+        --actor-user-id <id> --queue-id <id> --dry-run -
+"""
+
+import argparse
+import json
+import sys
+from aws_lambda_powertools import Logger
+
+from helpers.ticket_import_helper import TicketImportHelper, TicketImportFormat
+
+logger = Logger(service="FamHelpDesk-Ticket-Import")
+
+
+def import_tickets(
+    family_id: str,
+    stream,
+    import_format: TicketImportFormat,
+    actor_user_id: str,
+    queue_id: str = None,
+    dry_run: bool = False,
+    out=sys.stdout,
+) -> dict:
+    """
+    Import every row of a file, printing per-row errors as they happen.
+
+    Returns:
+        The import summary: rows read, imported and failed
+    """
+    helper = TicketImportHelper()
+    rows = helper.read_rows(stream, import_format)
+    summary = {}
+    for event in helper.import_tickets(
+        family_id,
+        rows,
+        actor_user_id=actor_user_id,
+        default_queue_id=queue_id,
+        dry_run=dry_run,
+    ):
+        out.write(json.dumps(event) + "\n")
+        out.flush()
+        summary = event.get("summary", summary)
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import tickets into a family")
+    parser.add_argument("file", help='CSV or NDJSON file, or "-" for stdin')
+    parser.add_argument("--family-id", required=True, help="Family to import into")
+    parser.add_argument(
+        "--actor-user-id",
+        required=True,
+        help="Importing user, recorded as creator of rows without created_by",
+    )
+    parser.add_argument("--queue-id", help="Queue for rows that do not name one")
+    parser.add_argument(
+        "--format",
+        choices=[f.value for f in TicketImportFormat],
+        help="File format (default: from the file extension, else csv)",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Validate only, write nothing"
+    )
+    args = parser.parse_args()
+
+    import_format = TicketImportFormat(
+        args.format
+        or (
+            TicketImportFormat.NDJSON.value
+            if args.file.endswith((".ndjson", ".jsonl"))
+            else TicketImportFormat.CSV.value
+        )
+    )
+    if args.file == "-":
+        stream = sys.stdin
+    else:
+        stream = open(args.file, encoding="utf-8-sig", newline="")
+    with stream:
+        result = import_tickets(
+            args.family_id,
+            stream,
+            import_format,
+            actor_user_id=args.actor_user_id,
+            queue_id=args.queue_id,
+            dry_run=args.dry_run,
+        )
+    logger.info(f"Ticket import finished: {result}")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Re-encode existing UPDATE audit records from full before/after snapshots to
+the compact delta encoding (changed fields plus a checksum of the after state).
+
+CREATE and DELETE records keep their full snapshot: they anchor the replay
+that AuditHelper.reconstruct_audit_records uses to rebuild full views. An
+entity whose history in the table does not start from a full snapshot (its
+CREATE was archived, or predates auditing) keeps its oldest UPDATE in full
+as its anchor. Records that are already delta-encoded are skipped, so the
+migration can be re-run safely.
+
+Usage:
+    python3 migrate_audit_encoding.py             # Re-encode all UPDATE audits
+    python3 migrate_audit_encoding.py --dry-run   # Only report the size savings
+"""
+
+import argparse
+from typing import Set, Tuple
+from aws_lambda_powertools import Logger
+
+from helpers.audit_encoding_helper import encode_update, estimate_item_size
+from models.audit import AuditModel, AuditActions
+
+logger = Logger(service="FamHelpDesk-Audit-Encoding-Migration")
+
+
+def migrate_audit_encoding(dry_run: bool = False) -> dict:
+    """
+    Delta-encode every full-snapshot UPDATE audit record that is not needed
+    as an anchor.
+
+    Args:
+        dry_run: Only compute the savings without writing
+
+    Returns:
+        Dict with the number of migrated records, anchors kept in full and
+        bytes before/after
+    """
+    stats = {"migrated": 0, "anchors_kept": 0, "bytes_before": 0, "bytes_after": 0}
+
+    for pk, entity_type, entity_id in find_entities_to_migrate():
+        prefix = AuditModel.create_entity_sk_prefix(entity_type, entity_id)
+        # The replay treats every full snapshot as the entity's state, so an
+        # UPDATE only needs to stay full when nothing before it is one
+        anchored = False
+        for record in AuditModel.query(
+            pk, AuditModel.sk.startswith(prefix), scan_index_forward=True
+        ):
+            if AuditModel.is_delta_encoded(record):
+                continue
+            migratable = (
+                record.action == AuditActions.UPDATE.value
+                and record.encoding is None
+                and record.before is not None
+                and record.after is not None
+            )
+            if migratable and anchored:
+                encode_record(record, stats, dry_run)
+                continue
+            if migratable:
+                stats["anchors_kept"] += 1
+            anchored = record.after is not None
+
+    logger.info(
+        f"{'Would migrate' if dry_run else 'Migrated'} {stats['migrated']} audit "
+        f"records, kept {stats['anchors_kept']} anchors: "
+        f"{stats['bytes_before']} -> {stats['bytes_after']} bytes"
+    )
+    return stats
+
+
+def find_entities_to_migrate() -> Set[Tuple[str, str, str]]:
+    """(pk, entity_type, entity_id) of every entity with full UPDATE records."""
+    return {
+        (record.pk, record.entity_type, record.entity_id)
+        for record in AuditModel.scan(
+            AuditModel.sk.startswith("AUDIT#")
+            & (AuditModel.action == AuditActions.UPDATE.value)
+            & AuditModel.encoding.does_not_exist()
+            & AuditModel.before.exists()
+            & AuditModel.after.exists(),
+            attributes_to_get=["pk", "sk", "entity_type", "entity_id"],
+        )
+    }
+
+
+def encode_record(record: AuditModel, stats: dict, dry_run: bool) -> None:
+    size_before = estimate_item_size(record.serialize())
+    payload = encode_update(record.before.as_dict(), record.after.as_dict())
+
+    if not dry_run:
+        record.update(
+            actions=[
+                AuditModel.encoding.set(payload["encoding"]),
+                AuditModel.changes.set(payload["changes"]),
+                AuditModel.checksum.set(payload["checksum"]),
+                AuditModel.before.remove(),
+                AuditModel.after.remove(),
+            ],
+            condition=AuditModel.encoding.does_not_exist(),
+        )
+    else:
+        record.encoding = payload["encoding"]
+        record.changes = payload["changes"]
+        record.checksum = payload["checksum"]
+        record.before = None
+        record.after = None
+
+    stats["migrated"] += 1
+    stats["bytes_before"] += size_before
+    stats["bytes_after"] += estimate_item_size(record.serialize())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Delta-encode existing UPDATE audit records"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report the records and savings without writing",
+    )
+    args = parser.parse_args()
+
+    result = migrate_audit_encoding(dry_run=args.dry_run)
+    print(
+        f"{'Would migrate' if args.dry_run else 'Migrated'} {result['migrated']} records, "
+        f"kept {result['anchors_kept']} anchors in full "
+        f"({result['bytes_before']} -> {result['bytes_after']} bytes)."
+    )
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Backfill the sparse FamilyQueueIndex for queues created before it existed.
+
+Every queue item gets queue_family_id set to its family_id, which adds it to
+the index that QueueHelper.get_all_queues_by_family queries. Items that
+already carry the attribute are skipped, so the migration can be re-run.
+
+Usage:
+    python3 migrate_queue_index.py             # Backfill all queues
+    python3 migrate_queue_index.py --dry-run   # Only report what would change
+"""
+
+import argparse
+from aws_lambda_powertools import Logger
+
+from models.queue import QueueModel
+
+logger = Logger(service="FamHelpDesk-Queue-Index-Migration")
+
+
+def migrate_queue_index(dry_run: bool = False) -> int:
+    """
+    Set queue_family_id on every queue item that is missing it.
+
+    Args:
+        dry_run: Only count the queues that would be updated
+
+    Returns:
+        Number of queue items updated (or that would be updated)
+    """
+    updated = 0
+    for queue in QueueModel.scan(
+        QueueModel.pk.startswith("FAMILY#")
+        & QueueModel.sk.startswith("GROUP#")
+        & QueueModel.sk.contains("#QUEUE#")
+        & QueueModel.queue_family_id.does_not_exist()
+    ):
+        if not dry_run:
+            queue.update(
+                actions=[QueueModel.queue_family_id.set(queue.family_id)],
+                condition=QueueModel.pk.exists(),
+            )
+        updated += 1
+        logger.info(
+            f"{'Would backfill' if dry_run else 'Backfilled'} queue {queue.queue_id} "
+            f"in family {queue.family_id}"
+        )
+
+    logger.info(
+        f"{'Would backfill' if dry_run else 'Backfilled'} {updated} queue items."
+    )
+    return updated
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill the FamilyQueueIndex")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report the queues that would be updated without writing",
+    )
+    args = parser.parse_args()
+
+    count = migrate_queue_index(dry_run=args.dry_run)
+    print(f"{'Would update' if args.dry_run else 'Updated'} {count} queue items.")
@@ -1,5 +1,7 @@
 from pynamodb.attributes import UnicodeAttribute, NumberAttribute, MapAttribute
+from pynamodb.indexes import GlobalSecondaryIndex, AllProjection
 from enum import Enum
+import time
 from models.base import FamHelpDeskBaseModel
 
 
@@ -19,6 +21,39 @@ class AuditEntityTypes(str, Enum):
     USER_PROFILE = "USER_PROFILE"
 
 
+class AuditEncoding(str, Enum):
+    # before/after hold complete entity states
+    FULL = "FULL"
+    # changes holds only changed fields; checksum covers the full after state
+    DELTA = "DELTA"
+
+
+class FamilyAuditIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "FamilyAuditIndex"
+        projection = AllProjection()
+        read_capacity_units = 5
+        write_capacity_units = 5
+
+    # Only audit items carry `time`, so the index holds family audits ordered
+    # by time across all entities
+    family_id = UnicodeAttribute(hash_key=True)
+    time = NumberAttribute(range_key=True)
+
+
+class ActorAuditIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "ActorAuditIndex"
+        projection = AllProjection()
+        read_capacity_units = 5
+        write_capacity_units = 5
+
+    # Every audit record across all families and user profiles, keyed by the
+    # user who performed the action and ordered by time
+    actor_user_id = UnicodeAttribute(hash_key=True)
+    time = NumberAttribute(range_key=True)
+
+
 class AuditModel(FamHelpDeskBaseModel):
 
     family_id = UnicodeAttribute(null=True)
@@ -28,8 +63,16 @@ class AuditModel(FamHelpDeskBaseModel):
     actor_user_id = UnicodeAttribute()
     before = MapAttribute(null=True)
     after = MapAttribute(null=True)
+    encoding = UnicodeAttribute(null=True)  # AuditEncoding, FULL when missing
+    changes = MapAttribute(null=True)
+    checksum = UnicodeAttribute(null=True)
     time = NumberAttribute()
 
+    # GSI for time-ordered family audit history
+    family_audit_index = FamilyAuditIndex()
+    # GSI for audit records by actor across families
+    actor_audit_index = ActorAuditIndex()
+
     @staticmethod
     def create_pk(family_id: str) -> str:
         return f"FAMILY#{family_id}"
@@ -40,4 +83,39 @@ class AuditModel(FamHelpDeskBaseModel):
 
     @staticmethod
     def create_sk(entity_type: str, entity_id: str, timestamp: int, action: str) -> str:
+        # timestamp is in epoch milliseconds. Records written before that
+        # carry epoch seconds; both have a fixed digit count, so an entity's
+        # keys still sort by time across the two.
         return f"AUDIT#{entity_type}#{entity_id}#TS#{timestamp}#ACTION#{action}"
+
+    @staticmethod
+    def now_epoch_ms() -> int:
+        return int(time.time() * 1000)
+
+    @staticmethod
+    def create_entity_sk_prefix(entity_type: str, entity_id: str) -> str:
+        return f"AUDIT#{entity_type}#{entity_id}#TS#"
+
+    @staticmethod
+    def clean_returned_audit(audit: "AuditModel") -> dict:
+        data = {
+            "entity_type": audit.entity_type,
+            "entity_id": audit.entity_id,
+            "action": audit.action,
+            "actor_user_id": audit.actor_user_id,
+            "time": audit.time,
+        }
+        if audit.family_id is not None:
+            data["family_id"] = audit.family_id
+        if audit.before is not None:
+            data["before"] = audit.before.as_dict()
+        if audit.after is not None:
+            data["after"] = audit.after.as_dict()
+        if audit.changes is not None:
+            data["changes"] = audit.changes.as_dict()
+            data["checksum"] = audit.checksum
+        return data
+
+    @staticmethod
+    def is_delta_encoded(audit: "AuditModel") -> bool:
+        return audit.encoding == AuditEncoding.DELTA.value
@@ -25,6 +25,14 @@ class FamHelpDeskBaseModel(Model):
     def generate_uuid() -> str:
         return str(uuid.uuid4())
 
+    @staticmethod
+    def generate_time_ordered_id() -> str:
+        """
+        ID that sorts by creation time: zero-padded epoch milliseconds plus a
+        random suffix so IDs created in the same millisecond stay unique.
+        """
+        return f"{int(time.time() * 1000):013d}-{uuid.uuid4().hex[:12]}"
+
     @staticmethod
     def now_epoch() -> int:
         return int(time.time())
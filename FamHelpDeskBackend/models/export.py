@@ -0,0 +1,58 @@
+from enum import Enum
+from models.base import FamHelpDeskBaseModel
+from pynamodb.attributes import UnicodeAttribute, NumberAttribute
+
+
+class ExportStatus(str, Enum):
+    PENDING = "PENDING"
+    READY = "READY"
+    FAILED = "FAILED"
+
+
+class ExportModel(FamHelpDeskBaseModel):
+    """
+    PK: FAMILY#{family_id}
+    SK: EXPORT#{export_id}
+
+    A job exporting a family's data as gzipped NDJSON to the export store,
+    for families too large to export in one API response.
+    """
+
+    family_id = UnicodeAttribute()
+    export_id = UnicodeAttribute()
+    status = UnicodeAttribute()
+    requested_by = UnicodeAttribute()
+    requested_at = NumberAttribute()
+    completed_at = NumberAttribute(null=True)
+    record_count = NumberAttribute(null=True)
+    size_bytes = NumberAttribute(null=True)
+    sha256 = UnicodeAttribute(null=True)
+    error = UnicodeAttribute(null=True)
+
+    @staticmethod
+    def create_pk(family_id: str) -> str:
+        return f"FAMILY#{family_id}"
+
+    @staticmethod
+    def create_sk(export_id: str) -> str:
+        return f"EXPORT#{export_id}"
+
+    @staticmethod
+    def create_file_key(family_id: str, export_id: str) -> str:
+        """Export store key of the job's gzipped NDJSON file."""
+        return f"{family_id}/{export_id}.ndjson.gz"
+
+    @staticmethod
+    def clean_returned_export(export: "ExportModel") -> dict:
+        data = {
+            "family_id": export.family_id,
+            "export_id": export.export_id,
+            "status": export.status,
+            "requested_by": export.requested_by,
+            "requested_at": export.requested_at,
+        }
+        for field in ("completed_at", "record_count", "size_bytes", "sha256", "error"):
+            value = getattr(export, field, None)
+            if value is not None:
+                data[field] = value
+        return data
@@ -1,6 +1,8 @@
+from typing import Dict, Optional
 from pynamodb.attributes import UnicodeAttribute, BooleanAttribute, NumberAttribute
 from pynamodb.indexes import GlobalSecondaryIndex, AllProjection
 from models.base import FamHelpDeskBaseModel, MembershipStatus
+from models.ticket import TicketStatus
 
 
 class UserMembershipIndex(GlobalSecondaryIndex):
@@ -21,6 +23,9 @@ class GroupMembershipModel(FamHelpDeskBaseModel):
     status = UnicodeAttribute()
     is_admin = BooleanAttribute()
     request_date = NumberAttribute()
+    # OPEN tickets assigned to the user in this group's queues, kept in step
+    # by every ticket write that changes them (see TicketHelper)
+    open_ticket_count = NumberAttribute(null=True)
 
     # GSI for querying by user_id
     user_index = UserMembershipIndex()
@@ -32,3 +37,39 @@ class GroupMembershipModel(FamHelpDeskBaseModel):
     @staticmethod
     def create_sk(group_id: str, user_id: str) -> str:
         return f"GROUP#{group_id}#MEMBER#{user_id}"
+
+    @staticmethod
+    def workload_deltas(
+        old_assignee: Optional[str] = None,
+        old_status: Optional[str] = None,
+        new_assignee: Optional[str] = None,
+        new_status: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """
+        Changes to members' open ticket counts, by user ID, when a ticket goes
+        from one assignee and status to another. Omit the old values for a
+        new ticket.
+        """
+        deltas: Dict[str, int] = {}
+        if old_assignee and old_status == TicketStatus.OPEN.value:
+            deltas[old_assignee] = deltas.get(old_assignee, 0) - 1
+        if new_assignee and new_status == TicketStatus.OPEN.value:
+            deltas[new_assignee] = deltas.get(new_assignee, 0) + 1
+        return {user_id: delta for user_id, delta in deltas.items() if delta}
+
+    @staticmethod
+    def get_open_ticket_count(membership: "GroupMembershipModel") -> int:
+        # Absent on memberships from before the counter; never shown negative
+        return max(0, membership.open_ticket_count or 0)
+
+    @staticmethod
+    def clean_returned_membership(membership: "GroupMembershipModel") -> dict:
+        return {
+            "family_id": membership.family_id,
+            "group_id": membership.group_id,
+            "user_id": membership.user_id,
+            "status": membership.status,
+            "is_admin": membership.is_admin,
+            "request_date": membership.request_date,
+            "open_ticket_count": GroupMembershipModel.get_open_ticket_count(membership),
+        }
@@ -12,6 +12,7 @@ class NotificationType(Enum):
     TICKET_ASSIGNED = "Ticket Assigned"
     TICKET_COMMENT = "Ticket Comment"
     TICKET_STATUS_CHANGED = "Ticket Status Changed"
+    TICKET_SLA_BREACHED = "Ticket SLA Breached"
     GROUP_INVITATION = "Group Invitation"
 
 
@@ -19,6 +20,10 @@ class NotificationModel(FamHelpDeskBaseModel):
     """
     PK: USER_PROFILE#{user_id}
     SK: NOTIFICATION#{notification_id}
+
+    Coalesced notifications (see NotificationHelper.create_coalesced_notifications)
+    have a deterministic notification_id, so a user has at most one per
+    subject; event_count counts the events it stands for.
     """
 
     notification_id = UnicodeAttribute()
@@ -33,6 +38,7 @@ class NotificationModel(FamHelpDeskBaseModel):
     ticket_id = UnicodeAttribute(
         null=True
     )  # Optional, if notification is ticket-related
+    event_count = NumberAttribute(null=True)  # Only on coalesced notifications
 
     @staticmethod
     def create_pk(user_id: str) -> str:
@@ -42,6 +48,12 @@ class NotificationModel(FamHelpDeskBaseModel):
     def create_sk(notification_id: str) -> str:
         return f"NOTIFICATION#{notification_id}"
 
+    @staticmethod
+    def create_coalesced_id(
+        notification_type: NotificationType, subject_id: str
+    ) -> str:
+        return f"{notification_type.name}-{subject_id}"
+
     @staticmethod
     def clean_returned_notification(notification: "NotificationModel") -> dict:
         data = {
@@ -56,4 +68,6 @@ class NotificationModel(FamHelpDeskBaseModel):
             data["family_id"] = notification.family_id
         if notification.ticket_id is not None:
             data["ticket_id"] = notification.ticket_id
+        if notification.event_count is not None:
+            data["event_count"] = notification.event_count
         return data
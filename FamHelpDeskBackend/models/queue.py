@@ -1,5 +1,22 @@
+from collections import Counter
+from typing import Dict, Optional
 from models.base import FamHelpDeskBaseModel
+from models.ticket import TicketSeverity, TicketStatus
 from pynamodb.attributes import UnicodeAttribute, NumberAttribute
+from pynamodb.indexes import GlobalSecondaryIndex, AllProjection
+
+
+class FamilyQueueIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "FamilyQueueIndex"
+        projection = AllProjection()
+        read_capacity_units = 5
+        write_capacity_units = 5
+
+    # Sparse index: only queue items carry queue_family_id, so a query returns
+    # the family's queues without reading group or membership items
+    queue_family_id = UnicodeAttribute(hash_key=True)
+    sk = UnicodeAttribute(range_key=True)
 
 
 class QueueModel(FamHelpDeskBaseModel):
@@ -9,6 +26,22 @@ class QueueModel(FamHelpDeskBaseModel):
     queue_name = UnicodeAttribute()
     queue_description = UnicodeAttribute(null=True)
     creation_date = NumberAttribute()
+    queue_family_id = UnicodeAttribute(null=True)
+    # Ticket counters, changed in the same transaction as every ticket write;
+    # absent means zero
+    open_ticket_count = NumberAttribute(null=True)
+    resolved_ticket_count = NumberAttribute(null=True)
+    closed_ticket_count = NumberAttribute(null=True)
+    # Open tickets by severity
+    open_sev_1_count = NumberAttribute(null=True)
+    open_sev_2_count = NumberAttribute(null=True)
+    open_sev_2_5_count = NumberAttribute(null=True)
+    open_sev_3_count = NumberAttribute(null=True)
+    open_sev_4_count = NumberAttribute(null=True)
+    open_sev_5_count = NumberAttribute(null=True)
+
+    # GSI for querying all queues of a family
+    family_queue_index = FamilyQueueIndex()
 
     @staticmethod
     def create_pk(family_id: str) -> str:
@@ -18,6 +51,75 @@ class QueueModel(FamHelpDeskBaseModel):
     def create_sk(group_id: str, queue_id: str) -> str:
         return f"GROUP#{group_id}#QUEUE#{queue_id}"
 
+    @staticmethod
+    def status_count_attribute(status: str) -> str:
+        return f"{TicketStatus(status).value.lower()}_ticket_count"
+
+    @staticmethod
+    def open_severity_count_attribute(severity: str) -> str:
+        return f"open_{TicketSeverity(severity).name.lower()}_count"
+
+    @staticmethod
+    def ticket_count_deltas(
+        severity: str,
+        old_status: Optional[str] = None,
+        new_status: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """
+        Counter changes that move one ticket between statuses, by attribute
+        name. Leave old_status unset for a new ticket and new_status unset for
+        a removed one. Deltas of many tickets can be summed into one update.
+        """
+        deltas = Counter()
+        for status, delta in ((old_status, -1), (new_status, 1)):
+            if status is None:
+                continue
+            deltas[QueueModel.status_count_attribute(status)] += delta
+            if status == TicketStatus.OPEN.value:
+                deltas[QueueModel.open_severity_count_attribute(severity)] += delta
+        return deltas
+
+    @staticmethod
+    def ticket_count_actions(
+        severity: str,
+        old_status: Optional[str] = None,
+        new_status: Optional[str] = None,
+    ) -> list:
+        """
+        Update actions that move one ticket between status counters (see
+        ticket_count_deltas).
+        """
+        return QueueModel.count_delta_actions(
+            QueueModel.ticket_count_deltas(severity, old_status, new_status)
+        )
+
+    @staticmethod
+    def count_delta_actions(deltas: Dict[str, int]) -> list:
+        """
+        ADD actions for counter deltas. ADD treats a missing counter as zero,
+        so queues created before the counters existed need no migration.
+        """
+        return [getattr(QueueModel, name).add(delta) for name, delta in deltas.items()]
+
+    @staticmethod
+    def get_ticket_counts(queue: "QueueModel") -> dict:
+        return {
+            "open": queue.open_ticket_count or 0,
+            "resolved": queue.resolved_ticket_count or 0,
+            "closed": queue.closed_ticket_count or 0,
+            "open_by_severity": {
+                severity.value: getattr(
+                    queue, QueueModel.open_severity_count_attribute(severity.value)
+                )
+                or 0
+                for severity in TicketSeverity
+            },
+        }
+
+    @staticmethod
+    def get_active_ticket_count(queue: "QueueModel") -> int:
+        return (queue.open_ticket_count or 0) + (queue.resolved_ticket_count or 0)
+
     @staticmethod
     def clean_returned_queue(queue: "QueueModel") -> dict:
         data = {
@@ -26,6 +128,7 @@ class QueueModel(FamHelpDeskBaseModel):
             "queue_id": queue.queue_id,
             "queue_name": queue.queue_name,
             "creation_date": queue.creation_date,
+            "ticket_counts": QueueModel.get_ticket_counts(queue),
         }
         if getattr(queue, "queue_description", None) is not None:
             data["queue_description"] = queue.queue_description
@@ -0,0 +1,71 @@
+from enum import Enum
+from models.base import FamHelpDeskBaseModel
+from pynamodb.attributes import UnicodeAttribute, NumberAttribute
+
+
+class ReportType(str, Enum):
+    QUEUE = "QUEUE"
+    TICKET = "TICKET"
+
+
+class ReportStatus(str, Enum):
+    PENDING = "PENDING"
+    READY = "READY"
+    FAILED = "FAILED"
+
+
+class ReportModel(FamHelpDeskBaseModel):
+    """
+    PK: FAMILY#{family_id}
+    SK: REPORT#{report_id}
+
+    A PDF report and its rendering state. report_id is the content hash of
+    the snapshot the report is rendered from, so asking again for a report of
+    unchanged data finds the PDF already rendered.
+    """
+
+    family_id = UnicodeAttribute()
+    report_id = UnicodeAttribute()
+    report_type = UnicodeAttribute()
+    queue_id = UnicodeAttribute()
+    ticket_id = UnicodeAttribute(null=True)
+    status = UnicodeAttribute()
+    requested_by = UnicodeAttribute()
+    requested_at = NumberAttribute()
+    rendered_at = NumberAttribute(null=True)
+    pdf_size = NumberAttribute(null=True)
+    error = UnicodeAttribute(null=True)
+
+    @staticmethod
+    def create_pk(family_id: str) -> str:
+        return f"FAMILY#{family_id}"
+
+    @staticmethod
+    def create_sk(report_id: str) -> str:
+        return f"REPORT#{report_id}"
+
+    @staticmethod
+    def create_snapshot_key(family_id: str, report_id: str) -> str:
+        """Report store key of the gzipped JSON snapshot the PDF is rendered from."""
+        return f"{family_id}/{report_id}.json.gz"
+
+    @staticmethod
+    def create_pdf_key(family_id: str, report_id: str) -> str:
+        return f"{family_id}/{report_id}.pdf"
+
+    @staticmethod
+    def clean_returned_report(report: "ReportModel") -> dict:
+        data = {
+            "family_id": report.family_id,
+            "report_id": report.report_id,
+            "report_type": report.report_type,
+            "queue_id": report.queue_id,
+            "status": report.status,
+            "requested_by": report.requested_by,
+            "requested_at": report.requested_at,
+        }
+        for field in ("ticket_id", "rendered_at", "pdf_size", "error"):
+            value = getattr(report, field, None)
+            if value is not None:
+                data[field] = value
+        return data
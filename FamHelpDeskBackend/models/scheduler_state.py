@@ -0,0 +1,21 @@
+from models.base import FamHelpDeskBaseModel
+from pynamodb.attributes import NumberAttribute
+
+
+class SchedulerStateModel(FamHelpDeskBaseModel):
+    """
+    PK: SCHEDULER#{scheduler_name}
+    SK: STATE
+    """
+
+    # Start of the newest time bucket that was fully processed
+    processed_through = NumberAttribute(null=True)
+    last_run = NumberAttribute(null=True)
+
+    @staticmethod
+    def create_pk(scheduler_name: str) -> str:
+        return f"SCHEDULER#{scheduler_name}"
+
+    @staticmethod
+    def create_sk() -> str:
+        return "STATE"
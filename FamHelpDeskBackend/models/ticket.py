@@ -1,9 +1,14 @@
 from enum import Enum
+from typing import Dict, Optional, Set, Tuple
+from constants.ticket import TICKET_DEADLINE_BUCKET_SECONDS
 from models.base import FamHelpDeskBaseModel
-from pynamodb.attributes import UnicodeAttribute, NumberAttribute
+from pynamodb.attributes import UnicodeAttribute, NumberAttribute, UnicodeSetAttribute
+from pynamodb.indexes import GlobalSecondaryIndex, AllProjection
 
 
 class TicketSeverity(str, Enum):
+    # Values are fixed width, so as strings they sort from most to least
+    # severe; the ticket index sort keys rely on this
     SEV_1 = "1.0"
     SEV_2 = "2.0"
     SEV_2_5 = "2.5"
@@ -18,10 +23,69 @@ class TicketStatus(str, Enum):
     CLOSED = "CLOSED"
 
 
+# Statuses that sort after CLOSED in queue_ticket_sk; listing them together
+# never reads closed tickets
+ACTIVE_TICKET_STATUSES = (TicketStatus.OPEN, TicketStatus.RESOLVED)
+
+
+class QueueTicketIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "QueueTicketIndex"
+        projection = AllProjection()
+        read_capacity_units = 5
+        write_capacity_units = 5
+
+    # Tickets of one queue, grouped by status, then severity, then age:
+    # STATUS#{status}#SEV#{severity}#CREATED#{creation_date}#ID#{ticket_id}
+    queue_ticket_pk = UnicodeAttribute(hash_key=True)
+    queue_ticket_sk = UnicodeAttribute(range_key=True)
+
+
+class AssigneeTicketIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "AssigneeTicketIndex"
+        projection = AllProjection()
+        read_capacity_units = 5
+        write_capacity_units = 5
+
+    # Sparse index: only OPEN, assigned tickets carry these keys. Each user's
+    # open work across all families, most severe then oldest first:
+    # SEV#{severity}#CREATED#{creation_date}#ID#{ticket_id}
+    assignee_ticket_pk = UnicodeAttribute(hash_key=True)
+    assignee_ticket_sk = UnicodeAttribute(range_key=True)
+
+
+class TicketDeadlineKind(str, Enum):
+    # OPEN ticket past its SLA
+    SLA = "SLA"
+    # RESOLVED ticket past its reopen window
+    AUTO_CLOSE = "AUTO_CLOSE"
+
+
+class DeadlineTicketIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "DeadlineTicketIndex"
+        projection = AllProjection()
+        read_capacity_units = 5
+        write_capacity_units = 5
+
+    # Sparse index: only tickets with a pending deadline carry these keys,
+    # partitioned by deadline bucket so the scheduler reads only due buckets:
+    # DEADLINE#{bucket_start} / DUE#{deadline}#{kind}#ID#{ticket_id}
+    deadline_pk = UnicodeAttribute(hash_key=True)
+    deadline_sk = UnicodeAttribute(range_key=True)
+
+
 class TicketModel(FamHelpDeskBaseModel):
     family_id = UnicodeAttribute()
     queue_id = UnicodeAttribute()
+    # The queue's group, so ticket writes can address the queue item's
+    # counters without looking the queue up
+    group_id = UnicodeAttribute(null=True)
     ticket_id = UnicodeAttribute()
+    # Sequential per family (see TicketNumberHelper), e.g. 142 / "SMITH-142"
+    ticket_number = NumberAttribute(null=True)
+    ticket_key = UnicodeAttribute(null=True)
     title = UnicodeAttribute()
     description = UnicodeAttribute(null=True)
     severity = UnicodeAttribute()
@@ -31,6 +95,31 @@ class TicketModel(FamHelpDeskBaseModel):
     closed_date = NumberAttribute(null=True)
     reopen_until = NumberAttribute(null=True)
     assigned_to = UnicodeAttribute(null=True)
+    created_by = UnicodeAttribute(null=True)
+    # Maintained with each comment write so ticket lists never read comments
+    comment_count = NumberAttribute(null=True)
+    last_activity = NumberAttribute(null=True)
+    # Who is notified of comments (see get_watchers): the creator and assignee
+    # implicitly, plus commenters and explicit subscribers, minus opt-outs.
+    # Commenting or subscribing clears an opt-out
+    subscribers = UnicodeSetAttribute(null=True)
+    unsubscribed = UnicodeSetAttribute(null=True)
+    # SLA deadline of the current OPEN period, and when it was breached
+    sla_due = NumberAttribute(null=True)
+    sla_breached_at = NumberAttribute(null=True)
+    queue_ticket_pk = UnicodeAttribute(null=True)
+    queue_ticket_sk = UnicodeAttribute(null=True)
+    assignee_ticket_pk = UnicodeAttribute(null=True)
+    assignee_ticket_sk = UnicodeAttribute(null=True)
+    deadline_pk = UnicodeAttribute(null=True)
+    deadline_sk = UnicodeAttribute(null=True)
+
+    # GSI for listing a queue's tickets by status and severity
+    queue_ticket_index = QueueTicketIndex()
+    # GSI for a user's open assigned tickets across families
+    assignee_ticket_index = AssigneeTicketIndex()
+    # GSI for the deadline scheduler
+    deadline_ticket_index = DeadlineTicketIndex()
 
     @staticmethod
     def create_pk(family_id: str) -> str:
@@ -39,3 +128,194 @@ class TicketModel(FamHelpDeskBaseModel):
     @staticmethod
     def create_sk(queue_id: str, ticket_id: str) -> str:
         return f"QUEUE#{queue_id}#TICKET#{ticket_id}"
+
+    @staticmethod
+    def create_queue_ticket_pk(family_id: str, queue_id: str) -> str:
+        return f"FAMILY#{family_id}#QUEUE#{queue_id}#TICKETS"
+
+    @staticmethod
+    def create_queue_ticket_sk(
+        status: str, severity: str, creation_date: int, ticket_id: str
+    ) -> str:
+        # Epoch seconds stay 10 digits wide, so creation_date sorts correctly
+        return f"STATUS#{status}#SEV#{severity}#CREATED#{creation_date}#ID#{ticket_id}"
+
+    @staticmethod
+    def create_queue_ticket_sk_prefix(
+        status: str, severity: Optional[str] = None
+    ) -> str:
+        if severity is None:
+            return f"STATUS#{status}#"
+        return f"STATUS#{status}#SEV#{severity}#"
+
+    @staticmethod
+    def create_assignee_ticket_pk(user_id: str) -> str:
+        return f"ASSIGNEE#{user_id}"
+
+    @staticmethod
+    def create_assignee_ticket_sk(
+        severity: str, creation_date: int, ticket_id: str
+    ) -> str:
+        return f"SEV#{severity}#CREATED#{creation_date}#ID#{ticket_id}"
+
+    @staticmethod
+    def deadline_bucket(epoch: int) -> int:
+        """Start of the deadline bucket that contains an epoch time."""
+        return epoch - epoch % TICKET_DEADLINE_BUCKET_SECONDS
+
+    @staticmethod
+    def create_deadline_pk(bucket: int) -> str:
+        return f"DEADLINE#{bucket}"
+
+    @staticmethod
+    def create_deadline_sk(
+        deadline: int, kind: TicketDeadlineKind, ticket_id: str
+    ) -> str:
+        return f"DUE#{deadline}#{kind.value}#ID#{ticket_id}"
+
+    @staticmethod
+    def create_deadline_sk_limit(now: int) -> str:
+        # Sorts after every deadline at or before now
+        return f"DUE#{now}#~"
+
+    @staticmethod
+    def get_deadline(
+        status: str,
+        sla_due: Optional[int],
+        sla_breached_at: Optional[int],
+        reopen_until: Optional[int],
+    ) -> Tuple[Optional[int], Optional[TicketDeadlineKind]]:
+        """The next deadline the scheduler must act on, if any."""
+        if status == TicketStatus.OPEN.value and sla_due and not sla_breached_at:
+            return sla_due, TicketDeadlineKind.SLA
+        if status == TicketStatus.RESOLVED.value and reopen_until:
+            return reopen_until, TicketDeadlineKind.AUTO_CLOSE
+        return None, None
+
+    @staticmethod
+    def get_index_keys(ticket: "TicketModel", **changes) -> Dict[str, Optional[str]]:
+        """
+        Derive every GSI key of a ticket from its fields, with `changes`
+        overriding fields that are about to be updated. None means the key
+        must be absent (the ticket is not in that sparse index).
+        """
+        state = {
+            field: changes.get(field, getattr(ticket, field))
+            for field in (
+                "family_id",
+                "queue_id",
+                "ticket_id",
+                "status",
+                "severity",
+                "creation_date",
+                "assigned_to",
+                "sla_due",
+                "sla_breached_at",
+                "reopen_until",
+            )
+        }
+        keys = {
+            "queue_ticket_pk": TicketModel.create_queue_ticket_pk(
+                state["family_id"], state["queue_id"]
+            ),
+            "queue_ticket_sk": TicketModel.create_queue_ticket_sk(
+                state["status"],
+                state["severity"],
+                state["creation_date"],
+                state["ticket_id"],
+            ),
+            "assignee_ticket_pk": None,
+            "assignee_ticket_sk": None,
+            "deadline_pk": None,
+            "deadline_sk": None,
+        }
+        if state["status"] == TicketStatus.OPEN.value and state["assigned_to"]:
+            keys["assignee_ticket_pk"] = TicketModel.create_assignee_ticket_pk(
+                state["assigned_to"]
+            )
+            keys["assignee_ticket_sk"] = TicketModel.create_assignee_ticket_sk(
+                state["severity"], state["creation_date"], state["ticket_id"]
+            )
+        deadline, kind = TicketModel.get_deadline(
+            state["status"],
+            state["sla_due"],
+            state["sla_breached_at"],
+            state["reopen_until"],
+        )
+        if deadline is not None:
+            keys["deadline_pk"] = TicketModel.create_deadline_pk(
+                TicketModel.deadline_bucket(deadline)
+            )
+            keys["deadline_sk"] = TicketModel.create_deadline_sk(
+                deadline, kind, state["ticket_id"]
+            )
+        return keys
+
+    @staticmethod
+    def set_index_keys(ticket: "TicketModel") -> None:
+        """Set the GSI keys on a ticket that is about to be saved."""
+        for name, value in TicketModel.get_index_keys(ticket).items():
+            setattr(ticket, name, value)
+
+    @staticmethod
+    def index_key_actions(ticket: "TicketModel", **changes) -> list:
+        """Update actions that keep the GSI keys in step with `changes`."""
+        actions = []
+        for name, value in TicketModel.get_index_keys(ticket, **changes).items():
+            attribute = getattr(TicketModel, name)
+            actions.append(
+                attribute.remove() if value is None else attribute.set(value)
+            )
+        return actions
+
+    @staticmethod
+    def get_watchers(ticket: "TicketModel") -> Set[str]:
+        implicit = {u for u in (ticket.created_by, ticket.assigned_to) if u}
+        return (implicit | set(ticket.subscribers or ())) - set(
+            ticket.unsubscribed or ()
+        )
+
+    @staticmethod
+    def watch_actions(user_id: str, watching: bool = True) -> list:
+        """Update actions subscribing a user to a ticket, or opting them out."""
+        if watching:
+            return [
+                TicketModel.subscribers.add({user_id}),
+                TicketModel.unsubscribed.delete({user_id}),
+            ]
+        return [
+            TicketModel.unsubscribed.add({user_id}),
+            TicketModel.subscribers.delete({user_id}),
+        ]
+
+    @staticmethod
+    def clean_returned_ticket(ticket: "TicketModel") -> dict:
+        data = {
+            "family_id": ticket.family_id,
+            "queue_id": ticket.queue_id,
+            "ticket_id": ticket.ticket_id,
+            "title": ticket.title,
+            "severity": ticket.severity,
+            "status": ticket.status,
+            "creation_date": ticket.creation_date,
+            "comment_count": ticket.comment_count or 0,
+            "watchers": sorted(TicketModel.get_watchers(ticket)),
+        }
+        for field in (
+            "group_id",
+            "ticket_number",
+            "ticket_key",
+            "description",
+            "resolved_date",
+            "closed_date",
+            "reopen_until",
+            "assigned_to",
+            "created_by",
+            "last_activity",
+            "sla_due",
+            "sla_breached_at",
+        ):
+            value = getattr(ticket, field, None)
+            if value is not None:
+                data[field] = value
+        return data
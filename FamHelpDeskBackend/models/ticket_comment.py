@@ -6,6 +6,8 @@ class TicketCommentModel(FamHelpDeskBaseModel):
     family_id = UnicodeAttribute()
     queue_id = UnicodeAttribute()
     ticket_id = UnicodeAttribute()
+    # Time-ordered (see generate_time_ordered_id), so a ticket's comments sort
+    # oldest to newest by sort key
     comment_id = UnicodeAttribute()
     comment_user = UnicodeAttribute()
     comment_body = UnicodeAttribute()
@@ -19,3 +21,20 @@ class TicketCommentModel(FamHelpDeskBaseModel):
     @staticmethod
     def create_sk(queue_id: str, ticket_id: str, comment_id: str) -> str:
         return f"QUEUE#{queue_id}#TICKET#{ticket_id}#COMMENT#{comment_id}"
+
+    @staticmethod
+    def create_sk_prefix(queue_id: str, ticket_id: str) -> str:
+        return f"QUEUE#{queue_id}#TICKET#{ticket_id}#COMMENT#"
+
+    @staticmethod
+    def clean_returned_comment(comment: "TicketCommentModel") -> dict:
+        return {
+            "family_id": comment.family_id,
+            "queue_id": comment.queue_id,
+            "ticket_id": comment.ticket_id,
+            "comment_id": comment.comment_id,
+            "comment_user": comment.comment_user,
+            "comment_body": comment.comment_body,
+            "comment_date": comment.comment_date,
+            "last_update": comment.last_update,
+        }
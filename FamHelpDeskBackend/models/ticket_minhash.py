@@ -0,0 +1,52 @@
+from models.base import FamHelpDeskBaseModel
+from pynamodb.attributes import UnicodeAttribute, NumberAttribute, BinaryAttribute
+
+
+class TicketSignatureModel(FamHelpDeskBaseModel):
+    """
+    PK: MINHASH#{family_id}
+    SK: TICKET#{ticket_id}
+
+    MinHash signature of a ticket's title and description, used to estimate
+    its similarity to duplicate candidates without reading the tickets.
+    """
+
+    family_id = UnicodeAttribute()
+    queue_id = UnicodeAttribute()
+    ticket_id = UnicodeAttribute()
+    title = UnicodeAttribute()
+    creation_date = NumberAttribute()
+    # Big-endian unsigned 32-bit values, one per permutation
+    signature = BinaryAttribute(legacy_encoding=False)
+
+    @staticmethod
+    def create_pk(family_id: str) -> str:
+        return f"MINHASH#{family_id}"
+
+    @staticmethod
+    def create_sk(ticket_id: str) -> str:
+        return f"TICKET#{ticket_id}"
+
+
+class TicketBandModel(FamHelpDeskBaseModel):
+    """
+    PK: MINHASH#{family_id}
+    SK: BAND#{band}#{band_hash}#TICKET#{ticket_id}
+
+    LSH bucket membership: tickets whose signatures agree on every row of a
+    band share its hash, so a band prefix query returns the candidates.
+    """
+
+    ticket_id = UnicodeAttribute()
+
+    @staticmethod
+    def create_pk(family_id: str) -> str:
+        return f"MINHASH#{family_id}"
+
+    @staticmethod
+    def create_sk(band: int, band_hash: str, ticket_id: str) -> str:
+        return f"BAND#{band:02d}#{band_hash}#TICKET#{ticket_id}"
+
+    @staticmethod
+    def create_sk_prefix(band: int, band_hash: str) -> str:
+        return f"BAND#{band:02d}#{band_hash}#TICKET#"
@@ -0,0 +1,72 @@
+from enum import Enum
+from models.base import FamHelpDeskBaseModel
+from pynamodb.attributes import UnicodeAttribute, NumberAttribute, ListAttribute
+
+
+class TicketMoveStatus(str, Enum):
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+
+
+class TicketMoveModel(FamHelpDeskBaseModel):
+    """
+    PK: FAMILY#{family_id}
+    SK: TICKET_MOVE#{move_id}
+
+    Checkpoint of a bulk ticket move between queues. Tickets are moved in
+    ticket ID order and the cursor is saved after every chunk, so an
+    interrupted move resumes after the last ticket it handled.
+    """
+
+    family_id = UnicodeAttribute()
+    move_id = UnicodeAttribute()
+    source_queue_id = UnicodeAttribute()
+    target_queue_id = UnicodeAttribute()
+    target_group_id = UnicodeAttribute()
+    actor_user_id = UnicodeAttribute()
+    # Tickets to move; absent means every ticket in the source queue
+    ticket_ids = ListAttribute(of=UnicodeAttribute, null=True)
+    status = UnicodeAttribute()
+    # ID of the last ticket moved or given up on
+    cursor = UnicodeAttribute(null=True)
+    tickets_moved = NumberAttribute(default=0)
+    comments_moved = NumberAttribute(default=0)
+    failed = NumberAttribute(default=0)
+    # Time spent moving across all runs, for throughput
+    elapsed_seconds = NumberAttribute(default=0)
+    started_at = NumberAttribute()
+    updated_at = NumberAttribute()
+    completed_at = NumberAttribute(null=True)
+
+    @staticmethod
+    def create_pk(family_id: str) -> str:
+        return f"FAMILY#{family_id}"
+
+    @staticmethod
+    def create_sk(move_id: str) -> str:
+        return f"TICKET_MOVE#{move_id}"
+
+    @staticmethod
+    def clean_returned_move(move: "TicketMoveModel") -> dict:
+        elapsed = move.elapsed_seconds or 0
+        data = {
+            "family_id": move.family_id,
+            "move_id": move.move_id,
+            "source_queue_id": move.source_queue_id,
+            "target_queue_id": move.target_queue_id,
+            "status": move.status,
+            "tickets_moved": move.tickets_moved,
+            "comments_moved": move.comments_moved,
+            "failed": move.failed,
+            "elapsed_seconds": round(elapsed, 3),
+            "tickets_per_second": (
+                round(move.tickets_moved / elapsed, 2) if elapsed > 0 else None
+            ),
+            "started_at": move.started_at,
+            "updated_at": move.updated_at,
+        }
+        for field in ("ticket_ids", "cursor", "completed_at"):
+            value = getattr(move, field, None)
+            if value is not None:
+                data[field] = value
+        return data
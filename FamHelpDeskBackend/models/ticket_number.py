@@ -0,0 +1,57 @@
+import re
+from models.base import FamHelpDeskBaseModel
+from pynamodb.attributes import UnicodeAttribute, NumberAttribute
+
+
+class TicketSequenceModel(FamHelpDeskBaseModel):
+    """
+    PK: FAMILY#{family_id}
+    SK: TICKET_SEQUENCE
+
+    Highest ticket number handed out to any container. Containers reserve
+    numbers in blocks, so this item is written once per block, not per ticket.
+    """
+
+    family_id = UnicodeAttribute(null=True)
+    last_number = NumberAttribute(null=True)
+
+    @staticmethod
+    def create_pk(family_id: str) -> str:
+        return f"FAMILY#{family_id}"
+
+    @staticmethod
+    def create_sk() -> str:
+        return "TICKET_SEQUENCE"
+
+
+class TicketNumberModel(FamHelpDeskBaseModel):
+    """
+    PK: FAMILY#{family_id}
+    SK: TICKET_NUMBER#{ticket_number}
+
+    Maps a ticket number to its ticket. Written with the ticket, only if the
+    number is unused, so a number can never point at two tickets.
+    """
+
+    family_id = UnicodeAttribute()
+    ticket_number = NumberAttribute()
+    queue_id = UnicodeAttribute()
+    ticket_id = UnicodeAttribute()
+
+    @staticmethod
+    def create_pk(family_id: str) -> str:
+        return f"FAMILY#{family_id}"
+
+    @staticmethod
+    def create_sk(ticket_number: int) -> str:
+        return f"TICKET_NUMBER#{ticket_number:010d}"
+
+    @staticmethod
+    def create_ticket_key_prefix(family_name: str) -> str:
+        # First word of the family name, e.g. "Smith Family" -> "SMITH"
+        words = re.findall(r"[A-Za-z0-9]+", family_name or "")
+        return words[0][:8].upper() if words else "TICKET"
+
+    @staticmethod
+    def create_ticket_key(prefix: str, ticket_number: int) -> str:
+        return f"{prefix}-{ticket_number}"
@@ -0,0 +1,176 @@
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from models.base import FamHelpDeskBaseModel
+from models.ticket import TicketModel, TicketSeverity, TicketStatus
+from pynamodb.attributes import UnicodeAttribute, NumberAttribute
+
+# (UTC day, counter deltas) of one or more ticket events
+RollupEvent = Tuple[str, Dict[str, int]]
+
+
+class TicketRollupModel(FamHelpDeskBaseModel):
+    """
+    PK: FAMILY#{family_id}
+    SK: ROLLUP#FAMILY#DAY#{yyyy-mm-dd}             (the whole family)
+        ROLLUP#QUEUE#{queue_id}#DAY#{yyyy-mm-dd}   (one queue)
+
+    Ticket activity of one UTC day, updated by the same transactions that
+    change tickets, so analytics read one item per day instead of tickets.
+    Counters are ADDed, so a day's first event creates its item. A scope's
+    days sort by date, so a date range is one sort key range.
+    """
+
+    family_id = UnicodeAttribute()
+    queue_id = UnicodeAttribute(null=True)
+    day = UnicodeAttribute()
+    opened_count = NumberAttribute(null=True)
+    # Tickets leaving OPEN: resolved, or closed without being resolved
+    resolved_count = NumberAttribute(null=True)
+    reopened_count = NumberAttribute(null=True)
+    closed_count = NumberAttribute(null=True)
+    # Net change of the OPEN backlog over the day
+    backlog_delta = NumberAttribute(null=True)
+    # Tickets leaving OPEN and their summed seconds since creation, by severity
+    resolved_sev_1_count = NumberAttribute(null=True)
+    resolved_sev_2_count = NumberAttribute(null=True)
+    resolved_sev_2_5_count = NumberAttribute(null=True)
+    resolved_sev_3_count = NumberAttribute(null=True)
+    resolved_sev_4_count = NumberAttribute(null=True)
+    resolved_sev_5_count = NumberAttribute(null=True)
+    resolve_seconds_sev_1 = NumberAttribute(null=True)
+    resolve_seconds_sev_2 = NumberAttribute(null=True)
+    resolve_seconds_sev_2_5 = NumberAttribute(null=True)
+    resolve_seconds_sev_3 = NumberAttribute(null=True)
+    resolve_seconds_sev_4 = NumberAttribute(null=True)
+    resolve_seconds_sev_5 = NumberAttribute(null=True)
+
+    @staticmethod
+    def create_pk(family_id: str) -> str:
+        return f"FAMILY#{family_id}"
+
+    @staticmethod
+    def create_sk_prefix(queue_id: Optional[str] = None) -> str:
+        scope = f"QUEUE#{queue_id}" if queue_id else "FAMILY"
+        return f"ROLLUP#{scope}#DAY#"
+
+    @staticmethod
+    def create_sk(day: str, queue_id: Optional[str] = None) -> str:
+        return f"{TicketRollupModel.create_sk_prefix(queue_id)}{day}"
+
+    @staticmethod
+    def day_of(epoch: int) -> str:
+        return time.strftime("%Y-%m-%d", time.gmtime(epoch))
+
+    @staticmethod
+    def resolved_severity_count_attribute(severity: str) -> str:
+        return f"resolved_{TicketSeverity(severity).name.lower()}_count"
+
+    @staticmethod
+    def resolve_seconds_attribute(severity: str) -> str:
+        return f"resolve_seconds_{TicketSeverity(severity).name.lower()}"
+
+    @staticmethod
+    def transition_deltas(
+        severity: str,
+        old_status: Optional[str],
+        new_status: str,
+        open_seconds: int = 0,
+    ) -> Dict[str, int]:
+        """
+        Counter changes of one ticket moving from old_status (None for a new
+        ticket) to new_status. open_seconds is the time since creation of a
+        ticket leaving OPEN.
+        """
+        deltas = Counter()
+        if old_status is None:
+            deltas["opened_count"] += 1
+        elif new_status == TicketStatus.OPEN.value:
+            deltas["reopened_count"] += 1
+        if old_status == TicketStatus.OPEN.value:
+            deltas["resolved_count"] += 1
+            deltas[TicketRollupModel.resolved_severity_count_attribute(severity)] += 1
+            deltas[TicketRollupModel.resolve_seconds_attribute(severity)] += max(
+                0, open_seconds
+            )
+        if new_status == TicketStatus.CLOSED.value:
+            deltas["closed_count"] += 1
+        deltas["backlog_delta"] += (new_status == TicketStatus.OPEN.value) - (
+            old_status == TicketStatus.OPEN.value
+        )
+        return {name: delta for name, delta in deltas.items() if delta}
+
+    @staticmethod
+    def ticket_history_events(ticket: TicketModel) -> List[RollupEvent]:
+        """
+        The events of a ticket's life as far as its dates tell: created OPEN,
+        then resolved and closed. Reopens leave no trace on the ticket, so a
+        reopened ticket only shows its current period.
+        """
+        events = [
+            (
+                TicketRollupModel.day_of(ticket.creation_date),
+                TicketRollupModel.transition_deltas(
+                    ticket.severity, None, TicketStatus.OPEN.value
+                ),
+            )
+        ]
+        status = TicketStatus.OPEN.value
+        for new_status, date in (
+            (TicketStatus.RESOLVED.value, ticket.resolved_date),
+            (TicketStatus.CLOSED.value, ticket.closed_date),
+        ):
+            if ticket.status == TicketStatus.OPEN.value or date is None:
+                continue
+            events.append(
+                (
+                    TicketRollupModel.day_of(date),
+                    TicketRollupModel.transition_deltas(
+                        ticket.severity,
+                        status,
+                        new_status,
+                        open_seconds=date - ticket.creation_date,
+                    ),
+                )
+            )
+            status = new_status
+        return events
+
+    @staticmethod
+    def update_actions(
+        family_id: str, day: str, deltas: Dict[str, int], queue_id: Optional[str] = None
+    ) -> list:
+        """
+        Actions applying counter deltas to a day, creating its item if needed.
+        ADD treats missing counters as zero.
+        """
+        actions = [
+            TicketRollupModel.family_id.set(family_id),
+            TicketRollupModel.day.set(day),
+            *[
+                getattr(TicketRollupModel, name).add(delta)
+                for name, delta in deltas.items()
+            ],
+        ]
+        if queue_id:
+            actions.append(TicketRollupModel.queue_id.set(queue_id))
+        return actions
+
+    @staticmethod
+    def get_counts(rollup: Optional["TicketRollupModel"]) -> Dict[str, int]:
+        """A day's counters, with zeros for counters it never had."""
+        names = [
+            "opened_count",
+            "resolved_count",
+            "reopened_count",
+            "closed_count",
+            "backlog_delta",
+        ]
+        for severity in TicketSeverity:
+            names.append(
+                TicketRollupModel.resolved_severity_count_attribute(severity.value)
+            )
+            names.append(TicketRollupModel.resolve_seconds_attribute(severity.value))
+        return {
+            name: (getattr(rollup, name) if rollup else None) or 0 for name in names
+        }
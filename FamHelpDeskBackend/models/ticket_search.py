@@ -0,0 +1,31 @@
+from models.base import FamHelpDeskBaseModel
+from pynamodb.attributes import UnicodeAttribute, NumberAttribute, BooleanAttribute
+
+
+class TicketSearchPostingModel(FamHelpDeskBaseModel):
+    """
+    PK: SEARCH#{family_id}#TERM#{term}
+    SK: CREATED#{creation_date}#TICKET#{ticket_id}
+
+    One posting of the family's inverted index: a ticket that contains the
+    term. Each term's postings are their own partition, newest ticket last,
+    so a query term reads only its own postings and newest first.
+    """
+
+    family_id = UnicodeAttribute()
+    term = UnicodeAttribute()
+    queue_id = UnicodeAttribute()
+    ticket_id = UnicodeAttribute()
+    creation_date = NumberAttribute()
+    # Occurrences in title and description, and whether the title has it
+    term_frequency = NumberAttribute()
+    in_title = BooleanAttribute(default=False)
+
+    @staticmethod
+    def create_pk(family_id: str, term: str) -> str:
+        return f"SEARCH#{family_id}#TERM#{term}"
+
+    @staticmethod
+    def create_sk(creation_date: int, ticket_id: str) -> str:
+        # Epoch seconds stay 10 digits wide, so creation_date sorts correctly
+        return f"CREATED#{creation_date}#TICKET#{ticket_id}"
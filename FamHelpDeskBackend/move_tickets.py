@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Move tickets with their comments from one queue to another, e.g. to empty a
+queue before deleting it or to re-route a batch of tickets.
+
+The move is checkpointed after every transactional chunk. If it stops for
+any reason, run again with --resume and the printed move ID to carry on
+after the last ticket it handled. Progress and throughput are printed after
+every run and published as CloudWatch metrics.
+
+Usage:
+    python3 move_tickets.py --family-id <id> --source-queue-id <id> \\
+        --target-queue-id <id> --actor-user-id <id>
+    python3 move_tickets.py --family-id <id> --source-queue-id <id> \\
+        --target-queue-id <id> --actor-user-id <id> --ticket-id <id> --ticket-id <id>
+    python3 move_tickets.py --family-id <id> --resume <move_id>
+"""
+
+import argparse
+from aws_lambda_powertools import Logger
+
+from constants.metrics import TICKET_MOVE_SERVICE
+from helpers.ticket_move_helper import TicketMoveHelper
+from models.ticket_move import TicketMoveModel
+
+logger = Logger(service=TICKET_MOVE_SERVICE)
+
+
+def move_tickets(
+    family_id: str,
+    source_queue_id: str = None,
+    target_queue_id: str = None,
+    actor_user_id: str = None,
+    ticket_ids: list = None,
+    move_id: str = None,
+) -> dict:
+    """
+    Start a move, or resume move_id, and run it to completion.
+
+    Returns:
+        The move's checkpoint (see TicketMoveModel.clean_returned_move)
+    """
+    helper = TicketMoveHelper()
+    if move_id is not None:
+        move = helper.get_move(family_id, move_id)
+    else:
+        move = helper.start_move(
+            family_id,
+            source_queue_id,
+            target_queue_id,
+            actor_user_id=actor_user_id,
+            ticket_ids=ticket_ids,
+        )
+    run = helper.run_move(move)
+    if run["failed_ticket_ids"]:
+        logger.warning(
+            f"{len(run['failed_ticket_ids'])} tickets were not moved: "
+            f"{run['failed_ticket_ids']}"
+        )
+    return TicketMoveModel.clean_returned_move(move)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Move tickets with their comments to another queue"
+    )
+    parser.add_argument("--family-id", required=True, help="Family of the queues")
+    parser.add_argument("--source-queue-id", help="Queue to move tickets out of")
+    parser.add_argument("--target-queue-id", help="Queue to move tickets into")
+    parser.add_argument("--actor-user-id", help="User recorded on audit records")
+    parser.add_argument(
+        "--ticket-id",
+        action="append",
+        dest="ticket_ids",
+        help="Ticket to move (repeatable, default: every ticket in the queue)",
+    )
+    parser.add_argument("--resume", dest="move_id", help="Move ID to resume")
+    args = parser.parse_args()
+    if args.move_id is None and not (
+        args.source_queue_id and args.target_queue_id and args.actor_user_id
+    ):
+        parser.error(
+            "--source-queue-id, --target-queue-id and --actor-user-id are "
+            "required unless --resume is given"
+        )
+
+    result = move_tickets(
+        args.family_id,
+        source_queue_id=args.source_queue_id,
+        target_queue_id=args.target_queue_id,
+        actor_user_id=args.actor_user_id,
+        ticket_ids=args.ticket_ids,
+        move_id=args.move_id,
+    )
+    print(
+        f"Move {result['move_id']} is {result['status']}: moved "
+        f"{result['tickets_moved']} tickets and {result['comments_moved']} "
+        f"comments, {result['failed']} failed, "
+        f"{result['tickets_per_second']} tickets/s."
+    )
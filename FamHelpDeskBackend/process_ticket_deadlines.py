@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Act on due ticket deadlines: auto-close resolved tickets whose reopen window
+has passed and flag open tickets that breached their SLA.
+
+Deployed as a scheduled Lambda (handler below); it can also run locally,
+once or in a loop. Each run reads only the deadline buckets since the last
+fully processed one and emits its counts as CloudWatch metrics.
+
+Usage:
+    python3 process_ticket_deadlines.py                  # One run
+    python3 process_ticket_deadlines.py --loop --interval 300
+    python3 process_ticket_deadlines.py --max-items 100
+"""
+
+import argparse
+import time
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.metrics import Metrics, MetricUnit
+
+from constants.metrics import (
+    API_METRICS_NAMESPACE,
+    TICKET_SCHEDULER_SERVICE,
+    TICKETS_AUTO_CLOSED,
+    TICKET_SLA_BREACHES,
+    TICKET_DEADLINES_SKIPPED,
+    TICKET_DEADLINE_BACKLOG,
+    TICKET_DEADLINE_LAG_SECONDS,
+)
+from constants.ticket import TICKET_DEADLINE_MAX_ITEMS_PER_RUN
+from helpers.ticket_deadline_helper import TicketDeadlineHelper
+
+logger = Logger(service=TICKET_SCHEDULER_SERVICE)
+
+
+def process_ticket_deadlines(
+    max_items: int = TICKET_DEADLINE_MAX_ITEMS_PER_RUN,
+) -> dict:
+    """
+    Run the deadline scheduler once and publish its metrics.
+
+    Args:
+        max_items: Maximum deadlines to act on in this run
+
+    Returns:
+        The run's stats from TicketDeadlineHelper.process_due_deadlines
+    """
+    stats = TicketDeadlineHelper().process_due_deadlines(max_items=max_items)
+
+    metrics = Metrics(namespace=API_METRICS_NAMESPACE, service=TICKET_SCHEDULER_SERVICE)
+    for name, key in (
+        (TICKETS_AUTO_CLOSED, "auto_closed"),
+        (TICKET_SLA_BREACHES, "sla_breaches"),
+        (TICKET_DEADLINES_SKIPPED, "skipped"),
+        (TICKET_DEADLINE_BACKLOG, "backlog"),
+    ):
+        metrics.add_metric(name=name, unit=MetricUnit.Count, value=stats[key])
+    metrics.add_metric(
+        name=TICKET_DEADLINE_LAG_SECONDS,
+        unit=MetricUnit.Seconds,
+        value=stats["lag_seconds"],
+    )
+    metrics.flush_metrics()
+
+    if stats["failed"]:
+        logger.warning(f"{stats['failed']} ticket deadlines failed and will be retried")
+    return stats
+
+
+def handler(event, context):
+    return process_ticket_deadlines()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Process due ticket deadlines")
+    parser.add_argument(
+        "--max-items",
+        type=int,
+        default=TICKET_DEADLINE_MAX_ITEMS_PER_RUN,
+        help="Maximum deadlines to act on per run",
+    )
+    parser.add_argument(
+        "--loop", action="store_true", help="Keep running every --interval seconds"
+    )
+    parser.add_argument(
+        "--interval", type=int, default=300, help="Seconds between runs with --loop"
+    )
+    args = parser.parse_args()
+
+    while True:
+        result = process_ticket_deadlines(max_items=args.max_items)
+        print(
+            f"Auto-closed {result['auto_closed']} tickets, flagged "
+            f"{result['sla_breaches']} SLA breaches, skipped {result['skipped']}, "
+            f"failed {result['failed']}, backlog {result['backlog']}."
+        )
+        if not args.loop:
+            break
+        time.sleep(args.interval)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Rebuild the daily ticket analytics rollups from the tickets themselves.
+
+TicketHelper keeps the rollups exact on its own; run this for families with
+tickets from before rollups existed, or after an import or move whose
+best-effort rollup updates failed. Each family's rollups are rewritten from
+its tickets' dates, so reopens recorded before the rebuild are lost. Ticket
+changes made while a family is being rebuilt may be overwritten; run it when
+the family is quiet. Safe to re-run.
+
+Usage:
+    python3 rebuild_ticket_rollups.py                    # All families
+    python3 rebuild_ticket_rollups.py --family-id <id>   # One family
+    python3 rebuild_ticket_rollups.py --dry-run          # Only count
+"""
+
+import argparse
+from aws_lambda_powertools import Logger
+
+from helpers.family_helper import FamilyHelper
+from helpers.ticket_rollup_helper import TicketRollupHelper
+
+logger = Logger(service="FamHelpDesk-Ticket-Rollup-Rebuild")
+
+
+def rebuild_ticket_rollups(family_ids: list = None, dry_run: bool = False) -> dict:
+    """
+    Rebuild the rollups of the given families.
+
+    Args:
+        family_ids: Families to rebuild (default: every family)
+        dry_run: Read the tickets without writing rollups
+
+    Returns:
+        Dict with the number of families and tickets read and rollups written
+    """
+    helper = TicketRollupHelper()
+    if family_ids is None:
+        family_ids = [f.family_id for f in FamilyHelper().get_all_families()]
+
+    totals = {"families": 0, "tickets": 0, "rollups": 0}
+    for family_id in family_ids:
+        result = helper.rebuild_rollups(family_id, dry_run=dry_run)
+        totals["families"] += 1
+        totals["tickets"] += result["tickets"]
+        totals["rollups"] += result["rollups"]
+
+    logger.info(
+        f"Rebuilt {totals['rollups']} rollups from {totals['tickets']} tickets "
+        f"of {totals['families']} families{' (dry run)' if dry_run else ''}"
+    )
+    return totals
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Rebuild daily ticket analytics rollups from tickets"
+    )
+    parser.add_argument(
+        "--family-id",
+        action="append",
+        dest="family_ids",
+        help="Family to rebuild (repeatable, default: all families)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Read tickets and count rollups without writing them",
+    )
+    args = parser.parse_args()
+
+    result = rebuild_ticket_rollups(family_ids=args.family_ids, dry_run=args.dry_run)
+    print(
+        f"{'Would rebuild' if args.dry_run else 'Rebuilt'} {result['rollups']} "
+        f"rollups from {result['tickets']} tickets of {result['families']} families."
+    )
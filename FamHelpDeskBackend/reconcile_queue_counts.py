@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Recount every queue's tickets and repair ticket counters that drifted: the
+queues' counters and the group members' open ticket counters.
+
+TicketHelper keeps the counters exact on its own; this job only matters after
+writes that bypass it or only update counters best effort, such as manual
+table edits, restores, imports and moves between groups. Counters that are
+already right are left untouched, so it is safe to re-run.
+
+Usage:
+    python3 reconcile_queue_counts.py                    # All families
+    python3 reconcile_queue_counts.py --family-id <id>   # One family
+    python3 reconcile_queue_counts.py --dry-run          # Only report drift
+"""
+
+import argparse
+from aws_lambda_powertools import Logger
+
+from collections import defaultdict
+
+from helpers.family_helper import FamilyHelper
+from helpers.group_helper import GroupHelper
+from helpers.group_membership_helper import GroupMembershipHelper
+from helpers.queue_helper import QueueHelper
+
+logger = Logger(service="FamHelpDesk-Queue-Count-Reconciliation")
+
+
+def reconcile_queue_counts(family_ids: list = None, dry_run: bool = False) -> dict:
+    """
+    Reconcile the ticket counters of every queue and group member in the
+    given families.
+
+    Args:
+        family_ids: Families to reconcile (default: every family)
+        dry_run: Only report the drift
+
+    Returns:
+        Dict with the number of queues checked and queues that drifted, and
+        the number of member counters that drifted
+    """
+    queue_helper = QueueHelper()
+    group_helper = GroupHelper()
+    membership_helper = GroupMembershipHelper()
+    if family_ids is None:
+        family_ids = [f.family_id for f in FamilyHelper().get_all_families()]
+
+    totals = {"queues": 0, "drifted": 0, "members_drifted": 0}
+    for family_id in family_ids:
+        group_queues = defaultdict(list)
+        for queue in queue_helper.get_all_queues_by_family(family_id):
+            group_queues[queue.group_id].append(queue.queue_id)
+            totals["queues"] += 1
+            if queue_helper.reconcile_ticket_counts(queue, dry_run=dry_run):
+                totals["drifted"] += 1
+        for group in group_helper.get_all_groups(family_id):
+            drift = membership_helper.reconcile_open_ticket_counts(
+                family_id, group.group_id, group_queues[group.group_id], dry_run
+            )
+            totals["members_drifted"] += len(drift)
+
+    logger.info(
+        f"Checked {totals['queues']} queues, {totals['drifted']} "
+        f"{'drifted' if dry_run else 'repaired'}; "
+        f"{totals['members_drifted']} member counters "
+        f"{'drifted' if dry_run else 'repaired'}"
+    )
+    return totals
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Recount queue and member ticket counters and repair drift"
+    )
+    parser.add_argument(
+        "--family-id",
+        action="append",
+        dest="family_ids",
+        help="Family to reconcile (repeatable, default: all families)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report drifted counters without repairing them",
+    )
+    args = parser.parse_args()
+
+    result = reconcile_queue_counts(family_ids=args.family_ids, dry_run=args.dry_run)
+    print(
+        f"Checked {result['queues']} queues; {result['drifted']} "
+        f"{'have drifted counters' if args.dry_run else 'repaired'}; "
+        f"{result['members_drifted']} member counters "
+        f"{'drifted' if args.dry_run else 'repaired'}."
+    )
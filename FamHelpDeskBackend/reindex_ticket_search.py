@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Rebuild the ticket search index from the tickets themselves.
+
+Tickets are indexed when they are created; run this for tickets created
+before search existed, or to repair postings after a failed index write.
+Postings are overwritten in place, so it is safe to re-run.
+
+Usage:
+    python3 reindex_ticket_search.py                    # All families
+    python3 reindex_ticket_search.py --family-id <id>   # One family
+"""
+
+import argparse
+from aws_lambda_powertools import Logger
+
+from helpers.family_export_reader import FamilyExportReader
+from helpers.family_helper import FamilyHelper
+from helpers.ticket_search_helper import TicketSearchHelper
+
+logger = Logger(service="FamHelpDesk-Ticket-Search-Reindex")
+
+
+def reindex_ticket_search(family_ids: list = None) -> dict:
+    """
+    Re-index every ticket of the given families.
+
+    Args:
+        family_ids: Families to re-index (default: every family)
+
+    Returns:
+        Dict with the number of families, tickets and postings written
+    """
+    search_helper = TicketSearchHelper()
+    if family_ids is None:
+        family_ids = [f.family_id for f in FamilyHelper().get_all_families()]
+
+    totals = {"families": 0, "tickets": 0, "postings": 0}
+    for family_id in family_ids:
+        for ticket in FamilyExportReader(family_id).iter_tickets():
+            totals["postings"] += search_helper.index_ticket(ticket)
+            totals["tickets"] += 1
+        totals["families"] += 1
+
+    logger.info(
+        f"Re-indexed {totals['tickets']} tickets from {totals['families']} families "
+        f"into {totals['postings']} postings"
+    )
+    return totals
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the ticket search index")
+    parser.add_argument(
+        "--family-id",
+        action="append",
+        dest="family_ids",
+        help="Family to re-index (repeatable, default: all families)",
+    )
+    args = parser.parse_args()
+
+    result = reindex_ticket_search(family_ids=args.family_ids)
+    print(
+        f"Re-indexed {result['tickets']} tickets from {result['families']} families "
+        f"({result['postings']} postings)."
+    )
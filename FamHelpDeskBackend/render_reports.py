@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Render enqueued PDF reports.
+
+Deployed as the report worker Lambda (handler below), which the API invokes
+asynchronously with {"family_id": ..., "report_id": ...} for every report it
+enqueues. It can also render a report locally, e.g. to retry a FAILED one.
+Render times and PDF sizes are published as CloudWatch metrics.
+
+Usage:
+    python3 render_reports.py --family-id <id> --report-id <id>
+"""
+
+import argparse
+import time
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.metrics import Metrics, MetricUnit
+
+from constants.metrics import (
+    API_METRICS_NAMESPACE,
+    REPORT_WORKER_SERVICE,
+    REPORTS_RENDERED,
+    REPORT_RENDER_FAILURES,
+    REPORT_RENDER_SECONDS,
+    REPORT_PDF_BYTES,
+)
+from helpers.report_helper import ReportHelper
+from models.report import ReportModel, ReportStatus
+
+logger = Logger(service=REPORT_WORKER_SERVICE)
+
+
+def render_report(family_id: str, report_id: str) -> dict:
+    """
+    Render one report and publish its metrics.
+
+    Returns:
+        The report as returned by the API, with its final status
+    """
+    started = time.monotonic()
+    report = ReportHelper().render_report(family_id, report_id)
+    elapsed = time.monotonic() - started
+
+    metrics = Metrics(namespace=API_METRICS_NAMESPACE, service=REPORT_WORKER_SERVICE)
+    if report.status == ReportStatus.READY.value:
+        metrics.add_metric(name=REPORTS_RENDERED, unit=MetricUnit.Count, value=1)
+        metrics.add_metric(
+            name=REPORT_PDF_BYTES, unit=MetricUnit.Bytes, value=report.pdf_size or 0
+        )
+    else:
+        metrics.add_metric(name=REPORT_RENDER_FAILURES, unit=MetricUnit.Count, value=1)
+    metrics.add_metric(
+        name=REPORT_RENDER_SECONDS, unit=MetricUnit.Seconds, value=elapsed
+    )
+    metrics.flush_metrics()
+
+    return ReportModel.clean_returned_report(report)
+
+
+def handler(event, context):
+    return render_report(event["family_id"], event["report_id"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render an enqueued PDF report")
+    parser.add_argument("--family-id", required=True, help="Family ID")
+    parser.add_argument("--report-id", required=True, help="Report ID")
+    args = parser.parse_args()
+
+    result = render_report(args.family_id, args.report_id)
+    print(
+        f"Report {result['report_id']} is {result['status']}"
+        + (f": {result['error']}" if result.get("error") else "")
+    )
@@ -104,6 +104,8 @@ async function main() {
       userPoolClient: cognitoStack.userPoolClient,
       userPoolClientIOS: cognitoStack.userPoolClientIOS,
       userTable: databaseStack.table,
+      auditArchiveBucket: databaseStack.auditArchiveBucket,
+      reportBucket: databaseStack.reportBucket,
       escalationEmail: escalationEmail,
       escalationNumber: escalationNumber,
     });
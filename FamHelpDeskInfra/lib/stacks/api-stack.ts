@@ -2,14 +2,18 @@ import {
   Stack,
   StackProps,
   Duration,
+  Size,
   aws_logs as logs,
   aws_apigateway as apigw,
   aws_lambda as lambda,
   aws_cognito as cognito,
   aws_dynamodb as dynamodb,
+  aws_s3 as s3,
   aws_route53 as route53,
   aws_certificatemanager as acm,
   aws_route53_targets as targets,
+  aws_events as events,
+  aws_events_targets as eventTargets,
 } from "aws-cdk-lib";
 import * as iam from "aws-cdk-lib/aws-iam";
 import { Construct } from "constructs";
@@ -27,6 +31,8 @@ interface ApiStackProps extends StackProps {
   userPoolClientIOS: cognito.UserPoolClient;
   stage: string;
   userTable: dynamodb.ITable;
+  auditArchiveBucket: s3.IBucket;
+  reportBucket: s3.IBucket;
   escalationEmail: string;
   escalationNumber: string;
 }
@@ -47,6 +53,8 @@ export class ApiStack extends Stack {
       userPoolClient,
       userPoolClientIOS,
       userTable,
+      auditArchiveBucket,
+      reportBucket,
       stage,
       escalationEmail,
       escalationNumber,
@@ -102,6 +110,64 @@ export class ApiStack extends Stack {
       },
     );
 
+    // Renders PDF reports the API enqueues, keeping fpdf off the API path
+    const reportWorkerLambda = new lambda.Function(
+      this,
+      `${famHelpDesk}-ReportWorkerLambda-${stage}`,
+      {
+        functionName: `${famHelpDesk}-ReportWorkerLambda-${stage}`,
+        runtime: lambda.Runtime.PYTHON_3_11,
+        handler: "render_reports.handler",
+        code: lambda.Code.fromAsset(
+          path.join(__dirname, "../../../FamHelpDeskBackend"),
+        ),
+        timeout: Duration.minutes(2),
+        memorySize: 1024,
+        layers: [layer],
+        tracing: lambda.Tracing.ACTIVE,
+        description: `${famHelpDesk}-ReportWorkerLambda-${stage}`,
+        environment: {
+          TABLE_NAME: userTable.tableName,
+          STAGE: stage.toLowerCase(),
+          REPORT_STORE_URI: `s3://${reportBucket.bucketName}/reports`,
+        },
+      },
+    );
+
+    userTable.grantReadWriteData(reportWorkerLambda);
+    reportBucket.grantReadWrite(reportWorkerLambda);
+
+    // Runs family export jobs too large for an API response; reads the
+    // audit archive so exports include archived records
+    const exportWorkerLambda = new lambda.Function(
+      this,
+      `${famHelpDesk}-ExportWorkerLambda-${stage}`,
+      {
+        functionName: `${famHelpDesk}-ExportWorkerLambda-${stage}`,
+        runtime: lambda.Runtime.PYTHON_3_11,
+        handler: "export_family_data.handler",
+        code: lambda.Code.fromAsset(
+          path.join(__dirname, "../../../FamHelpDeskBackend"),
+        ),
+        timeout: Duration.minutes(15),
+        memorySize: 512,
+        ephemeralStorageSize: Size.gibibytes(4),
+        layers: [layer],
+        tracing: lambda.Tracing.ACTIVE,
+        description: `${famHelpDesk}-ExportWorkerLambda-${stage}`,
+        environment: {
+          TABLE_NAME: userTable.tableName,
+          STAGE: stage.toLowerCase(),
+          AUDIT_ARCHIVE_URI: `s3://${auditArchiveBucket.bucketName}/audit-archive`,
+          EXPORT_STORE_URI: `s3://${reportBucket.bucketName}/exports`,
+        },
+      },
+    );
+
+    userTable.grantReadWriteData(exportWorkerLambda);
+    auditArchiveBucket.grantRead(exportWorkerLambda);
+    reportBucket.grantReadWrite(exportWorkerLambda);
+
     const famHelpDeskApi = new lambda.Function(
       this,
       `${famHelpDesk}-ApiLambda-${stage}`,
@@ -130,6 +196,12 @@ export class ApiStack extends Stack {
               : `https://famhelpdesk-${stage.toLowerCase()}.auth.us-west-2.amazoncognito.com`,
           STAGE: stage.toLowerCase(),
           API_DOMAIN_NAME: apiDomainName,
+          ADMIN_USER_IDS: process.env.ADMIN_USER_IDS ?? "",
+          AUDIT_ARCHIVE_URI: `s3://${auditArchiveBucket.bucketName}/audit-archive`,
+          REPORT_STORE_URI: `s3://${reportBucket.bucketName}/reports`,
+          REPORT_WORKER_FUNCTION: reportWorkerLambda.functionName,
+          EXPORT_STORE_URI: `s3://${reportBucket.bucketName}/exports`,
+          EXPORT_WORKER_FUNCTION: exportWorkerLambda.functionName,
         },
       },
     );
@@ -151,6 +223,40 @@ export class ApiStack extends Stack {
     );
 
     userTable.grantReadWriteData(famHelpDeskApi);
+    auditArchiveBucket.grantRead(famHelpDeskApi);
+    reportBucket.grantReadWrite(famHelpDeskApi);
+    reportWorkerLambda.grantInvoke(famHelpDeskApi);
+    exportWorkerLambda.grantInvoke(famHelpDeskApi);
+
+    // Scheduled job that auto-closes expired resolved tickets and flags SLA breaches
+    const ticketSchedulerLambda = new lambda.Function(
+      this,
+      `${famHelpDesk}-TicketSchedulerLambda-${stage}`,
+      {
+        functionName: `${famHelpDesk}-TicketSchedulerLambda-${stage}`,
+        runtime: lambda.Runtime.PYTHON_3_11,
+        handler: "process_ticket_deadlines.handler",
+        code: lambda.Code.fromAsset(
+          path.join(__dirname, "../../../FamHelpDeskBackend"),
+        ),
+        timeout: Duration.minutes(5),
+        memorySize: 512,
+        layers: [layer],
+        tracing: lambda.Tracing.ACTIVE,
+        description: `${famHelpDesk}-TicketSchedulerLambda-${stage}`,
+        environment: {
+          TABLE_NAME: userTable.tableName,
+          STAGE: stage.toLowerCase(),
+        },
+      },
+    );
+
+    userTable.grantReadWriteData(ticketSchedulerLambda);
+
+    new events.Rule(this, `${famHelpDesk}-TicketSchedulerRule-${stage}`, {
+      schedule: events.Schedule.rate(Duration.minutes(5)),
+      targets: [new eventTargets.LambdaFunction(ticketSchedulerLambda)],
+    });
 
     const accessLogGroup = new logs.LogGroup(
       this,
@@ -196,6 +302,8 @@ export class ApiStack extends Stack {
         handler: famHelpDeskApi,
         restApiName: `${famHelpDesk}-Api-${stage}`,
         proxy: false,
+        // Report and gzipped export downloads; clients send a matching Accept
+        binaryMediaTypes: ["application/pdf", "application/gzip"],
         defaultMethodOptions: {
           authorizationType: apigw.AuthorizationType.COGNITO,
           authorizer,
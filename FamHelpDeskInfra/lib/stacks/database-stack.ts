@@ -1,6 +1,7 @@
-import { Stack, StackProps, RemovalPolicy } from "aws-cdk-lib";
+import { Stack, StackProps, RemovalPolicy, Duration } from "aws-cdk-lib";
 import { Construct } from "constructs";
 import * as dynamodb from "aws-cdk-lib/aws-dynamodb";
+import * as s3 from "aws-cdk-lib/aws-s3";
 import { famHelpDesk } from "../constants";
 
 interface DatabaseStackProps extends StackProps {
@@ -9,6 +10,8 @@ interface DatabaseStackProps extends StackProps {
 
 export class DatabaseStack extends Stack {
   public readonly table: dynamodb.Table;
+  public readonly auditArchiveBucket: s3.Bucket;
+  public readonly reportBucket: s3.Bucket;
 
   constructor(scope: Construct, id: string, props: DatabaseStackProps) {
     super(scope, id, props);
@@ -41,5 +44,132 @@ export class DatabaseStack extends Stack {
       },
       projectionType: dynamodb.ProjectionType.ALL,
     });
+
+    // Indexes added after the table first shipped, in rollout order. A
+    // CloudFormation update of an existing table can create only one GSI, so
+    // such a table gets them one deploy at a time with the tableIndexCount
+    // context (see README). Without it every index is defined, as a new
+    // table can be created with all of them.
+    const rolloutIndexes: dynamodb.GlobalSecondaryIndexProps[] = [
+      // Sparse index holding only queue items, keyed by family
+      {
+        indexName: "FamilyQueueIndex",
+        partitionKey: {
+          name: "queue_family_id",
+          type: dynamodb.AttributeType.STRING,
+        },
+        sortKey: {
+          name: "sk",
+          type: dynamodb.AttributeType.STRING,
+        },
+        projectionType: dynamodb.ProjectionType.ALL,
+      },
+      // Family audit records ordered by time across all entities
+      {
+        indexName: "FamilyAuditIndex",
+        partitionKey: {
+          name: "family_id",
+          type: dynamodb.AttributeType.STRING,
+        },
+        sortKey: {
+          name: "time",
+          type: dynamodb.AttributeType.NUMBER,
+        },
+        projectionType: dynamodb.ProjectionType.ALL,
+      },
+      // Audit records across families keyed by the acting user
+      {
+        indexName: "ActorAuditIndex",
+        partitionKey: {
+          name: "actor_user_id",
+          type: dynamodb.AttributeType.STRING,
+        },
+        sortKey: {
+          name: "time",
+          type: dynamodb.AttributeType.NUMBER,
+        },
+        projectionType: dynamodb.ProjectionType.ALL,
+      },
+      // Tickets of a queue ordered by status, severity and creation date
+      {
+        indexName: "QueueTicketIndex",
+        partitionKey: {
+          name: "queue_ticket_pk",
+          type: dynamodb.AttributeType.STRING,
+        },
+        sortKey: {
+          name: "queue_ticket_sk",
+          type: dynamodb.AttributeType.STRING,
+        },
+        projectionType: dynamodb.ProjectionType.ALL,
+      },
+      // Open tickets by assignee across families (sparse)
+      {
+        indexName: "AssigneeTicketIndex",
+        partitionKey: {
+          name: "assignee_ticket_pk",
+          type: dynamodb.AttributeType.STRING,
+        },
+        sortKey: {
+          name: "assignee_ticket_sk",
+          type: dynamodb.AttributeType.STRING,
+        },
+        projectionType: dynamodb.ProjectionType.ALL,
+      },
+      // Pending ticket deadlines by time bucket, read by the deadline scheduler (sparse)
+      {
+        indexName: "DeadlineTicketIndex",
+        partitionKey: {
+          name: "deadline_pk",
+          type: dynamodb.AttributeType.STRING,
+        },
+        sortKey: {
+          name: "deadline_sk",
+          type: dynamodb.AttributeType.STRING,
+        },
+        projectionType: dynamodb.ProjectionType.ALL,
+      },
+    ];
+
+    const indexCount = Number(
+      this.node.tryGetContext("tableIndexCount") ?? rolloutIndexes.length,
+    );
+    if (
+      !Number.isInteger(indexCount) ||
+      indexCount < 0 ||
+      indexCount > rolloutIndexes.length
+    ) {
+      throw new Error(
+        `tableIndexCount must be an integer from 0 to ${rolloutIndexes.length}`,
+      );
+    }
+    for (const index of rolloutIndexes.slice(0, indexCount)) {
+      this.table.addGlobalSecondaryIndex(index);
+    }
+
+    // Cold tier for audit records moved out of the table by the archive job
+    this.auditArchiveBucket = new s3.Bucket(
+      this,
+      `${famHelpDesk}-AuditArchive-${stage}`,
+      {
+        blockPublicAccess: s3.BlockPublicAccess.BLOCK_ALL,
+        encryption: s3.BucketEncryption.S3_MANAGED,
+        enforceSSL: true,
+        removalPolicy: RemovalPolicy.RETAIN,
+      },
+    );
+
+    // Report snapshots and rendered PDFs, keyed by content hash, and family
+    // data export files. Everything in it can be generated again from the
+    // table, so it is not retained.
+    this.reportBucket = new s3.Bucket(this, `${famHelpDesk}-Reports-${stage}`, {
+      blockPublicAccess: s3.BlockPublicAccess.BLOCK_ALL,
+      encryption: s3.BucketEncryption.S3_MANAGED,
+      enforceSSL: true,
+      // Export files are downloaded once, soon after the job finishes
+      lifecycleRules: [{ prefix: "exports/", expiration: Duration.days(7) }],
+      removalPolicy: RemovalPolicy.DESTROY,
+      autoDeleteObjects: true,
+    });
   }
 }